@@ -0,0 +1,121 @@
+"""API 키 인증 (digest 조회 + 검증 결과 캐시)
+
+API 키 인증은 서비스 계정이 초당 수백 회 호출하는 경로이므로,
+정상 상태에서는 해싱과 DB 조회 없이 끝나도록 구성합니다.
+
+    1. 전체 키의 HMAC-SHA256 digest 계산 (마이크로초)
+    2. 검증된 키 캐시 조회 (로컬 LRU → Redis, 키: digest)
+    3. 미스 시 digest 유니크 인덱스로 단건 조회
+    4. digest가 없는 기존 키는 key_id 조회 + bcrypt 검증 후 digest를 채움
+
+캐시에는 상태가 ACTIVE인 키의 인증 정보만 저장하며, 만료/IP 검사는 요청마다
+캐시된 값으로 수행합니다. 키 수정/폐기 시 revoke_api_key_after_commit()으로 커밋 이후
+모든 워커의 캐시를 무효화합니다 (pub/sub).
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .cache import TwoLevelCache
+from .security import compute_api_key_digest, verify_password_async
+
+
+# 검증된 API 키 캐시 (digest → 인증 정보)
+api_key_cache: TwoLevelCache[dict[str, Any]] = TwoLevelCache(
+    "apikey:verified", local_ttl=30.0, redis_ttl=300
+)
+
+
+def api_key_to_auth_info(record: Any) -> dict[str, Any]:
+    """ApiKey 모델을 캐시 가능한 인증 정보(dict)로 변환"""
+    return {
+        "api_key_id": str(record.id),
+        "key_id": record.key_id,
+        "user_id": str(record.user_id),
+        "tenant_context": str(record.tenant_context) if record.tenant_context else None,
+        "scopes": list(record.scopes or []),
+        "service_account": record.service_account,
+        "allowed_ips": [str(ip) for ip in record.allowed_ips or []],
+        "expires_at": record.expires_at.isoformat() if record.expires_at else None,
+        "rate_limit_per_minute": record.rate_limit_per_minute,
+        "rate_limit_per_hour": record.rate_limit_per_hour,
+        "rate_limit_per_day": record.rate_limit_per_day,
+    }
+
+
+def is_api_key_expired(auth_info: dict[str, Any], now: datetime) -> bool:
+    """캐시된 인증 정보 기준 만료 여부"""
+    expires_at = auth_info.get("expires_at")
+    return expires_at is not None and now > datetime.fromisoformat(expires_at)
+
+
+async def _load_legacy_api_key(db: AsyncSession, api_key: str, digest: str) -> Any | None:
+    """
+    digest가 없는 기존 키 검증 (key_id 조회 + bcrypt)
+
+    검증에 성공하면 digest를 채워 다음 인증부터 digest 조회를 사용합니다.
+    (커밋은 호출자의 사용 통계 갱신과 함께 수행)
+    """
+    from src.models.manager.idam.api_key import ApiKey
+
+    # API 키 형식: "cxg_<type>_<secret>"
+    parts = api_key.split("_", 2)
+    key_id = f"{parts[0]}_{parts[1]}"
+    secret = parts[2]
+
+    result = await db.execute(
+        select(ApiKey).where(
+            ApiKey.key_id == key_id,
+            ApiKey.status == "ACTIVE",
+            ApiKey.key_digest.is_(None),
+        )
+    )
+    record = result.scalar_one_or_none()
+
+    if record is None or not await verify_password_async(secret, record.key_hash):
+        return None
+
+    record.key_digest = digest
+    return record
+
+
+async def load_api_key_auth_info(db: AsyncSession, api_key: str) -> dict[str, Any] | None:
+    """
+    API 키 인증 정보 조회 (캐시 경유)
+
+    Args:
+        db: Manager DB 세션
+        api_key: 전체 API 키 (cxg_<type>_<secret>, 형식 검증 완료된 값)
+
+    Returns:
+        인증 정보 dict 또는 None (존재하지 않거나 비활성/불일치)
+    """
+    from src.models.manager.idam.api_key import ApiKey
+
+    digest = compute_api_key_digest(api_key)
+
+    async def load() -> dict[str, Any] | None:
+        result = await db.execute(
+            select(ApiKey).where(ApiKey.key_digest == digest, ApiKey.status == "ACTIVE")
+        )
+        record = result.scalar_one_or_none()
+        if record is None:
+            record = await _load_legacy_api_key(db, api_key, digest)
+        return api_key_to_auth_info(record) if record is not None else None
+
+    return await api_key_cache.get(digest, load)
+
+
+def revoke_api_key_after_commit(db: AsyncSession, record: Any) -> None:
+    """
+    API 키 캐시 무효화 예약 (키 수정/폐기를 커밋하기 전에 호출, 커밋 후 모든 워커에 전파)
+
+    Args:
+        db: Manager DB 세션
+        record: 수정/폐기하는 ApiKey 모델
+    """
+    if record.key_digest:
+        api_key_cache.invalidate_after_commit(db, [record.key_digest])
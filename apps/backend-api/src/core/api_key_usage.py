@@ -0,0 +1,220 @@
+"""API 키 사용 통계 버퍼 (비동기 일괄 반영)
+
+API 키 인증마다 usage_count/last_used_at/last_used_ip를 UPDATE + 커밋하면
+요청 경로에 쓰기 트랜잭션이 생기고, 자주 쓰이는 키의 행 잠금 경합이 발생합니다.
+인증 시에는 프로세스 메모리에 누적만 하고, 백그라운드 태스크가 주기적으로
+idam.api_keys에 일괄 UPDATE합니다.
+
+    1. record(): 키별 증가량/마지막 사용 시각/IP 누적 (I/O 없음)
+    2. 주기(flush_interval) 또는 누적 키 수(max_pending) 도달 시 flush()
+    3. flush(): 키 ID 순으로 정렬한 단일 executemany UPDATE (잠금 순서 고정)
+    4. 종료 시 남은 누적분 flush
+
+유실 상한:
+    - 프로세스 비정상 종료 시 최대 flush_interval 동안의 증가분만 유실
+    - 반영 실패 시 누적분을 버퍼로 되돌려 다음 주기에 재시도
+      (버퍼가 max_pending의 10배를 넘으면 오래된 키부터 버리고 경고 로그)
+
+여러 워커가 같은 키를 갱신해도 usage_count는 증가량(+n)으로, last_used_at은
+더 최근 값만 반영하므로 순서와 무관하게 결과가 같습니다.
+"""
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import bindparam, case, func, update
+
+from .config import settings
+from .logging import get_logger
+
+
+logger = get_logger("api_key_usage")
+
+
+@dataclass
+class UsageEntry:
+    """키별 누적 사용량"""
+
+    count: int
+    last_used_at: datetime
+    last_used_ip: str | None
+
+
+class ApiKeyUsageRecorder:
+    """
+    API 키 사용 통계 버퍼
+
+    이벤트 루프 단일 스레드에서만 접근하므로 잠금이 필요 없습니다.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 1000):
+        """
+        Args:
+            flush_interval: 주기적 반영 간격 (초, 비정상 종료 시 유실 상한)
+            max_pending: 누적 키 수가 이 값에 도달하면 주기와 무관하게 즉시 반영
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: dict[UUID, UsageEntry] = {}
+        self._wakeup = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # 통계
+        self.flushed_rows = 0
+        self.flushed_increments = 0
+        self.failed_flushes = 0
+        self.dropped_increments = 0
+
+    @property
+    def pending_keys(self) -> int:
+        return len(self._pending)
+
+    def record(self, api_key_id: UUID, used_at: datetime, ip: str | None) -> None:
+        """
+        API 키 사용 1회 기록 (메모리 누적만 수행)
+
+        Args:
+            api_key_id: API 키 ID
+            used_at: 사용 시각 (timezone-aware)
+            ip: 클라이언트 IP (없으면 None)
+        """
+        entry = self._pending.get(api_key_id)
+        if entry is None:
+            self._pending[api_key_id] = UsageEntry(1, used_at, ip)
+        else:
+            entry.count += 1
+            if used_at >= entry.last_used_at:
+                entry.last_used_at = used_at
+                entry.last_used_ip = ip or entry.last_used_ip
+
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    # ==================== 반영 ====================
+
+    async def flush(self) -> int:
+        """
+        누적된 사용 통계를 DB에 일괄 반영
+
+        Returns:
+            반영된 키 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            try:
+                await self._write(batch)
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.warning(f"API 키 사용 통계 반영 실패, 다음 주기에 재시도: {e}")
+                self._restore(batch)
+                return 0
+
+            self.flushed_rows += len(batch)
+            self.flushed_increments += sum(entry.count for entry in batch.values())
+            return len(batch)
+
+    async def _write(self, batch: dict[UUID, UsageEntry]) -> None:
+        from src.models.manager.idam.api_key import ApiKey
+
+        from .database import ManagerSessionLocal
+
+        table = ApiKey.__table__
+        used_at = bindparam("b_used_at", type_=table.c.last_used_at.type)
+        is_newer = (table.c.last_used_at.is_(None)) | (table.c.last_used_at < used_at)
+
+        # 1. 키별 증가량 반영, 더 최근 사용 기록만 last_used_* 갱신
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                usage_count=table.c.usage_count + bindparam("b_count"),
+                last_used_at=func.greatest(func.coalesce(table.c.last_used_at, used_at), used_at),
+                last_used_ip=case(
+                    (is_newer & bindparam("b_ip").is_not(None), bindparam("b_ip")),
+                    else_=table.c.last_used_ip,
+                ),
+            )
+        )
+
+        # 2. 키 ID 순 정렬 (워커 간 잠금 순서를 고정해 교착 방지)
+        params = [
+            {
+                "b_id": api_key_id,
+                "b_count": entry.count,
+                "b_used_at": entry.last_used_at,
+                "b_ip": entry.last_used_ip,
+            }
+            for api_key_id, entry in sorted(batch.items(), key=lambda item: item[0])
+        ]
+
+        async with ManagerSessionLocal() as session:
+            await session.execute(stmt, params)
+            await session.commit()
+
+    def _restore(self, batch: dict[UUID, UsageEntry]) -> None:
+        """반영 실패한 누적분을 버퍼로 되돌림 (상한 초과분은 버림)"""
+        for api_key_id, failed in batch.items():
+            entry = self._pending.get(api_key_id)
+            if entry is None:
+                self._pending[api_key_id] = failed
+                continue
+            entry.count += failed.count
+            if failed.last_used_at > entry.last_used_at:
+                entry.last_used_at = failed.last_used_at
+                entry.last_used_ip = failed.last_used_ip or entry.last_used_ip
+
+        dropped = 0
+        limit = self.max_pending * 10
+        while len(self._pending) > limit:
+            dropped += self._pending.pop(next(iter(self._pending))).count
+
+        if dropped:
+            self.dropped_increments += dropped
+            logger.warning(f"API 키 사용 통계 누적 상한 초과, 버린 증가분: {dropped}")
+
+    # ==================== 백그라운드 태스크 ====================
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """주기적 반영 시작 (애플리케이션 시작 시)"""
+        if self._flusher is None:
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기적 반영 종료 + 남은 누적분 반영 (애플리케이션 종료 시)"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    def metrics(self) -> dict[str, int]:
+        """버퍼/반영 통계"""
+        return {
+            "pending_keys": self.pending_keys,
+            "flushed_rows": self.flushed_rows,
+            "flushed_increments": self.flushed_increments,
+            "failed_flushes": self.failed_flushes,
+            "dropped_increments": self.dropped_increments,
+        }
+
+
+api_key_usage_recorder = ApiKeyUsageRecorder(
+    flush_interval=settings.api_key_usage_flush_interval,
+    max_pending=settings.api_key_usage_max_pending,
+)
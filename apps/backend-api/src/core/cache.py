@@ -0,0 +1,291 @@
+"""2단계(로컬 LRU + Redis) 캐시
+
+인증/인가처럼 요청마다 반복되는 조회 결과를 캐시하는 공통 구현입니다.
+
+    1. 프로세스 내 LRU (TTL 짧음, 마이크로초 단위 조회)
+    2. Redis (워커 간 공유, settings.redis_url)
+    3. 미스 시 loader(DB 조회) 결과를 1, 2에 저장 (None은 캐시하지 않음)
+
+무효화:
+    - invalidate(): Redis 키 삭제 + pub/sub 채널로 다른 워커의 LRU 항목 제거
+    - invalidate_after_commit(): 세션 커밋 이후 무효화
+      (커밋 전에 무효화하면 동시 요청이 이전 값을 다시 캐시할 수 있음)
+    - invalidate_all_after_commit(): 세션 커밋 이후 전체 무효화
+    - pub/sub 수신이 끊겨도 로컬 TTL 이후에는 Redis/DB 값으로 갱신됨
+
+Redis 장애 시에는 로컬 LRU + DB 조회로 동작합니다 (캐시는 최적화 용도).
+
+사용 예:
+    cache = TwoLevelCache[dict]("apikey:verified", local_ttl=30, redis_ttl=300)
+    info = await cache.get(digest, lambda: load_api_key(db, digest))
+    await cache.invalidate([digest])
+"""
+
+import asyncio
+import contextlib
+import json
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .logging import get_logger
+from .redis import get_redis
+
+
+logger = get_logger("cache")
+
+V = TypeVar("V")
+
+# 전체 무효화 메시지
+_INVALIDATE_ALL = "*"
+
+
+class TwoLevelCache(Generic[V]):
+    """
+    로컬 LRU + Redis 2단계 캐시
+
+    키는 문자열이며, 값은 encode/decode로 Redis에 저장할 문자열과 변환합니다.
+    로컬 LRU에는 decode된 값을 그대로 보관하므로 적중 시 변환 비용이 없습니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis_factory: Callable[[], Redis] = get_redis,
+        max_size: int = 10_000,
+        local_ttl: float = 30.0,
+        redis_ttl: int = 600,
+        encode: Callable[[V], str] = json.dumps,
+        decode: Callable[[str], V] = json.loads,
+    ):
+        """
+        Args:
+            namespace: Redis 키/채널 접두사 (예: "perm:user")
+            redis_factory: Redis 클라이언트를 반환하는 함수
+            max_size: 로컬 LRU 최대 항목 수
+            local_ttl: 로컬 캐시 유효 시간 (초, pub/sub 유실 대비)
+            redis_ttl: Redis 캐시 유효 시간 (초)
+            encode: 값 → Redis 문자열 변환 함수
+            decode: Redis 문자열 → 값 변환 함수
+        """
+        self.namespace = namespace
+        self._redis_factory = redis_factory
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._encode = encode
+        self._decode = decode
+
+        self.key_prefix = f"{namespace}:"
+        self.channel = f"{namespace}:invalidate"
+        self._after_commit_name = f"cache:{namespace}"
+
+        self._local: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._listener: asyncio.Task | None = None
+
+    # ==================== 조회 ====================
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[V | None]]) -> V | None:
+        """
+        캐시 조회 (미스 시 loader 결과 저장)
+
+        Args:
+            key: 캐시 키
+            loader: 캐시 미스 시 원본 값을 조회하는 함수 (None이면 캐시하지 않음)
+
+        Returns:
+            캐시된 값 또는 loader 결과
+        """
+        value = await self.get_cached(key)
+        if value is not None:
+            return value
+
+        value = await loader()
+        if value is not None:
+            await self.set(key, value)
+        return value
+
+    def get_local(self, key: str) -> V | None:
+        """로컬 LRU만 조회 (I/O 없음)"""
+        return self._get_local(key)
+
+    async def get_cached(self, key: str) -> V | None:
+        """캐시된 값만 조회 (로컬 → Redis, 원본 조회 없음)"""
+        # 1. 로컬 LRU
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        # 2. Redis
+        try:
+            raw = await self._redis_factory().get(self.key_prefix + key)
+        except RedisError as e:
+            logger.warning(f"{self.namespace} 캐시 Redis 조회 실패: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = self._decode(raw)
+        self._set_local(key, value)
+        return value
+
+    async def set(self, key: str, value: V, ttl: float | None = None) -> None:
+        """
+        값 저장 (로컬 + Redis)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 값 자체의 유효 시간 (초, 선택). local_ttl/redis_ttl보다 짧으면 이 값을 사용
+        """
+        local_ttl = self.local_ttl if ttl is None else min(self.local_ttl, ttl)
+        redis_ttl = self.redis_ttl if ttl is None else min(self.redis_ttl, math.ceil(ttl))
+        self._set_local(key, value, local_ttl)
+        try:
+            await self._redis_factory().set(
+                self.key_prefix + key, self._encode(value), ex=redis_ttl
+            )
+        except RedisError as e:
+            logger.warning(f"{self.namespace} 캐시 Redis 저장 실패: {e}")
+
+    def _get_local(self, key: str) -> V | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._local.pop(key, None)
+            return None
+
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: V, ttl: float | None = None) -> None:
+        ttl = self.local_ttl if ttl is None else ttl
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    # ==================== 무효화 ====================
+
+    async def invalidate(self, keys: Iterable[Any]) -> None:
+        """특정 키들의 캐시 무효화 (모든 워커)"""
+        key_list = sorted({str(key) for key in keys})
+        if not key_list:
+            return
+
+        self._evict_local(key_list)
+        try:
+            redis = self._redis_factory()
+            await redis.delete(*(self.key_prefix + key for key in key_list))
+            await redis.publish(self.channel, ",".join(key_list))
+        except RedisError as e:
+            logger.warning(f"{self.namespace} 캐시 Redis 무효화 실패: {e}")
+
+    async def invalidate_all(self) -> None:
+        """전체 캐시 무효화 (모든 워커)"""
+        self._local.clear()
+        try:
+            redis = self._redis_factory()
+            keys = [key async for key in redis.scan_iter(match=self.key_prefix + "*", count=500)]
+            if keys:
+                await redis.unlink(*keys)
+            await redis.publish(self.channel, _INVALIDATE_ALL)
+        except RedisError as e:
+            logger.warning(f"{self.namespace} 캐시 Redis 전체 무효화 실패: {e}")
+
+    def invalidate_after_commit(self, db: AsyncSession, keys: Iterable[Any]) -> None:
+        """
+        세션 커밋 이후 캐시 무효화 예약
+
+        같은 세션에서 여러 번 호출하면 대상이 합쳐집니다. 커밋 전에 롤백되면
+        변경이 저장되지 않았으므로 무효화하지 않습니다.
+
+        Args:
+            db: 변경을 수행한 DB 세션 (변경을 커밋하기 전에 호출)
+            keys: 무효화할 캐시 키 목록
+        """
+        from .database import run_after_commit
+
+        run_after_commit(db, self._after_commit_name, (str(key) for key in keys), self._on_commit)
+
+    def invalidate_all_after_commit(self, db: AsyncSession) -> None:
+        """
+        세션 커밋 이후 전체 캐시 무효화 예약
+
+        영향받는 키를 특정하기 어려운 변경(예: 여러 역할에 걸친 권한 정의 수정)에 사용합니다.
+
+        Args:
+            db: 변경을 수행한 DB 세션 (변경을 커밋하기 전에 호출)
+        """
+        from .database import run_after_commit
+
+        run_after_commit(
+            db, f"{self._after_commit_name}:all", [_INVALIDATE_ALL], self._on_commit_all
+        )
+
+    def _on_commit(self, keys: Iterable[str]) -> Awaitable[None]:
+        # 로컬 LRU는 즉시 제거하고, Redis 무효화는 이벤트 루프에서 비동기로 수행
+        self._evict_local(keys)
+        return self.invalidate(keys)
+
+    def _on_commit_all(self, _: Iterable[str]) -> Awaitable[None]:
+        self._local.clear()
+        return self.invalidate_all()
+
+    def _evict_local(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+
+    # ==================== pub/sub 수신 ====================
+
+    def _handle_message(self, data: str) -> None:
+        if data == _INVALIDATE_ALL:
+            self._local.clear()
+        else:
+            self._evict_local(data.split(","))
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self._redis_factory().pubsub()
+                await pubsub.subscribe(self.channel)
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._handle_message(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                # 재구독 전까지 놓친 메시지는 로컬 TTL로 보정됨
+                logger.warning(f"{self.namespace} 캐시 무효화 채널 구독 실패, 재시도: {e}")
+                self._local.clear()
+                await asyncio.sleep(5)
+
+    def start(self) -> None:
+        """무효화 채널 구독 시작 (애플리케이션 시작 시)"""
+        if self._listener is None:
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop(self) -> None:
+        """무효화 채널 구독 종료 (애플리케이션 종료 시)"""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    def clear_local(self) -> None:
+        """로컬 LRU 비우기 (테스트용)"""
+        self._local.clear()
@@ -1,18 +1,173 @@
 """데이터베이스 설정"""
 
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Hashable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from inspect import isawaitable
+from typing import Any
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from .config import settings
+from .exceptions import NotFoundError, ServiceUnavailableError
+from .logging import get_logger
+from .metrics import instrument_engine
+
+
+logger = get_logger("database")
+
+# 커밋 이후 작업 중 실행 중인 비동기 작업 (완료 전 GC 방지)
+_after_commit_tasks: set[asyncio.Task[Any]] = set()
 
 
 class Base(DeclarativeBase):
-    """SQLAlchemy Base 클래스"""
+    """
+    SQLAlchemy Base 클래스
+
+    eager_defaults: 서버에서 생성되는 값(created_at server_default, updated_at onupdate 등)을
+    INSERT/UPDATE 문의 RETURNING으로 함께 가져옵니다.
+    flush 후 refresh(SELECT) 왕복 없이 생성/수정 결과를 바로 사용할 수 있습니다.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
+
+
+class UnitOfWorkSession(AsyncSession):
+    """
+    요청 단위 트랜잭션(unit of work)을 지원하는 세션
+
+    defer_commits() 이후의 commit()은 flush만 수행하고(SQL 실행, 트랜잭션 유지),
+    complete()에서 한 번에 커밋하거나 롤백합니다.
+    Mutation 헬퍼는 모드와 관계없이 기존처럼 commit()을 호출합니다.
+    커밋 이후 작업(after_commit 이벤트, 캐시 무효화 예약 등)은 실제 커밋 시점에 실행됩니다.
+    """
+
+    deferring = False
+    deferred_commits = 0
+    rolled_back = False
+
+    def defer_commits(self) -> None:
+        """이후 commit()을 complete()까지 미룸"""
+        self.deferring = True
+
+    async def commit(self) -> None:
+        if self.deferring:
+            self.deferred_commits += 1
+            await self.flush()
+            return
+        await super().commit()
+
+    async def rollback(self) -> None:
+        # 미룬 커밋 중 롤백되면 앞선 변경도 사라지므로 complete()에서 커밋하지 않음
+        if self.deferring:
+            self.rolled_back = True
+        await super().rollback()
+
+    async def complete(self, commit: bool) -> bool:
+        """
+        unit of work 종료
+
+        Args:
+            commit: True면 커밋 (중간에 롤백된 세션은 롤백)
+
+        Returns:
+            커밋 여부
+        """
+        self.deferring = False
+        self.deferred_commits = 0
+        if commit and not self.rolled_back:
+            try:
+                await self.commit()
+            except Exception:
+                # 커밋 실패 후에도 트랜잭션이 남는 드라이버가 있으므로 명시적으로 롤백
+                await self.rollback()
+                raise
+            return True
+
+        self.rolled_back = False
+        await self.rollback()
+        return False
+
+
+async def commit_now(db: AsyncSession) -> None:
+    """
+    unit of work와 무관하게 즉시 커밋
+
+    이어지는 오류로 요청 트랜잭션이 롤백되어도 남아야 하는 기록(로그인 잠금 등)에 사용합니다.
+    미룬 커밋 중이면 그때까지 flush된 앞선 변경도 함께 커밋됩니다.
+    """
+    if isinstance(db, UnitOfWorkSession) and db.deferring:
+        await AsyncSession.commit(db)
+        return
+    await db.commit()
+
+
+def run_after_commit(
+    db: AsyncSession,
+    name: str,
+    items: Iterable[Hashable],
+    callback: Callable[[set[Any]], Awaitable[Any] | None],
+) -> None:
+    """
+    세션 커밋 이후 작업 예약
+
+    캐시 무효화나 폐기 전파처럼 커밋된 변경에만 따라야 하는 작업에 사용합니다
+    (TwoLevelCache, MenuTreeCache의 invalidate_after_commit 등).
+    unit of work 모드에서는 요청 종료 시점의 실제 커밋 이후에 실행됩니다.
+
+    같은 세션에서 같은 name으로 여러 번 호출하면 대상이 합쳐져 커밋마다 callback이
+    한 번 호출됩니다. 커밋 전에 롤백되면 예약한 대상을 버립니다.
+    callback은 after_commit 이벤트 안에서 동기로 호출되며, awaitable을 반환하면
+    이벤트 루프에서 백그라운드로 실행합니다 (실패는 로그만 남김).
+
+    Args:
+        db: 변경을 수행한 DB 세션 (변경을 커밋하기 전에 호출)
+        name: 작업 이름 (세션 내 예약 대상을 구분)
+        items: 커밋 후 callback에 전달할 대상
+        callback: 커밋된 대상 집합을 받는 함수
+    """
+    sync_session = db.sync_session
+    pending_key = f"after_commit:{name}"
+    pending: set[Any] | None = sync_session.info.get(pending_key)
+    if pending is None:
+        pending = set()
+        sync_session.info[pending_key] = pending
+
+        def on_commit(session: Any) -> None:
+            if not pending:
+                return
+            committed = set(pending)
+            pending.clear()
+            result = callback(committed)
+            if isawaitable(result):
+                task = asyncio.get_running_loop().create_task(_run_after_commit(name, result))
+                _after_commit_tasks.add(task)
+                task.add_done_callback(_after_commit_tasks.discard)
+
+        def on_rollback(session: Any) -> None:
+            pending.clear()
 
-    pass
+        event.listen(sync_session, "after_commit", on_commit)
+        event.listen(sync_session, "after_rollback", on_rollback)
+
+    pending.update(items)
+
+
+async def _run_after_commit(name: str, awaitable: Awaitable[Any]) -> None:
+    try:
+        await awaitable
+    except Exception:
+        logger.exception(f"커밋 이후 작업 실패: {name}")
 
 
 # Engines
@@ -32,16 +187,20 @@ manager_engine = create_async_engine(
     max_overflow=10,
 )
 
+# SQL 실행 계측 (GraphQL 리졸버별 SQL 횟수/시간, N+1 탐지)
+instrument_engine(tenant_engine)
+instrument_engine(manager_engine)
+
 # Session Makers
 TenantSessionLocal = async_sessionmaker(
     tenant_engine,
-    class_=AsyncSession,
+    class_=UnitOfWorkSession,
     expire_on_commit=False,
 )
 
 ManagerSessionLocal = async_sessionmaker(
     manager_engine,
-    class_=AsyncSession,
+    class_=UnitOfWorkSession,
     expire_on_commit=False,
 )
 
@@ -71,6 +230,372 @@ async def get_manager_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# ==================== Tenant Engine Registry ====================
+
+
+def _to_async_dsn(dsn: str) -> str:
+    """동기 PostgreSQL DSN을 asyncpg DSN으로 변환"""
+    return dsn.replace("postgresql://", "postgresql+asyncpg://")
+
+
+async def resolve_tenant_dsn(tenant_key: str) -> str:
+    """
+    tenant_key(테넌트 코드)로 테넌트 DB 접속 정보 조회
+
+    manager.tnnt.tenants.extra_data["database_url"]에 전용 DSN이 지정된 경우 이를 사용하고,
+    없으면 공용 테넌트 DB(settings.tenants_database_url)를 사용합니다.
+
+    Raises:
+        NotFoundError: 테넌트가 존재하지 않거나 삭제된 경우
+    """
+    # 순환 참조 방지 (models.base -> core.database)
+    from src.models.manager.tnnt.tenant import Tenant
+
+    async with ManagerSessionLocal() as session:
+        result = await session.execute(
+            select(Tenant.extra_data).where(
+                Tenant.code == tenant_key,
+                Tenant.is_deleted.is_(False),
+            )
+        )
+        row = result.first()
+
+    if row is None:
+        raise NotFoundError(
+            message="테넌트를 찾을 수 없습니다",
+            detail={"tenant_key": tenant_key},
+        )
+
+    return tenant_dsn(row[0])
+
+
+def tenant_dsn(extra_data: dict | None) -> str:
+    """테넌트 extra_data의 전용 DSN (없으면 공용 테넌트 DB DSN)"""
+    return (extra_data or {}).get("database_url") or settings.tenants_database_url
+
+
+@dataclass
+class TenantEngineEntry:
+    """레지스트리에 등록된 테넌트 엔진 정보 (DSN당 1개)"""
+
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    dsn: str
+    leases: int = 0
+    last_used_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def checked_out(self) -> int:
+        """현재 사용 중(체크아웃)인 연결 수"""
+        pool = self.engine.pool
+        return pool.checkedout() if hasattr(pool, "checkedout") else 0
+
+    @property
+    def in_use(self) -> bool:
+        """임대 중(요청이 세션 팩토리를 보유)이거나 체크아웃된 연결이 있는지"""
+        return self.leases > 0 or self.checked_out > 0
+
+
+@dataclass
+class _TenantSlots:
+    """공용 엔진의 테넌트별 동시 임대 제한 (holders: 임대 중 + 대기 중인 요청 수)"""
+
+    semaphore: asyncio.Semaphore
+    holders: int = 0
+
+
+class TenantEngineRegistry:
+    """
+    테넌트 DB 엔진 레지스트리
+
+    테넌트 DSN마다 독립된 커넥션 풀을 가진 엔진을 지연 생성하여
+    전용 DB를 쓰는 테넌트의 부하가 다른 DB의 연결을 고갈시키지 않도록 합니다.
+
+    - 공용 엔진: 전용 DSN이 없는 테넌트(기본)는 공용 테넌트 DB 엔진(shared_engine,
+      기존 전역 tenant_engine 풀)을 함께 사용하며, 한 테넌트가 풀을 독점하지 않도록
+      테넌트별 동시 임대 수를 max_connections_per_tenant로 제한
+      (요청은 테넌트 DB 세션을 하나만 사용하므로 임대 수 = 연결 수 상한)
+    - 엔진 생성: 전용 DSN은 최초 요청 시 엔진 생성 (tenant_key → DSN, DSN → 엔진 메모리 캐시)
+    - DSN 캐시: dsn_ttl초 후 다시 조회하여 삭제/변경된 테넌트를 반영 (forget()으로 즉시 제거)
+    - 임대: 요청은 acquire()/release() 또는 lease()로 엔진을 사용하며,
+      임대 중이거나 체크아웃된 연결이 있는 엔진은 정리하지 않음
+    - 전체 상한: 전용 엔진당 (pool_size + max_overflow)의 합계가 max_total_connections 이하
+      (상한 도달 시 미사용 엔진을 LRU 순서로 정리, 모두 사용 중이면 acquire_timeout까지
+      반납을 기다린 뒤 ServiceUnavailableError)
+    - 유휴 정리: 유휴 TTL을 초과한 미사용 전용 엔진을 주기적으로 dispose
+
+    사용 예:
+        async with tenant_engine_registry.lease("acme") as session_factory:
+            async with session_factory() as session:
+                ...
+    """
+
+    def __init__(
+        self,
+        dsn_resolver: Callable[[str], Awaitable[str]] = resolve_tenant_dsn,
+        pool_size: int = settings.tenant_pool_size,
+        max_overflow: int = settings.tenant_max_overflow,
+        max_total_connections: int = settings.tenant_max_total_connections,
+        idle_ttl: float = settings.tenant_engine_idle_ttl,
+        acquire_timeout: float = settings.tenant_engine_acquire_timeout,
+        shared_engine: AsyncEngine | None = None,
+        shared_dsn: str = settings.tenants_database_url,
+        max_connections_per_tenant: int = settings.tenant_max_connections,
+        dsn_ttl: float = settings.tenant_dsn_ttl,
+    ):
+        """
+        Args:
+            dsn_resolver: tenant_key로 DSN을 조회하는 함수 (없는 테넌트는 NotFoundError)
+            pool_size: 전용 엔진당 풀 크기
+            max_overflow: 전용 엔진당 추가 허용 연결 수
+            max_total_connections: 전용 엔진 연결 수 합계 상한
+            idle_ttl: 유휴 전용 엔진 정리 기준 (초)
+            acquire_timeout: 엔진/테넌트 연결 한도 대기 시간 (초)
+            shared_engine: 공용 테넌트 DB 엔진 (없으면 공용 DSN도 전용 엔진처럼 생성)
+            shared_dsn: 공용 테넌트 DB DSN
+            max_connections_per_tenant: 공용 엔진에서 테넌트당 최대 동시 임대 수
+            dsn_ttl: tenant_key → DSN 조회 결과 유지 시간 (초)
+        """
+        self._dsn_resolver = dsn_resolver
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.idle_ttl = idle_ttl
+        self.acquire_timeout = acquire_timeout
+        self.max_connections_per_tenant = max_connections_per_tenant
+        self.dsn_ttl = dsn_ttl
+
+        # 전체 연결 수 상한으로부터 동시에 유지할 수 있는 엔진 수 계산
+        self.max_engines = max(1, max_total_connections // (pool_size + max_overflow))
+
+        # 공용 엔진은 정리/상한 대상이 아님 (풀 크기는 shared_engine 설정을 따름)
+        self._shared: TenantEngineEntry | None = None
+        if shared_engine is not None:
+            self._shared = TenantEngineEntry(
+                engine=shared_engine,
+                session_factory=async_sessionmaker(
+                    shared_engine, class_=UnitOfWorkSession, expire_on_commit=False
+                ),
+                dsn=shared_dsn,
+            )
+
+        self._engines: OrderedDict[str, TenantEngineEntry] = OrderedDict()  # DSN → 엔진
+        self._tenant_dsns: dict[str, tuple[str, float]] = {}  # tenant_key → (DSN, 조회 시각)
+        self._tenant_slots: dict[str, _TenantSlots] = {}  # 공용 엔진 임대 중인 테넌트
+        self._condition = asyncio.Condition()
+        self._last_sweep_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def __contains__(self, tenant_key: object) -> bool:
+        dsn = self._cached_dsn(tenant_key)  # type: ignore[arg-type]
+        return dsn is not None and self._entry_for(dsn) is not None
+
+    @asynccontextmanager
+    async def lease(self, tenant_key: str) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+        """tenant_key의 세션 팩토리 임대 (블록 종료 시 반납)"""
+        entry = await self.acquire(tenant_key)
+        try:
+            yield entry.session_factory
+        finally:
+            await self.release(entry, tenant_key)
+
+    async def acquire(self, tenant_key: str) -> TenantEngineEntry:
+        """
+        tenant_key의 엔진 임대 (없으면 생성, 사용 후 반드시 release())
+
+        Raises:
+            NotFoundError: 테넌트가 존재하지 않거나 삭제된 경우
+            ServiceUnavailableError: 모든 엔진이 사용 중이거나 테넌트의 공용 엔진 연결 한도에
+                도달하여 acquire_timeout 안에 반납되지 않은 경우
+        """
+        # 유휴 엔진 정리 (TTL의 절반 주기)
+        if time.monotonic() - self._last_sweep_at > self.idle_ttl / 2:
+            await self.evict_idle()
+
+        # 1. DSN 조회 (캐시 만료 시 다시 조회, 락 밖에서 수행)
+        dsn = self._cached_dsn(tenant_key)
+        if dsn is None:
+            dsn = await self._dsn_resolver(tenant_key)
+            self._tenant_dsns[tenant_key] = (dsn, time.monotonic())
+
+        # 2. 공용 엔진: 테넌트별 동시 임대 제한
+        if self._shared is not None and dsn == self._shared.dsn:
+            await self._acquire_slot(tenant_key)
+            return self._lease(self._shared)
+
+        # 3. 빠른 경로: 이미 생성된 전용 엔진
+        entry = self._engines.get(dsn)
+        if entry is not None:
+            return self._lease(entry)
+
+        async with self._condition:
+            deadline = time.monotonic() + self.acquire_timeout
+            while True:
+                # 대기 중 다른 요청(같은 DSN의 다른 테넌트 포함)이 먼저 생성했을 수 있음
+                entry = self._engines.get(dsn)
+                if entry is not None:
+                    return self._lease(entry)
+
+                # 4. 상한 미만이면 생성, 상한이면 미사용 LRU 엔진 정리
+                if len(self._engines) < self.max_engines:
+                    entry = self._create_entry(dsn)
+                    self._engines[dsn] = entry
+                    return self._lease(entry)
+
+                evicted = self._pop_lru()
+                if evicted is not None:
+                    await evicted.engine.dispose()
+                    continue
+
+                # 5. 모두 사용 중이면 반납 대기
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining <= 0:
+                        raise TimeoutError
+                    await asyncio.wait_for(self._condition.wait(), remaining)
+                except TimeoutError:
+                    raise ServiceUnavailableError(
+                        message="테넌트 DB 연결이 모두 사용 중입니다. 잠시 후 다시 시도해 주세요",
+                        detail={"tenant_key": tenant_key, "max_engines": self.max_engines},
+                    ) from None
+
+    async def release(self, entry: TenantEngineEntry, tenant_key: str) -> None:
+        """acquire()로 임대한 엔진 반납"""
+        entry.leases -= 1
+        entry.last_used_at = time.monotonic()
+        if entry is self._shared:
+            self._release_slot(tenant_key)
+        elif entry.leases == 0:
+            # 상한에서 대기 중인 요청이 이 엔진을 정리할 수 있음
+            async with self._condition:
+                self._condition.notify_all()
+
+    def forget(self, tenant_keys: Iterable[str]) -> None:
+        """tenant_key → DSN 캐시 제거 (테넌트 삭제/DSN 변경 시, 다음 요청에서 다시 조회)"""
+        for tenant_key in tenant_keys:
+            self._tenant_dsns.pop(tenant_key, None)
+
+    def _cached_dsn(self, tenant_key: str) -> str | None:
+        cached = self._tenant_dsns.get(tenant_key)
+        if cached is None:
+            return None
+        dsn, resolved_at = cached
+        if time.monotonic() - resolved_at > self.dsn_ttl:
+            del self._tenant_dsns[tenant_key]
+            return None
+        return dsn
+
+    def _entry_for(self, dsn: str) -> TenantEngineEntry | None:
+        if self._shared is not None and dsn == self._shared.dsn:
+            return self._shared
+        return self._engines.get(dsn)
+
+    async def _acquire_slot(self, tenant_key: str) -> None:
+        slots = self._tenant_slots.get(tenant_key)
+        if slots is None:
+            slots = _TenantSlots(asyncio.Semaphore(self.max_connections_per_tenant))
+            self._tenant_slots[tenant_key] = slots
+
+        slots.holders += 1
+        try:
+            await asyncio.wait_for(slots.semaphore.acquire(), self.acquire_timeout)
+        except TimeoutError:
+            self._discard_slot(tenant_key, slots)
+            raise ServiceUnavailableError(
+                message="테넌트의 DB 연결이 모두 사용 중입니다. 잠시 후 다시 시도해 주세요",
+                detail={
+                    "tenant_key": tenant_key,
+                    "max_connections": self.max_connections_per_tenant,
+                },
+            ) from None
+        except BaseException:
+            self._discard_slot(tenant_key, slots)
+            raise
+
+    def _release_slot(self, tenant_key: str) -> None:
+        slots = self._tenant_slots[tenant_key]
+        slots.semaphore.release()
+        self._discard_slot(tenant_key, slots)
+
+    def _discard_slot(self, tenant_key: str, slots: _TenantSlots) -> None:
+        # 임대/대기 중인 요청이 없는 테넌트의 세마포어는 보관하지 않음
+        slots.holders -= 1
+        if slots.holders == 0:
+            del self._tenant_slots[tenant_key]
+
+    def _lease(self, entry: TenantEngineEntry) -> TenantEngineEntry:
+        entry.leases += 1
+        entry.last_used_at = time.monotonic()
+        if entry.dsn in self._engines:
+            self._engines.move_to_end(entry.dsn)
+        return entry
+
+    def _create_entry(self, dsn: str) -> TenantEngineEntry:
+        engine = create_async_engine(
+            _to_async_dsn(dsn),
+            echo=settings.debug,
+            pool_pre_ping=True,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+        )
+        instrument_engine(engine)
+        session_factory = async_sessionmaker(
+            engine,
+            class_=UnitOfWorkSession,
+            expire_on_commit=False,
+        )
+        return TenantEngineEntry(engine=engine, session_factory=session_factory, dsn=dsn)
+
+    def _remove(self, dsn: str) -> TenantEngineEntry:
+        # DSN이 바뀐 테넌트는 다음 요청에서 다시 조회하도록 매핑도 제거
+        for tenant_key in [key for key, value in self._tenant_dsns.items() if value[0] == dsn]:
+            del self._tenant_dsns[tenant_key]
+        return self._engines.pop(dsn)
+
+    def _pop_lru(self) -> TenantEngineEntry | None:
+        """사용 중이 아닌 가장 오래된 엔진 1개를 레지스트리에서 제거 (dispose는 호출자)"""
+        for dsn, entry in self._engines.items():
+            if not entry.in_use:
+                return self._remove(dsn)
+        return None
+
+    async def evict_idle(self) -> int:
+        """
+        유휴 TTL을 초과한 엔진 정리
+
+        Returns:
+            정리된 엔진 수
+        """
+        self._last_sweep_at = time.monotonic()
+        deadline = self._last_sweep_at - self.idle_ttl
+
+        async with self._condition:
+            expired = [
+                dsn
+                for dsn, entry in self._engines.items()
+                if entry.last_used_at < deadline and not entry.in_use
+            ]
+            for dsn in expired:
+                await self._remove(dsn).engine.dispose()
+            if expired:
+                self._condition.notify_all()
+
+        return len(expired)
+
+    async def dispose_all(self) -> None:
+        """모든 전용 테넌트 엔진 종료 (애플리케이션 종료 시, 공용 엔진은 close_db()에서 종료)"""
+        async with self._condition:
+            entries = list(self._engines.values())
+            self._engines.clear()
+            self._tenant_dsns.clear()
+        for entry in entries:
+            await entry.engine.dispose()
+
+
+tenant_engine_registry = TenantEngineRegistry(shared_engine=tenant_engine)
+
+
 async def init_db():
     """데이터베이스 연결 확인"""
     # 디버그 모드에서만 연결 테스트 수행
@@ -99,6 +624,7 @@ async def init_db():
 async def close_db():
     """데이터베이스 연결 종료"""
     try:
+        await tenant_engine_registry.dispose_all()
         await tenant_engine.dispose()
         await manager_engine.dispose()
     except Exception:
@@ -111,11 +637,14 @@ async def get_manager_db_session() -> AsyncSession:
     return ManagerSessionLocal()
 
 
-async def get_tenant_db_session(tenant_key: str) -> AsyncSession:
+async def get_tenant_db_session(tenant_key: str) -> AsyncGenerator[AsyncSession, None]:
     """
-    Tenant DB 세션 생성 (GraphQL용)
+    Tenant DB 세션 (GraphQL용)
 
-    TODO: tenant_key로 tenant별 DB 연결 정보 조회 및 세션 생성
-    현재는 단일 tenant DB를 사용
+    tenant_key별 엔진 레지스트리에서 엔진을 임대하고, 세션 종료 시 반납합니다.
     """
-    return TenantSessionLocal()
+    async with (
+        tenant_engine_registry.lease(tenant_key) as session_factory,
+        session_factory() as session,
+    ):
+        yield session
@@ -1,5 +1,6 @@
 """Core dependencies for the application."""
 
+import math
 from collections.abc import AsyncGenerator
 from typing import Any
 from uuid import UUID
@@ -70,87 +71,75 @@ async def verify_api_key(
     try:
         from datetime import UTC, datetime
 
-        from sqlalchemy import select
+        from src.core.api_key_auth import is_api_key_expired, load_api_key_auth_info
+        from src.core.api_key_usage import api_key_usage_recorder
+        from src.core.config import settings
+        from src.core.exceptions import RateLimitExceededError
+        from src.core.rate_limit import rate_limiter
 
-        from src.core.security import verify_password
-        from src.models.manager.idam.api_key import ApiKey
-
-        # API 키 형식: "cxg_<key_id>_<secret>"
-        # 예: "cxg_usr_abc123_XyZ789..."
-        if not api_key.startswith("cxg_"):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid API key format",
-            )
-
-        parts = api_key.split("_", 2)
-        if len(parts) != 3:
+        # API 키 형식: "cxg_<type>_<secret>"
+        # 예: "cxg_usr_XyZ789..."
+        if not api_key.startswith("cxg_") or len(api_key.split("_", 2)) != 3:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid API key format",
             )
 
-        key_id = f"{parts[0]}_{parts[1]}"  # cxg_<type>
-        secret = parts[2]
-
-        # DB에서 API 키 조회
-        stmt = select(ApiKey).where(
-            ApiKey.key_id == key_id,
-            ApiKey.status == "ACTIVE",
-        )
-        result = await db.execute(stmt)
-        api_key_record = result.scalar_one_or_none()
+        # 검증된 키 캐시 → digest 단건 조회 순으로 인증 정보 조회 (해싱 없음)
+        api_key_info = await load_api_key_auth_info(db, api_key)
 
-        if not api_key_record:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="API key not found or inactive",
-            )
-
-        # 시크릿 검증 (해시 비교)
-        if not verify_password(secret, api_key_record.key_hash):
+        if not api_key_info:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid API key",
             )
 
         # 만료 확인
-        if api_key_record.expires_at and datetime.now(UTC) > api_key_record.expires_at.replace(tzinfo=UTC):
+        now = datetime.now(UTC)
+        if is_api_key_expired(api_key_info, now):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="API key has expired",
             )
 
         # IP 화이트리스트 확인
-        if api_key_record.allowed_ips and request and request.client:
-            client_ip = request.client.host
-            if client_ip not in api_key_record.allowed_ips:
+        client_ip = request.client.host if request and request.client else None
+        if api_key_info["allowed_ips"] and client_ip:
+            if client_ip not in api_key_info["allowed_ips"]:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="IP address not allowed",
                 )
 
-        # Rate Limit 확인 (TODO: Redis 사용 권장)
-        # 현재는 DB 사용량 카운트만 확인
+        # Rate Limit 확인 (키 기본 한도 + intg.rate_limits, Redis 슬라이딩 윈도우)
+        if settings.rate_limit_enabled:
+            try:
+                await rate_limiter.enforce(await rate_limiter.rules_for_api_key(api_key_info))
+            except RateLimitExceededError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=e.message,
+                    headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+                ) from e
 
-        # 사용 통계 업데이트
-        api_key_record.usage_count += 1
-        api_key_record.last_used_at = datetime.now(UTC)
-        if request and request.client:
-            api_key_record.last_used_ip = request.client.host
+        # 사용 통계는 메모리에 누적 후 백그라운드에서 일괄 반영 (요청 경로에 쓰기 없음)
+        api_key_usage_recorder.record(UUID(api_key_info["api_key_id"]), now, client_ip)
 
-        await db.commit()
+        # digest가 없던 기존 키의 digest 백필 반영
+        if db.dirty:
+            await db.commit()
 
         # API 키 정보 반환
         return {
-            "api_key_id": str(api_key_record.id),
-            "key_id": api_key_record.key_id,
-            "user_id": str(api_key_record.user_id),
-            "tenant_context": str(api_key_record.tenant_context)
-            if api_key_record.tenant_context
-            else None,
-            "scopes": api_key_record.scopes or [],
-            "service_account": api_key_record.service_account,
+            key: api_key_info[key]
+            for key in (
+                "api_key_id",
+                "key_id",
+                "user_id",
+                "tenant_context",
+                "scopes",
+                "service_account",
+            )
         }
 
     except HTTPException:
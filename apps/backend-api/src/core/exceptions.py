@@ -66,3 +66,31 @@ class DatabaseError(CXGError):
         detail: dict[str, Any] | None = None,
     ):
         super().__init__(message=message, code="DATABASE_ERROR", detail=detail)
+
+
+class ServiceUnavailableError(CXGError):
+    """일시적 과부하 예외 (잠시 후 재시도 가능)"""
+
+    def __init__(
+        self,
+        message: str = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요",
+        detail: dict[str, Any] | None = None,
+    ):
+        super().__init__(message=message, code="SERVICE_UNAVAILABLE", detail=detail)
+
+
+class RateLimitExceededError(CXGError):
+    """요청 한도 초과 (retry_after초 후 재시도 가능)"""
+
+    def __init__(
+        self,
+        message: str = "요청 한도를 초과했습니다. 잠시 후 다시 시도해 주세요",
+        retry_after: float = 0.0,
+        detail: dict[str, Any] | None = None,
+    ):
+        self.retry_after = retry_after
+        super().__init__(
+            message=message,
+            code="RATE_LIMIT_EXCEEDED",
+            detail={**(detail or {}), "retry_after": retry_after},
+        )
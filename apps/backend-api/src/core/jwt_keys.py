@@ -0,0 +1,232 @@
+"""JWT 서명 키 관리 (비대칭 서명 + kid 기반 키 교체 + 검증 결과 캐시)
+
+서명 방식:
+    - 비대칭(RS256/ES256 등): settings.jwt_keys_dir의 PEM 키로 서명하고,
+      공개키는 /.well-known/jwks.json으로 공개합니다 (웹 앱 등에서 오프라인 검증 가능).
+    - 대칭(HS256, 개발 기본값): jwt_keys_dir가 비어 있으면 settings.secret_key로 서명합니다.
+
+키 디렉토리 구성:
+    <kid>.pem       개인키 (서명 + 검증)
+    <kid>.pub.pem   공개키 (검증 전용, 교체된 이전 키)
+
+키 교체 절차:
+    1. 새 개인키를 <새 kid>.pem으로 추가하고 JWT_ACTIVE_KID를 새 kid로 지정
+       (지정하지 않으면 이름순으로 마지막 개인키가 서명 키)
+    2. 이전 키는 Refresh Token 수명(7일) 동안 <이전 kid>.pub.pem으로 남겨 검증만 허용
+    3. 이후 이전 키 파일 삭제
+
+검증 결과 캐시:
+    서명 검증을 통과한 토큰은 토큰 해시(SHA-256) → 페이로드로 exp까지 캐시하여,
+    같은 토큰의 반복 요청은 딕셔너리 조회로 끝납니다 (LRU, 최대 cache_size개).
+    키 목록에서 제거된 kid의 토큰은 캐시에 있어도 거부됩니다.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from jose import JWTError, jwk, jwt
+
+from .config import settings
+from .logging import get_logger
+
+
+logger = get_logger("jwt_keys")
+
+# 대칭 키(secret_key) 사용 시 kid
+SYMMETRIC_KID = "default"
+
+
+@dataclass(frozen=True)
+class JwtKey:
+    """JWT 서명/검증 키"""
+
+    kid: str
+    algorithm: str
+    verify_key: str  # 공개키 PEM (대칭 키는 secret)
+    signing_key: str | None = None  # 개인키 PEM (검증 전용 키는 None)
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm.startswith("HS")
+
+
+def _public_pem(private_pem: bytes) -> str:
+    private_key = serialization.load_pem_private_key(private_pem, password=None)
+    return (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+class JwtKeySet:
+    """
+    JWT 키 집합 (서명 키 1개 + 검증 키 여러 개)
+
+    verify()는 이벤트 루프와 스레드 풀 양쪽에서 호출될 수 있으므로 캐시 접근을 잠급니다.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "HS256",
+        secret_key: str = "",
+        keys_dir: str = "",
+        active_kid: str = "",
+        cache_size: int = 10_000,
+    ):
+        """
+        Args:
+            algorithm: 서명 알고리즘 (HS256, RS256, ES256 등)
+            secret_key: 대칭 키 (keys_dir가 비어 있을 때 사용)
+            keys_dir: PEM 키 디렉토리 (비대칭 서명)
+            active_kid: 서명에 사용할 kid (비어 있으면 이름순 마지막 개인키)
+            cache_size: 검증된 토큰 캐시 최대 항목 수
+        """
+        self.algorithm = algorithm
+        self.secret_key = secret_key
+        self.keys_dir = keys_dir
+        self.active_kid = active_kid
+        self.cache_size = cache_size
+
+        self._keys: dict[str, JwtKey] = {}
+        self._signing_key: JwtKey | None = None
+        self._verified: OrderedDict[bytes, tuple[float, str, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+        self.load()
+
+    # ==================== 키 로드 ====================
+
+    def load(self) -> None:
+        """키 디렉토리(또는 대칭 키)에서 키 집합 다시 읽기"""
+        keys: dict[str, JwtKey] = {}
+
+        if not self.keys_dir:
+            keys[SYMMETRIC_KID] = JwtKey(
+                kid=SYMMETRIC_KID,
+                algorithm=self.algorithm,
+                verify_key=self.secret_key,
+                signing_key=self.secret_key,
+            )
+        else:
+            if self.algorithm.startswith("HS"):
+                raise ValueError(
+                    "JWT 키 디렉토리 사용 시 비대칭 알고리즘(RS256, ES256 등)이 필요합니다"
+                )
+
+            for path in sorted(Path(self.keys_dir).glob("*.pem")):
+                if path.name.endswith(".pub.pem"):
+                    kid = path.name.removesuffix(".pub.pem")
+                    keys.setdefault(
+                        kid, JwtKey(kid=kid, algorithm=self.algorithm, verify_key=path.read_text())
+                    )
+                else:
+                    kid = path.name.removesuffix(".pem")
+                    private_pem = path.read_bytes()
+                    keys[kid] = JwtKey(
+                        kid=kid,
+                        algorithm=self.algorithm,
+                        verify_key=_public_pem(private_pem),
+                        signing_key=private_pem.decode(),
+                    )
+
+        signing_kids = [kid for kid, key in keys.items() if key.signing_key]
+        active_kid = self.active_kid or (signing_kids[-1] if signing_kids else "")
+        if active_kid not in signing_kids:
+            raise ValueError(f"JWT 서명 키를 찾을 수 없습니다: {active_kid or self.keys_dir}")
+
+        with self._lock:
+            self._keys = keys
+            self._signing_key = keys[active_kid]
+
+        logger.info(f"JWT 키 로드: 서명 kid={active_kid}, 검증 kid={sorted(keys)}")
+
+    # ==================== 서명/검증 ====================
+
+    def sign(self, claims: dict[str, Any]) -> str:
+        """클레임 서명 (헤더에 kid 포함)"""
+        key = self._signing_key
+        if key is None or key.signing_key is None:
+            raise RuntimeError("JWT 서명 키가 로드되지 않았습니다")
+        return jwt.encode(
+            claims, key.signing_key, algorithm=key.algorithm, headers={"kid": key.kid}
+        )
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """
+        토큰 서명/만료 검증 (검증 결과 캐시 사용)
+
+        Returns:
+            토큰 페이로드 (복사본)
+
+        Raises:
+            JWTError: 서명 불일치, 만료, 알 수 없는 kid
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+
+        # 1. 검증된 토큰 캐시 (exp 이전 + kid가 아직 키 집합에 있을 때만)
+        with self._lock:
+            entry = self._verified.get(digest)
+            if entry is not None:
+                exp, kid, payload = entry
+                if exp > time.time() and kid in self._keys:
+                    self._verified.move_to_end(digest)
+                    self.hits += 1
+                    return dict(payload)
+                self._verified.pop(digest, None)
+            self.misses += 1
+
+        # 2. kid로 검증 키 선택 (kid 없는 이전 토큰은 대칭 키로 검증)
+        kid = jwt.get_unverified_header(token).get("kid") or SYMMETRIC_KID
+        key = self._keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown key id: {kid}")
+
+        # 3. 전체 검증 (서명, exp 등)
+        payload = jwt.decode(token, key.verify_key, algorithms=[key.algorithm])
+
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            with self._lock:
+                self._verified[digest] = (float(exp), kid, payload)
+                while len(self._verified) > self.cache_size:
+                    self._verified.popitem(last=False)
+
+        return dict(payload)
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """공개키 집합 (JWKS, 대칭 키는 제외)"""
+        keys = []
+        for key in self._keys.values():
+            if key.is_symmetric:
+                continue
+            public_jwk = jwk.construct(key.verify_key, key.algorithm).to_dict()
+            keys.append({**public_jwk, "kid": key.kid, "use": "sig", "alg": key.algorithm})
+        return {"keys": keys}
+
+    def clear_cache(self) -> None:
+        """검증된 토큰 캐시 비우기"""
+        with self._lock:
+            self._verified.clear()
+
+
+jwt_key_set = JwtKeySet(
+    algorithm=settings.algorithm,
+    secret_key=settings.secret_key,
+    keys_dir=settings.jwt_keys_dir,
+    active_kid=settings.jwt_active_kid,
+    cache_size=settings.jwt_verified_cache_size,
+)
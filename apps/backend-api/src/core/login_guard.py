@@ -0,0 +1,183 @@
+"""로그인 무차별 대입(brute-force) 방어
+
+로그인 실패 횟수를 사용자명/IP별 Redis 카운터로 추적하고, 임계값을 넘으면
+지수적으로 늘어나는 시간 동안 로그인을 차단합니다.
+
+    1. check(): 잠금 여부 확인 (비밀번호 검증 전에 수행, 잠금 중이면 bcrypt 생략)
+    2. register_failure(): 실패 카운터 증가, 임계값 이상이면 잠금
+       잠금 시간 = base_delay * 2^(실패 횟수 - 임계값), 최대 max_delay
+    3. register_success(): 사용자명 카운터/잠금 해제 (IP 카운터는 유지)
+
+실패 카운터는 window초 동안 실패가 없으면 만료됩니다.
+idam.users에는 잠금이 새로 시작될 때만 failed_login_attempts/locked_until을
+기록하므로, 대량 로그인 실패가 사용자 행 UPDATE를 만들지 않습니다.
+
+Redis 장애 시에는 잠금 없이 동작합니다 (users.locked_until 검사는 유지).
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .config import settings
+from .logging import get_logger
+from .redis import get_redis
+
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+
+logger = get_logger("login_guard")
+
+KEY_PREFIX = "login:"
+
+# KEYS: 사용자 실패 카운터, IP 실패 카운터, 사용자 잠금, IP 잠금
+# ARGV: window, 사용자 임계값, IP 임계값, base_delay, max_delay
+# 반환: {사용자 실패 횟수, 사용자 잠금 시간(초, 새 잠금일 때만), IP 실패 횟수, IP 잠금 시간}
+_FAILURE_SCRIPT = """
+local window = tonumber(ARGV[1])
+local base = tonumber(ARGV[4])
+local max_delay = tonumber(ARGV[5])
+local result = {}
+
+for i = 1, 2 do
+  local threshold = tonumber(ARGV[i + 1])
+  local count = redis.call('INCR', KEYS[i])
+  local lock_ttl = 0
+
+  if count >= threshold then
+    lock_ttl = math.floor(math.min(base * 2 ^ (count - threshold), max_delay))
+    -- 이미 잠긴 경우(동시 요청)는 새 잠금으로 보지 않음
+    if not redis.call('SET', KEYS[i + 2], count, 'EX', lock_ttl, 'NX') then
+      lock_ttl = 0
+    end
+  end
+
+  -- 잠금 기간 동안 카운터가 만료되지 않도록 유지 (다음 잠금 시간 계산용)
+  redis.call('EXPIRE', KEYS[i], window + lock_ttl)
+  result[#result + 1] = count
+  result[#result + 1] = lock_ttl
+end
+
+return result
+"""
+
+
+@dataclass(frozen=True)
+class LoginFailure:
+    """로그인 실패 기록 결과"""
+
+    user_failures: int = 0
+    user_lock_seconds: int = 0  # 이번 실패로 사용자명 잠금이 시작된 경우 잠금 시간
+    ip_failures: int = 0
+    ip_lock_seconds: int = 0  # 이번 실패로 IP 잠금이 시작된 경우 잠금 시간
+
+    @property
+    def user_locked(self) -> bool:
+        """사용자명 잠금이 새로 시작되었는지 여부 (users 테이블 기록 대상)"""
+        return self.user_lock_seconds > 0
+
+
+class LoginGuard:
+    """사용자명/IP별 로그인 실패 추적"""
+
+    def __init__(
+        self,
+        redis_factory: Callable[[], Redis] = get_redis,
+        window: int = 900,
+        user_threshold: int = 5,
+        ip_threshold: int = 20,
+        base_delay: int = 30,
+        max_delay: int = 3600,
+    ):
+        """
+        Args:
+            redis_factory: Redis 클라이언트를 반환하는 함수
+            window: 실패 카운터 유지 시간 (초)
+            user_threshold: 사용자명 잠금 임계값 (연속 실패 횟수)
+            ip_threshold: IP 잠금 임계값 (연속 실패 횟수)
+            base_delay: 최초 잠금 시간 (초)
+            max_delay: 최대 잠금 시간 (초)
+        """
+        self._redis_factory = redis_factory
+        self.window = window
+        self.user_threshold = user_threshold
+        self.ip_threshold = ip_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._failure_script: AsyncScript | None = None
+
+    @staticmethod
+    def _keys(username: str, ip_address: str) -> list[str]:
+        return [
+            f"{KEY_PREFIX}fail:user:{username}",
+            f"{KEY_PREFIX}fail:ip:{ip_address}",
+            f"{KEY_PREFIX}lock:user:{username}",
+            f"{KEY_PREFIX}lock:ip:{ip_address}",
+        ]
+
+    async def check(self, username: str, ip_address: str) -> float:
+        """
+        잠금 여부 확인
+
+        Returns:
+            남은 잠금 시간 (초, 잠금이 없으면 0)
+        """
+        _, _, user_lock, ip_lock = self._keys(username, ip_address)
+        try:
+            async with self._redis_factory().pipeline(transaction=False) as pipe:
+                pipe.pttl(user_lock)
+                pipe.pttl(ip_lock)
+                ttls = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"로그인 잠금 확인 실패 (잠금 없이 진행): {e}")
+            return 0.0
+
+        return max([ttl / 1000 for ttl in ttls if ttl > 0], default=0.0)
+
+    async def register_failure(self, username: str, ip_address: str) -> LoginFailure:
+        """로그인 실패 기록 (사용자명/IP 카운터 증가 + 필요 시 잠금)"""
+        args = [
+            self.window,
+            self.user_threshold,
+            self.ip_threshold,
+            self.base_delay,
+            self.max_delay,
+        ]
+        try:
+            redis = self._redis_factory()
+            # 스크립트 SHA 등록 후 EVALSHA (스크립트 본문은 최초 1회/NOSCRIPT 시에만 전송)
+            if self._failure_script is None:
+                self._failure_script = redis.register_script(_FAILURE_SCRIPT)
+            result = await self._failure_script(
+                keys=self._keys(username, ip_address), args=args, client=redis
+            )
+        except RedisError as e:
+            logger.warning(f"로그인 실패 기록 실패: {e}")
+            return LoginFailure()
+
+        user_failures, user_lock, ip_failures, ip_lock = (int(v) for v in result)
+        if ip_lock:
+            logger.warning(f"로그인 실패 누적으로 IP 잠금: {ip_address} ({ip_lock}s)")
+        return LoginFailure(user_failures, user_lock, ip_failures, ip_lock)
+
+    async def register_success(self, username: str) -> None:
+        """로그인 성공 시 사용자명 카운터/잠금 해제"""
+        user_fail, _, user_lock, _ = self._keys(username, "")
+        try:
+            await self._redis_factory().delete(user_fail, user_lock)
+        except RedisError as e:
+            logger.warning(f"로그인 실패 카운터 초기화 실패: {e}")
+
+
+login_guard = LoginGuard(
+    window=settings.login_lockout_window,
+    user_threshold=settings.login_lockout_threshold,
+    ip_threshold=settings.login_lockout_ip_threshold,
+    base_delay=settings.login_lockout_base_delay,
+    max_delay=settings.login_lockout_max_delay,
+)
@@ -0,0 +1,236 @@
+"""로그인 이력 write-behind 버퍼
+
+로그인 시도마다 idam.login_logs에 INSERT + 커밋하면 대량 로그인 시도
+(credential stuffing) 시 요청 수만큼 쓰기 트랜잭션이 발생합니다.
+로그인 처리 중에는 메모리 버퍼에 추가만 하고, 백그라운드 태스크가 모아서
+executemany INSERT로 일괄 기록합니다.
+
+    1. add(): 버퍼에 이력 추가 (I/O 없음, 문자열은 컬럼 길이로 자름)
+    2. 주기(flush_interval) 또는 batch_size 도달 시 flush()
+    3. flush(): batch_size 단위 executemany INSERT + 커밋
+    4. 종료 시 남은 이력 flush
+
+유실 상한:
+    - 프로세스 비정상 종료 시 최대 flush_interval 동안의 이력만 유실
+    - 기록 실패(DB 장애) 시 버퍼 앞쪽으로 되돌려 다음 주기에 재시도
+    - 데이터 오류로 배치가 실패하면 행 단위로 다시 기록하고, 계속 실패하는 행만
+      로그를 남기고 버림 (한 행 때문에 버퍼 전체가 막히지 않도록)
+    - 버퍼가 max_pending을 넘으면 새 이력을 버리고 건수를 기록 (메모리 상한)
+"""
+
+import asyncio
+import contextlib
+import ipaddress
+from functools import cache
+from typing import Any
+
+from sqlalchemy import String, insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from .config import settings
+from .logging import get_logger
+
+
+logger = get_logger("login_log_buffer")
+
+# INET 컬럼에 저장할 수 없는 주소(예: "unknown") 대체값
+UNKNOWN_IP = "0.0.0.0"
+
+# 재시도해도 같은 행에서 다시 실패하는 오류 (길이 초과, 제약 조건 위반 등)
+ROW_ERRORS = (DataError, IntegrityError)
+
+
+def normalize_ip(value: str | None) -> str:
+    """INET 컬럼에 저장 가능한 IP 문자열 반환 (잘못된 값은 0.0.0.0)"""
+    if value:
+        try:
+            return str(ipaddress.ip_address(value))
+        except ValueError:
+            pass
+    return UNKNOWN_IP
+
+
+@cache
+def column_lengths() -> dict[str, int]:
+    """login_logs 문자열 컬럼의 최대 길이 (컬럼명 → 길이)"""
+    from src.models.manager.idam.login_log import LoginLog
+
+    return {
+        column.name: column.type.length
+        for column in LoginLog.__table__.columns
+        if isinstance(column.type, String) and column.type.length
+    }
+
+
+class LoginLogBuffer:
+    """
+    로그인 이력 버퍼
+
+    이벤트 루프 단일 스레드에서만 접근하므로 잠금이 필요 없습니다.
+    """
+
+    def __init__(
+        self, flush_interval: float = 1.0, batch_size: int = 500, max_pending: int = 10_000
+    ):
+        """
+        Args:
+            flush_interval: 주기적 기록 간격 (초, 비정상 종료 시 유실 상한)
+            batch_size: INSERT 1회당 최대 행 수 (도달 시 주기와 무관하게 기록)
+            max_pending: 버퍼 최대 행 수 (초과분은 버림)
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self._pending: list[dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # 통계
+        self.written_rows = 0
+        self.failed_flushes = 0
+        self.dropped_rows = 0
+        self.rejected_rows = 0
+
+    @property
+    def pending_rows(self) -> int:
+        return len(self._pending)
+
+    def add(self, **values: Any) -> None:
+        """
+        로그인 이력 1건 추가 (LoginLog 컬럼명 = 값)
+
+        ip_address는 INET 컬럼에 맞게 정규화하고, 문자열은 컬럼 길이로 자릅니다
+        (인증 전 입력인 username 등이 길어도 배치 INSERT가 실패하지 않도록).
+        """
+        if len(self._pending) >= self.max_pending:
+            self.dropped_rows += 1
+            if self.dropped_rows % 1000 == 1:
+                logger.warning(f"로그인 이력 버퍼 초과, 버린 이력: {self.dropped_rows}")
+            return
+
+        values["ip_address"] = normalize_ip(values.get("ip_address"))
+        for name, length in column_lengths().items():
+            value = values.get(name)
+            if isinstance(value, str) and len(value) > length:
+                values[name] = value[:length]
+        self._pending.append(values)
+
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    # ==================== 기록 ====================
+
+    async def flush(self) -> int:
+        """
+        버퍼의 이력을 DB에 일괄 기록
+
+        Returns:
+            기록된 행 수
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._pending:
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+                try:
+                    await self._write(batch)
+                except ROW_ERRORS as e:
+                    # 일부 행의 데이터 오류: 행 단위로 다시 기록하고 실패한 행만 버림
+                    logger.warning(f"로그인 이력 배치 기록 실패, 행 단위로 재시도: {e}")
+                    rows_written, remaining = await self._write_rows(batch)
+                    written += rows_written
+                    if remaining:
+                        self._restore(remaining)
+                        break
+                    continue
+                except Exception as e:
+                    logger.warning(f"로그인 이력 기록 실패, 다음 주기에 재시도: {e}")
+                    self._restore(batch)
+                    break
+
+                written += len(batch)
+
+            self.written_rows += written
+            return written
+
+    async def _write_rows(self, batch: list[dict[str, Any]]) -> tuple[int, list[dict[str, Any]]]:
+        """
+        행 단위 기록 (데이터 오류 행은 로그를 남기고 버림)
+
+        Returns:
+            (기록된 행 수, DB 장애로 기록하지 못한 나머지 행)
+        """
+        written = 0
+        for index, row in enumerate(batch):
+            try:
+                await self._write([row])
+            except ROW_ERRORS as e:
+                self.rejected_rows += 1
+                logger.error(f"로그인 이력 기록 불가, 버림: {row!r} ({e})")
+                continue
+            except Exception as e:
+                logger.warning(f"로그인 이력 기록 실패, 다음 주기에 재시도: {e}")
+                return written, batch[index:]
+            written += 1
+        return written, []
+
+    def _restore(self, rows: list[dict[str, Any]]) -> None:
+        """기록하지 못한 행을 버퍼 앞쪽으로 되돌림 (상한 초과분은 최신 이력부터 버림)"""
+        self.failed_flushes += 1
+        self._pending[:0] = rows
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[-overflow:]
+            self.dropped_rows += overflow
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        from src.models.manager.idam.login_log import LoginLog
+
+        from .database import ManagerSessionLocal
+
+        # 컬럼 기본값(id 등)은 Core INSERT에서도 적용됨
+        async with ManagerSessionLocal() as session:
+            await session.execute(insert(LoginLog.__table__), batch)
+            await session.commit()
+
+    # ==================== 백그라운드 태스크 ====================
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """주기적 기록 시작 (애플리케이션 시작 시)"""
+        if self._flusher is None:
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기적 기록 종료 + 남은 이력 기록 (애플리케이션 종료 시)"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    def metrics(self) -> dict[str, int]:
+        """버퍼/기록 통계"""
+        return {
+            "pending_rows": self.pending_rows,
+            "written_rows": self.written_rows,
+            "failed_flushes": self.failed_flushes,
+            "dropped_rows": self.dropped_rows,
+            "rejected_rows": self.rejected_rows,
+        }
+
+
+login_log_buffer = LoginLogBuffer(
+    flush_interval=settings.login_log_flush_interval,
+    batch_size=settings.login_log_batch_size,
+    max_pending=settings.login_log_max_pending,
+)
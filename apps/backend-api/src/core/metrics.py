@@ -0,0 +1,282 @@
+"""애플리케이션 메트릭 (Prometheus 텍스트 형식) + SQL 실행 계측
+
+외부 의존성 없이 카운터/히스토그램을 프로세스 메모리에 집계하고,
+/metrics 엔드포인트에서 Prometheus 텍스트 형식(0.0.4)으로 노출합니다.
+값은 워커 프로세스별이므로 Prometheus에서 인스턴스(워커)별로 수집합니다.
+
+SQL 계측:
+    instrument_engine()으로 엔진에 before/after_cursor_execute 이벤트를 등록하면,
+    track_queries()로 시작한 추적 범위(ContextVar) 안에서 실행된 SQL의 횟수/시간이
+    QueryTracker에 기록됩니다. 추적 범위 밖의 SQL(백그라운드 flush 등)은 무시합니다.
+
+    SQL은 set_current_field()로 지정된 필드(리졸버)로 집계되며,
+    같은 필드에서 같은 문장이 반복 실행되면 N+1 후보로 판단합니다.
+"""
+
+import math
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+# 기본 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, value: float = 1.0) -> None:
+        """카운터 증가 (레이블 값은 labelnames 순서)"""
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + value
+
+    def samples(self) -> Iterator[str]:
+        for labelvalues, value in sorted(self._values.items()):
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 → [버킷별 개수..., 합계, 개수]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """관측값 기록 (레이블 값은 labelnames 순서)"""
+        data = self._values.get(labelvalues)
+        if data is None:
+            data = self._values[labelvalues] = [0.0] * (len(self.buckets) + 2)
+
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                data[i] += 1
+                break
+        data[-2] += value
+        data[-1] += 1
+
+    def samples(self) -> Iterator[str]:
+        for labelvalues, data in sorted(self._values.items()):
+            cumulative = 0.0
+            for i, bound in enumerate((*self.buckets, math.inf)):
+                # +Inf 버킷은 전체 개수
+                cumulative = cumulative + data[i] if i < len(self.buckets) else data[-1]
+                le = f'le="{_format_value(bound)}"'
+                labels = _format_labels(self.labelnames, labelvalues, le)
+                yield f"{self.name}_bucket{labels} {_format_value(cumulative)}"
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {_format_value(data[-2])}"
+            yield f"{self.name}_count{labels} {_format_value(data[-1])}"
+
+
+class MetricsRegistry:
+    """
+    메트릭 레지스트리
+
+    카운터/히스토그램 외에, 컴포넌트의 metrics() 같은 dict 반환 함수를
+    수집기(collector)로 등록하면 렌더링 시점의 값을 게이지로 노출합니다.
+    """
+
+    def __init__(self, prefix: str = "cxg"):
+        self.prefix = prefix
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """카운터 등록 (같은 이름이면 기존 카운터 반환)"""
+        full_name = f"{self.prefix}_{name}"
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = self._metrics[full_name] = Counter(full_name, documentation, labelnames)
+        assert isinstance(metric, Counter)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """히스토그램 등록 (같은 이름이면 기존 히스토그램 반환)"""
+        full_name = f"{self.prefix}_{name}"
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = Histogram(full_name, documentation, labelnames, buckets)
+            self._metrics[full_name] = metric
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def register_collector(self, name: str, collect: Callable[[], dict[str, Any]]) -> None:
+        """
+        게이지 수집기 등록
+
+        Args:
+            name: 메트릭 이름 접두사 (예: "password_hash" → cxg_password_hash_<키>)
+            collect: 숫자 값 dict를 반환하는 함수 (예: hashing_executor.metrics)
+        """
+        self._collectors[name] = collect
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines: list[str] = []
+
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+
+        for name, collect in self._collectors.items():
+            for key, value in collect().items():
+                if not isinstance(value, int | float):
+                    continue
+                metric_name = f"{self.prefix}_{name}_{key}"
+                lines.append(f"# TYPE {metric_name} gauge")
+                lines.append(f"{metric_name} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+# ==================== SQL 실행 계측 ====================
+
+
+@dataclass
+class FieldStats:
+    """필드(리졸버)별 집계"""
+
+    calls: int = 0
+    duration: float = 0.0
+    sql_count: int = 0
+    sql_duration: float = 0.0
+
+
+@dataclass
+class QueryTracker:
+    """추적 범위(GraphQL 작업 1회) 동안의 SQL/리졸버 집계"""
+
+    sql_count: int = 0
+    sql_duration: float = 0.0
+    fields: dict[str, FieldStats] = field(default_factory=dict)
+    # (필드, SQL 문장) → 실행 횟수 (N+1 탐지용)
+    repeats: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    def field_stats(self, field_name: str) -> FieldStats:
+        stats = self.fields.get(field_name)
+        if stats is None:
+            stats = self.fields[field_name] = FieldStats()
+        return stats
+
+    def record_query(self, statement: str, duration: float, field_name: str | None) -> None:
+        self.sql_count += 1
+        self.sql_duration += duration
+        if field_name is None:
+            return
+
+        stats = self.field_stats(field_name)
+        stats.sql_count += 1
+        stats.sql_duration += duration
+        key = (field_name, statement)
+        self.repeats[key] = self.repeats.get(key, 0) + 1
+
+    def n_plus_one(self, threshold: int) -> list[tuple[str, str, int]]:
+        """같은 필드에서 threshold회를 초과해 반복된 문장 (필드, 문장, 횟수)"""
+        return [
+            (field_name, statement, count)
+            for (field_name, statement), count in self.repeats.items()
+            if count > threshold
+        ]
+
+
+_current_tracker: ContextVar[QueryTracker | None] = ContextVar("query_tracker", default=None)
+_current_field: ContextVar[str | None] = ContextVar("query_field", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryTracker]:
+    """현재 컨텍스트(와 여기서 생성되는 태스크)에서 실행되는 SQL 추적"""
+    tracker = QueryTracker()
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
+def set_current_field(field_name: str) -> Token:
+    """이후 실행되는 SQL을 집계할 필드 지정 (reset_current_field로 복원)"""
+    return _current_field.set(field_name)
+
+
+def reset_current_field(token: Token) -> None:
+    _current_field.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_tracker.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracker = _current_tracker.get()
+    if tracker is None:
+        return
+    starts = conn.info.get("query_start_time")
+    if not starts:
+        return
+    tracker.record_query(statement, time.perf_counter() - starts.pop(), _current_field.get())
+
+
+def instrument_engine(engine: AsyncEngine) -> AsyncEngine:
+    """엔진에 SQL 실행 계측 이벤트 등록 (엔진 생성 직후 1회)"""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
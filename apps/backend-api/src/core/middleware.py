@@ -1,35 +1,82 @@
-"""미들웨어"""
+"""미들웨어
 
+BaseHTTPMiddleware는 요청마다 태스크/스트림 래핑을 추가하고 스트리밍 응답을
+버퍼링하므로, 요청 ID/처리 시간 측정은 순수 ASGI 미들웨어 하나로 처리합니다.
+
+응답 헤더:
+    - X-Request-ID: 요청 ID (클라이언트가 보낸 값이 유효하면 그대로 사용)
+    - X-Process-Time: 처리 시간 (초, 기존 헤더 호환)
+    - Server-Timing: app;dur=<ms> + add_server_timing()으로 추가한 항목
+
+처리 시간은 응답 헤더 전송 시점까지의 시간입니다 (스트리밍 응답 본문 전송 시간 제외).
+"""
+
+import re
 import time
 import uuid
-from collections.abc import Callable
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 외부에서 전달된 요청 ID 허용 형식 (헤더 주입 방지)
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+def add_server_timing(scope: Scope, name: str, duration_ms: float) -> None:
+    """
+    Server-Timing 항목 추가 (응답 헤더 전송 전에 호출)
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+    Args:
+        scope: ASGI scope (Request.scope)
+        name: 항목 이름 (예: "db")
+        duration_ms: 소요 시간 (ms)
+    """
+    scope.setdefault("state", {}).setdefault("server_timing", []).append((name, duration_ms))
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """요청 ID 추가 미들웨어"""
+class RequestContextMiddleware:
+    """요청 ID 부여 + 처리 시간 측정 (순수 ASGI)"""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        start = time.perf_counter_ns()
+        request_id = self._request_id(scope)
 
+        # request.state.request_id로 조회 가능
+        state: dict[str, Any] = scope.setdefault("state", {})
+        state["request_id"] = request_id
 
-class TimingMiddleware(BaseHTTPMiddleware):
-    """요청 처리 시간 측정 미들웨어"""
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+                timings = [f"app;dur={elapsed_ms:.3f}"]
+                timings += [f"{name};dur={dur:.3f}" for name, dur in state.get("server_timing", ())]
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+                headers = list(message.get("headers", ()))
+                headers += [
+                    (b"x-request-id", request_id.encode()),
+                    (b"x-process-time", f"{elapsed_ms / 1000:.6f}".encode()),
+                    (b"server-timing", ", ".join(timings).encode()),
+                ]
+                message = {**message, "headers": headers}
 
-        response = await call_next(request)
+            await send(message)
 
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        await self.app(scope, receive, send_wrapper)
 
-        return response
+    @staticmethod
+    def _request_id(scope: Scope) -> str:
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.match(request_id):
+                    return request_id
+                break
+        return str(uuid.uuid4())
@@ -0,0 +1,79 @@
+"""사용자 권한 집합 캐시
+
+권한 검증(BaseResourcePermission)이 필드마다 user_roles/role_permissions를
+조회하지 않도록 사용자별 권한 집합을 로컬 LRU + Redis에 캐시합니다.
+(캐시 구조와 무효화 방식은 src/core/cache.py 참고)
+
+무효화:
+    - 사용자-역할, 역할-권한 매핑 및 역할 상태 변경: invalidate_after_commit()으로
+      영향받는 사용자만 커밋 이후 무효화
+    - 권한 정의 수정(상태/resource/action): 여러 역할에 걸치므로 invalidate_all_after_commit()
+    - 사용자-역할 만료(expires_at): 가장 이른 만료 시각까지만 캐시 (이벤트 없이 만료되므로)
+
+사용 예:
+    permissions = await permission_cache.get(user_id, lambda: load_grants(db, user_id))
+    if "user:read" in permissions:
+        ...
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime
+
+from .cache import TwoLevelCache
+
+
+def _encode(permissions: frozenset[str]) -> str:
+    return json.dumps(sorted(permissions))
+
+
+def _decode(raw: str) -> frozenset[str]:
+    return frozenset(json.loads(raw))
+
+
+class PermissionCache(TwoLevelCache[frozenset[str]]):
+    """
+    사용자별 권한 집합 캐시
+
+    권한 집합은 "resource:action" 형식(소문자) 문자열의 frozenset입니다.
+    권한이 없는 사용자(빈 집합)도 캐시합니다.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("local_ttl", 30.0)
+        kwargs.setdefault("redis_ttl", 600)
+        super().__init__("perm:user", encode=_encode, decode=_decode, **kwargs)
+
+    async def get(  # type: ignore[override]
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[tuple[Iterable[str], datetime | None]]],
+    ) -> frozenset[str]:
+        """
+        사용자 권한 집합 조회
+
+        Args:
+            key: 사용자 ID
+            loader: 캐시 미스 시 (권한 키 목록, 가장 이른 역할 만료 시각)을 조회하는 함수
+
+        Returns:
+            권한 집합 ("resource:action")
+        """
+        key = str(key)
+        permissions = await self.get_cached(key)
+        if permissions is not None:
+            return permissions
+
+        keys, expires_at = await loader()
+        permissions = frozenset(keys)
+        if expires_at is None:
+            await self.set(key, permissions)
+        else:
+            # 역할 만료 시각 이후에는 캐시된 권한을 사용하지 않음
+            ttl = (expires_at - datetime.now(UTC)).total_seconds()
+            if ttl > 0:
+                await self.set(key, permissions, ttl=ttl)
+        return permissions
+
+
+permission_cache = PermissionCache()
@@ -0,0 +1,525 @@
+"""Redis 기반 요청 제한 (슬라이딩 윈도우 + 토큰 버킷)
+
+API 키/사용자/테넌트별 요청 수를 Redis Lua 스크립트로 원자적으로 판정합니다.
+
+    1. 슬라이딩 윈도우: 최근 window초 동안의 요청 시각을 ZSET에 기록, limit 이하만 허용
+    2. 토큰 버킷: 윈도우 한도 초과 시 burst_allowance만큼 추가 허용
+       (burst / window 속도로 다시 채워짐)
+    3. 한 요청에 적용되는 규칙을 한 번의 스크립트 호출로 판정
+       (차단 시 어떤 규칙에도 기록하지 않으므로 차단된 요청은 한도를 소모하지 않음)
+
+규칙 출처:
+    - intg.rate_limits (api_key_id / user_id / tenant_id 대상, 로컬 LRU + Redis 캐시)
+    - idam.api_keys.rate_limit_per_minute/hour/day (API 키 기본 한도)
+
+초과 시 조치 (action_on_exceed):
+    - BLOCK: 즉시 거절 (RateLimitExceededError, HTTP 429)
+    - THROTTLE: 대기 시간이 짧으면 기다린 후 한 번 재시도, 길면 거절
+    - LOG_ONLY: 허용하고 경고 로그만 남김
+
+규칙별 total_requests/blocked_requests/current_usage는 Redis 해시에 누적한 뒤
+주기적으로 intg.rate_limits에 반영합니다.
+
+Redis 장애 시에는 요청을 허용합니다 (가용성 우선).
+
+사용 예:
+    rules = await rate_limiter.rules_for_user(user_id)
+    await rate_limiter.enforce(rules)
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, func, or_, select, update
+
+from .cache import TwoLevelCache
+from .config import settings
+from .exceptions import RateLimitExceededError
+from .logging import get_logger
+from .redis import get_redis
+
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+
+logger = get_logger("rate_limit")
+
+# limit_type별 기본 윈도우 (window_size가 없을 때)
+LIMIT_TYPE_WINDOWS = {
+    "REQUESTS_PER_MINUTE": 60,
+    "REQUESTS_PER_HOUR": 3600,
+    "REQUESTS_PER_DAY": 86400,
+}
+
+KEY_PREFIX = "ratelimit:"
+STATS_KEY = "ratelimit:stats"
+
+# KEYS: 규칙마다 (윈도우 ZSET, 버킷 HASH), 마지막은 통계 HASH
+# ARGV: now_ms, member, 규칙 수, 규칙마다 (limit, window_ms, burst, enforce, rule_id)
+# 반환: {허용 여부, 재시도 대기(ms), 최소 잔여 요청 수, 차단 규칙 번호(1부터, 없으면 0),
+#        LOG_ONLY 초과 규칙 번호(없으면 0)}
+_HIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local member = ARGV[2]
+local n = tonumber(ARGV[3])
+local stats = KEYS[#KEYS]
+
+local modes = {}
+local tokens = {}
+local blocked_by = 0
+local soft_exceeded = 0
+local retry = 0
+local remaining = -1
+
+-- 1. 판정 (기록 없음)
+for i = 1, n do
+  local a = 3 + (i - 1) * 5
+  local limit = tonumber(ARGV[a + 1])
+  local window = tonumber(ARGV[a + 2])
+  local burst = tonumber(ARGV[a + 3])
+  local enforce = ARGV[a + 4]
+  local wkey = KEYS[(i - 1) * 2 + 1]
+  local bkey = KEYS[(i - 1) * 2 + 2]
+
+  redis.call('ZREMRANGEBYSCORE', wkey, '-inf', now - window)
+  local count = redis.call('ZCARD', wkey)
+
+  local available = 0
+  if burst > 0 then
+    local state = redis.call('HMGET', bkey, 'tokens', 'ts')
+    if state[1] then
+      local elapsed = math.max(0, now - tonumber(state[2]))
+      available = math.min(burst, tonumber(state[1]) + elapsed * burst / window)
+    else
+      available = burst
+    end
+  end
+  tokens[i] = available
+
+  if count < limit then
+    modes[i] = 0
+  elseif available >= 1 then
+    modes[i] = 1
+  else
+    modes[i] = -1
+  end
+
+  local left = math.max(0, limit - count - 1)
+  if remaining < 0 or left < remaining then
+    remaining = left
+  end
+
+  if modes[i] == -1 and enforce ~= '1' then
+    soft_exceeded = i
+  end
+
+  if modes[i] == -1 and enforce == '1' then
+    local wait = window
+    local oldest = redis.call('ZRANGE', wkey, 0, 0, 'WITHSCORES')
+    if oldest[2] then
+      wait = tonumber(oldest[2]) + window - now
+    end
+    if burst > 0 then
+      wait = math.min(wait, math.ceil((1 - available) * window / burst))
+    end
+    if blocked_by == 0 or wait > retry then
+      blocked_by = i
+      retry = wait
+    end
+  end
+end
+
+-- 2. 기록 (차단 시 한도를 소모하지 않음)
+for i = 1, n do
+  local a = 3 + (i - 1) * 5
+  local window = tonumber(ARGV[a + 2])
+  local enforce = ARGV[a + 4]
+  local rule_id = ARGV[a + 5]
+  local wkey = KEYS[(i - 1) * 2 + 1]
+  local bkey = KEYS[(i - 1) * 2 + 2]
+
+  if blocked_by == 0 then
+    if modes[i] == 1 then
+      redis.call('HSET', bkey, 'tokens', tokens[i] - 1, 'ts', now)
+      redis.call('PEXPIRE', bkey, window)
+    else
+      redis.call('ZADD', wkey, now, member)
+      redis.call('PEXPIRE', wkey, window)
+    end
+  end
+
+  if rule_id ~= '' then
+    redis.call('HINCRBY', stats, rule_id .. ':total', 1)
+    if modes[i] == -1 and enforce == '1' then
+      redis.call('HINCRBY', stats, rule_id .. ':blocked', 1)
+    end
+    redis.call('HSET', stats, rule_id .. ':usage', redis.call('ZCARD', wkey))
+  end
+end
+
+if blocked_by > 0 then
+  return {0, retry, 0, blocked_by, soft_exceeded}
+end
+return {1, 0, math.max(remaining, 0), 0, soft_exceeded}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """요청 제한 규칙"""
+
+    subject: str  # 제한 대상 (예: "apikey:<id>", "user:<id>", "tenant:<code>")
+    limit: int  # 윈도우 내 허용 요청 수
+    window: int  # 윈도우 크기 (초)
+    burst: int = 0  # 한도 초과 시 추가 허용량 (토큰 버킷)
+    action: str = "BLOCK"  # BLOCK | THROTTLE | LOG_ONLY
+    rule_id: str | None = None  # intg.rate_limits.id (통계 반영용, 기본 한도는 None)
+
+    @property
+    def redis_key(self) -> str:
+        return f"{KEY_PREFIX}{self.subject}:{self.rule_id or self.window}"
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """요청 제한 판정 결과"""
+
+    allowed: bool
+    retry_after: float = 0.0  # 초
+    remaining: int | None = None  # 가장 여유가 적은 규칙의 잔여 요청 수
+    rule: RateLimitRule | None = None  # 차단한 규칙
+
+
+def rate_limit_row_to_rule(subject: str, row: Any) -> RateLimitRule | None:
+    """intg.rate_limits 행을 규칙으로 변환 (대역폭 등 요청 수 이외 유형은 None)"""
+    window = row.window_size or LIMIT_TYPE_WINDOWS.get(row.limit_type)
+    if row.limit_type not in LIMIT_TYPE_WINDOWS or not window or row.limit_value <= 0:
+        return None
+
+    return RateLimitRule(
+        subject=subject,
+        limit=row.limit_value,
+        window=window,
+        burst=row.burst_allowance or 0,
+        action=row.action_on_exceed,
+        rule_id=str(row.id),
+    )
+
+
+def api_key_default_rules(auth_info: dict[str, Any]) -> list[RateLimitRule]:
+    """API 키 기본 한도 (rate_limit_per_minute/hour/day)"""
+    subject = f"apikey:{auth_info['api_key_id']}"
+    limits = (
+        (auth_info.get("rate_limit_per_minute"), 60),
+        (auth_info.get("rate_limit_per_hour"), 3600),
+        (auth_info.get("rate_limit_per_day"), 86400),
+    )
+    return [
+        RateLimitRule(subject=subject, limit=limit, window=window)
+        for limit, window in limits
+        if limit
+    ]
+
+
+class RateLimiter:
+    """
+    Redis 요청 제한기
+
+    규칙 조회(intg.rate_limits)는 캐시되며, 규칙 변경 시 invalidate_rules()로 무효화합니다.
+    """
+
+    def __init__(
+        self,
+        redis_factory: Callable[[], Redis] = get_redis,
+        clock: Callable[[], float] = time.time,
+        stats_flush_interval: float = 60.0,
+        throttle_max_delay: float = 1.0,
+    ):
+        """
+        Args:
+            redis_factory: Redis 클라이언트를 반환하는 함수
+            clock: 현재 시각(초) 함수 (테스트에서 시간 고정용)
+            stats_flush_interval: 통계 반영 주기 (초)
+            throttle_max_delay: THROTTLE 규칙의 최대 대기 시간 (초, 초과 시 거절)
+        """
+        self._redis_factory = redis_factory
+        self._clock = clock
+        self.stats_flush_interval = stats_flush_interval
+        self.throttle_max_delay = throttle_max_delay
+
+        self.rule_cache: TwoLevelCache[list[dict[str, Any]]] = TwoLevelCache(
+            "ratelimit:rules", redis_factory=redis_factory, local_ttl=30.0, redis_ttl=300
+        )
+        self._hit_script: AsyncScript | None = None
+        self._flusher: asyncio.Task | None = None
+
+    # ==================== 판정 ====================
+
+    async def hit(self, rules: Iterable[RateLimitRule]) -> RateLimitDecision:
+        """
+        요청 1회 판정 + 기록
+
+        Args:
+            rules: 이 요청에 적용되는 규칙 목록
+
+        Returns:
+            판정 결과 (규칙이 없거나 Redis 장애 시 허용)
+        """
+        rule_list = list(rules)
+        if not rule_list:
+            return RateLimitDecision(allowed=True)
+
+        keys: list[str] = []
+        args: list[Any] = [int(self._clock() * 1000), uuid4().hex, len(rule_list)]
+        for rule in rule_list:
+            keys += [f"{rule.redis_key}:w", f"{rule.redis_key}:b"]
+            args += [
+                rule.limit,
+                rule.window * 1000,
+                rule.burst,
+                "0" if rule.action == "LOG_ONLY" else "1",
+                rule.rule_id or "",
+            ]
+        keys.append(STATS_KEY)
+
+        try:
+            redis = self._redis_factory()
+            # 스크립트 SHA 등록 후 EVALSHA (스크립트 본문은 최초 1회/NOSCRIPT 시에만 전송)
+            if self._hit_script is None:
+                self._hit_script = redis.register_script(_HIT_SCRIPT)
+            result = await self._hit_script(keys=keys, args=args, client=redis)
+        except RedisError as e:
+            logger.warning(f"요청 제한 판정 실패 (허용 처리): {e}")
+            return RateLimitDecision(allowed=True)
+
+        allowed, retry_ms, remaining, blocked_by, soft_exceeded = (int(v) for v in result)
+        if soft_exceeded:
+            rule = rule_list[soft_exceeded - 1]
+            logger.warning(f"요청 제한 초과 (LOG_ONLY): {rule.subject} {rule.limit}/{rule.window}s")
+
+        if not allowed:
+            return RateLimitDecision(
+                allowed=False,
+                retry_after=max(retry_ms, 0) / 1000,
+                remaining=0,
+                rule=rule_list[blocked_by - 1],
+            )
+
+        return RateLimitDecision(allowed=True, remaining=remaining)
+
+    async def enforce(self, rules: Iterable[RateLimitRule]) -> RateLimitDecision:
+        """
+        판정 후 초과 시 예외 발생 (THROTTLE 규칙은 짧게 대기 후 한 번 재시도)
+
+        Raises:
+            RateLimitExceededError: 요청 한도 초과
+        """
+        rule_list = list(rules)
+        decision = await self.hit(rule_list)
+
+        if (
+            not decision.allowed
+            and decision.rule is not None
+            and decision.rule.action == "THROTTLE"
+            and decision.retry_after <= self.throttle_max_delay
+        ):
+            await asyncio.sleep(decision.retry_after)
+            decision = await self.hit(rule_list)
+
+        if not decision.allowed:
+            raise RateLimitExceededError(
+                retry_after=decision.retry_after,
+                detail={"subject": decision.rule.subject if decision.rule else None},
+            )
+        return decision
+
+    # ==================== 규칙 조회 ====================
+
+    async def _load_rules(
+        self, subject: str, condition: Any, join_tenant: bool = False
+    ) -> list[dict[str, Any]]:
+        from src.models.manager.intg.rate_limits import RateLimits
+
+        from .database import ManagerSessionLocal
+
+        stmt = select(RateLimits).where(
+            RateLimits.deleted.is_(False),
+            or_(RateLimits.expires_at.is_(None), RateLimits.expires_at > func.now()),
+            condition,
+        )
+        if join_tenant:
+            from src.models.manager.tnnt.tenant import Tenant
+
+            stmt = stmt.join(Tenant, Tenant.id == RateLimits.tenant_id)
+
+        async with ManagerSessionLocal() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+
+        rules = (rate_limit_row_to_rule(subject, row) for row in rows)
+        return [asdict(rule) for rule in rules if rule is not None]
+
+    async def _rules(
+        self, subject: str, loader: Callable[[], Awaitable[list[dict[str, Any]]]]
+    ) -> list[RateLimitRule]:
+        cached = await self.rule_cache.get(subject, loader)
+        return [RateLimitRule(**rule) for rule in cached or []]
+
+    async def rules_for_api_key(self, auth_info: dict[str, Any]) -> list[RateLimitRule]:
+        """API 키 규칙 (기본 한도 + intg.rate_limits)"""
+        from src.models.manager.intg.rate_limits import RateLimits
+
+        subject = f"apikey:{auth_info['api_key_id']}"
+        api_key_id = UUID(auth_info["api_key_id"])
+        rules = await self._rules(
+            subject, lambda: self._load_rules(subject, RateLimits.api_key_id == api_key_id)
+        )
+        return api_key_default_rules(auth_info) + rules
+
+    async def rules_for_user(self, user_id: str) -> list[RateLimitRule]:
+        """사용자 규칙 (intg.rate_limits)"""
+        from src.models.manager.intg.rate_limits import RateLimits
+
+        subject = f"user:{user_id}"
+        return await self._rules(
+            subject, lambda: self._load_rules(subject, RateLimits.user_id == UUID(user_id))
+        )
+
+    async def rules_for_tenant(self, tenant_key: str) -> list[RateLimitRule]:
+        """테넌트 규칙 (intg.rate_limits, tenant_key = 테넌트 코드)"""
+        from src.models.manager.tnnt.tenant import Tenant
+
+        subject = f"tenant:{tenant_key}"
+        return await self._rules(
+            subject,
+            lambda: self._load_rules(subject, Tenant.code == tenant_key, join_tenant=True),
+        )
+
+    async def invalidate_rules(self, subjects: Iterable[str]) -> None:
+        """규칙 캐시 무효화 (intg.rate_limits 변경 후)"""
+        await self.rule_cache.invalidate(subjects)
+
+    # ==================== 통계 반영 ====================
+
+    async def collect_stats(self) -> dict[str, dict[str, int]]:
+        """
+        누적 통계를 Redis에서 꺼냄 (조회와 삭제를 원자적으로 수행)
+
+        Returns:
+            {rule_id: {"total": n, "blocked": n, "usage": n}}
+        """
+        async with self._redis_factory().pipeline(transaction=True) as pipe:
+            pipe.hgetall(STATS_KEY)
+            pipe.delete(STATS_KEY)
+            raw, _ = await pipe.execute()
+
+        stats: dict[str, dict[str, int]] = defaultdict(dict)
+        for field, value in raw.items():
+            rule_id, _, name = field.rpartition(":")
+            stats[rule_id][name] = int(value)
+        return dict(stats)
+
+    async def _restore_stats(self, stats: dict[str, dict[str, int]]) -> None:
+        async with self._redis_factory().pipeline(transaction=False) as pipe:
+            for rule_id, values in stats.items():
+                for name in ("total", "blocked"):
+                    if values.get(name):
+                        pipe.hincrby(STATS_KEY, f"{rule_id}:{name}", values[name])
+            await pipe.execute()
+
+    async def _write_stats(self, stats: dict[str, dict[str, int]]) -> None:
+        from src.models.manager.intg.rate_limits import RateLimits
+
+        from .database import ManagerSessionLocal
+
+        table = RateLimits.__table__
+        now = datetime.now(UTC)
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                total_requests=func.coalesce(table.c.total_requests, 0) + bindparam("b_total"),
+                blocked_requests=func.coalesce(table.c.blocked_requests, 0)
+                + bindparam("b_blocked"),
+                current_usage=bindparam("b_usage"),
+                window_start=func.now() - func.make_interval(0, 0, 0, 0, 0, 0, table.c.window_size),
+                last_access_at=now,
+            )
+        )
+        params = [
+            {
+                "b_id": UUID(rule_id),
+                "b_total": values.get("total", 0),
+                "b_blocked": values.get("blocked", 0),
+                "b_usage": values.get("usage", 0),
+            }
+            for rule_id, values in sorted(stats.items())
+        ]
+
+        async with ManagerSessionLocal() as session:
+            await session.execute(stmt, params)
+            await session.commit()
+
+    async def flush_stats(self) -> int:
+        """
+        누적 통계를 intg.rate_limits에 반영
+
+        Returns:
+            반영된 규칙 수 (실패 시 통계를 Redis로 되돌리고 0)
+        """
+        try:
+            stats = await self.collect_stats()
+        except RedisError as e:
+            logger.warning(f"요청 제한 통계 조회 실패: {e}")
+            return 0
+
+        if not stats:
+            return 0
+
+        try:
+            await self._write_stats(stats)
+        except Exception as e:
+            logger.warning(f"요청 제한 통계 반영 실패, 다음 주기에 재시도: {e}")
+            try:
+                await self._restore_stats(stats)
+            except RedisError as restore_error:
+                logger.warning(f"요청 제한 통계 복원 실패: {restore_error}")
+            return 0
+
+        return len(stats)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.stats_flush_interval)
+            await self.flush_stats()
+
+    def start(self) -> None:
+        """규칙 캐시 구독 + 통계 반영 시작 (애플리케이션 시작 시)"""
+        self.rule_cache.start()
+        if self._flusher is None:
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """통계 반영 종료 + 남은 통계 반영 (애플리케이션 종료 시)"""
+        await self.rule_cache.stop()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush_stats()
+
+
+rate_limiter = RateLimiter(
+    stats_flush_interval=settings.rate_limit_stats_flush_interval,
+    throttle_max_delay=settings.rate_limit_throttle_max_delay,
+)
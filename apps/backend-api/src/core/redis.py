@@ -0,0 +1,41 @@
+"""Redis 클라이언트
+
+애플리케이션 전역에서 공유하는 비동기 Redis 클라이언트를 제공합니다.
+클라이언트는 최초 사용 시 생성되며(지연 생성), 애플리케이션 종료 시 close_redis()로 정리합니다.
+
+Redis는 캐시/카운터 용도로만 사용하므로, 호출자는 Redis 장애 시
+원본(DB) 조회로 대체하도록 구현해야 합니다.
+
+사용 예:
+    redis = get_redis()
+    await redis.set("key", "value", ex=60)
+"""
+
+from redis.asyncio import Redis
+
+from .config import settings
+
+
+_client: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """공용 Redis 클라이언트 반환 (없으면 생성)"""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(settings.redis_url, decode_responses=True)
+    return _client
+
+
+def set_redis(client: Redis | None) -> None:
+    """공용 Redis 클라이언트 교체 (테스트에서 fakeredis 주입용)"""
+    global _client
+    _client = client
+
+
+async def close_redis() -> None:
+    """Redis 연결 종료 (애플리케이션 종료 시)"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
@@ -1,14 +1,25 @@
 """인증 및 보안 관련 유틸리티"""
 
+import asyncio
+import hashlib
+import hmac
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
 from passlib.context import CryptContext
 
 from .config import settings
+from .exceptions import ServiceUnavailableError
+from .jwt_keys import jwt_key_set
+
+
+T = TypeVar("T")
 
 
 # 비밀번호 해싱 컨텍스트
@@ -44,6 +55,131 @@ def get_password_hash(password: str) -> str:
 hash_password = get_password_hash
 
 
+# ==================== bcrypt 전용 실행기 ====================
+
+
+class HashingExecutor:
+    """
+    bcrypt 해싱/검증 전용 제한 스레드 풀
+
+    12라운드 bcrypt는 호출당 수백 ms의 CPU를 사용하므로, 이벤트 루프에서 직접
+    실행하면 해당 워커의 모든 요청이 멈춥니다. 이 실행기는:
+
+    - 전용 스레드 풀(max_workers)에서 실행하여 이벤트 루프를 막지 않고
+      (bcrypt는 해싱 중 GIL을 해제하므로 스레드 간 병렬 실행 가능)
+    - 실행 중 + 대기 중 작업이 max_workers + max_pending을 넘으면 즉시 거절하여
+      로그인 폭주 시 대기열이 무한정 늘어나지 않도록 합니다
+
+    카운터는 이벤트 루프 스레드에서만 갱신되므로 별도 락이 필요 없습니다.
+
+    사용 예:
+        ok = await hashing_executor.run(verify_password, plain, hashed)
+        print(hashing_executor.metrics())
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+
+        # 메트릭
+        self.in_flight = 0  # 실행 중 + 대기 중 작업 수
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0  # 제출 ~ 실행 시작 대기 시간 합계
+        self.total_run_seconds = 0.0  # 실행 시간 합계
+
+    @property
+    def queue_depth(self) -> int:
+        """스레드를 기다리는 작업 수"""
+        return max(0, self.in_flight - self.max_workers)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        해싱 함수를 전용 스레드 풀에서 실행
+
+        Raises:
+            ServiceUnavailableError: 대기열이 가득 찬 경우
+        """
+        if self.in_flight >= self.max_workers + self.max_pending:
+            self.rejected += 1
+            raise ServiceUnavailableError(
+                message="인증 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요",
+                detail={"queue_depth": self.queue_depth},
+            )
+
+        self.in_flight += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        submitted_at = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = fn(*args)
+            return result, started_at - submitted_at, time.perf_counter() - started_at
+
+        try:
+            loop = asyncio.get_running_loop()
+            result, wait_seconds, run_seconds = await loop.run_in_executor(
+                self._get_executor(), timed
+            )
+        finally:
+            self.in_flight -= 1
+
+        self.completed += 1
+        self.total_wait_seconds += wait_seconds
+        self.total_run_seconds += run_seconds
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        """실행기 메트릭 (모니터링용)"""
+        completed = self.completed or 1
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": self.total_wait_seconds / completed * 1000,
+            "avg_run_ms": self.total_run_seconds / completed * 1000,
+        }
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료 (애플리케이션 종료 시)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hashing_executor = HashingExecutor(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (bcrypt 전용 스레드 풀에서 실행)"""
+    return await hashing_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (bcrypt 전용 스레드 풀에서 실행)"""
+    return await hashing_executor.run(get_password_hash, password)
+
+
+# Alias for GraphQL compatibility
+hash_password_async = get_password_hash_async
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Access Token 생성"""
     to_encode = data.copy()
@@ -54,7 +190,7 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
         expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
 
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt_key_set.sign(to_encode)
 
     return encoded_jwt
 
@@ -64,7 +200,7 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=7)
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt_key_set.sign(to_encode)
 
     return encoded_jwt
 
@@ -78,7 +214,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict[str, Any
     )
 
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt_key_set.verify(token)
         user_id: str | None = payload.get("sub")
         token_type: str | None = payload.get("type")
 
@@ -106,6 +242,8 @@ def decode_access_token(token: str) -> dict[str, Any]:
     """
     Access Token 디코드 (GraphQL용)
 
+    같은 토큰의 반복 요청은 검증된 토큰 캐시에서 조회합니다 (jwt_keys.JwtKeySet).
+
     Returns:
         dict: 토큰 페이로드
 
@@ -113,7 +251,7 @@ def decode_access_token(token: str) -> dict[str, Any]:
         Exception: 토큰이 유효하지 않은 경우
     """
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt_key_set.verify(token)
         token_type: str | None = payload.get("type")
 
         if token_type != "access":
@@ -124,7 +262,7 @@ def decode_access_token(token: str) -> dict[str, Any]:
         raise Exception(f"Invalid token: {str(e)}") from e
 
 
-def generate_api_key(key_type: str = "usr") -> tuple[str, str]:
+async def generate_api_key(key_type: str = "usr") -> tuple[str, str]:
     """
     API 키 생성
 
@@ -137,7 +275,7 @@ def generate_api_key(key_type: str = "usr") -> tuple[str, str]:
         - secret_hash: DB에 저장할 해시값
 
     Example:
-        >>> api_key, key_hash = generate_api_key("usr")
+        >>> api_key, key_hash = await generate_api_key("usr")
         >>> print(api_key)
         cxg_usr_XyZ789AbC123...
         >>> # key_hash는 DB의 key_hash 필드에 저장
@@ -150,12 +288,30 @@ def generate_api_key(key_type: str = "usr") -> tuple[str, str]:
     # 전체 API 키 생성
     full_api_key = f"cxg_{key_type}_{secret}"
 
-    # 시크릿 해시 (DB 저장용)
-    secret_hash = get_password_hash(secret)
+    # 시크릿 해시 (DB 저장용, bcrypt 전용 스레드 풀)
+    secret_hash = await get_password_hash_async(secret)
 
     return full_api_key, secret_hash
 
 
+def compute_api_key_digest(api_key: str) -> str:
+    """
+    API 키 조회용 digest 계산 (HMAC-SHA256)
+
+    API 키는 충분히 긴 무작위 값이므로 느린 해시(bcrypt) 없이 서버 비밀키 기반
+    HMAC만으로 안전하게 저장/조회할 수 있습니다. digest는 유니크 인덱스로 조회하며,
+    DB가 유출되어도 서버 비밀키 없이는 원본 키를 검증할 수 없습니다.
+
+    Args:
+        api_key: 전체 API 키 (cxg_<type>_<secret>)
+
+    Returns:
+        str: 64자 hex digest
+    """
+    secret = settings.api_key_digest_secret or settings.secret_key
+    return hmac.new(secret.encode(), api_key.encode(), hashlib.sha256).hexdigest()
+
+
 def generate_verification_code(length: int = 6) -> str:
     """
     검증 코드 생성 (이메일 인증, MFA 등)
@@ -0,0 +1,286 @@
+"""로그인 세션 검증 (검증 캐시 + 폐기 목록 + 활동 시각 일괄 반영)
+
+JWT에 포함된 session_id로 idam.sessions의 상태/만료를 요청마다 확인하되,
+정상 상태에서는 DB 조회 없이 끝나도록 구성합니다.
+
+    1. 로컬 LRU 적중 → 만료 시각만 확인 (I/O 없음)
+    2. 로컬 미스 → Redis 폐기 목록 확인 후 검증 캐시(Redis → DB) 조회
+    3. 폐기(revoke_session) 커밋 후 폐기 목록에 추가 + 모든 워커의 검증 캐시 무효화 (pub/sub)
+
+폐기 목록은 세션별 Redis 키(session:revoked:<session_id>)로, 세션 만료 시각까지만
+유지됩니다. 로컬 캐시에 남은 항목은 pub/sub 무효화로 제거되며, 메시지가 유실돼도
+로컬 TTL(30초) 이후에는 폐기 목록 확인을 거칩니다.
+
+last_activity_at은 세션별로 activity_interval초에 한 번만 기록 대상으로 모은 뒤
+백그라운드에서 일괄 UPDATE합니다 (워커 간 중복은 Redis SET NX로 제거).
+"""
+
+import asyncio
+import contextlib
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .cache import TwoLevelCache
+from .config import settings
+from .logging import get_logger
+from .redis import get_redis
+
+
+logger = get_logger("session_auth")
+
+REVOKED_PREFIX = "session:revoked:"
+ACTIVITY_PREFIX = "session:activity:"
+
+# 검증된 세션 캐시 (session_id → 세션 정보, ACTIVE 세션만 저장)
+session_cache: TwoLevelCache[dict[str, Any]] = TwoLevelCache(
+    "session:valid", local_ttl=30.0, redis_ttl=300
+)
+
+
+def session_to_auth_info(record: Any) -> dict[str, Any]:
+    """Session 모델을 캐시 가능한 검증 정보(dict)로 변환"""
+    return {
+        "id": str(record.id),
+        "user_id": str(record.user_id),
+        "expires_at": record.expires_at.isoformat(),
+    }
+
+
+async def _load_session(db_factory: Any, session_id: str) -> dict[str, Any] | None:
+    from src.models.manager.idam.session import Session
+
+    async with db_factory() as db:
+        result = await db.execute(
+            select(Session.id, Session.user_id, Session.expires_at).where(
+                Session.session_id == session_id, Session.status == "ACTIVE"
+            )
+        )
+        row = result.first()
+    return session_to_auth_info(row) if row is not None else None
+
+
+async def is_session_revoked(session_id: str) -> bool:
+    """Redis 폐기 목록 확인 (Redis 장애 시 False)"""
+    try:
+        return bool(await get_redis().exists(REVOKED_PREFIX + session_id))
+    except RedisError as e:
+        logger.warning(f"세션 폐기 목록 조회 실패: {e}")
+        return False
+
+
+async def validate_session(session_id: str, user_id: str) -> bool:
+    """
+    세션 유효성 검증
+
+    Args:
+        session_id: JWT의 session_id
+        user_id: JWT의 sub (세션 소유자와 일치해야 함)
+
+    Returns:
+        ACTIVE 상태이고 만료되지 않았으며 소유자가 일치하면 True
+    """
+    from .database import ManagerSessionLocal
+
+    # 1. 로컬 LRU (폐기 시 pub/sub으로 제거됨)
+    info = session_cache.get_local(session_id)
+
+    # 2. 로컬 미스 → 폐기 목록 확인 후 Redis/DB 조회
+    if info is None:
+        if await is_session_revoked(session_id):
+            return False
+        info = await session_cache.get(
+            session_id, lambda: _load_session(ManagerSessionLocal, session_id)
+        )
+
+    if info is None or info["user_id"] != user_id:
+        return False
+
+    if datetime.now(UTC) > datetime.fromisoformat(info["expires_at"]):
+        return False
+
+    session_activity_recorder.touch(session_id)
+    return True
+
+
+async def revoke_session_cache(session_ids: list[str], expires_at: datetime | None = None) -> None:
+    """
+    세션 폐기 전파 (폐기 목록 추가 + 검증 캐시 무효화)
+
+    Args:
+        session_ids: 폐기된 세션의 session_id 목록
+        expires_at: 세션 만료 시각 (폐기 목록 유지 기한, 없으면 최대 세션 수명)
+    """
+    if not session_ids:
+        return
+
+    ttl = settings.session_revocation_ttl
+    if expires_at is not None:
+        ttl = max(1, int((expires_at - datetime.now(UTC)).total_seconds()))
+
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.set(REVOKED_PREFIX + session_id, 1, ex=ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"세션 폐기 목록 추가 실패: {e}")
+
+    await session_cache.invalidate(session_ids)
+
+
+async def _revoke_committed(sessions: set[tuple[str, datetime | None]]) -> None:
+    for session_id, expires_at in sessions:
+        await revoke_session_cache([session_id], expires_at)
+
+
+def revoke_session_after_commit(
+    db: AsyncSession, session_id: str, expires_at: datetime | None = None
+) -> None:
+    """
+    세션 폐기 전파 예약 (폐기 변경을 커밋하기 전에 호출, 실제 커밋 이후 전파)
+
+    Args:
+        db: 세션 상태를 변경하는 Manager DB 세션
+        session_id: 폐기할 세션의 session_id
+        expires_at: 세션 만료 시각
+    """
+    from .database import run_after_commit
+
+    run_after_commit(db, "session:revoke", [(session_id, expires_at)], _revoke_committed)
+
+
+async def revoke_session_by_pk(db: AsyncSession, session_pk: Any) -> None:
+    """
+    세션 PK로 폐기 전파 예약 (세션 삭제를 커밋하기 전에 호출)
+
+    Args:
+        db: Manager DB 세션
+        session_pk: idam.sessions.id
+    """
+    from src.models.manager.idam.session import Session
+
+    row = (
+        await db.execute(
+            select(Session.session_id, Session.expires_at).where(Session.id == session_pk)
+        )
+    ).first()
+    if row is not None:
+        revoke_session_after_commit(db, row.session_id, row.expires_at)
+
+
+class SessionActivityRecorder:
+    """
+    세션 활동 시각(last_activity_at) 일괄 반영
+
+    세션별로 interval초에 한 번만 기록 대상으로 모으고, flush_interval마다
+    단일 executemany UPDATE로 반영합니다.
+    """
+
+    def __init__(self, interval: float = 60.0, flush_interval: float = 10.0):
+        """
+        Args:
+            interval: 세션별 최소 기록 간격 (초)
+            flush_interval: 일괄 반영 주기 (초)
+        """
+        self.interval = interval
+        self.flush_interval = flush_interval
+
+        self._last_touched: dict[str, float] = {}
+        self._pending: dict[str, datetime] = {}
+        self._flusher: asyncio.Task | None = None
+
+    def touch(self, session_id: str) -> None:
+        """세션 활동 기록 (interval 이내 재호출은 무시, I/O 없음)"""
+        now = time.monotonic()
+        last = self._last_touched.get(session_id)
+        if last is not None and now - last < self.interval:
+            return
+
+        self._last_touched[session_id] = now
+        self._pending[session_id] = datetime.now(UTC)
+
+    async def _claim(self, session_ids: list[str]) -> list[str]:
+        """다른 워커가 interval 내에 기록한 세션 제외 (Redis SET NX)"""
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for session_id in session_ids:
+                    pipe.set(ACTIVITY_PREFIX + session_id, 1, ex=int(self.interval), nx=True)
+                claimed = await pipe.execute()
+        except RedisError:
+            return session_ids
+        return [sid for sid, ok in zip(session_ids, claimed, strict=True) if ok]
+
+    async def flush(self) -> int:
+        """
+        모아둔 활동 시각을 DB에 일괄 반영
+
+        Returns:
+            반영 대상 세션 수
+        """
+        # 기록 간격이 지난 항목은 정리 (메모리 상한)
+        cutoff = time.monotonic() - self.interval
+        self._last_touched = {
+            sid: touched for sid, touched in self._last_touched.items() if touched >= cutoff
+        }
+
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        session_ids = await self._claim(sorted(batch))
+        if not session_ids:
+            return 0
+
+        from src.models.manager.idam.session import Session
+
+        from .database import ManagerSessionLocal
+
+        table = Session.__table__
+        activity_at = bindparam("b_activity_at", type_=table.c.last_activity_at.type)
+        stmt = (
+            update(table)
+            .where(table.c.session_id == bindparam("b_session_id"))
+            .values(last_activity_at=func.greatest(table.c.last_activity_at, activity_at))
+        )
+        params = [{"b_session_id": sid, "b_activity_at": batch[sid]} for sid in session_ids]
+
+        try:
+            async with ManagerSessionLocal() as db:
+                await db.execute(stmt, params)
+                await db.commit()
+        except Exception as e:
+            # 활동 시각은 다음 요청에서 다시 기록되므로 재시도하지 않음
+            logger.warning(f"세션 활동 시각 반영 실패: {e}")
+            return 0
+
+        return len(session_ids)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """주기적 반영 시작 (애플리케이션 시작 시)"""
+        if self._flusher is None:
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기적 반영 종료 + 남은 항목 반영 (애플리케이션 종료 시)"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+
+session_activity_recorder = SessionActivityRecorder(
+    interval=settings.session_activity_interval,
+    flush_interval=settings.session_activity_flush_interval,
+)
@@ -1,7 +1,16 @@
 """GraphQL 공통 모듈"""
 
-from .base_loader import BaseDataLoader, BaseFieldLoader
-from .base_mutations import create_entity, delete_entity, update_entity
+from .base_loader import BaseDataLoader, BaseFieldLoader, BaseRelationLoader, SessionSource
+from .base_mutations import (
+    MAX_BULK_INPUTS,
+    create_entities,
+    create_entity,
+    delete_entity,
+    update_entities,
+    update_entity,
+    upsert_entities,
+    validate_bulk_inputs,
+)
 from .base_permissions import (
     BaseResourcePermission,
     CanCreate,
@@ -13,15 +22,38 @@ from .base_permissions import (
     IsMaster,
     create_permission_class,
 )
-from .base_queries import get_by_id, get_count, get_list
-from .base_types import ErrorResponse, PageInfo, SuccessResponse
+from .base_queries import (
+    MAX_PAGE_SIZE,
+    CountMode,
+    clamp_limit,
+    decode_cursor,
+    encode_cursor,
+    get_by_id,
+    get_count,
+    get_estimated_count,
+    get_list,
+    get_list_with_count,
+    to_connection,
+    validate_first,
+)
+from .base_types import (
+    BulkResult,
+    BulkRowError,
+    Connection,
+    Edge,
+    ErrorResponse,
+    PageInfo,
+    SuccessResponse,
+)
 from .converters import (
     model_to_graphql_converter,
     safe_id_to_uuid,
     safe_uuid_to_id,
 )
 from .interfaces import Node
+from .projection import get_projection_keys, get_projection_options, get_selected_field_names
 from .scalars import DateTimeScalar, DecimalScalar, UUIDScalar
+from .statement_cache import StatementCache, statement_cache
 
 
 __all__ = [
@@ -33,19 +65,39 @@ __all__ = [
     "Node",
     # Base Types
     "PageInfo",
+    "Connection",
+    "Edge",
     "SuccessResponse",
     "ErrorResponse",
+    "BulkResult",
+    "BulkRowError",
     # Loaders
     "BaseDataLoader",
     "BaseFieldLoader",
+    "BaseRelationLoader",
+    "SessionSource",
     # Queries
     "get_by_id",
     "get_list",
     "get_count",
+    "get_list_with_count",
+    "get_estimated_count",
+    "CountMode",
+    "to_connection",
+    "validate_first",
+    "clamp_limit",
+    "MAX_PAGE_SIZE",
+    "encode_cursor",
+    "decode_cursor",
     # Mutations
     "create_entity",
     "update_entity",
     "delete_entity",
+    "create_entities",
+    "upsert_entities",
+    "update_entities",
+    "validate_bulk_inputs",
+    "MAX_BULK_INPUTS",
     # Permissions
     "BaseResourcePermission",
     "CanView",
@@ -56,6 +108,13 @@ __all__ = [
     "IsAuthenticated",
     "IsMaster",
     "create_permission_class",
+    # Projection
+    "get_projection_keys",
+    "get_projection_options",
+    "get_selected_field_names",
+    # Statement Cache
+    "StatementCache",
+    "statement_cache",
     # Converters
     "model_to_graphql_converter",
     "safe_uuid_to_id",
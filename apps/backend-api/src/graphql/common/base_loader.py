@@ -1,20 +1,77 @@
 """GraphQL 공통 DataLoader 베이스 클래스
 
 DataLoader 패턴을 구현하여 N+1 쿼리 문제를 해결합니다.
-여러 개의 단일 조회를 하나의 배치 쿼리로 최적화합니다.
+aiodataloader 기반으로 동작하며, 같은 이벤트 루프 틱(tick)에 요청된
+여러 개의 단일 조회를 하나의 배치 쿼리(IN 조건)로 합칩니다.
+
+특징:
+    - 배치 로딩: 같은 틱의 load() 호출을 모아 한 번의 쿼리로 조회
+    - 요청 단위 캐시: 같은 키는 요청(로더 인스턴스) 내에서 한 번만 조회
+    - 최대 배치 크기: IN 절이 과도하게 커지지 않도록 max_batch_size 단위로 분할
+    - 세션 직렬화: 분할된 배치와 같은 틱의 다른 로더는 각각 별도 태스크로 실행되므로,
+      요청 세션(AsyncSession은 동시 실행 불가)에 저장한 락으로 한 번에 하나씩 조회
+
+로더는 요청마다 새로 생성해야 합니다 (src/graphql/loaders.py의 create_loaders 참고).
 """
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
+from aiodataloader import DataLoader
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 ModelType = TypeVar("ModelType")
 
+# 세션 또는 세션을 반환하는 함수 (GraphQL 컨텍스트의 지연 생성 세션용)
+SessionSource = AsyncSession | Callable[[], AsyncSession]
+
+# 기본 최대 배치 크기 (IN 절 파라미터 수 제한)
+DEFAULT_MAX_BATCH_SIZE = 500
+
+# 세션별 배치 조회 락 (session.info 키)
+_SESSION_LOCK_KEY = "dataloader_lock"
+
+
+def _to_uuid(key: Any) -> UUID:
+    """문자열/UUID 키를 UUID로 변환"""
+    return key if isinstance(key, UUID) else UUID(str(key))
+
+
+def _cache_key(key: Any) -> str:
+    """UUID와 문자열 키가 같은 캐시 항목을 사용하도록 정규화"""
+    return str(key)
+
+
+class _SessionLoader(DataLoader):
+    """세션 지연 접근을 지원하는 DataLoader 공통 부모"""
+
+    max_batch_size = DEFAULT_MAX_BATCH_SIZE
 
-class BaseDataLoader(Generic[ModelType]):
+    def __init__(self, db: SessionSource, max_batch_size: int | None = None):
+        super().__init__(max_batch_size=max_batch_size, get_cache_key=_cache_key)
+        self._db = db
+
+    @property
+    def db(self) -> AsyncSession:
+        """배치 실행 시점의 DB 세션"""
+        return self._db() if callable(self._db) else self._db
+
+    async def execute(self, stmt: Any) -> Any:
+        """배치 조회 실행 (같은 세션을 쓰는 로더/배치 간 직렬화)"""
+        db = self.db
+        lock = db.info.get(_SESSION_LOCK_KEY)
+        if lock is None:
+            lock = db.info[_SESSION_LOCK_KEY] = asyncio.Lock()
+        async with lock:
+            return await db.execute(stmt)
+
+
+class BaseDataLoader(_SessionLoader, Generic[ModelType]):
     """
     기본 DataLoader 클래스 (N+1 쿼리 최적화)
 
@@ -25,69 +82,59 @@ class BaseDataLoader(Generic[ModelType]):
         loader = BaseDataLoader(db, User)
         users = await loader.load_many(["id1", "id2", "id3"])
         user = await loader.load("id1")
+
+        # 같은 틱의 load() 호출은 하나의 쿼리로 합쳐집니다
+        user1, user2 = await asyncio.gather(loader.load(id1), loader.load(id2))
     """
 
-    def __init__(self, db: AsyncSession, model_class: type[ModelType]):
+    def __init__(
+        self,
+        db: SessionSource,
+        model_class: type[ModelType],
+        conditions: Sequence[Any] = (),
+        max_batch_size: int | None = None,
+    ):
         """
         DataLoader 초기화
 
         Args:
-            db: SQLAlchemy 비동기 세션
+            db: SQLAlchemy 비동기 세션 (또는 세션을 반환하는 함수)
             model_class: 조회할 SQLAlchemy 모델 클래스
+            conditions: 항상 적용할 추가 WHERE 조건 (예: Model.is_active)
+            max_batch_size: 배치당 최대 키 수 (기본값: 500)
         """
-        self.db = db
+        super().__init__(db, max_batch_size)
         self.model_class = model_class
+        self.conditions = tuple(conditions)
 
-    async def load_many(self, ids: list[str]) -> list[ModelType | None]:
+    async def batch_load_fn(self, keys: list[Any]) -> list[ModelType | None]:
         """
         여러 ID를 한 번의 쿼리로 조회 (배치 로딩)
 
         Args:
-            ids: 조회할 ID 목록 (문자열 형식)
+            keys: 조회할 ID 목록 (문자열 또는 UUID)
 
         Returns:
             조회된 모델 목록 (입력 순서 보장)
             - 존재하는 ID: 모델 객체 반환
             - 존재하지 않는 ID: None 반환
-
-        Note:
-            반환되는 리스트의 순서는 입력된 ids 순서와 동일하게 유지됩니다.
         """
-        if not ids:
-            return []
-
-        # 문자열 ID를 UUID로 변환
-        uuids = [UUID(id_) for id_ in ids]
-
         # SQLAlchemy 모델 클래스는 런타임에 id 속성을 가지지만
         # 타입 체커는 이를 알 수 없으므로 type: ignore 사용
         stmt = select(self.model_class).where(
-            self.model_class.id.in_(uuids)  # type: ignore[attr-defined]
+            self.model_class.id.in_([_to_uuid(key) for key in keys]),  # type: ignore[attr-defined]
+            *self.conditions,
         )
-        result = await self.db.execute(stmt)
-        items = result.scalars().all()
+        result = await self.execute(stmt)
 
         # ID를 키로 하는 딕셔너리 생성 (빠른 조회)
-        item_map = {str(item.id): item for item in items}  # type: ignore[attr-defined]
+        item_map = {str(item.id): item for item in result.scalars().all()}  # type: ignore[attr-defined]
 
         # 입력 순서대로 결과 반환 (없는 ID는 None)
-        return [item_map.get(id_) for id_ in ids]
+        return [item_map.get(str(key)) for key in keys]
 
-    async def load(self, id_: str) -> ModelType | None:
-        """
-        단일 ID 조회
-
-        Args:
-            id_: 조회할 ID (문자열 형식)
 
-        Returns:
-            조회된 모델 객체 또는 None
-        """
-        result = await self.load_many([id_])
-        return result[0] if result else None
-
-
-class BaseFieldLoader(Generic[ModelType]):
+class BaseFieldLoader(_SessionLoader, Generic[ModelType]):
     """
     특정 필드로 조회하는 DataLoader
 
@@ -99,20 +146,30 @@ class BaseFieldLoader(Generic[ModelType]):
         user = await loader.load("user1@example.com")
     """
 
-    def __init__(self, db: AsyncSession, model_class: type[ModelType], field_name: str):
+    def __init__(
+        self,
+        db: SessionSource,
+        model_class: type[ModelType],
+        field_name: str,
+        conditions: Sequence[Any] = (),
+        max_batch_size: int | None = None,
+    ):
         """
         필드 기반 DataLoader 초기화
 
         Args:
-            db: SQLAlchemy 비동기 세션
+            db: SQLAlchemy 비동기 세션 (또는 세션을 반환하는 함수)
             model_class: 조회할 SQLAlchemy 모델 클래스
             field_name: 조회에 사용할 필드명 (예: "email", "username")
+            conditions: 항상 적용할 추가 WHERE 조건
+            max_batch_size: 배치당 최대 키 수 (기본값: 500)
         """
-        self.db = db
+        super().__init__(db, max_batch_size)
         self.model_class = model_class
         self.field_name = field_name
+        self.conditions = tuple(conditions)
 
-    async def load_many(self, values: list[Any]) -> list[ModelType | None]:
+    async def batch_load_fn(self, values: list[Any]) -> list[ModelType | None]:
         """
         여러 필드 값을 한 번의 쿼리로 조회
 
@@ -124,33 +181,89 @@ class BaseFieldLoader(Generic[ModelType]):
             - 존재하는 값: 모델 객체 반환
             - 존재하지 않는 값: None 반환
         """
-        if not values:
-            return []
-
-        # 지정된 필드로 조회
         field = getattr(self.model_class, self.field_name)
-        stmt = select(self.model_class).where(field.in_(values))
-        result = await self.db.execute(stmt)
-        items = result.scalars().all()
+        stmt = select(self.model_class).where(field.in_(values), *self.conditions)
+        result = await self.execute(stmt)
 
-        # 필드 값으로 매핑 (getattr는 런타임에 동작)
+        # 필드 값으로 매핑 (UUID/문자열 모두 허용하도록 문자열로 정규화)
         item_map = {
-            getattr(item, self.field_name): item
-            for item in items  # type: ignore[attr-defined]
+            str(getattr(item, self.field_name)): item for item in result.scalars().all()
         }
 
         # 입력 순서대로 결과 반환
-        return [item_map.get(value) for value in values]
+        return [item_map.get(str(value)) for value in values]
+
 
-    async def load(self, value: Any) -> ModelType | None:
+class BaseRelationLoader(_SessionLoader, Generic[ModelType]):
+    """
+    키별 연관 엔티티 목록을 조회하는 DataLoader (1:N, N:M 관계)
+
+    중간 테이블을 JOIN하여 여러 키의 연관 엔티티를 한 번의 쿼리로 조회합니다.
+
+    사용 예:
+        # 사용자별 역할 목록 (UserRole 중간 테이블 경유)
+        loader = BaseRelationLoader(
+            db,
+            Role,
+            key_column=UserRole.user_id,
+            join=(UserRole, UserRole.role_id == Role.id),
+            conditions=[UserRole.status == "ACTIVE"],
+            order_by=[Role.priority],
+        )
+        roles = await loader.load(user_id)  # list[Role]
+    """
+
+    def __init__(
+        self,
+        db: SessionSource,
+        model_class: type[ModelType],
+        key_column: Any,
+        join: tuple[Any, Any] | None = None,
+        conditions: Sequence[Any] = (),
+        order_by: Sequence[Any] = (),
+        max_batch_size: int | None = None,
+    ):
         """
-        단일 필드 값으로 조회
+        관계 DataLoader 초기화
 
         Args:
-            value: 조회할 필드 값
+            db: SQLAlchemy 비동기 세션 (또는 세션을 반환하는 함수)
+            model_class: 조회할(반환할) SQLAlchemy 모델 클래스
+            key_column: 키로 사용할 컬럼 (예: UserRole.user_id)
+            join: (JOIN 대상, ON 조건) 튜플 (중간 테이블 경유 시)
+            conditions: 추가 WHERE 조건
+            order_by: 키별 목록의 정렬 기준
+            max_batch_size: 배치당 최대 키 수 (기본값: 500)
+        """
+        super().__init__(db, max_batch_size)
+        self.model_class = model_class
+        self.key_column = key_column
+        self.join = join
+        self.conditions = tuple(conditions)
+        self.order_by = tuple(order_by)
+
+    async def batch_load_fn(self, keys: list[Any]) -> list[list[ModelType]]:
+        """
+        여러 키의 연관 엔티티 목록을 한 번의 쿼리로 조회
 
         Returns:
-            조회된 모델 객체 또는 None
+            키별 엔티티 목록 (입력 순서 보장, 연관 엔티티가 없으면 빈 리스트)
         """
-        result = await self.load_many([value])
-        return result[0] if result else None
+        stmt = select(self.key_column, self.model_class)
+        if self.join is not None:
+            stmt = stmt.join(*self.join)
+        stmt = stmt.where(
+            self.key_column.in_([_to_uuid(key) for key in keys]),
+            *self.conditions,
+        )
+        if self.order_by:
+            stmt = stmt.order_by(*self.order_by)
+
+        result = await self.execute(stmt)
+
+        # 키별로 그룹핑 (정렬 순서 유지)
+        grouped: dict[str, list[ModelType]] = defaultdict(list)
+        for key, item in result.all():
+            grouped[str(key)].append(item)
+
+        return [grouped.get(str(key), []) for key in keys]
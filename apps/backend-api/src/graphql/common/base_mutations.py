@@ -2,15 +2,26 @@
 
 엔티티의 생성(Create), 수정(Update), 삭제(Delete) 작업을 위한
 재사용 가능한 헬퍼 함수들을 제공합니다.
+
+일괄 처리(create_entities, upsert_entities, update_entities)는 행마다 왕복하지 않고
+청크 단위 다중 행 INSERT ... RETURNING / ON CONFLICT / executemany UPDATE로 처리하며,
+실패한 행만 BulkRowError로 보고합니다.
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.exceptions import ValidationError
+
+from .base_types import BulkResult, BulkRowError
+from .statement_cache import select_by_id_statement
+
 
 ModelType = TypeVar("ModelType")  # SQLAlchemy Model Type
 GraphQLType = TypeVar("GraphQLType")  # GraphQL Type
@@ -65,9 +76,9 @@ async def create_entity(
         before_commit(entity)
 
     # 4. 데이터베이스에 저장
+    # (서버 생성 값(created_at 등)은 eager_defaults로 INSERT ... RETURNING에서 함께 받음)
     db.add(entity)
     await db.commit()
-    await db.refresh(entity)  # DB에서 생성된 값(ID, 타임스탬프 등) 갱신
 
     # 5. GraphQL 타입으로 변환하여 반환
     return to_graphql(entity)
@@ -111,18 +122,12 @@ async def update_entity(
             tenant_id=current_tenant_id  # 추가 필터
         )
     """
-    # 1. 기본 조회 쿼리 구성
-    stmt = select(model_class).where(
-        model_class.id == entity_id  # type: ignore[attr-defined]
-    )
-
-    # 2. 추가 필터 적용 (예: 테넌트 격리, soft delete 체크 등)
-    for field, value in filters.items():
-        if hasattr(model_class, field):
-            stmt = stmt.where(getattr(model_class, field) == value)
+    # 1. 캐시된 ID 조회 문장 구성
+    # 2. 추가 필터 포함 (예: 테넌트 격리, soft delete 체크 등)
+    stmt, params = select_by_id_statement(model_class, entity_id, filters)
 
     # 3. 엔티티 조회
-    result = await db.execute(stmt)
+    result = await db.execute(stmt, params)
     entity = result.scalar_one_or_none()
 
     if not entity:
@@ -149,9 +154,8 @@ async def update_entity(
     if before_commit:
         before_commit(entity)
 
-    # 7. 데이터베이스에 저장
+    # 7. 데이터베이스에 저장 (updated_at은 UPDATE ... RETURNING으로 갱신)
     await db.commit()
-    await db.refresh(entity)
 
     # 8. GraphQL 타입으로 변환하여 반환
     return to_graphql(entity)
@@ -197,18 +201,12 @@ async def delete_entity(
             soft_delete=False
         )
     """
-    # 1. 기본 조회 쿼리 구성
-    stmt = select(model_class).where(
-        model_class.id == entity_id  # type: ignore[attr-defined]
-    )
-
-    # 2. 추가 필터 적용
-    for field, value in filters.items():
-        if hasattr(model_class, field):
-            stmt = stmt.where(getattr(model_class, field) == value)
+    # 1. 캐시된 ID 조회 문장 구성
+    # 2. 추가 필터 포함
+    stmt, params = select_by_id_statement(model_class, entity_id, filters)
 
     # 3. 엔티티 조회
-    result = await db.execute(stmt)
+    result = await db.execute(stmt, params)
     entity = result.scalar_one_or_none()
 
     if not entity:
@@ -225,3 +223,394 @@ async def delete_entity(
         await db.commit()
 
     return True
+
+
+# ==================== 일괄 처리 ====================
+
+
+# 청크당 기본 행 수 (PostgreSQL 바인드 파라미터 한도 안에서 열 수에 따라 줄어듦)
+DEFAULT_BULK_CHUNK_SIZE = 500
+MAX_BIND_PARAMS = 32767
+
+# 일괄 Mutation 한 요청의 최대 입력 수 (inputs 상한)
+MAX_BULK_INPUTS = 1000
+
+# 충돌 시 갱신하지 않는 열 (upsert 기본값)
+_UPSERT_EXCLUDED_COLUMNS = {"id", "created_at", "created_by"}
+
+Row = tuple[int, dict[str, Any]]  # (입력 위치, 열 값)
+
+
+def validate_bulk_inputs(inputs: Sequence[Any], maximum: int = MAX_BULK_INPUTS) -> None:
+    """
+    일괄 Mutation 입력 수 검증
+
+    한 요청의 트랜잭션과 응답이 과도하게 커지지 않도록 일괄 리졸버에서
+    create_entities/upsert_entities/update_entities 호출 전에 사용합니다.
+
+    Args:
+        inputs: 입력 데이터 목록
+        maximum: 최대 입력 수
+
+    Raises:
+        ValidationError: 입력이 maximum개를 넘는 경우
+    """
+    if len(inputs) > maximum:
+        raise ValidationError(
+            message=f"한 번에 최대 {maximum}개까지 처리할 수 있습니다",
+            detail={"count": len(inputs), "max": maximum},
+        )
+
+
+def _input_to_dict(input_data: Any) -> dict[str, Any]:
+    return {k: v for k, v in input_data.__dict__.items() if not k.startswith("_")}
+
+
+def _chunked(rows: list[Row], model_class: type, chunk_size: int) -> list[list[Row]]:
+    """청크 분할 (행 수 × 열 수가 바인드 파라미터 한도를 넘지 않도록)"""
+    columns = len(model_class.__table__.columns)  # type: ignore[attr-defined]
+    size = max(1, min(chunk_size, MAX_BIND_PARAMS // max(columns, 1)))
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
+def _row_error(index: int, error: IntegrityError | DataError) -> BulkRowError:
+    code = "CONSTRAINT_VIOLATION" if isinstance(error, IntegrityError) else "INVALID_VALUE"
+    message = str(error.orig).strip().splitlines()[0] if error.orig else str(error)
+    return BulkRowError(index=index, code=code, message=message)
+
+
+def _prepare_rows(
+    inputs: Sequence[Any],
+    prepare_data: Callable[[Any], dict] | None,
+    errors: list[BulkRowError],
+) -> list[Row]:
+    """입력 → 열 값 (변환에 실패한 행은 INVALID_INPUT)"""
+    rows: list[Row] = []
+    for index, input_data in enumerate(inputs):
+        try:
+            data = prepare_data(input_data) if prepare_data else _input_to_dict(input_data)
+        except (ValueError, TypeError) as e:
+            errors.append(BulkRowError(index=index, code="INVALID_INPUT", message=str(e)))
+            continue
+        rows.append((index, data))
+    return rows
+
+
+def _assign_primary_keys(model_class: type, rows: list[Row]) -> None:
+    """Python 기본값이 있는 기본 키(uuid4 등)를 미리 채움 (RETURNING 결과를 입력과 매칭)"""
+    for column in model_class.__table__.primary_key.columns:  # type: ignore[attr-defined]
+        default = column.default
+        if default is None or not default.is_callable:
+            continue
+        for _, data in rows:
+            if data.get(column.key) is None:
+                data[column.key] = default.arg(None)
+
+
+def _dedupe_rows(rows: list[Row], key_columns: list[str], errors: list[BulkRowError]) -> list[Row]:
+    """같은 키가 배치 안에 여러 번 있으면 첫 행만 처리 (ON CONFLICT는 한 행을 두 번 갱신할 수 없음)"""
+    seen: set[tuple] = set()
+    unique: list[Row] = []
+    for index, data in rows:
+        key = tuple(data.get(column) for column in key_columns)
+        if key in seen:
+            errors.append(
+                BulkRowError(
+                    index=index,
+                    code="DUPLICATE_IN_BATCH",
+                    message=f"같은 {', '.join(key_columns)} 값이 요청에 중복되어 있습니다",
+                )
+            )
+            continue
+        seen.add(key)
+        unique.append((index, data))
+    return unique
+
+
+async def _execute_chunk(
+    db: AsyncSession,
+    rows: list[Row],
+    execute: Callable[[list[Row]], Awaitable[list[Any]]],
+    errors: list[BulkRowError],
+) -> list[Any]:
+    """
+    청크 실행 (SAVEPOINT)
+
+    제약 조건 위반 등으로 청크가 실패하면 행 단위로 다시 실행해 실패한 행만 오류로 남깁니다.
+    """
+    try:
+        async with db.begin_nested():
+            return await execute(rows)
+    except (IntegrityError, DataError) as e:
+        if len(rows) == 1:
+            errors.append(_row_error(rows[0][0], e))
+            return []
+
+    entities: list[Any] = []
+    for row in rows:
+        entities += await _execute_chunk(db, [row], execute, errors)
+    return entities
+
+
+def _to_bulk_result(
+    rows: list[Row],
+    entities: list[Any],
+    key_columns: list[str],
+    to_graphql: Callable[[Any], GraphQLType],
+    errors: list[BulkRowError],
+    missing_code: str,
+    missing_message: str,
+) -> BulkResult[GraphQLType]:
+    """처리 결과를 입력 순서로 정렬 (결과가 없는 행은 missing_code 오류)"""
+    by_key = {tuple(getattr(e, column) for column in key_columns): e for e in entities}
+    failed = {error.index for error in errors}
+
+    items: list[GraphQLType] = []
+    for index, data in rows:
+        if index in failed:
+            continue
+        entity = by_key.get(tuple(data.get(column) for column in key_columns))
+        if entity is None:
+            errors.append(BulkRowError(index=index, code=missing_code, message=missing_message))
+            continue
+        items.append(to_graphql(entity))
+
+    errors.sort(key=lambda error: error.index)
+    return BulkResult(
+        items=items, errors=errors, success_count=len(items), error_count=len(errors)
+    )
+
+
+async def _insert_entities(
+    db: AsyncSession,
+    model_class: type[ModelType],
+    inputs: Sequence[Any],
+    to_graphql: Callable[[ModelType], GraphQLType],  # type: ignore[type-var]
+    prepare_data: Callable[[Any], dict] | None,
+    conflict_columns: list[str] | None,
+    update_columns: list[str] | None,
+    upsert: bool,
+    chunk_size: int,
+) -> BulkResult[GraphQLType]:
+    errors: list[BulkRowError] = []
+
+    # 1. 입력 준비 + 기본 키 할당 + 배치 내 중복 제거
+    rows = _prepare_rows(inputs, prepare_data, errors)
+    _assign_primary_keys(model_class, rows)
+    table = model_class.__table__  # type: ignore[attr-defined]
+    key_columns = conflict_columns or [column.key for column in table.primary_key.columns]
+    if conflict_columns:
+        rows = _dedupe_rows(rows, conflict_columns, errors)
+
+    async def execute(chunk: list[Row]) -> list[Any]:
+        # 열 구성이 같은 행끼리 다중 행 VALUES로 묶음
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for _, data in chunk:
+            groups.setdefault(tuple(sorted(data)), []).append(data)
+
+        entities: list[Any] = []
+        for columns, values in groups.items():
+            stmt = insert(model_class).values(values)
+            if upsert:
+                assert conflict_columns
+                targets = update_columns or [
+                    c
+                    for c in columns
+                    if c not in conflict_columns and c not in _UPSERT_EXCLUDED_COLUMNS
+                ]
+                set_ = {c: stmt.excluded[c] for c in targets}
+                if "updated_at" in table.columns:
+                    set_.setdefault("updated_at", func.now())
+                stmt = stmt.on_conflict_do_update(index_elements=conflict_columns, set_=set_)
+            elif conflict_columns:
+                stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+
+            result = await db.scalars(
+                stmt.returning(model_class), execution_options={"populate_existing": True}
+            )
+            entities += result.all()
+        return entities
+
+    # 2. 청크 단위 실행 (청크당 왕복 1회)
+    entities: list[Any] = []
+    for chunk in _chunked(rows, model_class, chunk_size):
+        entities += await _execute_chunk(db, chunk, execute, errors)
+
+    await db.commit()
+
+    # 3. RETURNING 결과를 입력 순서로 매칭 (ON CONFLICT DO NOTHING으로 빠진 행은 이미 존재)
+    return _to_bulk_result(
+        rows,
+        entities,
+        key_columns,
+        to_graphql,
+        errors,
+        missing_code="ALREADY_EXISTS",
+        missing_message=f"같은 {', '.join(key_columns)} 값을 가진 항목이 이미 존재합니다",
+    )
+
+
+async def create_entities(
+    db: AsyncSession,
+    model_class: type[ModelType],
+    inputs: Sequence[Any],
+    to_graphql: Callable[[ModelType], GraphQLType],  # type: ignore[type-var]
+    prepare_data: Callable[[Any], dict] | None = None,
+    conflict_columns: list[str] | None = None,
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+) -> BulkResult[GraphQLType]:
+    """
+    엔티티 일괄 생성 (Bulk Create)
+
+    청크마다 다중 행 INSERT ... RETURNING 1회로 생성하고 마지막에 한 번 커밋합니다.
+    실패한 행만 오류로 보고하고 나머지 행은 생성합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model_class: SQLAlchemy 모델 클래스
+        inputs: 입력 데이터 목록 (Strawberry Input 타입)
+        to_graphql: 모델을 GraphQL 타입으로 변환하는 함수
+        prepare_data: 입력 데이터를 열 값 dict로 변환하는 함수 (ValueError → INVALID_INPUT)
+        conflict_columns: 유니크 키 열 (지정하면 이미 있는 행은 ALREADY_EXISTS로 건너뜀)
+        chunk_size: 청크당 최대 행 수
+
+    Returns:
+        BulkResult (items: 생성된 항목, errors: 실패한 행)
+
+    사용 예:
+        result = await create_entities(
+            db=db,
+            model_class=Permission,
+            inputs=inputs,
+            to_graphql=permission_to_graphql,
+            conflict_columns=["code"],
+        )
+    """
+    return await _insert_entities(
+        db, model_class, inputs, to_graphql, prepare_data, conflict_columns, None, False, chunk_size
+    )
+
+
+async def upsert_entities(
+    db: AsyncSession,
+    model_class: type[ModelType],
+    inputs: Sequence[Any],
+    to_graphql: Callable[[ModelType], GraphQLType],  # type: ignore[type-var]
+    conflict_columns: list[str],
+    update_columns: list[str] | None = None,
+    prepare_data: Callable[[Any], dict] | None = None,
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+) -> BulkResult[GraphQLType]:
+    """
+    엔티티 일괄 생성/갱신 (Bulk Upsert)
+
+    INSERT ... ON CONFLICT (conflict_columns) DO UPDATE ... RETURNING으로
+    없는 행은 생성하고 있는 행은 갱신합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model_class: SQLAlchemy 모델 클래스
+        inputs: 입력 데이터 목록 (Strawberry Input 타입)
+        to_graphql: 모델을 GraphQL 타입으로 변환하는 함수
+        conflict_columns: 유니크 키 열 (유니크 제약/인덱스가 있어야 함)
+        update_columns: 충돌 시 갱신할 열 (None이면 키/id/created_* 외 입력된 모든 열)
+        prepare_data: 입력 데이터를 열 값 dict로 변환하는 함수 (ValueError → INVALID_INPUT)
+        chunk_size: 청크당 최대 행 수
+
+    Returns:
+        BulkResult (items: 생성/갱신된 항목, errors: 실패한 행)
+    """
+    return await _insert_entities(
+        db,
+        model_class,
+        inputs,
+        to_graphql,
+        prepare_data,
+        conflict_columns,
+        update_columns,
+        True,
+        chunk_size,
+    )
+
+
+async def update_entities(
+    db: AsyncSession,
+    model_class: type[ModelType],
+    updates: Sequence[tuple[UUID, Any]],
+    to_graphql: Callable[[ModelType], GraphQLType],  # type: ignore[type-var]
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    **filters: Any,
+) -> BulkResult[GraphQLType]:
+    """
+    엔티티 일괄 수정 (Bulk Update)
+
+    update_entity처럼 입력의 non-None 필드만 수정합니다.
+    청크마다 대상 확인(SELECT), 기본 키 기준 executemany UPDATE, 결과 조회(SELECT)
+    세 번만 왕복합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model_class: SQLAlchemy 모델 클래스
+        updates: (엔티티 ID, 입력 데이터) 목록
+        to_graphql: 모델을 GraphQL 타입으로 변환하는 함수
+        chunk_size: 청크당 최대 행 수
+        **filters: 추가 필터 조건 (조건에 맞지 않는 행은 NOT_FOUND)
+
+    Returns:
+        BulkResult (items: 수정된 항목, errors: 실패한 행)
+    """
+    errors: list[BulkRowError] = []
+    mapper = inspect(model_class)
+    pk_column = mapper.primary_key[0]
+    pk_key = mapper.get_property_by_column(pk_column).key
+
+    # 1. 입력 → 기본 키 + 수정할 필드
+    rows: list[Row] = []
+    for index, (entity_id, input_data) in enumerate(updates):
+        data = {
+            field: value
+            for field, value in _input_to_dict(input_data).items()
+            if value is not None and hasattr(model_class, field)
+        }
+        data[pk_key] = entity_id
+        rows.append((index, data))
+    rows = _dedupe_rows(rows, [pk_key], errors)
+
+    conditions = [getattr(model_class, key) == value for key, value in filters.items()]
+
+    async def execute(chunk: list[Row]) -> list[Any]:
+        ids = [data[pk_key] for _, data in chunk]
+
+        # 2. 필터 조건에 맞는 대상 확인
+        found = set(await db.scalars(select(pk_column).where(pk_column.in_(ids), *conditions)))
+        if not found:
+            return []
+        values = [data for _, data in chunk if data[pk_key] in found and len(data) > 1]
+
+        # 3. 기본 키 기준 UPDATE (열 구성이 같은 행끼리 executemany)
+        if values:
+            await db.execute(update(model_class), values)
+
+        # 4. 수정된 행 조회
+        result = await db.scalars(
+            select(model_class)
+            .where(pk_column.in_(found))
+            .execution_options(populate_existing=True)
+        )
+        return list(result.all())
+
+    entities: list[Any] = []
+    for chunk in _chunked(rows, model_class, chunk_size):
+        entities += await _execute_chunk(db, chunk, execute, errors)
+
+    await db.commit()
+
+    return _to_bulk_result(
+        rows,
+        entities,
+        [pk_key],
+        to_graphql,
+        errors,
+        missing_code="NOT_FOUND",
+        missing_message="항목을 찾을 수 없습니다",
+    )
@@ -6,10 +6,45 @@ Strawberry의 Permission 시스템을 확장하여 리소스 기반 권한 관
 
 from collections.abc import Callable
 from typing import Any
+from uuid import UUID
 
 from strawberry.permission import BasePermission
 from strawberry.types import Info
 
+from src.core.permission_cache import permission_cache
+
+
+# GraphQL 권한 액션 → DB 권한 액션 (MANAGE 권한은 모든 액션 허용)
+ACTION_ALIASES: dict[str, tuple[str, ...]] = {
+    "view": ("read", "list"),
+}
+
+
+async def get_user_permissions(info: Info) -> frozenset[str]:
+    """
+    현재 사용자의 권한 키 집합 조회 (권한 캐시 경유)
+
+    로컬 LRU → Redis → Manager DB 순으로 조회하므로, 캐시 적중 시
+    필드별 권한 검증에 DB 조회가 발생하지 않습니다.
+
+    Args:
+        info: GraphQL 실행 컨텍스트
+
+    Returns:
+        "resource:action" 형식의 권한 키 집합 (비로그인 시 빈 집합)
+    """
+    # 순환 참조 방지를 위해 함수 내부에서 import
+    from src.graphql.manager.idam.permissions.queries import get_manager_user_permission_grants
+
+    user_id = getattr(info.context, "user_id", "")
+    if not user_id:
+        return frozenset()
+
+    db = info.context.manager_db_session
+    return await permission_cache.get(
+        user_id, lambda: get_manager_user_permission_grants(db, UUID(user_id))
+    )
+
 
 class BaseResourcePermission(BasePermission):
     """
@@ -49,14 +84,17 @@ class BaseResourcePermission(BasePermission):
             권한이 있으면 True, 없으면 False
 
         Note:
-            실제 프로젝트에서는 info.context에서 사용자 정보 및 권한을 확인하여
-            구현해야 합니다.
+            사용자 권한 집합은 permission_cache에서 조회하며,
+            역할/권한 매핑 변경 시 해당 사용자의 캐시가 무효화됩니다.
         """
-        # TODO: 실제 권한 체크 로직 구현
-        # 예시:
-        # user = info.context.user
-        # return user.has_permission(self.resource, self.action)
-        return True
+        permissions = await get_user_permissions(info)
+        return self.is_granted(permissions)
+
+    def is_granted(self, permissions: frozenset[str]) -> bool:
+        """권한 키 집합에 이 리소스/액션 권한이 포함되어 있는지 확인"""
+        resource = self.resource.lower()
+        actions = (*ACTION_ALIASES.get(self.action, (self.action,)), "manage")
+        return any(f"{resource}:{action}" in permissions for action in actions)
 
 
 class CanView(BaseResourcePermission):
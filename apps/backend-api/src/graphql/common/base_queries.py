@@ -2,25 +2,183 @@
 
 엔티티 조회를 위한 재사용 가능한 헬퍼 함수들을 제공합니다.
 단일 조회, 목록 조회, 개수 조회 등 기본적인 Read 작업을 지원합니다.
+
+목록 조회는 두 가지 페이지네이션 모드를 지원합니다:
+    - 오프셋 모드 (기본): limit/offset, 깊은 페이지일수록 느려짐
+    - 키셋 모드 (keyset=True): (created_at, id) 기준 seek, 페이지 깊이와 무관하게 일정한 비용
 """
 
-from collections.abc import Callable
-from typing import Any, TypeVar
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, Literal, TypeVar
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.exceptions import ValidationError
+
+from .base_types import Connection, Edge, PageInfo
+from .projection import finalize_projected, get_projection_keys
+from .statement_cache import (
+    select_by_id_statement,
+    select_count_statement,
+    select_list_statement,
+)
+
 
 ModelType = TypeVar("ModelType")  # SQLAlchemy Model Type
 GraphQLType = TypeVar("GraphQLType")  # GraphQL Type
 
+# 전체 개수 계산 방식
+#   - exact: 정확한 개수 (윈도우 COUNT, 필터 결과 전체 스캔)
+#   - estimated: 플래너 통계 기반 추정치 (대용량 테이블용, 스캔 없음)
+CountMode = Literal["exact", "estimated"]
+
+# 한 페이지 최대 조회 개수 (first/limit 상한)
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(created_at: datetime, id_: UUID | str) -> str:
+    """
+    키셋 페이지네이션 커서 생성
+
+    (created_at, id)를 base64 인코딩한 불투명(opaque) 문자열을 반환합니다.
+    클라이언트는 커서의 내부 구조에 의존하지 않고 after 인자로 그대로 전달합니다.
+
+    Args:
+        created_at: 행의 생성일시
+        id_: 행의 ID
+
+    Returns:
+        커서 문자열
+    """
+    payload = json.dumps([created_at.isoformat(), str(id_)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    키셋 페이지네이션 커서 해석
+
+    Args:
+        cursor: encode_cursor로 생성한 커서 문자열
+
+    Returns:
+        (created_at, id) 튜플
+
+    Raises:
+        ValidationError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(id_)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValidationError(message="유효하지 않은 커서입니다") from e
+
+
+def clamp_limit(limit: int, maximum: int = MAX_PAGE_SIZE) -> int:
+    """
+    오프셋 목록 조회 개수(limit)를 0 ~ maximum 범위로 제한
+
+    Args:
+        limit: 요청된 조회 개수
+        maximum: 상한 (기본값: MAX_PAGE_SIZE)
+
+    Returns:
+        제한된 조회 개수
+    """
+    return min(max(limit, 0), maximum)
+
+
+def validate_first(first: int) -> int:
+    """
+    커서 페이지네이션 페이지 크기(first) 검증
+
+    Connection 리졸버에서 get_list(limit=first + 1) 호출 전에 사용합니다.
+
+    Args:
+        first: 페이지 크기
+
+    Returns:
+        검증된 페이지 크기
+
+    Raises:
+        ValidationError: 1 ~ MAX_PAGE_SIZE 범위를 벗어난 경우
+    """
+    if not 1 <= first <= MAX_PAGE_SIZE:
+        raise ValidationError(
+            message=f"first는 1 이상 {MAX_PAGE_SIZE} 이하여야 합니다",
+            detail={"first": first, "max": MAX_PAGE_SIZE},
+        )
+    return first
+
+
+def to_connection(
+    items: Sequence[GraphQLType], first: int, after: str | None = None
+) -> Connection[GraphQLType]:
+    """
+    키셋 모드 목록 조회 결과를 Relay Connection으로 변환
+
+    get_list(keyset=True)를 limit=first + 1로 호출한 결과를 전달합니다.
+    한 건을 더 조회하여 다음 페이지 존재 여부를 COUNT 없이 판단합니다.
+    커서는 GraphQL 타입의 created_at, id 필드로 생성합니다.
+
+    Args:
+        items: get_list(keyset=True, limit=first + 1) 결과
+        first: 페이지 크기
+        after: 요청에 사용한 커서 (이전 페이지 존재 여부 판단용)
+
+    Returns:
+        Connection: 엣지 목록과 페이지 정보
+    """
+    has_next_page = len(items) > first
+    edges = [
+        Edge(node=item, cursor=encode_cursor(item.created_at, item.id))  # type: ignore[attr-defined]
+        for item in items[:first]
+    ]
+
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            has_previous_page=after is not None,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
+
+
+def _apply_filters(
+    stmt: Select,
+    model_class: type[ModelType],
+    filters: dict[str, Any],
+    extra_conditions: list[Any] | None = None,
+) -> Select:
+    """
+    추정 개수 쿼리 필터 적용 (EXPLAIN용, 리터럴 값으로 렌더링되므로 문장 캐시 미사용)
+
+    단순 필터는 모델에 존재하는 필드만, 값이 None이 아닐 때만 AND 조건으로 적용합니다.
+    """
+    for field, value in filters.items():
+        if hasattr(model_class, field) and value is not None:
+            stmt = stmt.where(getattr(model_class, field) == value)
+
+    if extra_conditions:
+        stmt = stmt.where(*extra_conditions)
+
+    return stmt
+
 
 async def get_by_id(
     db: AsyncSession,
     model_class: type[ModelType],
     id_: UUID,
     to_graphql: Callable[[ModelType], GraphQLType],  # type: ignore[type-var]
+    info: Any = None,
     **filters: Any,
 ) -> GraphQLType | None:
     """
@@ -34,6 +192,7 @@ async def get_by_id(
         model_class: SQLAlchemy 모델 클래스
         id_: 조회할 엔티티의 UUID
         to_graphql: 모델을 GraphQL 타입으로 변환하는 함수
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
         **filters: 추가 필터 조건 (예: is_deleted=False, tenant_id=xxx)
 
     Returns:
@@ -48,24 +207,23 @@ async def get_by_id(
             is_deleted=False  # Soft delete 필터
         )
     """
-    # 1. 기본 ID 조회 쿼리 생성
-    stmt = select(model_class).where(
-        model_class.id == id_  # type: ignore[attr-defined]
-    )
+    # 1. 요청된 필드의 컬럼 (info 전달 시)
+    projection = get_projection_keys(info, model_class)
 
-    # 2. 추가 필터 적용 (예: is_deleted=False, status='ACTIVE' 등)
-    for field, value in filters.items():
-        if hasattr(model_class, field):
-            stmt = stmt.where(getattr(model_class, field) == value)
+    # 2. 캐시된 ID 조회 문장 + 파라미터 (추가 필터 포함, 예: is_deleted=False)
+    stmt, params = select_by_id_statement(model_class, id_, filters, projection)
 
     # 3. 쿼리 실행
-    result = await db.execute(stmt)
+    result = await db.execute(stmt, params)
     item = result.scalar_one_or_none()
 
     # 4. 결과가 없으면 None 반환
     if not item:
         return None
 
+    if projection:
+        finalize_projected(db, [item])
+
     # 5. DB 모델을 GraphQL 타입으로 변환
     return to_graphql(item)
 
@@ -78,6 +236,9 @@ async def get_list(
     offset: int = 0,
     order_by: Any = None,
     extra_conditions: list[Any] | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Any = None,
     **filters: Any,
 ) -> list[GraphQLType]:
     """
@@ -86,20 +247,30 @@ async def get_list(
     다양한 조건으로 엔티티 목록을 조회합니다.
     페이징, 필터링, 정렬을 모두 지원합니다.
 
+    키셋 모드(keyset=True 또는 after 지정)에서는 (created_at, id) 내림차순으로
+    정렬하고 커서 위치부터 seek하므로, offset과 order_by는 무시됩니다.
+    (created_at, id) 인덱스를 타므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
     Args:
         db: 데이터베이스 세션
         model_class: SQLAlchemy 모델 클래스
         to_graphql: 모델을 GraphQL 타입으로 변환하는 함수
-        limit: 조회 개수 제한 (기본값: 20)
+        limit: 조회 개수 제한 (기본값: 20, 최대 MAX_PAGE_SIZE)
         offset: 조회 시작 위치 (페이징용, 기본값: 0)
         order_by: 정렬 기준 (예: User.created_at.desc())
                   기본값은 created_at 내림차순
         extra_conditions: 추가 WHERE 조건 리스트 (복잡한 조건용)
+        after: 키셋 모드 커서 (이 커서 다음 행부터 조회)
+        keyset: 키셋 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
         **filters: 단순 필터 조건 (예: status='ACTIVE', is_deleted=False)
 
     Returns:
         GraphQL 타입 객체 리스트
 
+    Raises:
+        ValidationError: 커서 형식이 올바르지 않은 경우
+
     사용 예:
         # 기본 조회
         users = await get_list(
@@ -128,34 +299,53 @@ async def get_list(
             to_graphql=user_to_graphql,
             extra_conditions=[or_(User.email.like('%@example.com'), User.username.like('admin%'))]
         )
-    """
-    # 1. 기본 쿼리 생성 (limit, offset 적용)
-    stmt = select(model_class).limit(limit).offset(offset)
 
-    # 2. 단순 필터 적용 (AND 조건)
-    for field, value in filters.items():
-        if hasattr(model_class, field) and value is not None:
-            stmt = stmt.where(getattr(model_class, field) == value)
+        # 키셋 모드 (Relay Connection)
+        items = await get_list(
+            db=db,
+            model_class=User,
+            to_graphql=user_to_graphql,
+            limit=first + 1,
+            after=after,
+            keyset=True,
+        )
+        connection = to_connection(items, first, after)
+    """
+    keyset = keyset or after is not None
+
+    # 1. 페이지 파라미터 (키셋 모드는 offset 대신 커서 위치, 다음 페이지 확인용 1건 포함)
+    limit = clamp_limit(limit, MAX_PAGE_SIZE + 1 if keyset else MAX_PAGE_SIZE)
+    paging: dict[str, Any] = {"_limit": limit}
+    if not keyset:
+        paging["_offset"] = offset
+    elif after is not None:
+        paging["_after_created_at"], paging["_after_id"] = decode_cursor(after)
+
+    # 2. 요청된 필드의 컬럼 (info 전달 시)
+    projection = get_projection_keys(info, model_class)
+
+    # 3. 캐시된 목록 문장 조회 (단순 필터 + 정렬 + 페이지)
+    stmt, make_params = select_list_statement(
+        model_class,
+        filters,
+        order_by=order_by,
+        keyset=keyset,
+        seek=after is not None,
+        projection=projection,
+    )
+    params = make_params(**paging)
 
-    # 3. 추가 조건 적용 (복잡한 WHERE 조건)
+    # 4. 추가 WHERE 조건 적용 (복잡한 조건은 캐시하지 않음)
     if extra_conditions:
-        for condition in extra_conditions:
-            stmt = stmt.where(condition)
-
-    # 4. 정렬 적용
-    if order_by is not None:
-        # 명시적으로 정렬 기준이 제공된 경우 (리스트면 unpacking, 아니면 단일 값)
-        stmt = stmt.order_by(*order_by) if isinstance(order_by, list) else stmt.order_by(order_by)
-    elif hasattr(model_class, "created_at"):
-        # 기본 정렬: created_at 내림차순 (최신 데이터 우선)
-        stmt = stmt.order_by(
-            model_class.created_at.desc()  # type: ignore[attr-defined]
-        )
+        stmt = stmt.where(*extra_conditions)
 
     # 5. 쿼리 실행
-    result = await db.execute(stmt)
+    result = await db.execute(stmt, params)
     items = result.scalars().all()
 
+    if projection:
+        finalize_projected(db, items)
+
     # 6. 모든 아이템을 GraphQL 타입으로 변환
     return [to_graphql(item) for item in items]
 
@@ -192,14 +382,129 @@ async def get_count(db: AsyncSession, model_class: type[ModelType], **filters: A
         total_count = await get_count(db, User, status='ACTIVE')
         total_pages = (total_count + page_size - 1) // page_size
     """
-    # 1. COUNT 쿼리 생성
-    stmt = select(func.count()).select_from(model_class)
+    # 1. 캐시된 COUNT 문장 + 필터 파라미터
+    stmt, params = select_count_statement(model_class, filters)
 
-    # 2. 필터 적용
-    for field, value in filters.items():
-        if hasattr(model_class, field) and value is not None:
-            stmt = stmt.where(getattr(model_class, field) == value)
-
-    # 3. 쿼리 실행 및 결과 반환
-    result = await db.execute(stmt)
+    # 2. 쿼리 실행 및 결과 반환
+    result = await db.execute(stmt, params)
     return result.scalar_one()
+
+
+async def get_estimated_count(db: AsyncSession, stmt: Select) -> int:
+    """
+    플래너 통계 기반 추정 개수 조회
+
+    EXPLAIN으로 쿼리 플래너가 예상한 결과 행 수를 반환합니다.
+    실제 스캔을 하지 않으므로 대용량 테이블에서도 일정한 비용으로 동작하지만,
+    통계(ANALYZE) 갱신 주기에 따라 실제 개수와 차이가 날 수 있습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        stmt: 개수를 추정할 SELECT 쿼리 (필터 적용된 상태)
+
+    Returns:
+        추정 행 수
+    """
+    conn = await db.connection()
+
+    # EXPLAIN은 바인드 파라미터를 받을 수 없으므로 리터럴로 렌더링 (값은 dialect가 이스케이프)
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def get_list_with_count(
+    db: AsyncSession,
+    model_class: type[ModelType],
+    to_graphql: Callable[[ModelType], GraphQLType],  # type: ignore[type-var]
+    limit: int = 20,
+    offset: int = 0,
+    order_by: Any = None,
+    extra_conditions: list[Any] | None = None,
+    count_mode: CountMode = "exact",
+    info: Any = None,
+    **filters: Any,
+) -> tuple[list[GraphQLType], int]:
+    """
+    엔티티 목록 + 전체 개수 조회 (한 번의 쿼리)
+
+    get_list + get_count를 따로 호출하면 같은 필터로 두 번 왕복합니다.
+    이 함수는 COUNT(*) OVER () 윈도우 함수로 페이지 행과 전체 개수를 함께 조회합니다.
+
+    count_mode="estimated"이면 정확한 개수 대신 플래너 통계 기반 추정치를 사용합니다.
+    (감사 로그, 로그인 이력처럼 정확한 개수가 전체 스캔 비용만큼 가치 있지 않은 테이블용)
+
+    Args:
+        db: 데이터베이스 세션
+        model_class: SQLAlchemy 모델 클래스
+        to_graphql: 모델을 GraphQL 타입으로 변환하는 함수
+        limit: 조회 개수 제한 (기본값: 20, 최대 MAX_PAGE_SIZE)
+        offset: 조회 시작 위치 (기본값: 0)
+        order_by: 정렬 기준 (기본값: created_at 내림차순)
+        extra_conditions: 추가 WHERE 조건 리스트
+        count_mode: 전체 개수 계산 방식 ("exact" 또는 "estimated")
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
+        **filters: 단순 필터 조건 (예: status='ACTIVE')
+
+    Returns:
+        (GraphQL 타입 객체 리스트, 전체 개수) 튜플
+
+    사용 예:
+        users, total = await get_list_with_count(
+            db=db,
+            model_class=User,
+            to_graphql=user_to_graphql,
+            limit=20,
+            offset=40,
+            status="ACTIVE",
+        )
+    """
+    # 1. 추정 모드: 목록 조회 + EXPLAIN 추정치
+    if count_mode == "estimated":
+        count_stmt = _apply_filters(select(model_class), model_class, filters, extra_conditions)
+        total_count = await get_estimated_count(db, count_stmt)
+        items = await get_list(
+            db=db,
+            model_class=model_class,
+            to_graphql=to_graphql,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            extra_conditions=extra_conditions,
+            info=info,
+            **filters,
+        )
+        return items, total_count
+
+    # 2. 정확 모드: 윈도우 COUNT로 페이지 행과 전체 개수를 함께 조회
+    projection = get_projection_keys(info, model_class)
+    stmt, make_params = select_list_statement(
+        model_class, filters, order_by=order_by, with_total=True, projection=projection
+    )
+    if extra_conditions:
+        stmt = stmt.where(*extra_conditions)
+
+    result = await db.execute(stmt, make_params(_limit=clamp_limit(limit), _offset=offset))
+    rows = result.all()
+
+    if projection:
+        finalize_projected(db, [row[0] for row in rows])
+
+    # 3. 전체 개수 추출
+    if rows:
+        total_count = rows[0].total_count
+    elif offset > 0:
+        # 마지막 페이지를 넘어선 요청은 행이 없어 윈도우 결과도 없으므로 COUNT로 보완
+        count_stmt, count_params = select_count_statement(model_class, filters)
+        if extra_conditions:
+            count_stmt = count_stmt.where(*extra_conditions)
+        total_count = (await db.execute(count_stmt, count_params)).scalar_one()
+    else:
+        total_count = 0
+
+    # 4. GraphQL 타입으로 변환
+    return [to_graphql(row[0]) for row in rows], total_count
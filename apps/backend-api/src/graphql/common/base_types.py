@@ -4,9 +4,14 @@
 페이지네이션, 성공/에러 응답 등 공통적으로 사용되는 타입들을 제공합니다.
 """
 
+from typing import Generic, TypeVar
+
 import strawberry
 
 
+NodeType = TypeVar("NodeType")
+
+
 @strawberry.type(description="페이지네이션 정보 (Relay 스펙)")
 class PageInfo:
     """
@@ -34,7 +39,46 @@ class PageInfo:
     end_cursor: str | None = strawberry.field(
         default=None, description="마지막 아이템의 커서 (다음 페이지 요청 시 사용)"
     )
-    total_count: int = strawberry.field(description="전체 아이템 수 (필터 적용 후)")
+    total_count: int | None = strawberry.field(
+        default=None,
+        description="전체 아이템 수 (필터 적용 후, 커서 페이지네이션에서는 계산하지 않음)",
+    )
+
+
+@strawberry.type(description="Connection 엣지 (Relay 스펙)")
+class Edge(Generic[NodeType]):
+    """
+    Relay Connection의 엣지
+
+    노드와 해당 노드의 위치를 나타내는 불투명(opaque) 커서를 함께 전달합니다.
+    Strawberry 제네릭 타입이므로 스키마에는 {노드타입}Edge 이름으로 노출됩니다.
+    (예: ManagerUserEdge)
+    """
+
+    node: NodeType = strawberry.field(description="엣지의 노드")
+    cursor: str = strawberry.field(description="노드 위치 커서 (after 인자로 전달)")
+
+
+@strawberry.type(description="Connection (Relay 스펙)")
+class Connection(Generic[NodeType]):
+    """
+    Relay Cursor Connection
+
+    키셋(커서) 페이지네이션 결과 타입입니다.
+    스키마에는 {노드타입}Connection 이름으로 노출됩니다. (예: ManagerUserConnection)
+
+    사용 예:
+        @strawberry.field
+        async def users_connection(
+            self, info, first: int = 20, after: str | None = None
+        ) -> Connection[ManagerUser]:
+            validate_first(first)
+            items = await get_list(..., limit=first + 1, after=after, keyset=True)
+            return to_connection(items, first, after)
+    """
+
+    edges: list[Edge[NodeType]] = strawberry.field(description="엣지 목록")
+    page_info: PageInfo = strawberry.field(description="페이지네이션 정보")
 
 
 @strawberry.type(description="성공 응답")
@@ -87,3 +131,42 @@ class ErrorResponse:
     field: str | None = strawberry.field(
         default=None, description="에러가 발생한 필드명 (필드 레벨 에러인 경우)"
     )
+
+
+@strawberry.type(description="일괄 처리 행 오류")
+class BulkRowError:
+    """
+    일괄 처리(bulk) Mutation의 행 단위 오류
+
+    실패한 행만 오류로 보고하고 나머지 행은 처리합니다.
+    index는 요청한 입력 목록에서의 위치(0부터)입니다.
+    """
+
+    index: int = strawberry.field(description="입력 목록에서의 위치 (0부터)")
+    code: str = strawberry.field(
+        description="에러 코드 (INVALID_INPUT, ALREADY_EXISTS, DUPLICATE_IN_BATCH, "
+        "CONSTRAINT_VIOLATION, INVALID_VALUE, NOT_FOUND)"
+    )
+    message: str = strawberry.field(description="에러 메시지")
+
+
+@strawberry.type(description="일괄 처리 결과")
+class BulkResult(Generic[NodeType]):
+    """
+    일괄 처리(bulk) Mutation 결과
+
+    스키마에는 {노드타입}BulkResult 이름으로 노출됩니다. (예: ManagerPermissionBulkResult)
+    items는 성공한 행을 입력 순서대로 담습니다.
+
+    사용 예:
+        @strawberry.mutation
+        async def bulk_create_permissions(
+            self, info, inputs: list[ManagerPermissionCreateInput]
+        ) -> BulkResult[ManagerPermission]:
+            return await create_entities(...)
+    """
+
+    items: list[NodeType] = strawberry.field(description="처리된 항목 (입력 순서)")
+    errors: list[BulkRowError] = strawberry.field(description="실패한 행 오류")
+    success_count: int = strawberry.field(description="성공한 행 수")
+    error_count: int = strawberry.field(description="실패한 행 수")
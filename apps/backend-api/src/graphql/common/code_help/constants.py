@@ -7,7 +7,9 @@ Code Help Constants & Handlers
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, Any, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import or_
+
+from ..base_queries import get_list_with_count
 from .types import CodeHelpResult
 
 
@@ -52,43 +54,25 @@ class CustomerSearchHandler(CodeHelpHandler):
         """거래처 검색"""
         from ...tenants.crm.customers.models import Customer
 
-        # 기본 쿼리
-        query = select(Customer)
+        # 조회 조건 (목록/전체 개수 공통)
+        conditions = []
 
         # 검색어 필터
         search_filter = self._build_search_filter(
             Customer, search_query, ["customer_code", "customer_name"]
         )
         if search_filter is not None:
-            query = query.where(search_filter)
+            conditions.append(search_filter)
 
         # 상태 필터
         if filters and "status" in filters:
-            query = query.where(Customer.status == filters["status"])
-        else:
-            query = query.where(Customer.status == "ACTIVE")
-
-        # 전체 개수
-        count_query = select(func.count(Customer.id))
-        count_query = count_query.select_from(Customer)
-        if search_filter is not None:
-            count_query = count_query.where(search_filter)
-        if filters and "status" in filters:
-            count_query = count_query.where(Customer.status == filters["status"])
+            conditions.append(Customer.status == filters["status"])
         else:
-            count_query = count_query.where(Customer.status == "ACTIVE")
-
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # 데이터 조회
-        query = query.limit(limit).offset(offset).order_by(Customer.created_at.desc())
-        result = await db.execute(query)
-        customers = result.scalars().all()
+            conditions.append(Customer.status == "ACTIVE")
 
         # 응답 변환
-        items = [
-            CodeHelpResult(
+        def to_result(c) -> CodeHelpResult:
+            return CodeHelpResult(
                 id=str(c.id),
                 code=c.customer_code,
                 name=c.customer_name,
@@ -102,8 +86,17 @@ class CustomerSearchHandler(CodeHelpHandler):
                 created_at=c.created_at,
                 updated_at=c.updated_at,
             )
-            for c in customers
-        ]
+
+        # 목록 + 전체 개수 (윈도우 COUNT로 한 번에 조회)
+        items, total_count = await get_list_with_count(
+            db=db,
+            model_class=Customer,
+            to_graphql=to_result,
+            limit=limit,
+            offset=offset,
+            order_by=Customer.created_at.desc(),
+            extra_conditions=conditions,
+        )
 
         return total_count, items
 
@@ -122,48 +115,29 @@ class EmployeeSearchHandler(CodeHelpHandler):
         """사원 검색"""
         from ...tenants.hrm.employees.models import Employee
 
-        # 기본 쿼리
-        query = select(Employee)
+        # 조회 조건 (목록/전체 개수 공통)
+        conditions = []
 
         # 검색어 필터
         search_filter = self._build_search_filter(
             Employee, search_query, ["employee_code", "employee_name"]
         )
         if search_filter is not None:
-            query = query.where(search_filter)
+            conditions.append(search_filter)
 
         # 상태 필터
         if filters and "status" in filters:
-            query = query.where(Employee.status == filters["status"])
+            conditions.append(Employee.status == filters["status"])
         else:
-            query = query.where(Employee.status == "ACTIVE")
+            conditions.append(Employee.status == "ACTIVE")
 
         # 부서 필터
         if filters and "department" in filters:
-            query = query.where(Employee.department == filters["department"])
-
-        # 전체 개수
-        count_query = select(func.count(Employee.id)).select_from(Employee)
-        if search_filter is not None:
-            count_query = count_query.where(search_filter)
-        if filters and "status" in filters:
-            count_query = count_query.where(Employee.status == filters["status"])
-        else:
-            count_query = count_query.where(Employee.status == "ACTIVE")
-        if filters and "department" in filters:
-            count_query = count_query.where(Employee.department == filters["department"])
-
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # 데이터 조회
-        query = query.limit(limit).offset(offset).order_by(Employee.created_at.desc())
-        result = await db.execute(query)
-        employees = result.scalars().all()
+            conditions.append(Employee.department == filters["department"])
 
         # 응답 변환
-        items = [
-            CodeHelpResult(
+        def to_result(e) -> CodeHelpResult:
+            return CodeHelpResult(
                 id=str(e.id),
                 code=e.employee_code,
                 name=e.employee_name,
@@ -177,8 +151,17 @@ class EmployeeSearchHandler(CodeHelpHandler):
                 created_at=e.created_at,
                 updated_at=e.updated_at,
             )
-            for e in employees
-        ]
+
+        # 목록 + 전체 개수 (윈도우 COUNT로 한 번에 조회)
+        items, total_count = await get_list_with_count(
+            db=db,
+            model_class=Employee,
+            to_graphql=to_result,
+            limit=limit,
+            offset=offset,
+            order_by=Employee.created_at.desc(),
+            extra_conditions=conditions,
+        )
 
         return total_count, items
 
@@ -197,42 +180,25 @@ class UserSearchHandler(CodeHelpHandler):
         """사용자 검색 (Manager IDAM Users)"""
         from ...manager.idam.users.models import User
 
-        # 기본 쿼리
-        query = select(User)
+        # 조회 조건 (목록/전체 개수 공통)
+        conditions = []
 
         # 검색어 필터
         search_filter = self._build_search_filter(
             User, search_query, ["full_name", "email", "username"]
         )
         if search_filter is not None:
-            query = query.where(search_filter)
+            conditions.append(search_filter)
 
         # 상태 필터
         if filters and "status" in filters:
-            query = query.where(User.status == filters["status"])
-        else:
-            query = query.where(User.status == "ACTIVE")
-
-        # 전체 개수
-        count_query = select(func.count(User.id)).select_from(User)
-        if search_filter is not None:
-            count_query = count_query.where(search_filter)
-        if filters and "status" in filters:
-            count_query = count_query.where(User.status == filters["status"])
+            conditions.append(User.status == filters["status"])
         else:
-            count_query = count_query.where(User.status == "ACTIVE")
-
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # 데이터 조회
-        query = query.limit(limit).offset(offset).order_by(User.created_at.desc())
-        result = await db.execute(query)
-        users = result.scalars().all()
+            conditions.append(User.status == "ACTIVE")
 
         # 응답 변환
-        items = [
-            CodeHelpResult(
+        def to_result(u) -> CodeHelpResult:
+            return CodeHelpResult(
                 id=str(u.id),
                 code=u.username,
                 name=u.full_name,
@@ -246,8 +212,17 @@ class UserSearchHandler(CodeHelpHandler):
                 created_at=u.created_at,
                 updated_at=u.updated_at,
             )
-            for u in users
-        ]
+
+        # 목록 + 전체 개수 (윈도우 COUNT로 한 번에 조회)
+        items, total_count = await get_list_with_count(
+            db=db,
+            model_class=User,
+            to_graphql=to_result,
+            limit=limit,
+            offset=offset,
+            order_by=User.created_at.desc(),
+            extra_conditions=conditions,
+        )
 
         return total_count, items
 
@@ -266,48 +241,29 @@ class CommonCodeSearchHandler(CodeHelpHandler):
         """공통코드 검색 (부모코드 필터 가능)"""
         from ...tenants.sys.common_codes.models import CommonCode
 
-        # 기본 쿼리
-        query = select(CommonCode)
+        # 조회 조건 (목록/전체 개수 공통)
+        conditions = []
 
         # 검색어 필터
         search_filter = self._build_search_filter(
             CommonCode, search_query, ["code", "name"]
         )
         if search_filter is not None:
-            query = query.where(search_filter)
+            conditions.append(search_filter)
 
         # 부모코드 필터 (중요)
         if filters and "parent_code" in filters:
-            query = query.where(CommonCode.parent_code == filters["parent_code"])
+            conditions.append(CommonCode.parent_code == filters["parent_code"])
 
         # 상태 필터
         if filters and "status" in filters:
-            query = query.where(CommonCode.status == filters["status"])
-        else:
-            query = query.where(CommonCode.status == "ACTIVE")
-
-        # 전체 개수
-        count_query = select(func.count(CommonCode.id)).select_from(CommonCode)
-        if search_filter is not None:
-            count_query = count_query.where(search_filter)
-        if filters and "parent_code" in filters:
-            count_query = count_query.where(CommonCode.parent_code == filters["parent_code"])
-        if filters and "status" in filters:
-            count_query = count_query.where(CommonCode.status == filters["status"])
+            conditions.append(CommonCode.status == filters["status"])
         else:
-            count_query = count_query.where(CommonCode.status == "ACTIVE")
-
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # 데이터 조회
-        query = query.limit(limit).offset(offset).order_by(CommonCode.sort_order, CommonCode.code)
-        result = await db.execute(query)
-        codes = result.scalars().all()
+            conditions.append(CommonCode.status == "ACTIVE")
 
         # 응답 변환
-        items = [
-            CodeHelpResult(
+        def to_result(c) -> CodeHelpResult:
+            return CodeHelpResult(
                 id=str(c.id),
                 code=c.code,
                 name=c.name,
@@ -319,8 +275,17 @@ class CommonCodeSearchHandler(CodeHelpHandler):
                 created_at=c.created_at,
                 updated_at=c.updated_at,
             )
-            for c in codes
-        ]
+
+        # 목록 + 전체 개수 (윈도우 COUNT로 한 번에 조회)
+        items, total_count = await get_list_with_count(
+            db=db,
+            model_class=CommonCode,
+            to_graphql=to_result,
+            limit=limit,
+            offset=offset,
+            order_by=[CommonCode.sort_order, CommonCode.code],
+            extra_conditions=conditions,
+        )
 
         return total_count, items
 
@@ -339,42 +304,25 @@ class ParentCodeSearchHandler(CodeHelpHandler):
         """상위코드 검색"""
         from ...tenants.sys.common_codes.models import CommonCode
 
-        # 기본 쿼리 - parent_code가 NULL인 것들만 (부모 코드)
-        query = select(CommonCode).where(CommonCode.parent_code == None)
+        # 조회 조건 (목록/전체 개수 공통) - parent_code가 NULL인 것들만 (부모 코드)
+        conditions = [CommonCode.parent_code == None]
 
         # 검색어 필터
         search_filter = self._build_search_filter(
             CommonCode, search_query, ["code", "name"]
         )
         if search_filter is not None:
-            query = query.where(search_filter)
+            conditions.append(search_filter)
 
         # 상태 필터
         if filters and "status" in filters:
-            query = query.where(CommonCode.status == filters["status"])
-        else:
-            query = query.where(CommonCode.status == "ACTIVE")
-
-        # 전체 개수
-        count_query = select(func.count(CommonCode.id)).select_from(CommonCode).where(CommonCode.parent_code == None)
-        if search_filter is not None:
-            count_query = count_query.where(search_filter)
-        if filters and "status" in filters:
-            count_query = count_query.where(CommonCode.status == filters["status"])
+            conditions.append(CommonCode.status == filters["status"])
         else:
-            count_query = count_query.where(CommonCode.status == "ACTIVE")
-
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # 데이터 조회
-        query = query.limit(limit).offset(offset).order_by(CommonCode.sort_order, CommonCode.code)
-        result = await db.execute(query)
-        codes = result.scalars().all()
+            conditions.append(CommonCode.status == "ACTIVE")
 
         # 응답 변환
-        items = [
-            CodeHelpResult(
+        def to_result(c) -> CodeHelpResult:
+            return CodeHelpResult(
                 id=str(c.id),
                 code=c.code,
                 name=c.name,
@@ -384,8 +332,17 @@ class ParentCodeSearchHandler(CodeHelpHandler):
                 created_at=c.created_at,
                 updated_at=c.updated_at,
             )
-            for c in codes
-        ]
+
+        # 목록 + 전체 개수 (윈도우 COUNT로 한 번에 조회)
+        items, total_count = await get_list_with_count(
+            db=db,
+            model_class=CommonCode,
+            to_graphql=to_result,
+            limit=limit,
+            offset=offset,
+            order_by=[CommonCode.sort_order, CommonCode.code],
+            extra_conditions=conditions,
+        )
 
         return total_count, items
 
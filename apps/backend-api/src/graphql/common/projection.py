@@ -0,0 +1,165 @@
+"""GraphQL 공통 컬럼 프로젝션 유틸리티
+
+GraphQL 요청의 selection set에서 실제로 요청된 필드를 분석하여,
+해당 필드에 필요한 컬럼만 조회(load_only)하도록 돕습니다.
+목록 화면에서 넓은 Text/JSONB 컬럼을 읽지 않아 전송량과 ORM 하이드레이션 비용을 줄입니다.
+
+동작 규칙:
+    - GraphQL 필드명(camelCase)을 snake_case로 변환하여 모델 컬럼과 매칭
+    - 컬럼이 아닌 관계 필드(예: user)는 {필드명}_id 컬럼을 대신 포함
+    - 매칭할 수 없는 필드가 하나라도 있으면 프로젝션하지 않음 (전체 컬럼 조회)
+    - id, created_at은 항상 포함 (식별/커서 생성용)
+    - Connection 래퍼(edges.node, items)는 자동으로 내려가서 노드 필드를 분석
+
+사용 예:
+    users = await get_list(db, User, user_to_graphql, info=info)
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+from strawberry.utils.str_converters import to_snake_case
+
+
+# 항상 조회하는 컬럼 (식별자, 키셋 커서)
+ALWAYS_LOADED_COLUMNS = ("id", "created_at")
+
+# 노드 목록을 감싸는 래퍼 필드 (Relay Connection, 목록 응답)
+_WRAPPER_PATHS = (("edges", "node"), ("items",))
+
+
+def _flatten(selections: Iterable[Any]) -> list[SelectedField]:
+    """프래그먼트(... on Type, ...Fragment)를 펼쳐 필드 목록으로 변환"""
+    fields: list[SelectedField] = []
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            fields.append(selection)
+        elif isinstance(selection, FragmentSpread | InlineFragment):
+            fields.extend(_flatten(selection.selections))
+    return fields
+
+
+def _descend(fields: list[SelectedField], path: Sequence[str]) -> list[SelectedField] | None:
+    """래퍼 경로(edges → node 등)를 따라 노드의 필드 목록 반환"""
+    for name in path:
+        children = [field for field in fields if field.name == name]
+        if not children:
+            return None
+        fields = _flatten(selection for child in children for selection in child.selections)
+    return fields
+
+
+def get_selected_field_names(info: Any) -> set[str] | None:
+    """
+    현재 리졸버가 반환하는 노드 타입에서 요청된 필드명(snake_case) 조회
+
+    Args:
+        info: Strawberry Info
+
+    Returns:
+        요청된 필드명 집합 (selection set을 분석할 수 없으면 None)
+    """
+    selected = getattr(info, "selected_fields", None)
+    if not selected:
+        return None
+
+    fields = _flatten(selection for field in selected for selection in field.selections)
+
+    # Connection/목록 래퍼이면 노드 필드까지 내려감
+    for path in _WRAPPER_PATHS:
+        node_fields = _descend(fields, path)
+        if node_fields is not None:
+            fields = node_fields
+            break
+
+    return {to_snake_case(field.name) for field in fields if not field.name.startswith("__")}
+
+
+def get_projection_keys(info: Any, model_class: type) -> frozenset[str] | None:
+    """
+    요청된 필드에 해당하는 컬럼 키 집합 조회
+
+    문장 캐시 키로도 사용되므로 정렬 무관한 frozenset으로 반환합니다.
+
+    Args:
+        info: Strawberry Info (None이면 프로젝션하지 않음)
+        model_class: SQLAlchemy 모델 클래스
+
+    Returns:
+        조회할 컬럼 키 집합 (프로젝션 불가 또는 불필요 시 None)
+    """
+    if info is None:
+        return None
+
+    field_names = get_selected_field_names(info)
+    if not field_names:
+        return None
+
+    column_keys = {attr.key for attr in sa_inspect(model_class).column_attrs}
+
+    # 1. 요청 필드 → 컬럼 매핑
+    keys = {key for key in ALWAYS_LOADED_COLUMNS if key in column_keys}
+    for name in field_names:
+        if name in column_keys:
+            keys.add(name)
+        elif f"{name}_id" in column_keys:
+            # 관계 필드 (예: user → user_id)
+            keys.add(f"{name}_id")
+        else:
+            # 의존 컬럼을 알 수 없는 계산 필드 → 안전하게 전체 컬럼 조회
+            return None
+
+    # 2. 모든 컬럼이 요청되었으면 프로젝션 불필요
+    if keys >= column_keys:
+        return None
+
+    return frozenset(keys)
+
+
+def get_projection_options(info: Any, model_class: type) -> list[Any]:
+    """
+    요청된 필드에 해당하는 컬럼만 조회하는 로더 옵션 생성
+
+    Args:
+        info: Strawberry Info (None이면 프로젝션하지 않음)
+        model_class: SQLAlchemy 모델 클래스
+
+    Returns:
+        select().options()에 전달할 옵션 리스트 (프로젝션 불가 시 빈 리스트)
+    """
+    keys = get_projection_keys(info, model_class)
+    if not keys:
+        return []
+
+    return [load_only(*(getattr(model_class, key) for key in sorted(keys)), raiseload=False)]
+
+
+def finalize_projected(db: AsyncSession, items: Iterable[Any]) -> None:
+    """
+    프로젝션으로 조회한 모델의 미조회 컬럼 정리
+
+    *_to_graphql 변환 함수는 모든 속성에 접근하므로, 미조회 컬럼에 접근하면
+    비동기 세션에서 지연 로딩(lazy load)이 발생합니다. 미조회 컬럼은 None으로
+    채우고(변경 추적 없이), 부분 로딩된 객체가 같은 세션의 다른 조회에 재사용되지
+    않도록 세션에서 분리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        items: 조회된 모델 객체들
+    """
+    for item in items:
+        state = sa_inspect(item)
+        column_keys = {attr.key for attr in state.mapper.column_attrs}
+        unloaded = state.unloaded & column_keys
+        if not unloaded:
+            # 이미 전체 로딩된 객체 (identity map에 있던 객체 등)
+            continue
+
+        for key in unloaded:
+            set_committed_value(item, key, None)
+        db.expunge(item)
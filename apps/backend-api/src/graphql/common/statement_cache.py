@@ -0,0 +1,271 @@
+"""GraphQL 공통 SQL 문장(Statement) 캐시
+
+공통 Query/Mutation 헬퍼(get_by_id, get_list, get_count, update_entity 등)는
+호출마다 select()를 새로 만들고 필터 키마다 hasattr/getattr을 수행합니다.
+SQLAlchemy는 새 문장 객체마다 캐시 키를 다시 계산해야 하므로,
+리졸버 호출당 수십~수백 마이크로초의 CPU를 문장 구성에 사용하게 됩니다.
+
+이 모듈은 (모델, 필터 키 집합, 정렬, ...) 단위로 값 대신 bindparam을 사용한
+문장 템플릿을 캐시합니다. 같은 모양의 요청은 같은 문장 객체를 재사용하므로:
+    - 문장 구성 / 캐시 키 계산 비용이 사라지고 (캐시 키는 객체에 메모이즈됨)
+    - SQLAlchemy 컴파일 캐시와 asyncpg prepared statement 캐시가 항상 적중합니다
+
+사용 예:
+    stmt, params = select_by_id_statement(User, user_id, {"is_deleted": False})
+    result = await db.execute(stmt, params)
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import Integer, Select, bindparam, func, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, load_only
+from sqlalchemy.sql.elements import UnaryExpression
+
+
+# 캐시 최대 문장 수 (모델 × 필터 조합 수에 비례)
+DEFAULT_MAX_STATEMENTS = 1024
+
+
+class StatementCache:
+    """
+    SQL 문장 템플릿 LRU 캐시
+
+    키는 문장의 "모양"(모델, 필터 키, 정렬 등)이며 값은 bindparam을 사용하는
+    Select 객체입니다. 문장 객체는 불변으로 취급하며, 호출자는 .where() 등으로
+    파생 문장을 만들 수 있지만 캐시된 객체를 수정하지 않습니다.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_STATEMENTS) -> None:
+        self.max_size = max_size
+        self._statements: OrderedDict[Hashable, Select] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Select]) -> Select:
+        """캐시된 문장 반환 (없으면 build()로 생성 후 저장)"""
+        with self._lock:
+            stmt = self._statements.get(key)
+            if stmt is not None:
+                self._statements.move_to_end(key)
+                self.hits += 1
+                return stmt
+
+        stmt = build()
+
+        with self._lock:
+            self.misses += 1
+            self._statements[key] = stmt
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+        return stmt
+
+    def clear(self) -> None:
+        """캐시 비우기 (테스트용)"""
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+# 전역 문장 캐시 (프로세스 단위)
+statement_cache = StatementCache()
+
+# 캐시할 수 없는 정렬 기준 표시
+_UNCACHEABLE = object()
+
+
+def _filter_spec(
+    model_class: type, filters: dict[str, Any], skip_none: bool
+) -> tuple[tuple[str, bool], ...]:
+    """
+    필터 딕셔너리를 캐시 키용 명세로 변환
+
+    Returns:
+        ((필드명, 값이 None인지), ...) - 모델에 없는 필드는 제외
+    """
+    return tuple(
+        (field, value is None)
+        for field, value in filters.items()
+        if hasattr(model_class, field) and not (skip_none and value is None)
+    )
+
+
+def _filter_params(filters: dict[str, Any], spec: tuple[tuple[str, bool], ...]) -> dict[str, Any]:
+    """필터 명세에 해당하는 bind 파라미터 값"""
+    return {f"f_{field}": filters[field] for field, is_null in spec if not is_null}
+
+
+def _filter_conditions(model_class: type, spec: tuple[tuple[str, bool], ...]) -> list[Any]:
+    """필터 명세를 bindparam 조건으로 변환 (None 값은 IS NULL)"""
+    conditions = []
+    for field, is_null in spec:
+        column = getattr(model_class, field)
+        conditions.append(column.is_(None) if is_null else column == bindparam(f"f_{field}"))
+    return conditions
+
+
+def _order_by_key(order_by: Any) -> Hashable:
+    """
+    정렬 기준을 캐시 키로 변환
+
+    모델 컬럼 또는 컬럼.asc()/desc()만 캐시하고, 그 외 식은 캐시하지 않습니다.
+    """
+    if order_by is None:
+        return None
+
+    items = order_by if isinstance(order_by, list) else [order_by]
+    key = []
+    for item in items:
+        modifier = None
+        if isinstance(item, UnaryExpression):
+            modifier = item.modifier
+            item = item.element
+        if isinstance(item, InstrumentedAttribute):
+            key.append((item.class_, item.key, modifier))
+        elif getattr(item, "table", None) is not None and getattr(item, "key", None):
+            key.append((item.table, item.key, modifier))
+        else:
+            return _UNCACHEABLE
+    return tuple(key)
+
+
+def _projection_options(model_class: type, projection: frozenset[str] | None) -> list[Any]:
+    """프로젝션 컬럼 키를 load_only 옵션으로 변환"""
+    if not projection:
+        return []
+    return [
+        load_only(*(getattr(model_class, key) for key in sorted(projection)), raiseload=False)
+    ]
+
+
+def select_by_id_statement(
+    model_class: type,
+    id_: Any,
+    filters: dict[str, Any],
+    projection: frozenset[str] | None = None,
+) -> tuple[Select, dict[str, Any]]:
+    """
+    ID 단건 조회 문장 (get_by_id, update_entity, delete_entity 공용)
+
+    필터 값이 None이면 IS NULL 조건으로 처리합니다.
+
+    Returns:
+        (캐시된 문장, bind 파라미터) 튜플
+    """
+    spec = _filter_spec(model_class, filters, skip_none=False)
+
+    def build() -> Select:
+        return (
+            select(model_class)
+            .where(
+                model_class.id == bindparam("id_"),  # type: ignore[attr-defined]
+                *_filter_conditions(model_class, spec),
+            )
+            .options(*_projection_options(model_class, projection))
+        )
+
+    stmt = statement_cache.get_or_build(("by_id", model_class, spec, projection), build)
+    return stmt, {"id_": id_, **_filter_params(filters, spec)}
+
+
+def select_list_statement(
+    model_class: type,
+    filters: dict[str, Any],
+    order_by: Any = None,
+    keyset: bool = False,
+    seek: bool = False,
+    with_total: bool = False,
+    projection: frozenset[str] | None = None,
+) -> tuple[Select, Callable[..., dict[str, Any]]]:
+    """
+    목록 조회 문장 (get_list, get_list_with_count 공용)
+
+    값이 None인 단순 필터는 적용하지 않습니다. limit/offset과 키셋 커서 값도
+    bindparam이므로 페이지가 달라도 같은 문장을 재사용합니다.
+
+    Args:
+        model_class: SQLAlchemy 모델 클래스
+        filters: 단순 필터 조건
+        order_by: 정렬 기준 (키셋 모드에서는 무시)
+        keyset: 키셋 모드 ((created_at, id) 내림차순, offset 미사용)
+        seek: 키셋 커서 조건 포함 여부 (after 지정 시)
+        with_total: COUNT(*) OVER () 전체 개수 컬럼 포함 여부
+        projection: load_only 대상 컬럼 키
+
+    Returns:
+        (문장, 파라미터 생성 함수) 튜플.
+        캐시할 수 없는 정렬 식(func 등)이면 매번 새로 구성한 문장을 반환합니다.
+    """
+    order_key = None if keyset else _order_by_key(order_by)
+    spec = _filter_spec(model_class, filters, skip_none=True)
+
+    def build() -> Select:
+        columns: list[Any] = [model_class]
+        if with_total:
+            columns.append(func.count().over().label("total_count"))
+
+        stmt = select(*columns).where(*_filter_conditions(model_class, spec))
+        stmt = stmt.limit(bindparam("_limit", type_=Integer))
+
+        if keyset:
+            created_at_col = model_class.created_at  # type: ignore[attr-defined]
+            id_col = model_class.id  # type: ignore[attr-defined]
+            if seek:
+                stmt = stmt.where(
+                    tuple_(created_at_col, id_col)
+                    < tuple_(
+                        bindparam("_after_created_at", type_=created_at_col.type),
+                        bindparam("_after_id", type_=id_col.type),
+                    )
+                )
+            stmt = stmt.order_by(created_at_col.desc(), id_col.desc())
+        else:
+            stmt = stmt.offset(bindparam("_offset", type_=Integer))
+            if order_by is not None:
+                stmt = stmt.order_by(*(order_by if isinstance(order_by, list) else [order_by]))
+            elif hasattr(model_class, "created_at"):
+                stmt = stmt.order_by(model_class.created_at.desc())  # type: ignore[attr-defined]
+
+        return stmt.options(*_projection_options(model_class, projection))
+
+    if order_key is _UNCACHEABLE:
+        stmt = build()
+    else:
+        key = ("list", model_class, spec, order_key, keyset, seek, with_total, projection)
+        stmt = statement_cache.get_or_build(key, build)
+    base_params = _filter_params(filters, spec)
+
+    def params(**paging: Any) -> dict[str, Any]:
+        return {**base_params, **paging}
+
+    return stmt, params
+
+
+def select_count_statement(
+    model_class: type, filters: dict[str, Any]
+) -> tuple[Select, dict[str, Any]]:
+    """
+    개수 조회 문장 (get_count 및 범위 밖 페이지 보정용)
+
+    Returns:
+        (캐시된 문장, bind 파라미터) 튜플
+    """
+    spec = _filter_spec(model_class, filters, skip_none=True)
+
+    def build() -> Select:
+        return (
+            select(func.count())
+            .select_from(model_class)
+            .where(*_filter_conditions(model_class, spec))
+        )
+
+    stmt = statement_cache.get_or_build(("count", model_class, spec), build)
+    return stmt, _filter_params(filters, spec)
@@ -1,12 +1,30 @@
 """GraphQL Context - 멀티 DB 지원"""
 
+from collections.abc import AsyncGenerator
+from dataclasses import field
+
 import strawberry
 from fastapi import Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from strawberry.fastapi import BaseContext
 
-from src.core.database import get_manager_db_session, get_tenant_db_session
+from src.core.config import settings
+from src.core.database import (
+    ManagerSessionLocal,
+    TenantEngineEntry,
+    UnitOfWorkSession,
+    tenant_engine_registry,
+)
+from src.core.exceptions import NotFoundError
+from src.core.logging import get_logger
+from src.core.rate_limit import rate_limiter
 from src.core.security import decode_access_token
+from src.core.session_auth import validate_session
+
+from .loaders import LoaderRegistry, create_loaders
+
+
+logger = get_logger("graphql.context")
 
 
 @strawberry.type
@@ -17,6 +35,13 @@ class GraphQLContext(BaseContext):
     3단계 구조를 위한 멀티 DB 세션 지원:
     - Manager DB: manager.idam, manager.tenant_mgmt
     - Tenant DB: tenants.sys, tenants.crm, tenants.hrm
+
+    DB 세션은 리졸버가 처음 접근할 때 생성되며(지연 생성),
+    요청이 끝나면 get_context에서 close_db_sessions()로 반드시 정리합니다.
+
+    unit of work 모드 (Mutation 작업, UnitOfWorkExtension에서 시작/종료):
+        작업 동안 세션의 commit()은 flush만 수행하고, 작업이 끝나면 한 번에 커밋합니다.
+        한 요청의 여러 Mutation(예: 사용자 생성 → 역할 할당)이 하나의 트랜잭션으로 묶입니다.
     """
 
     request: strawberry.Private[Request]
@@ -26,36 +51,119 @@ class GraphQLContext(BaseContext):
     username: str
     role: str
     tenant_key: str | None = None
+    session_id: str | None = None
 
-    # DB 세션
-    manager_db_session: strawberry.Private[AsyncSession]
-    tenant_db_session: strawberry.Private[AsyncSession | None] = None
+    # DB 세션 팩토리 (세션 자체는 최초 접근 시 생성)
+    manager_session_factory: strawberry.Private[async_sessionmaker[AsyncSession]] = (
+        ManagerSessionLocal
+    )
+    tenant_session_factory: strawberry.Private[async_sessionmaker[AsyncSession] | None] = None
 
     # DataLoaders (3단계 네이밍: 시스템.스키마.엔티티)
-    loaders: strawberry.Private[dict]
+    loaders: strawberry.Private[LoaderRegistry] = field(default_factory=LoaderRegistry)
+
+    # 요청 중 생성된 세션
+    opened_sessions: strawberry.Private[dict[str, AsyncSession]] = field(default_factory=dict)
+
+    # unit of work 모드 여부 (이 동안 생성되는 세션도 커밋을 미룸)
+    unit_of_work: strawberry.Private[bool] = False
+
+    def _open_session(self, name: str, factory: async_sessionmaker[AsyncSession]) -> AsyncSession:
+        session = factory()
+        if self.unit_of_work and isinstance(session, UnitOfWorkSession):
+            session.defer_commits()
+        self.opened_sessions[name] = session
+        return session
+
+    @property
+    def manager_db_session(self) -> AsyncSession:
+        """Manager DB 세션 (최초 접근 시 생성)"""
+        session = self.opened_sessions.get("manager")
+        if session is None:
+            session = self._open_session("manager", self.manager_session_factory)
+        return session
+
+    @property
+    def tenant_db_session(self) -> AsyncSession | None:
+        """Tenant DB 세션 (tenant_key가 있을 때만, 최초 접근 시 생성)"""
+        if self.tenant_session_factory is None:
+            return None
+
+        session = self.opened_sessions.get("tenant")
+        if session is None:
+            session = self._open_session("tenant", self.tenant_session_factory)
+        return session
+
+    def begin_unit_of_work(self) -> None:
+        """unit of work 시작 (이미 열린 세션 포함)"""
+        self.unit_of_work = True
+        for session in self.opened_sessions.values():
+            if isinstance(session, UnitOfWorkSession):
+                session.defer_commits()
+
+    async def end_unit_of_work(self, commit: bool) -> bool | None:
+        """
+        unit of work 종료 (세션별 커밋 또는 전체 롤백)
+
+        한 세션이라도 중간에 롤백되었거나 커밋에 실패하면 나머지 세션은 롤백합니다.
+        (Manager/Tenant DB 간 2단계 커밋은 아님)
+
+        Args:
+            commit: True면 커밋, False면 롤백
+
+        Returns:
+            커밋 여부 (미룬 커밋이 없었으면 None)
+        """
+        self.unit_of_work = False
+        sessions = [
+            session
+            for session in self.opened_sessions.values()
+            if isinstance(session, UnitOfWorkSession) and session.deferring
+        ]
+        has_work = any(session.deferred_commits for session in sessions)
+        if any(session.rolled_back for session in sessions):
+            commit = False
+        try:
+            for session in sessions:
+                commit = await session.complete(commit)
+        except Exception:
+            for session in sessions:
+                if session.deferring:
+                    await session.complete(False)
+            raise
+        return commit if has_work else None
 
+    async def close_db_sessions(self) -> None:
+        """요청 중 생성된 DB 세션 정리 (미완료 트랜잭션은 롤백)"""
+        sessions = list(self.opened_sessions.values())
+        self.opened_sessions.clear()
+        for session in sessions:
+            await session.close()
 
-async def get_context(request: Request) -> GraphQLContext:
+
+async def get_context(request: Request) -> AsyncGenerator[GraphQLContext, None]:
     """
     GraphQL Context 생성
 
     Manager/Tenants 시스템 모두 지원
 
+    FastAPI yield 의존성으로 동작하여 요청 종료 시 DB 세션을 정리합니다.
+    세션은 리졸버가 실제로 사용할 때만 생성되므로
+    introspection 등 DB를 사용하지 않는 요청은 커넥션을 점유하지 않습니다.
+
     인증이 필요 없는 쿼리/뮤테이션:
     - signup: 회원가입
     - signin: 로그인
     - forgot_password: 비밀번호 찾기
     - reset_password: 비밀번호 재설정
     """
-    # Manager DB 세션 (항상 필요)
-    manager_db = await get_manager_db_session()
-
     # 1. JWT 토큰 파싱 (선택적)
     auth_header = request.headers.get("Authorization")
     user_id = ""
     username = ""
     role = ""
     tenant_key = None
+    session_id = None
 
     if auth_header:
         try:
@@ -65,27 +173,52 @@ async def get_context(request: Request) -> GraphQLContext:
             username = token_data.get("username", "")
             role = token_data.get("role", "")
             tenant_key = token_data.get("tenant_key")
+            session_id = token_data.get("session_id")
         except Exception:
             # 토큰 파싱 실패 시 무시 (인증 필요 없는 작업용)
             pass
 
-    # 2. Tenant DB 세션 (tenant_key 있을 때만)
-    tenant_db = None
+    # 세션 검증 (폐기/만료된 세션의 토큰은 미인증으로 처리, 정상 상태에서는 캐시만 조회)
+    if user_id and session_id and not await validate_session(session_id, user_id):
+        user_id = username = role = ""
+        tenant_key = session_id = None
+
+    # 2. 요청 제한 (사용자/테넌트별 intg.rate_limits, 초과 시 429)
+    if user_id and settings.rate_limit_enabled:
+        rules = await rate_limiter.rules_for_user(user_id)
+        if tenant_key:
+            rules += await rate_limiter.rules_for_tenant(tenant_key)
+        await rate_limiter.enforce(rules)
+
+    # 3. Tenant DB 엔진 임대 (tenant_key 있을 때만, 요청 종료 시 반납, 커넥션은 점유하지 않음)
+    tenant_engine: TenantEngineEntry | None = None
     if tenant_key:
-        tenant_db = await get_tenant_db_session(tenant_key)
-
-    # 3. DataLoaders 생성
-    from .loaders import create_loaders
-
-    loaders = create_loaders(manager_db, tenant_db)
-
-    return GraphQLContext(
-        request=request,
-        user_id=user_id,
-        username=username,
-        role=role,
-        tenant_key=tenant_key,
-        manager_db_session=manager_db,
-        tenant_db_session=tenant_db,
-        loaders=loaders,
-    )
+        try:
+            tenant_engine = await tenant_engine_registry.acquire(tenant_key)
+        except NotFoundError:
+            # 삭제/미등록 테넌트의 토큰은 미인증으로 처리
+            logger.warning(f"알 수 없는 테넌트의 토큰: tenant_key={tenant_key}")
+            user_id = username = role = ""
+            tenant_key = session_id = None
+
+    try:
+        context = GraphQLContext(
+            request=request,
+            user_id=user_id,
+            username=username,
+            role=role,
+            tenant_key=tenant_key,
+            session_id=session_id,
+            tenant_session_factory=tenant_engine.session_factory if tenant_engine else None,
+        )
+
+        # 4. DataLoaders 생성 (세션은 배치 로딩 시점에 컨텍스트에서 가져옴)
+        context.loaders = create_loaders(context)
+
+        try:
+            yield context
+        finally:
+            await context.close_db_sessions()
+    finally:
+        if tenant_engine is not None:
+            await tenant_engine_registry.release(tenant_engine, tenant_key)
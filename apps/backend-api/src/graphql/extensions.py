@@ -0,0 +1,445 @@
+"""GraphQL 스키마 확장 (문서 캐시 + 쿼리 비용 제한 + 성능 계측)
+
+DocumentCacheExtension은 같은 쿼리 문서의 파싱/검증을 스키마별 LRU로 건너뜁니다
+(graphql/persisted_queries.py의 DocumentCache).
+
+QueryCostExtension은 검증을 통과한 쿼리의 비용/깊이를 실행 전에 계산하여
+(graphql/query_cost.py) 제한을 넘으면 거부하고, 테넌트별 실행 예산이 모자라면
+대기시킵니다. 계산된 비용은 응답 extensions.cost로 반환합니다.
+
+UnitOfWorkExtension은 Mutation 작업을 하나의 트랜잭션으로 실행합니다
+(GraphQLContext unit of work 모드). 헬퍼의 commit()은 flush로 바뀌고, 작업이 오류 없이
+끝나면 한 번 커밋하며, 오류가 있으면 작업의 모든 변경을 롤백합니다.
+
+PerformanceExtension은 GraphQL 작업(operation)마다:
+    1. 사용자 정의 리졸버의 실행 시간 측정 (기본 속성 리졸버/인트로스펙션 제외)
+    2. 리졸버 실행 중 발생한 SQL 횟수/시간을 필드별로 집계 (core.metrics.instrument_engine)
+    3. 같은 필드에서 같은 SQL이 임계값을 초과해 반복되면 N+1 경고 로그 + 카운터 증가
+
+결과는 /metrics(Prometheus)로 노출되고, Server-Timing 헤더에 sql 항목으로 추가되며,
+settings.graphql_metrics_in_response가 켜져 있으면 응답 extensions.performance에도
+포함됩니다 (개발용).
+
+DataLoader 일괄 조회 SQL은 처음 load()를 호출한 필드로 집계됩니다.
+비동기 실행(schema.execute) 전용입니다.
+"""
+
+import time
+from inspect import isawaitable
+from typing import Any
+
+from strawberry.extensions import SchemaExtension
+from strawberry.extensions.tracing.utils import should_skip_tracing
+from strawberry.types.graphql import OperationType
+
+from graphql import ExecutionResult as GraphQLExecutionResult
+from graphql import GraphQLError
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.core.metrics import (
+    QueryTracker,
+    metrics_registry,
+    reset_current_field,
+    set_current_field,
+    track_queries,
+)
+from src.core.middleware import add_server_timing
+
+from .context import GraphQLContext
+from .persisted_queries import DocumentCache
+from .query_cost import QueryCost, QueryCostError, analyze_query, cost_admission
+
+
+logger = get_logger("graphql.performance")
+
+OPERATION_DURATION = metrics_registry.histogram(
+    "graphql_operation_duration_seconds",
+    "GraphQL 작업 처리 시간",
+    ("schema", "operation_type"),
+)
+OPERATION_SQL_QUERIES = metrics_registry.histogram(
+    "graphql_operation_sql_queries",
+    "GraphQL 작업당 SQL 실행 횟수",
+    ("schema", "operation_type"),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+RESOLVER_DURATION = metrics_registry.histogram(
+    "graphql_resolver_duration_seconds",
+    "리졸버 실행 시간",
+    ("schema", "field"),
+)
+RESOLVER_SQL_QUERIES = metrics_registry.counter(
+    "graphql_resolver_sql_queries_total",
+    "리졸버에서 실행된 SQL 횟수",
+    ("schema", "field"),
+)
+RESOLVER_SQL_DURATION = metrics_registry.counter(
+    "graphql_resolver_sql_duration_seconds_total",
+    "리졸버에서 실행된 SQL 시간 합계",
+    ("schema", "field"),
+)
+N_PLUS_ONE = metrics_registry.counter(
+    "graphql_n_plus_one_total",
+    "같은 필드에서 같은 SQL이 임계값을 초과해 반복된 작업 수 (N+1 의심)",
+    ("schema", "field"),
+)
+QUERY_COST = metrics_registry.histogram(
+    "graphql_query_cost",
+    "GraphQL 쿼리 정적 분석 비용",
+    ("schema",),
+    buckets=(10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000),
+)
+QUERY_REJECTED = metrics_registry.counter(
+    "graphql_query_rejected_total",
+    "비용/깊이 제한으로 거부된 쿼리 수",
+    ("schema", "code"),
+)
+COST_QUEUE_WAIT = metrics_registry.histogram(
+    "graphql_cost_queue_wait_seconds",
+    "실행 예산 대기 시간 (대기한 쿼리만)",
+    ("schema",),
+)
+UNIT_OF_WORK = metrics_registry.counter(
+    "graphql_unit_of_work_total",
+    "Mutation 작업 트랜잭션 종료 수",
+    ("schema", "outcome"),
+)
+
+# 스키마 이름 → 문서 캐시 (/metrics 수집용)
+document_caches: dict[str, DocumentCache] = {}
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """
+    파싱/검증된 문서 캐시
+
+    Strawberry의 ParserCache/ValidationCache는 인스턴스를 요청 간에 공유하므로
+    (execution_context를 덮어씀) 동시 요청에서 안전하지 않아, 요청마다 생성되는
+    확장 + 스키마별 DocumentCache로 구현합니다.
+    """
+
+    documents: DocumentCache
+
+    @classmethod
+    def for_schema(cls, schema_name: str) -> type["DocumentCacheExtension"]:
+        """스키마별 문서 캐시를 사용하는 확장 클래스 생성"""
+        documents = document_caches.setdefault(
+            schema_name, DocumentCache(settings.graphql_document_cache_size)
+        )
+        return type(f"{schema_name.title()}{cls.__name__}", (cls,), {"documents": documents})
+
+    def __init__(self, *, execution_context: Any):
+        super().__init__(execution_context=execution_context)
+        self._cached = False
+
+    def on_parse(self):
+        execution_context = self.execution_context
+        document = self.documents.get(execution_context.query) if execution_context.query else None
+        if document is not None:
+            # graphql_document가 있으면 Strawberry가 파싱을 건너뜀
+            execution_context.graphql_document = document
+            self._cached = True
+        yield
+
+    def on_validate(self):
+        execution_context = self.execution_context
+        if self._cached:
+            # errors가 None이 아니면 Strawberry가 검증을 건너뜀
+            execution_context.errors = []
+        yield
+        if not self._cached and execution_context.errors == []:
+            self.documents.set(execution_context.query, execution_context.graphql_document)
+
+
+class QueryCostExtension(SchemaExtension):
+    """쿼리 비용/깊이 제한 + 테넌트별 비용 기반 실행 허용"""
+
+    schema_name = "graphql"
+
+    @classmethod
+    def for_schema(cls, schema_name: str) -> type["QueryCostExtension"]:
+        """스키마 이름(메트릭 레이블)이 지정된 확장 클래스 생성"""
+        return type(f"{schema_name.title()}{cls.__name__}", (cls,), {"schema_name": schema_name})
+
+    def __init__(self, *, execution_context: Any):
+        super().__init__(execution_context=execution_context)
+        self._cost: QueryCost | None = None
+        self._queued = 0.0
+
+    def _subject(self) -> str:
+        """실행 예산 주체 (테넌트, 없으면 사용자)"""
+        context = self.execution_context.context
+        tenant_key = getattr(context, "tenant_key", None)
+        if tenant_key:
+            return tenant_key
+        return f"user:{getattr(context, 'user_id', '') or 'anonymous'}"
+
+    def _check_limits(self, cost: QueryCost) -> None:
+        if cost.depth > settings.graphql_max_depth:
+            raise QueryCostError(
+                "쿼리 깊이가 허용 범위를 초과합니다",
+                code="QUERY_TOO_DEEP",
+                detail={"depth": cost.depth, "max_depth": settings.graphql_max_depth},
+            )
+        if cost.cost > settings.graphql_max_query_cost:
+            raise QueryCostError(
+                "쿼리 비용이 허용 범위를 초과합니다. limit을 줄이거나 필드를 나누어 요청하세요",
+                code="QUERY_TOO_COMPLEX",
+                detail={"cost": cost.cost, "max_cost": settings.graphql_max_query_cost},
+            )
+
+    def _reject(self, error: QueryCostError) -> None:
+        QUERY_REJECTED.inc(self.schema_name, error.code)
+        # result를 지정하면 Strawberry가 실행을 건너뜀
+        self.execution_context.result = GraphQLExecutionResult(
+            data=None,
+            errors=[
+                GraphQLError(error.message, extensions={"code": error.code, **error.detail})
+            ],
+        )
+
+    async def on_execute(self):
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        if document is None or execution_context.result is not None:
+            yield
+            return
+
+        # 1. 정적 분석 (검증 이후, 실행 전)
+        cost = analyze_query(
+            execution_context.schema._schema,
+            document,
+            execution_context.operation_name,
+            execution_context.variables,
+        )
+        self._cost = cost
+        QUERY_COST.observe(cost.cost, self.schema_name)
+
+        # 2. 쿼리 단위 제한 + 실행 예산 대기
+        subject = self._subject()
+        try:
+            self._check_limits(cost)
+            self._queued = await cost_admission.acquire(subject, cost.cost)
+        except QueryCostError as e:
+            self._reject(e)
+            yield
+            return
+
+        if self._queued:
+            COST_QUEUE_WAIT.observe(self._queued, self.schema_name)
+
+        # 3. 실행 (종료 시 예산 반환)
+        try:
+            yield
+        finally:
+            await cost_admission.release(subject, cost.cost)
+
+    def get_results(self) -> dict[str, Any]:
+        if self._cost is None:
+            return {}
+        cost = {"requested": self._cost.cost, "depth": self._cost.depth}
+        if self._queued:
+            cost["queued_ms"] = round(self._queued * 1000, 3)
+        return {"cost": cost}
+
+
+class UnitOfWorkExtension(SchemaExtension):
+    """Mutation 작업 단위 트랜잭션 (한 번 커밋, 오류 시 전체 롤백)"""
+
+    schema_name = "graphql"
+
+    @classmethod
+    def for_schema(cls, schema_name: str) -> type["UnitOfWorkExtension"]:
+        """스키마 이름(메트릭 레이블)이 지정된 확장 클래스 생성"""
+        return type(f"{schema_name.title()}{cls.__name__}", (cls,), {"schema_name": schema_name})
+
+    def _fail(self, error: GraphQLError) -> None:
+        # 롤백된 작업의 data는 저장되지 않은 값이므로 반환하지 않음
+        result = self.execution_context.result
+        errors = list(result.errors or []) if result is not None else []
+        self.execution_context.result = GraphQLExecutionResult(data=None, errors=[*errors, error])
+
+    async def on_execute(self):
+        execution_context = self.execution_context
+        context = execution_context.context
+        if (
+            not settings.graphql_unit_of_work
+            or execution_context.result is not None
+            or not isinstance(context, GraphQLContext)
+            or execution_context.operation_type != OperationType.MUTATION
+        ):
+            yield
+            return
+
+        # 1. 실행 (세션 commit()은 flush만 수행)
+        context.begin_unit_of_work()
+        try:
+            yield
+        except BaseException:
+            await context.end_unit_of_work(commit=False)
+            raise
+
+        # 2. 오류가 없으면 커밋, 있으면 작업 전체 롤백
+        result = execution_context.result
+        success = result is not None and not result.errors
+        try:
+            committed = await context.end_unit_of_work(commit=success)
+        except Exception as e:
+            logger.exception("Mutation 트랜잭션 커밋 실패")
+            UNIT_OF_WORK.inc(self.schema_name, "failed")
+            self._fail(
+                GraphQLError(
+                    "변경 사항을 저장하지 못했습니다",
+                    extensions={"code": "TRANSACTION_FAILED"},
+                    original_error=e,
+                )
+            )
+            return
+
+        if committed is None:
+            return
+        UNIT_OF_WORK.inc(self.schema_name, "committed" if committed else "rolled_back")
+        if not committed:
+            self._fail(
+                GraphQLError(
+                    "요청의 변경 사항이 모두 롤백되었습니다",
+                    extensions={"code": "TRANSACTION_ROLLED_BACK"},
+                )
+            )
+
+
+class PerformanceExtension(SchemaExtension):
+    """리졸버/SQL 성능 계측 (schema_name은 for_schema()로 지정)"""
+
+    schema_name = "graphql"
+
+    @classmethod
+    def for_schema(cls, schema_name: str) -> type["PerformanceExtension"]:
+        """스키마 이름(메트릭 레이블)이 지정된 확장 클래스 생성"""
+        return type(f"{schema_name.title()}{cls.__name__}", (cls,), {"schema_name": schema_name})
+
+    def __init__(self, *, execution_context: Any):
+        super().__init__(execution_context=execution_context)
+        self._tracker: QueryTracker | None = None
+        self._duration = 0.0
+
+    def on_operation(self):
+        start = time.perf_counter()
+        with track_queries() as tracker:
+            self._tracker = tracker
+            yield
+        self._duration = time.perf_counter() - start
+        self._report(tracker)
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        if self._tracker is None or should_skip_tracing(_next, info):
+            return _next(root, info, *args, **kwargs)
+
+        field_name = f"{info.parent_type.name}.{info.field_name}"
+        token = set_current_field(field_name)
+        start = time.perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._record_resolver(field_name, start)
+            raise
+        finally:
+            reset_current_field(token)
+
+        if isawaitable(result):
+            return self._await_resolver(result, field_name, start)
+
+        self._record_resolver(field_name, start)
+        return result
+
+    async def _await_resolver(self, result: Any, field_name: str, start: float) -> Any:
+        # 코루틴 실행 중의 SQL도 이 필드로 집계되도록 다시 지정
+        token = set_current_field(field_name)
+        try:
+            return await result
+        finally:
+            reset_current_field(token)
+            self._record_resolver(field_name, start)
+
+    def _record_resolver(self, field_name: str, start: float) -> None:
+        duration = time.perf_counter() - start
+        RESOLVER_DURATION.observe(duration, self.schema_name, field_name)
+        if self._tracker is not None:
+            stats = self._tracker.field_stats(field_name)
+            stats.calls += 1
+            stats.duration += duration
+
+    def _operation_type(self) -> str:
+        try:
+            return self.execution_context.operation_type.value
+        except RuntimeError:
+            return "unknown"
+
+    def _report(self, tracker: QueryTracker) -> None:
+        schema_name = self.schema_name
+        operation_type = self._operation_type()
+
+        # 1. 작업 단위 메트릭
+        OPERATION_DURATION.observe(self._duration, schema_name, operation_type)
+        OPERATION_SQL_QUERIES.observe(tracker.sql_count, schema_name, operation_type)
+
+        # 2. 필드별 SQL 집계
+        for field_name, stats in tracker.fields.items():
+            if stats.sql_count:
+                RESOLVER_SQL_QUERIES.inc(schema_name, field_name, value=stats.sql_count)
+                RESOLVER_SQL_DURATION.inc(schema_name, field_name, value=stats.sql_duration)
+
+        # 3. N+1 탐지
+        for field_name, statement, count in tracker.n_plus_one(
+            settings.graphql_n_plus_one_threshold
+        ):
+            N_PLUS_ONE.inc(schema_name, field_name)
+            logger.warning(
+                f"N+1 의심: {field_name}에서 같은 SQL {count}회 실행 "
+                f"(operation={self.execution_context.operation_name}): {statement[:200]}"
+            )
+
+        # 4. Server-Timing (sql;dur=<ms>)
+        request = getattr(self.execution_context.context, "request", None)
+        if request is not None:
+            add_server_timing(request.scope, "sql", tracker.sql_duration * 1000)
+
+    def get_results(self) -> dict[str, Any]:
+        if not settings.graphql_metrics_in_response or self._tracker is None:
+            return {}
+
+        tracker = self._tracker
+        threshold = settings.graphql_n_plus_one_threshold
+        return {
+            "performance": {
+                "duration_ms": round(self._duration * 1000, 3),
+                "sql_count": tracker.sql_count,
+                "sql_ms": round(tracker.sql_duration * 1000, 3),
+                "resolvers": [
+                    {
+                        "field": field_name,
+                        "calls": stats.calls,
+                        "duration_ms": round(stats.duration * 1000, 3),
+                        "sql_count": stats.sql_count,
+                        "sql_ms": round(stats.sql_duration * 1000, 3),
+                    }
+                    for field_name, stats in tracker.fields.items()
+                ],
+                "n_plus_one": [
+                    {"field": field_name, "count": count, "statement": statement}
+                    for field_name, statement, count in tracker.n_plus_one(threshold)
+                ],
+            }
+        }
+
+
+def schema_extensions(schema_name: str) -> list[type[SchemaExtension]]:
+    """스키마에 등록할 확장 목록"""
+    extensions: list[type[SchemaExtension]] = [
+        DocumentCacheExtension.for_schema(schema_name),
+        QueryCostExtension.for_schema(schema_name),
+        UnitOfWorkExtension.for_schema(schema_name),
+    ]
+    if settings.metrics_enabled:
+        extensions.append(PerformanceExtension.for_schema(schema_name))
+    return extensions
@@ -1,39 +1,129 @@
 """모든 시스템의 DataLoader 생성"""
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 
-def create_loaders(manager_db: AsyncSession, tenant_db: AsyncSession | None) -> dict:
+if TYPE_CHECKING:
+    from aiodataloader import DataLoader
+
+    from .context import GraphQLContext
+
+
+class LoaderRegistry:
+    """
+    요청 단위 DataLoader 레지스트리
+
+    로더 팩토리만 등록해 두고, 리졸버가 처음 조회할 때 로더를 생성합니다.
+    사용하지 않는 로더는 생성되지 않으며, 같은 요청 안에서는 같은 인스턴스
+    (= 같은 배치 큐와 캐시)를 공유합니다.
+
+    사용 예:
+        loader = info.context.loaders.get("roles_by_user_loader")
+        if loader:
+            roles = await loader.load(user_id)
+    """
+
+    def __init__(self) -> None:
+        self._factories: dict[str, Callable[[], DataLoader]] = {}
+        self._aliases: dict[str, str] = {}
+        self._loaders: dict[str, DataLoader] = {}
+
+    def register(self, factory: Callable[[], "DataLoader"], name: str, *aliases: str) -> None:
+        """
+        로더 팩토리 등록
+
+        Args:
+            factory: 로더를 생성하는 함수 (최초 조회 시 1회 호출)
+            name: 로더 이름
+            *aliases: 같은 로더 인스턴스를 가리키는 별칭
+        """
+        self._factories[name] = factory
+        for alias in (name, *aliases):
+            self._aliases[alias] = name
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """로더 조회 (미등록 이름이면 default 반환)"""
+        canonical = self._aliases.get(name)
+        if canonical is None:
+            return default
+
+        loader = self._loaders.get(canonical)
+        if loader is None:
+            loader = self._factories[canonical]()
+            self._loaders[canonical] = loader
+        return loader
+
+    def __getitem__(self, name: str) -> "DataLoader":
+        loader = self.get(name)
+        if loader is None:
+            raise KeyError(name)
+        return loader
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._aliases
+
+
+def create_loaders(context: "GraphQLContext") -> LoaderRegistry:
     """
     모든 DataLoader 생성
 
-    네이밍 규칙: {시스템명}.{스키마명}.{엔티티명}
+    네이밍 규칙:
+    - 단건 조회: {엔티티명}_loader (예: user_loader, role_loader)
+    - 연관 목록 조회: {대상}_by_{키}_loader (예: roles_by_user_loader)
+    - Tenants 시스템: tenants_ 접두사 (예: tenants_department_loader)
 
-    예시:
-    - manager.idam.user
-    - manager.tenant_mgmt.tenant
-    - tenants.sys.user
-    - tenants.sys.branch
-    - tenants.crm.customer
+    DB 세션은 컨텍스트에서 지연 생성되므로, 로더는 실제 배치 로딩 시점에
+    context.manager_db_session / context.tenant_db_session에 접근합니다.
 
     Args:
-        manager_db: Manager DB 세션
-        tenant_db: Tenant DB 세션 (None 가능)
+        context: GraphQL 요청 컨텍스트
 
     Returns:
-        DataLoader 딕셔너리
+        DataLoader 레지스트리
     """
+    # 순환 참조 방지를 위해 함수 내부에서 import
+    from src.graphql.manager.idam.permissions.loaders import ManagerPermissionLoader
+    from src.graphql.manager.idam.role_permissions.loaders import (
+        ManagerPermissionsByRoleLoader,
+        ManagerRolesByPermissionLoader,
+    )
+    from src.graphql.manager.idam.roles.loaders import ManagerRoleLoader
+    from src.graphql.manager.idam.user_roles.loaders import ManagerRolesByUserLoader
+    from src.graphql.manager.idam.users.loaders import ManagerUserLoader
+    from src.graphql.manager.tnnt.tenants.loaders import ManagerTenantLoader
+
+    loaders = LoaderRegistry()
+
+    def manager_db():
+        return context.manager_db_session
+
+    # Manager IDAM / TNNT Loaders
+    loaders.register(lambda: ManagerUserLoader(manager_db), "user_loader", "user_by_id_loader")
+    loaders.register(lambda: ManagerRoleLoader(manager_db), "role_loader", "role_by_id_loader")
+    loaders.register(lambda: ManagerPermissionLoader(manager_db), "permission_by_id_loader")
+    loaders.register(lambda: ManagerTenantLoader(manager_db), "tenant_loader")
+    loaders.register(lambda: ManagerRolesByUserLoader(manager_db), "roles_by_user_loader")
+    loaders.register(
+        lambda: ManagerRolesByPermissionLoader(manager_db), "roles_by_permission_loader"
+    )
+    loaders.register(
+        lambda: ManagerPermissionsByRoleLoader(manager_db), "manager_permissions_by_role_loader"
+    )
 
-    loaders = {}
+    # Tenants Loaders (tenant_key가 있을 때만)
+    if context.tenant_session_factory is not None:
+        from src.graphql.tenants.crm.customers.loaders import TenantsCustomerLoader
+        from src.graphql.tenants.sys.departments.loaders import TenantsDepartmentLoader
+        from src.graphql.tenants.sys.roles.loaders import TenantsRoleLoader
+        from src.graphql.tenants.sys.users.loaders import TenantsUserLoader
 
-    # TODO: Manager IDAM Loaders 구현
-    # from src.graphql.manager.idam.users.loaders import UserLoader
-    # loaders["manager.idam.user"] = UserLoader(manager_db)
+        def tenant_db():
+            return context.tenant_db_session
 
-    # TODO: Tenants SYS Loaders 구현 (tenant_db가 있을 때만)
-    if tenant_db:
-        # from src.graphql.tenants.sys.users.loaders import UserLoader
-        # loaders["tenants.sys.user"] = UserLoader(tenant_db)
-        pass
+        loaders.register(lambda: TenantsUserLoader(tenant_db), "tenants_user_loader")
+        loaders.register(lambda: TenantsRoleLoader(tenant_db), "tenants_role_loader")
+        loaders.register(lambda: TenantsDepartmentLoader(tenant_db), "tenants_department_loader")
+        loaders.register(lambda: TenantsCustomerLoader(tenant_db), "tenants_customer_loader")
 
     return loaders
@@ -10,24 +10,29 @@ from uuid import UUID
 
 import strawberry
 from fastapi import Request
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.database import commit_now
 from src.core.exceptions import (
     AlreadyExistsError,
     NotFoundError,
+    RateLimitExceededError,
     UnauthorizedError,
     ValidationError,
 )
+from src.core.login_guard import login_guard
+from src.core.login_log_buffer import login_log_buffer, normalize_ip
 from src.core.security import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
 )
+from src.core.session_auth import revoke_session_after_commit
 from src.graphql.decorators import require_auth
-from src.models.manager.idam import LoginLog, Session, User
+from src.models.manager.idam import Session, User
 
 from .queries import user_to_graphql
 from .types import (
@@ -43,8 +48,7 @@ from .types import (
 )
 
 
-async def create_login_log(
-    db: AsyncSession,
+def record_login_attempt(
     username: str,
     ip_address: str,
     user_agent: str | None,
@@ -53,15 +57,18 @@ async def create_login_log(
     user_id: UUID | None = None,
     user_type: str | None = None,
     failure_reason: str | None = None,
+    session_id: str | None = None,
 ) -> None:
     """
-    로그인 시도 이력 기록
+    로그인 시도 이력 기록 (write-behind)
 
     성공/실패 여부와 관계없이 모든 로그인 시도를 기록합니다.
     보안 감사(Security Audit) 및 이상 탐지에 활용됩니다.
 
+    요청 처리 중에는 버퍼에 추가만 하고, idam.login_logs에는 백그라운드에서
+    일괄 INSERT됩니다 (src/core/login_log_buffer.py).
+
     Args:
-        db: 데이터베이스 세션
         username: 로그인 시도한 사용자명
         ip_address: 요청 IP 주소
         user_agent: User-Agent 헤더
@@ -70,8 +77,9 @@ async def create_login_log(
         user_id: 사용자 ID (로그인 성공 시)
         user_type: 사용자 타입 (로그인 성공 시)
         failure_reason: 실패 사유 (실패 시)
+        session_id: 생성된 세션 ID (로그인 성공 시)
     """
-    login_log = LoginLog(
+    login_log_buffer.add(
         username=username,
         ip_address=ip_address,
         user_agent=user_agent,
@@ -80,12 +88,12 @@ async def create_login_log(
         user_id=user_id,
         user_type=user_type,
         failure_reason=failure_reason,
+        session_id=session_id,
+        mfa_used=False,
     )
-    db.add(login_log)
-    await db.commit()
 
 
-async def create_session(
+def create_session(
     db: AsyncSession,
     session_id: str,
     user_id: UUID,
@@ -93,13 +101,15 @@ async def create_session(
     ip_address: str,
     user_agent: str | None,
     expires_at: datetime,
-) -> None:
+) -> Session:
     """
     사용자 세션 생성
 
     로그인 성공 시 새로운 세션을 생성합니다.
     세션 추적 및 동시 로그인 관리에 사용됩니다.
 
+    세션에 추가만 하며, 커밋은 호출자가 사용자 정보 갱신과 함께 수행합니다.
+
     Args:
         db: 데이터베이스 세션
         session_id: 생성할 세션 ID (랜덤 생성)
@@ -108,6 +118,9 @@ async def create_session(
         ip_address: 요청 IP 주소
         user_agent: User-Agent 헤더
         expires_at: 세션 만료 시각
+
+    Returns:
+        추가된 세션 모델
     """
     session = Session(
         session_id=session_id,
@@ -119,6 +132,103 @@ async def create_session(
         status="ACTIVE",
     )
     db.add(session)
+    return session
+
+
+async def handle_login_failure(
+    db: AsyncSession,
+    username: str,
+    ip_address: str,
+    user_agent: str | None,
+    failure_reason: str,
+    user: User | None = None,
+) -> None:
+    """
+    로그인 실패 처리 (이력 기록 + 실패 카운터 증가)
+
+    실패 횟수는 Redis 카운터로만 관리하며, 이번 실패로 잠금이 새로 시작된
+    경우에만 idam.users에 failed_login_attempts/locked_until을 기록합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        username: 로그인 시도한 사용자명
+        ip_address: 요청 IP 주소
+        user_agent: User-Agent 헤더
+        failure_reason: 실패 사유
+        user: 사용자 (존재하는 경우)
+    """
+    record_login_attempt(
+        username=username,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        attempt_type="LOGIN",
+        success=False,
+        failure_reason=failure_reason,
+    )
+
+    failure = await login_guard.register_failure(username, ip_address)
+    if not failure.user_locked or user is None:
+        return
+
+    await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(
+            failed_login_attempts=failure.user_failures,
+            locked_until=datetime.now(UTC) + timedelta(seconds=failure.user_lock_seconds),
+        )
+    )
+    # 이어지는 로그인 실패 오류로 요청 트랜잭션이 롤백되어도 잠금은 남아야 함
+    await commit_now(db)
+
+    record_login_attempt(
+        username=username,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        attempt_type="LOCKED",
+        success=False,
+        user_id=user.id,
+        user_type=user.user_type,
+        failure_reason="TOO_MANY_FAILURES",
+    )
+
+
+def raise_login_locked(
+    username: str, ip_address: str, user_agent: str | None, retry_after: float
+) -> None:
+    """잠금 중인 로그인 시도 기록 후 예외 발생"""
+    record_login_attempt(
+        username=username,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        attempt_type="LOGIN",
+        success=False,
+        failure_reason="LOCKED",
+    )
+    raise RateLimitExceededError(
+        message="로그인 실패 횟수를 초과했습니다. 잠시 후 다시 시도해 주세요",
+        retry_after=retry_after,
+    )
+
+
+async def logout_session(db: AsyncSession, session_id: str) -> None:
+    """
+    세션 폐기 (로그아웃)
+
+    세션 상태를 REVOKED로 변경하고, 커밋 후 폐기 목록/검증 캐시에 전파합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        session_id: 토큰의 세션 ID
+    """
+    result = await db.execute(
+        update(Session)
+        .where(Session.session_id == session_id, Session.status == "ACTIVE")
+        .values(status="REVOKED")
+        .returning(Session.expires_at)
+    )
+    expires_at = result.scalar_one_or_none()
+    revoke_session_after_commit(db, session_id, expires_at)
     await db.commit()
 
 
@@ -159,7 +269,7 @@ async def signup_user(db: AsyncSession, data: SignupInput) -> ManagerAuthUser:
     user = User(
         username=data.username,
         email=data.email,
-        password=get_password_hash(data.password),
+        password=await get_password_hash_async(data.password),
         full_name=data.full_name or data.username,
         user_type="MASTER",  # 기본 타입: MASTER
         status="ACTIVE",
@@ -167,7 +277,6 @@ async def signup_user(db: AsyncSession, data: SignupInput) -> ManagerAuthUser:
 
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     return user_to_graphql(user)
 
@@ -189,46 +298,45 @@ async def signin_user(db: AsyncSession, data: SigninInput, request: Request) ->
 
     Raises:
         UnauthorizedError: 인증 실패 (사용자 없음, 비밀번호 불일치, 계정 비활성)
+        RateLimitExceededError: 로그인 실패 누적으로 잠긴 경우 (사용자명 또는 IP)
     """
-    # 클라이언트 정보 추출 (None-safe)
-    ip_address = request.client.host if request.client else "unknown"
+    # 클라이언트 정보 추출 (None-safe, INET 컬럼에 저장 가능한 값으로 정규화)
+    ip_address = normalize_ip(request.client.host if request.client else None)
     user_agent = request.headers.get("user-agent")
 
-    # 1. 사용자 조회
+    # 1. 잠금 확인 (잠금 중이면 DB 조회/비밀번호 검증 없이 거절)
+    retry_after = await login_guard.check(data.username, ip_address)
+    if retry_after:
+        raise_login_locked(data.username, ip_address, user_agent, retry_after)
+
+    # 2. 사용자 조회
     result = await db.execute(select(User).where(User.username == data.username))
     user = result.scalar_one_or_none()
 
     if not user:
-        # 보안: 사용자 미존재 시도 기록
-        await create_login_log(
-            db=db,
-            username=data.username,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            attempt_type="LOGIN",
-            success=False,
-            failure_reason="USER_NOT_FOUND",
+        # 보안: 사용자 미존재 시도도 실패로 기록 (잠금 동작을 존재하는 사용자와 동일하게)
+        await handle_login_failure(
+            db, data.username, ip_address, user_agent, failure_reason="USER_NOT_FOUND"
         )
         # 보안: 구체적인 오류는 숨김 (사용자 열거 공격 방지)
         raise UnauthorizedError(message="사용자명 또는 비밀번호가 일치하지 않습니다")
 
-    # 2. 비밀번호 확인 (타입 체크 추가)
-    if not user.password or not verify_password(data.password, user.password):
-        await create_login_log(
-            db=db,
-            username=data.username,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            attempt_type="LOGIN",
-            success=False,
-            failure_reason="INVALID_PASSWORD",
+    now = datetime.now(UTC)
+    if user.locked_until and user.locked_until > now:
+        raise_login_locked(
+            data.username, ip_address, user_agent, (user.locked_until - now).total_seconds()
+        )
+
+    # 3. 비밀번호 확인 (타입 체크 추가)
+    if not user.password or not await verify_password_async(data.password, user.password):
+        await handle_login_failure(
+            db, data.username, ip_address, user_agent, failure_reason="INVALID_PASSWORD", user=user
         )
         raise UnauthorizedError(message="사용자명 또는 비밀번호가 일치하지 않습니다")
 
-    # 3. 계정 활성 상태 확인
+    # 4. 계정 활성 상태 확인
     if user.status != "ACTIVE":
-        await create_login_log(
-            db=db,
+        record_login_attempt(
             username=data.username,
             ip_address=ip_address,
             user_agent=user_agent,
@@ -240,9 +348,28 @@ async def signin_user(db: AsyncSession, data: SigninInput, request: Request) ->
         )
         raise UnauthorizedError(message="비활성화된 계정입니다")
 
-    # 4. 로그인 성공 로그
-    await create_login_log(
+    # 5. 세션 생성 (7일 유효) + 사용자 로그인 정보 갱신 (단일 트랜잭션)
+    await login_guard.register_success(data.username)
+    session_id = secrets.token_urlsafe(32)
+
+    create_session(
         db=db,
+        session_id=session_id,
+        user_id=user.id,
+        session_type="WEB",
+        ip_address=ip_address,
+        user_agent=user_agent,
+        expires_at=now + timedelta(days=7),
+    )
+    user.last_login_at = now
+    user.last_login_ip = ip_address
+    if user.failed_login_attempts or user.locked_until:
+        user.failed_login_attempts = 0
+        user.locked_until = None
+    await db.commit()
+
+    # 6. 로그인 성공 로그
+    record_login_attempt(
         username=data.username,
         ip_address=ip_address,
         user_agent=user_agent,
@@ -250,23 +377,10 @@ async def signin_user(db: AsyncSession, data: SigninInput, request: Request) ->
         success=True,
         user_id=user.id,
         user_type=user.user_type,
-    )
-
-    # 5. 세션 생성 (7일 유효)
-    session_id = secrets.token_urlsafe(32)
-    session_expires_at = datetime.now(UTC) + timedelta(days=7)
-
-    await create_session(
-        db=db,
         session_id=session_id,
-        user_id=user.id,
-        session_type="WEB",
-        ip_address=ip_address,
-        user_agent=user_agent,
-        expires_at=session_expires_at,
     )
 
-    # 6. JWT 토큰 생성
+    # 7. JWT 토큰 생성
     token_data = {
         "sub": str(user.id),
         "username": user.username,
@@ -285,7 +399,9 @@ async def signin_user(db: AsyncSession, data: SigninInput, request: Request) ->
     )
 
 
-async def refresh_user_token(db: AsyncSession, user_id: UUID) -> TokenResponse:
+async def refresh_user_token(
+    db: AsyncSession, user_id: UUID, session_id: str | None = None
+) -> TokenResponse:
     """
     Access Token 갱신
 
@@ -295,6 +411,7 @@ async def refresh_user_token(db: AsyncSession, user_id: UUID) -> TokenResponse:
     Args:
         db: 데이터베이스 세션
         user_id: 사용자 ID
+        session_id: 기존 토큰의 세션 ID (새 토큰에도 유지)
 
     Returns:
         새로운 Access Token 및 Refresh Token
@@ -318,6 +435,8 @@ async def refresh_user_token(db: AsyncSession, user_id: UUID) -> TokenResponse:
         "username": user.username,
         "email": user.email,
     }
+    if session_id:
+        token_data["session_id"] = session_id
 
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
@@ -355,11 +474,11 @@ async def change_user_password(db: AsyncSession, user_id: UUID, data: ChangePass
         raise NotFoundError(message="사용자를 찾을 수 없습니다")
 
     # 현재 비밀번호 확인 (타입 체크 추가)
-    if not user.password or not verify_password(data.current_password, user.password):
+    if not user.password or not await verify_password_async(data.current_password, user.password):
         raise UnauthorizedError(message="현재 비밀번호가 일치하지 않습니다")
 
     # 새 비밀번호 해시화하여 저장
-    user.password = get_password_hash(data.new_password)
+    user.password = await get_password_hash_async(data.new_password)
     await db.commit()
 
     return True
@@ -441,7 +560,7 @@ async def reset_user_password(
             raise NotFoundError(message="사용자를 찾을 수 없습니다")
 
         # 비밀번호 변경
-        user.password = get_password_hash(new_password)
+        user.password = await get_password_hash_async(new_password)
         user.password_changed_at = datetime.now(UTC)
 
         # 토큰이 있다면 삭제
@@ -476,7 +595,7 @@ async def reset_user_password(
         raise ValidationError(message="유효하지 않거나 만료된 토큰입니다")
 
     # 비밀번호 변경
-    user.password = get_password_hash(new_password)
+    user.password = await get_password_hash_async(new_password)
     user.password_changed_at = datetime.now(UTC)
 
     # 토큰 삭제 (재사용 방지)
@@ -563,7 +682,7 @@ class ManagerAuthMutations:
         except (ValueError, TypeError) as e:
             raise UnauthorizedError(message="유효하지 않은 사용자 ID 형식입니다") from e
 
-        return await refresh_user_token(db, user_id)
+        return await refresh_user_token(db, user_id, info.context.session_id)
 
     @strawberry.mutation(description="비밀번호 변경")
     @require_auth
@@ -606,11 +725,12 @@ class ManagerAuthMutations:
             성공 메시지
 
         Note:
-            실제 로그아웃은 클라이언트에서 토큰을 삭제합니다.
-            필요시 서버에서 토큰 블랙리스트(Redis) 관리 가능합니다.
+            클라이언트는 토큰을 삭제하고, 서버는 토큰의 세션을 폐기합니다.
+            폐기된 세션의 토큰은 만료 전이라도 모든 워커에서 미인증으로 처리됩니다.
         """
-        # 실제로는 클라이언트에서 토큰을 삭제
-        # 필요시 Redis에 블랙리스트 추가 가능
+        session_id = info.context.session_id
+        if session_id:
+            await logout_session(info.context.manager_db_session, session_id)
         return MessageResponse(message="로그아웃되었습니다")
 
     @strawberry.mutation(description="비밀번호 찾기")
@@ -9,7 +9,8 @@ from uuid import UUID
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import generate_api_key
+from src.core.api_key_auth import revoke_api_key_after_commit
+from src.core.security import compute_api_key_digest, generate_api_key
 from src.graphql.common import update_entity
 from src.models.manager.idam.api_key import ApiKey as ApiKeyModel
 
@@ -47,7 +48,7 @@ async def create_manager_api_key(
     """
     # 1. API 키 생성 (실제 키와 해시)
     # generate_api_key: (full_key, key_hash) 반환
-    full_api_key, key_hash = generate_api_key("mgr")  # mgr = manager prefix
+    full_api_key, key_hash = await generate_api_key("mgr")  # mgr = manager prefix
 
     # 2. Key ID 생성 (공개적으로 사용 가능)
     key_id = f"cxg_mgr_{input_data.user_id}"
@@ -56,6 +57,7 @@ async def create_manager_api_key(
     api_key = ApiKeyModel(
         key_id=key_id,
         key_hash=key_hash,  # 해시만 저장 (원본 키는 저장하지 않음)
+        key_digest=compute_api_key_digest(full_api_key),  # 인증 시 단건 조회용
         key_name=input_data.key_name,
         user_id=input_data.user_id,
         tenant_context=input_data.tenant_context,
@@ -71,7 +73,6 @@ async def create_manager_api_key(
     # 4. 데이터베이스에 저장
     db.add(api_key)
     await db.commit()
-    await db.refresh(api_key)
 
     # 5. GraphQL 타입으로 변환하여 반환
     return manager_api_key_to_graphql(api_key), full_api_key
@@ -107,6 +108,8 @@ async def update_manager_api_key(
         entity_id=api_key_id,
         input_data=input_data,
         to_graphql=manager_api_key_to_graphql,
+        # 상태/스코프/IP 등 변경을 커밋 후 반영 (모든 워커의 검증 캐시 무효화)
+        before_commit=lambda api_key: revoke_api_key_after_commit(db, api_key),
     )
 
     if result is None:
@@ -8,8 +8,9 @@ from uuid import UUID
 
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.idam.api_key import ApiKey as ApiKeyModel
 
 from .types import ManagerApiKey
@@ -51,13 +52,16 @@ def manager_api_key_to_graphql(api_key: ApiKeyModel) -> "ManagerApiKey":
     )
 
 
-async def get_manager_api_key_by_id(db: AsyncSession, api_key_id: UUID) -> "ManagerApiKey | None":
+async def get_manager_api_key_by_id(
+    db: AsyncSession, api_key_id: UUID, info: Info | None = None
+) -> "ManagerApiKey | None":
     """
     ID로 Manager API 키 단건 조회
 
     Args:
         db: 데이터베이스 세션
         api_key_id: 조회할 API 키 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         ManagerApiKey: API 키 객체 또는 None
@@ -67,6 +71,7 @@ async def get_manager_api_key_by_id(db: AsyncSession, api_key_id: UUID) -> "Mana
         model_class=ApiKeyModel,
         id_=api_key_id,
         to_graphql=manager_api_key_to_graphql,
+        info=info,
     )
 
 
@@ -76,6 +81,9 @@ async def get_manager_api_keys(
     offset: int = 0,
     user_id: UUID | None = None,
     status: str | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerApiKey]":
     """
     Manager API 키 목록 조회
@@ -86,6 +94,9 @@ async def get_manager_api_keys(
         offset: 건너뛸 개수 (페이징용)
         user_id: 사용자 ID 필터 (특정 사용자의 키만 조회)
         status: 상태 필터 (ACTIVE, INACTIVE, REVOKED)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[ManagerApiKey]: API 키 객체 리스트
@@ -107,6 +118,9 @@ async def get_manager_api_keys(
         limit=limit,
         offset=offset,
         order_by=ApiKeyModel.created_at.desc(),  # 최신 생성 순
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
@@ -135,7 +149,7 @@ class ManagerApiKeyQueries:
             키 생성 시에만 한 번 반환됩니다.
         """
         db = info.context.manager_db_session
-        return await get_manager_api_key_by_id(db, UUID(id))
+        return await get_manager_api_key_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager API 키 목록")
     async def api_keys(
@@ -163,4 +177,38 @@ class ManagerApiKeyQueries:
             manager_api_keys(user_id: "xxx", status: "ACTIVE")
         """
         db = info.context.manager_db_session
-        return await get_manager_api_keys(db, limit, offset, user_id, status)
+        return await get_manager_api_keys(db, limit, offset, user_id, status, info=info)
+
+    @strawberry.field(description="Manager API 키 목록 (커서 페이지네이션)")
+    async def api_keys_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        user_id: UUID | None = None,
+        status: str | None = None,
+    ) -> "Connection[ManagerApiKey]":
+        """
+        API 키 목록 조회 (키셋 페이지네이션)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerApiKey]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_api_keys(
+            db,
+            limit=first + 1,
+            user_id=user_id,
+            status=status,
+            after=after,
+            keyset=True,
+            info=info,
+        )
+        return to_connection(items, first, after)
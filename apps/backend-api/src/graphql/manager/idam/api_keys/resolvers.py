@@ -30,16 +30,15 @@ async def resolve_manager_api_key_user(user_id: UUID, info):
         - 없으면 직접 DB 조회
         - 사용자가 삭제되었거나 없는 경우 None 반환
     """
-    db = info.context.manager_db_session
-
     # 1. DataLoader 사용 시도 (N+1 쿼리 최적화)
     loader = info.context.loaders.get("user_by_id_loader")
     if loader:
-        return await loader.load(user_id)
-
-    # 2. Fallback: 직접 조회
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+        user = await loader.load(user_id)
+    else:
+        # 2. Fallback: 직접 조회
+        db = info.context.manager_db_session
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
 
     if not user:
         return None
@@ -9,10 +9,17 @@ from uuid import UUID
 
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from sqlalchemy import func, select
-
-from src.graphql.common import get_by_id, get_list
+from strawberry.types import Info
+
+from src.graphql.common import (
+    Connection,
+    CountMode,
+    get_by_id,
+    get_list,
+    get_list_with_count,
+    to_connection,
+    validate_first,
+)
 from src.models.manager.idam.login_log import LoginLog as LoginLogModel
 
 from .types import ManagerLoginLog, ManagerLoginLogsConnection
@@ -51,13 +58,16 @@ def manager_login_log_to_graphql(log: LoginLogModel) -> "ManagerLoginLog":
     )
 
 
-async def get_manager_login_log_by_id(db: AsyncSession, log_id: UUID) -> "ManagerLoginLog | None":
+async def get_manager_login_log_by_id(
+    db: AsyncSession, log_id: UUID, info: Info | None = None
+) -> "ManagerLoginLog | None":
     """
     ID로 Manager 로그인 이력 단건 조회
 
     Args:
         db: 데이터베이스 세션
         log_id: 조회할 로그인 이력 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         ManagerLoginLog: 로그인 이력 객체 또는 None
@@ -67,51 +77,40 @@ async def get_manager_login_log_by_id(db: AsyncSession, log_id: UUID) -> "Manage
         model_class=LoginLogModel,
         id_=log_id,
         to_graphql=manager_login_log_to_graphql,
+        info=info,
     )
 
 
-async def get_manager_login_logs_count(
-    db: AsyncSession,
+def _build_login_log_filters(
     search: str | None = None,
     user_id: UUID | None = None,
     attempt_type: str | None = None,
     success: bool | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-) -> int:
+) -> "tuple[dict, list]":
     """
-    Manager 로그인 이력 전체 개수 조회
-
-    다양한 필터 조건을 기반으로 전체 로그인 이력 개수를 계산합니다.
-
-    Args:
-        db: 데이터베이스 세션
-        search: 검색어 (사용자명, IP 주소 등 전체 필드 검색)
-        user_id: 사용자 ID 필터
-        attempt_type: 시도 타입 필터
-        success: 성공 여부 필터
-        start_date: 시작 날짜
-        end_date: 종료 날짜
+    로그인 이력 목록/개수 조회 공통 필터 구성
 
     Returns:
-        int: 필터 조건을 만족하는 전체 로그인 이력 개수
+        tuple: (단순 필터 딕셔너리, 추가 WHERE 조건 리스트)
     """
     from sqlalchemy import or_
 
-    query = select(func.count()).select_from(LoginLogModel)
-
-    # 필터 조건 적용
+    # 1. 단순 필터 조건 구성
+    filters = {}
     if user_id:
-        query = query.where(LoginLogModel.user_id == user_id)
+        filters["user_id"] = user_id
     if attempt_type:
-        query = query.where(LoginLogModel.attempt_type == attempt_type)
+        filters["attempt_type"] = attempt_type
     if success is not None:
-        query = query.where(LoginLogModel.success == success)
+        filters["success"] = success
 
-    # 검색어 필터
+    # 2. 검색어 필터 (사용자명, IP 주소, 실패 사유)
+    extra_conditions = []
     if search:
         search_pattern = f"%{search}%"
-        query = query.where(
+        extra_conditions.append(
             or_(
                 LoginLogModel.username.ilike(search_pattern),
                 LoginLogModel.ip_address.cast(str).ilike(search_pattern),
@@ -119,16 +118,14 @@ async def get_manager_login_logs_count(
             )
         )
 
-    # 날짜 범위 필터
+    # 3. 날짜 범위 필터는 extra_conditions로 처리
+    # (비교 연산자를 사용하므로 단순 딕셔너리 필터로 처리 불가)
     if start_date:
-        query = query.where(LoginLogModel.created_at >= start_date)
+        extra_conditions.append(LoginLogModel.created_at >= start_date)
     if end_date:
-        query = query.where(LoginLogModel.created_at <= end_date)
-
-    result = await db.execute(query)
-    count = result.scalar_one()
+        extra_conditions.append(LoginLogModel.created_at <= end_date)
 
-    return count or 0
+    return filters, extra_conditions
 
 
 async def get_manager_login_logs(
@@ -141,6 +138,9 @@ async def get_manager_login_logs(
     success: bool | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerLoginLog]":
     """
     Manager 로그인 이력 목록 조회
@@ -158,6 +158,9 @@ async def get_manager_login_logs(
         success: 성공 여부 필터 (True: 성공만, False: 실패만, None: 전체)
         start_date: 시작 날짜 (이 날짜 이후의 이력)
         end_date: 종료 날짜 (이 날짜 이전의 이력)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[ManagerLoginLog]: 로그인 이력 객체 리스트
@@ -176,37 +179,62 @@ async def get_manager_login_logs(
             db, start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31)
         )
     """
-    from sqlalchemy import or_
+    filters, extra_conditions = _build_login_log_filters(
+        search, user_id, attempt_type, success, start_date, end_date
+    )
 
-    # 1. 단순 필터 조건 구성
-    filters = {}
-    if user_id:
-        filters["user_id"] = user_id
-    if attempt_type:
-        filters["attempt_type"] = attempt_type
-    if success is not None:
-        filters["success"] = success
+    return await get_list(
+        db=db,
+        model_class=LoginLogModel,
+        to_graphql=manager_login_log_to_graphql,
+        limit=limit,
+        offset=offset,
+        order_by=LoginLogModel.created_at.desc(),  # 최신 순
+        extra_conditions=extra_conditions if extra_conditions else None,
+        after=after,
+        keyset=keyset,
+        info=info,
+        **filters,
+    )
 
-    # 2. 검색어 필터 (사용자명, IP 주소, 실패 사유)
-    extra_conditions = []
-    if search:
-        search_pattern = f"%{search}%"
-        extra_conditions.append(
-            or_(
-                LoginLogModel.username.ilike(search_pattern),
-                LoginLogModel.ip_address.cast(str).ilike(search_pattern),
-                LoginLogModel.failure_reason.ilike(search_pattern),
-            )
-        )
 
-    # 3. 날짜 범위 필터는 extra_conditions로 처리
-    # (비교 연산자를 사용하므로 단순 딕셔너리 필터로 처리 불가)
-    if start_date:
-        extra_conditions.append(LoginLogModel.created_at >= start_date)
-    if end_date:
-        extra_conditions.append(LoginLogModel.created_at <= end_date)
+async def get_manager_login_logs_with_count(
+    db: AsyncSession,
+    limit: int = 50,
+    offset: int = 0,
+    search: str | None = None,
+    user_id: UUID | None = None,
+    attempt_type: str | None = None,
+    success: bool | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    count_mode: CountMode = "exact",
+    info: Info | None = None,
+) -> "tuple[list[ManagerLoginLog], int]":
+    """
+    Manager 로그인 이력 목록 + 전체 개수 조회 (한 번의 쿼리)
 
-    return await get_list(
+    Args:
+        db: 데이터베이스 세션
+        limit: 조회 개수 제한 (기본값: 50)
+        offset: 건너뛸 개수 (페이징용)
+        search: 검색어 (사용자명, IP 주소 등 전체 필드 검색)
+        user_id: 사용자 ID 필터
+        attempt_type: 시도 타입 필터
+        success: 성공 여부 필터
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        count_mode: 전체 개수 계산 방식 (exact: 정확, estimated: 플래너 통계 추정치)
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
+
+    Returns:
+        tuple: (로그인 이력 객체 리스트, 전체 개수)
+    """
+    filters, extra_conditions = _build_login_log_filters(
+        search, user_id, attempt_type, success, start_date, end_date
+    )
+
+    return await get_list_with_count(
         db=db,
         model_class=LoginLogModel,
         to_graphql=manager_login_log_to_graphql,
@@ -214,6 +242,8 @@ async def get_manager_login_logs(
         offset=offset,
         order_by=LoginLogModel.created_at.desc(),  # 최신 순
         extra_conditions=extra_conditions if extra_conditions else None,
+        count_mode=count_mode,
+        info=info,
         **filters,
     )
 
@@ -238,7 +268,7 @@ class ManagerLoginLogQueries:
             ManagerLoginLog: 로그인 이력 객체 또는 None
         """
         db = info.context.manager_db_session
-        return await get_manager_login_log_by_id(db, UUID(id))
+        return await get_manager_login_log_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 로그인 이력 목록 (페이지네이션 포함)")
     async def login_logs_connection(
@@ -252,6 +282,7 @@ class ManagerLoginLogQueries:
         success: bool | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        estimated_total: bool = False,
     ) -> "ManagerLoginLogsConnection":
         """
         로그인 이력 목록 조회 (페이징 및 필터링 지원)
@@ -268,6 +299,7 @@ class ManagerLoginLogQueries:
             success: 성공 여부 필터 (선택)
             start_date: 시작 날짜 (선택)
             end_date: 종료 날짜 (선택)
+            estimated_total: 전체 개수를 플래너 통계 추정치로 반환 (전체 스캔 회피)
 
         Returns:
             ManagerLoginLogsConnection: 로그인 이력 목록과 전체 개수
@@ -301,11 +333,18 @@ class ManagerLoginLogQueries:
             }
         """
         db = info.context.manager_db_session
-        items = await get_manager_login_logs(
-            db, limit, offset, search, user_id, attempt_type, success, start_date, end_date
-        )
-        total = await get_manager_login_logs_count(
-            db, search, user_id, attempt_type, success, start_date, end_date
+        items, total = await get_manager_login_logs_with_count(
+            db,
+            limit,
+            offset,
+            search,
+            user_id,
+            attempt_type,
+            success,
+            start_date,
+            end_date,
+            count_mode="estimated" if estimated_total else "exact",
+            info=info,
         )
         return ManagerLoginLogsConnection(items=items, total=total)
 
@@ -343,5 +382,60 @@ class ManagerLoginLogQueries:
         """
         db = info.context.manager_db_session
         return await get_manager_login_logs(
-            db, limit, offset, search, user_id, attempt_type, success, start_date, end_date
+            db,
+            limit,
+            offset,
+            search,
+            user_id,
+            attempt_type,
+            success,
+            start_date,
+            end_date,
+            info=info,
+        )
+
+    @strawberry.field(description="Manager 로그인 이력 목록 (커서 페이지네이션)")
+    async def login_logs_cursor_connection(
+        self,
+        info,
+        first: int = 50,
+        after: str | None = None,
+        search: str | None = None,
+        user_id: UUID | None = None,
+        attempt_type: str | None = None,
+        success: bool | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> "Connection[ManagerLoginLog]":
+        """
+        로그인 이력 목록 조회 (키셋 페이지네이션)
+
+        로그인 이력처럼 계속 쌓이는 테이블은 offset 기반 loginLogsConnection의
+        깊은 페이지가 점점 느려지므로, 무한 스크롤/내보내기에는 이 필드를 사용합니다.
+        전체 개수는 계산하지 않습니다 (pageInfo.totalCount = null).
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerLoginLog]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_login_logs(
+            db,
+            limit=first + 1,
+            search=search,
+            user_id=user_id,
+            attempt_type=attempt_type,
+            success=success,
+            start_date=start_date,
+            end_date=end_date,
+            after=after,
+            keyset=True,
+            info=info,
         )
+        return to_connection(items, first, after)
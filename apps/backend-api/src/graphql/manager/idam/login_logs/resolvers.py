@@ -40,16 +40,15 @@ async def resolve_manager_login_log_user(user_id: UUID | None, info):
     if user_id is None:
         return None
 
-    db = info.context.manager_db_session
-
     # 2. DataLoader 사용 시도 (N+1 쿼리 최적화)
     loader = info.context.loaders.get("user_by_id_loader")
     if loader:
-        return await loader.load(user_id)
-
-    # 3. Fallback: 직접 조회
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+        user = await loader.load(user_id)
+    else:
+        # 3. Fallback: 직접 조회
+        db = info.context.manager_db_session
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
 
     if not user:
         return None
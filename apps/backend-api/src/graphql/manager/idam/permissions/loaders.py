@@ -3,21 +3,19 @@
 공통 모듈을 사용한 DataLoader 구현
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.graphql.common import BaseDataLoader, BaseFieldLoader
+from src.graphql.common import BaseDataLoader, BaseFieldLoader, SessionSource
 from src.models.manager.idam.permission import Permission as PermissionModel
 
 
 class ManagerPermissionLoader(BaseDataLoader[PermissionModel]):
     """Manager 권한 DataLoader (N+1 쿼리 최적화)"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: SessionSource):
         super().__init__(db, PermissionModel)
 
 
 class ManagerPermissionByCodeLoader(BaseFieldLoader[PermissionModel]):
     """Code로 권한 조회 DataLoader"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: SessionSource):
         super().__init__(db, PermissionModel, "code")
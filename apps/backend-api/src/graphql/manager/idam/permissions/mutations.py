@@ -9,7 +9,15 @@ from uuid import UUID
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.graphql.common import create_entity, update_entity
+from src.core.permission_cache import permission_cache
+from src.graphql.common import (
+    BulkResult,
+    create_entities,
+    create_entity,
+    update_entity,
+    upsert_entities,
+    validate_bulk_inputs,
+)
 from src.models.manager.idam.permission import Permission as PermissionModel
 
 from .queries import manager_permission_to_graphql
@@ -71,6 +79,7 @@ async def update_manager_permission(
 
     Note:
         권한을 비활성화(INACTIVE)하는 대신 역할에서 제거하는 것이 더 안전합니다.
+        권한 정의는 여러 역할에 걸쳐 있으므로 커밋 이후 권한 캐시 전체를 무효화합니다.
     """
     return await update_entity(
         db=db,
@@ -78,6 +87,61 @@ async def update_manager_permission(
         entity_id=permission_id,
         input_data=input_data,
         to_graphql=manager_permission_to_graphql,
+        before_commit=lambda _: permission_cache.invalidate_all_after_commit(db),
+    )
+
+
+async def create_manager_permissions(
+    db: AsyncSession, inputs: list[ManagerPermissionCreateInput]
+) -> BulkResult[ManagerPermission]:
+    """
+    Manager 권한 일괄 생성
+
+    다중 행 INSERT로 청크당 한 번에 생성합니다.
+    이미 있는 code는 ALREADY_EXISTS, 제약 조건 위반은 CONSTRAINT_VIOLATION으로
+    해당 행만 실패 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        inputs: 권한 생성 입력 데이터 목록
+
+    Returns:
+        BulkResult: 생성된 권한 + 실패한 행 오류
+    """
+    return await create_entities(
+        db=db,
+        model_class=PermissionModel,
+        inputs=inputs,
+        to_graphql=manager_permission_to_graphql,
+        conflict_columns=["code"],
+    )
+
+
+async def upsert_manager_permissions(
+    db: AsyncSession, inputs: list[ManagerPermissionCreateInput]
+) -> BulkResult[ManagerPermission]:
+    """
+    Manager 권한 일괄 생성/갱신 (code 기준)
+
+    권한 정의 파일 동기화처럼 같은 목록을 반복 적용할 때 사용합니다.
+    없는 code는 생성하고, 있는 code는 입력 값으로 갱신합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        inputs: 권한 입력 데이터 목록
+
+    Returns:
+        BulkResult: 생성/갱신된 권한 + 실패한 행 오류
+    """
+    # 기존 권한의 상태/resource/action이 바뀔 수 있으므로 커밋 이후 권한 캐시 전체 무효화
+    # (upsert_entities가 커밋하므로 호출 전에 예약, 롤백되면 예약도 버려짐)
+    permission_cache.invalidate_all_after_commit(db)
+    return await upsert_entities(
+        db=db,
+        model_class=PermissionModel,
+        inputs=inputs,
+        to_graphql=manager_permission_to_graphql,
+        conflict_columns=["code"],
     )
 
 
@@ -163,3 +227,43 @@ class ManagerPermissionMutations:
         """
         db = info.context.manager_db_session
         return await update_manager_permission(db, UUID(id), input)
+
+    @strawberry.mutation(description="Manager 권한 일괄 생성")
+    async def bulk_create_permissions(
+        self, info, inputs: list[ManagerPermissionCreateInput]
+    ) -> BulkResult[ManagerPermission]:
+        """
+        Manager 권한 일괄 생성
+
+        실패한 행은 errors에 입력 위치(index)와 함께 보고되고, 나머지 행은 생성됩니다.
+
+        사용 예:
+            mutation {
+              permissions {
+                bulkCreatePermissions(inputs: [
+                  { code: "products.create", name: "제품 생성", category: "제품 관리",
+                    resource: "products", action: "CREATE" }
+                ]) {
+                  successCount
+                  items { id code }
+                  errors { index code message }
+                }
+              }
+            }
+        """
+        db = info.context.manager_db_session
+        validate_bulk_inputs(inputs)
+        return await create_manager_permissions(db, inputs)
+
+    @strawberry.mutation(description="Manager 권한 일괄 생성/갱신 (code 기준)")
+    async def bulk_upsert_permissions(
+        self, info, inputs: list[ManagerPermissionCreateInput]
+    ) -> BulkResult[ManagerPermission]:
+        """
+        Manager 권한 일괄 생성/갱신
+
+        code가 같은 권한이 있으면 갱신하고, 없으면 생성합니다.
+        """
+        db = info.context.manager_db_session
+        validate_bulk_inputs(inputs)
+        return await upsert_manager_permissions(db, inputs)
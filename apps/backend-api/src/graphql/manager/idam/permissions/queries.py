@@ -4,13 +4,19 @@ Manager 시스템 권한 조회 Query 구현
 RBAC 시스템의 권한 관리를 위한 조회 기능을 제공합니다.
 """
 
+from datetime import datetime
 from uuid import UUID
 
 import strawberry
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.idam.permission import Permission as PermissionModel
+from src.models.manager.idam.role import Role as RoleModel
+from src.models.manager.idam.role_permission import RolePermission as RolePermissionModel
+from src.models.manager.idam.user_role import UserRole as UserRoleModel
 
 from .types import ManagerPermission
 
@@ -44,7 +50,7 @@ def manager_permission_to_graphql(permission: PermissionModel) -> "ManagerPermis
 
 
 async def get_manager_permission_by_id(
-    db: AsyncSession, permission_id: UUID
+    db: AsyncSession, permission_id: UUID, info: Info | None = None
 ) -> "ManagerPermission | None":
     """
     ID로 Manager 권한 단건 조회
@@ -52,6 +58,7 @@ async def get_manager_permission_by_id(
     Args:
         db: 데이터베이스 세션
         permission_id: 조회할 권한 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         Permission: 권한 객체 또는 None
@@ -61,6 +68,7 @@ async def get_manager_permission_by_id(
         model_class=PermissionModel,
         id_=permission_id,
         to_graphql=manager_permission_to_graphql,
+        info=info,
     )
 
 
@@ -75,6 +83,9 @@ async def get_manager_permissions(
     scope: str | None = None,
     status: str | None = None,
     is_system: bool | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerPermission]":
     """
     Manager 권한 목록 조회
@@ -93,6 +104,9 @@ async def get_manager_permissions(
         scope: 범위 필터 (GLOBAL, TENANT)
         status: 상태 필터 (ACTIVE, INACTIVE)
         is_system: 시스템 권한 필터
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[Permission]: 권한 객체 리스트
@@ -137,10 +151,55 @@ async def get_manager_permissions(
             PermissionModel.resource,  # 2차: 리소스별 그룹화
             PermissionModel.action,  # 3차: 액션별 정렬
         ],
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
 
+async def get_manager_user_permission_grants(
+    db: AsyncSession, user_id: UUID
+) -> tuple[set[str], datetime | None]:
+    """
+    사용자의 유효 권한 키 집합과 가장 이른 만료 시각 조회 (권한 캐시 로더)
+
+    활성 사용자-역할 매핑(만료 전) → 활성 역할 → 활성 권한을 한 번의 쿼리로 조회합니다.
+    만료 시각은 권한 캐시가 역할 만료 이후까지 남지 않도록 TTL을 정하는 데 사용합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+
+    Returns:
+        tuple: ("resource:action" 형식(소문자)의 권한 키 집합 (예: "user:read"),
+                권한을 부여한 사용자-역할 매핑 중 가장 이른 expires_at (없으면 None))
+    """
+    stmt = (
+        select(PermissionModel.resource, PermissionModel.action, UserRoleModel.expires_at)
+        .join(RolePermissionModel, RolePermissionModel.permission_id == PermissionModel.id)
+        .join(RoleModel, RoleModel.id == RolePermissionModel.role_id)
+        .join(UserRoleModel, UserRoleModel.role_id == RoleModel.id)
+        .where(
+            UserRoleModel.user_id == user_id,
+            UserRoleModel.status == "ACTIVE",
+            or_(UserRoleModel.expires_at.is_(None), UserRoleModel.expires_at > func.now()),
+            RoleModel.status == "ACTIVE",
+            PermissionModel.status == "ACTIVE",
+        )
+        .distinct()
+    )
+    result = await db.execute(stmt)
+
+    keys: set[str] = set()
+    expires: list[datetime] = []
+    for resource, action, expires_at in result.all():
+        keys.add(f"{resource.lower()}:{action.lower()}")
+        if expires_at is not None:
+            expires.append(expires_at)
+    return keys, min(expires, default=None)
+
+
 @strawberry.type
 class ManagerPermissionQueries:
     """
@@ -161,7 +220,7 @@ class ManagerPermissionQueries:
             Permission: 권한 객체 또는 None
         """
         db = info.context.manager_db_session
-        return await get_manager_permission_by_id(db, UUID(id))
+        return await get_manager_permission_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 권한 목록")
     async def permissions(
@@ -213,5 +272,59 @@ class ManagerPermissionQueries:
         """
         db = info.context.manager_db_session
         return await get_manager_permissions(
-            db, limit, offset, search, category, resource, action, scope, status, is_system
+            db,
+            limit,
+            offset,
+            search,
+            category,
+            resource,
+            action,
+            scope,
+            status,
+            is_system,
+            info=info,
+        )
+
+    @strawberry.field(description="Manager 권한 목록 (커서 페이지네이션)")
+    async def permissions_connection(
+        self,
+        info,
+        first: int = 50,
+        after: str | None = None,
+        search: str | None = None,
+        category: str | None = None,
+        resource: str | None = None,
+        action: str | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        is_system: bool | None = None,
+    ) -> "Connection[ManagerPermission]":
+        """
+        권한 목록 조회 (키셋 페이지네이션, 필터는 permissions와 동일)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerPermission]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_permissions(
+            db,
+            limit=first + 1,
+            search=search,
+            category=category,
+            resource=resource,
+            action=action,
+            scope=scope,
+            status=status,
+            is_system=is_system,
+            after=after,
+            keyset=True,
+            info=info,
         )
+        return to_connection(items, first, after)
@@ -39,22 +39,21 @@ async def resolve_manager_permission_roles(permission_id: UUID, info) -> list:
         - "users.create" 권한 → ["관리자", "사용자 관리자"] 역할
         - "billing.read" 권한 → ["관리자", "재무 담당자"] 역할
     """
-    db = info.context.manager_db_session
-
     # 1. DataLoader 사용 시도 (N+1 쿼리 최적화)
     loader = info.context.loaders.get("roles_by_permission_loader")
     if loader:
-        return await loader.load(permission_id)
-
-    # 2. Fallback: 직접 조회
-    # RolePermission 중간 테이블을 통해 Role 조회
-    result = await db.execute(
-        select(Role)
-        .join(RolePermission, RolePermission.role_id == Role.id)
-        .where(RolePermission.permission_id == permission_id)
-        .order_by(Role.name)  # 역할명 기준 정렬
-    )
-    roles = result.scalars().all()
+        roles = await loader.load(permission_id)
+    else:
+        # 2. Fallback: 직접 조회
+        # RolePermission 중간 테이블을 통해 Role 조회
+        db = info.context.manager_db_session
+        result = await db.execute(
+            select(Role)
+            .join(RolePermission, RolePermission.role_id == Role.id)
+            .where(RolePermission.permission_id == permission_id)
+            .order_by(Role.name)  # 역할명 기준 정렬
+        )
+        roles = result.scalars().all()
 
     # 3. Import를 여기서 하여 순환 참조 방지
     from ..roles.queries import manager_role_to_graphql
@@ -6,9 +6,9 @@ DataLoader는 GraphQL 쿼리 실행 중 발생하는 N+1 쿼리 문제를 해결
 여러 번의 개별 조회를 하나의 배치 조회로 최적화하여 DB 부하를 줄입니다.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.graphql.common import BaseDataLoader
+from src.graphql.common import BaseDataLoader, BaseRelationLoader, SessionSource
+from src.models.manager.idam.permission import Permission as PermissionModel
+from src.models.manager.idam.role import Role as RoleModel
 from src.models.manager.idam.role_permission import RolePermission as RolePermissionModel
 
 
@@ -20,5 +20,31 @@ class ManagerRolePermissionLoader(BaseDataLoader[RolePermissionModel]):
     - BaseDataLoader를 상속하여 공통 배치 로딩 로직 활용
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: SessionSource):
         super().__init__(db, RolePermissionModel)
+
+
+class ManagerRolesByPermissionLoader(BaseRelationLoader[RoleModel]):
+    """권한별 할당 역할 목록 DataLoader (역할명 순)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(
+            db,
+            RoleModel,
+            key_column=RolePermissionModel.permission_id,
+            join=(RolePermissionModel, RolePermissionModel.role_id == RoleModel.id),
+            order_by=[RoleModel.name],
+        )
+
+
+class ManagerPermissionsByRoleLoader(BaseRelationLoader[PermissionModel]):
+    """역할별 권한 목록 DataLoader (카테고리/리소스/액션 순)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(
+            db,
+            PermissionModel,
+            key_column=RolePermissionModel.role_id,
+            join=(RolePermissionModel, RolePermissionModel.permission_id == PermissionModel.id),
+            order_by=[PermissionModel.category, PermissionModel.resource, PermissionModel.action],
+        )
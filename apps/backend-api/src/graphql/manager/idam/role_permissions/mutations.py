@@ -15,8 +15,10 @@ import strawberry
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.permission_cache import permission_cache
 from src.models.manager.idam.role_permission import RolePermission as RolePermissionModel
 
+from ..user_roles.queries import get_manager_user_ids_by_role_id
 from .queries import manager_role_permission_to_graphql
 from .types import (
     ManagerRolePermission,
@@ -68,7 +70,6 @@ async def create_manager_role_permission(
 
     db.add(role_permission)
     await db.flush()
-    await db.refresh(role_permission)
 
     return manager_role_permission_to_graphql(role_permission)
 
@@ -164,6 +165,17 @@ async def bulk_remove_manager_permissions_from_role(
     return result.rowcount or 0  # type: ignore[attr-defined]
 
 
+async def invalidate_role_permission_cache(db: AsyncSession, role_id: UUID) -> None:
+    """역할이 할당된 사용자들의 권한 캐시 무효화 예약 (커밋 이후 적용)
+
+    Args:
+        db: 비동기 DB 세션 (역할-권한 변경을 수행한 세션)
+        role_id: 권한이 변경된 역할 ID
+    """
+    user_ids = await get_manager_user_ids_by_role_id(db, role_id)
+    permission_cache.invalidate_after_commit(db, user_ids)
+
+
 @strawberry.type
 class ManagerRolePermissionMutations:
     """Manager IDAM Role Permissions Mutation
@@ -184,7 +196,9 @@ class ManagerRolePermissionMutations:
         db = info.context.manager_db_session
         # TODO: info.context에서 현재 사용자 ID 가져오기
         granted_by = None  # info.context.current_user.id
-        return await create_manager_role_permission(db, input, granted_by)
+        role_permission = await create_manager_role_permission(db, input, granted_by)
+        await invalidate_role_permission_cache(db, UUID(input.role_id))
+        return role_permission
 
     @strawberry.mutation(description="Manager 역할에서 권한 해제")
     async def remove_permission_from_role(
@@ -197,7 +211,10 @@ class ManagerRolePermissionMutations:
         단일 권한을 특정 역할에서 제거합니다.
         """
         db = info.context.manager_db_session
-        return await delete_manager_role_permission(db, input)
+        deleted = await delete_manager_role_permission(db, input)
+        if deleted:
+            await invalidate_role_permission_cache(db, UUID(input.role_id))
+        return deleted
 
     @strawberry.mutation(description="Manager 역할에 여러 권한 일괄 할당")
     async def bulk_assign_permissions_to_role(
@@ -212,12 +229,14 @@ class ManagerRolePermissionMutations:
         """
         db = info.context.manager_db_session
         granted_by = None  # info.context.current_user.id
-        return await bulk_assign_manager_permissions_to_role(
+        role_permissions = await bulk_assign_manager_permissions_to_role(
             db,
             UUID(role_id),
             [UUID(pid) for pid in permission_ids],
             granted_by,
         )
+        await invalidate_role_permission_cache(db, UUID(role_id))
+        return role_permissions
 
     @strawberry.mutation(description="Manager 역할에서 여러 권한 일괄 해제")
     async def bulk_remove_permissions_from_role(
@@ -232,8 +251,11 @@ class ManagerRolePermissionMutations:
         반환값은 실제 삭제된 매핑의 개수입니다.
         """
         db = info.context.manager_db_session
-        return await bulk_remove_manager_permissions_from_role(
+        removed = await bulk_remove_manager_permissions_from_role(
             db,
             UUID(role_id),
             [UUID(pid) for pid in permission_ids],
         )
+        if removed:
+            await invalidate_role_permission_cache(db, UUID(role_id))
+        return removed
@@ -12,8 +12,9 @@ from uuid import UUID
 
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.idam.role_permission import RolePermission as RolePermissionModel
 
 from .types import ManagerRolePermission
@@ -46,13 +47,14 @@ def manager_role_permission_to_graphql(
 
 
 async def get_manager_role_permission_by_id(
-    db: AsyncSession, role_permission_id: UUID
+    db: AsyncSession, role_permission_id: UUID, info: Info | None = None
 ) -> "ManagerRolePermission | None":
     """ID로 Manager 역할-권한 매핑 조회
 
     Args:
         db: 비동기 DB 세션
         role_permission_id: 조회할 매핑 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         역할-권한 매핑 객체 또는 None
@@ -62,6 +64,7 @@ async def get_manager_role_permission_by_id(
         model_class=RolePermissionModel,
         id_=role_permission_id,
         to_graphql=manager_role_permission_to_graphql,
+        info=info,
     )
 
 
@@ -71,6 +74,9 @@ async def get_manager_role_permissions(
     offset: int = 0,
     role_id: UUID | None = None,
     permission_id: UUID | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerRolePermission]":
     """Manager 역할-권한 매핑 목록 조회
 
@@ -80,6 +86,9 @@ async def get_manager_role_permissions(
         offset: 조회 시작 위치
         role_id: 특정 역할로 필터링 (선택)
         permission_id: 특정 권한으로 필터링 (선택)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         역할-권한 매핑 객체 목록
@@ -97,6 +106,9 @@ async def get_manager_role_permissions(
         limit=limit,
         offset=offset,
         order_by=RolePermissionModel.created_at.desc(),
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
@@ -153,7 +165,7 @@ class ManagerRolePermissionQueries:
         특정 ID의 역할-권한 매핑을 조회합니다.
         """
         db = info.context.manager_db_session
-        return await get_manager_role_permission_by_id(db, UUID(id))
+        return await get_manager_role_permission_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 역할-권한 매핑 목록")
     async def role_permissions(
@@ -176,6 +188,7 @@ class ManagerRolePermissionQueries:
             offset,
             UUID(role_id) if role_id else None,
             UUID(permission_id) if permission_id else None,
+            info=info,
         )
 
     @strawberry.field(description="역할에 할당된 권한 목록")
@@ -199,3 +212,37 @@ class ManagerRolePermissionQueries:
         """
         db = info.context.manager_db_session
         return await get_manager_roles_by_permission_id(db, UUID(permission_id))
+
+    @strawberry.field(description="Manager 역할-권한 매핑 목록 (커서 페이지네이션)")
+    async def role_permissions_connection(
+        self,
+        info,
+        first: int = 50,
+        after: str | None = None,
+        role_id: strawberry.ID | None = None,
+        permission_id: strawberry.ID | None = None,
+    ) -> "Connection[ManagerRolePermission]":
+        """
+        역할-권한 매핑 목록 조회 (키셋 페이지네이션)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerRolePermission]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_role_permissions(
+            db,
+            limit=first + 1,
+            role_id=UUID(role_id) if role_id else None,
+            permission_id=UUID(permission_id) if permission_id else None,
+            after=after,
+            keyset=True,
+            info=info,
+        )
+        return to_connection(items, first, after)
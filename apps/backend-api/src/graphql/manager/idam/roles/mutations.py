@@ -9,7 +9,14 @@ from uuid import UUID
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.graphql.common import create_entity, update_entity
+from src.core.permission_cache import permission_cache
+from src.graphql.common import (
+    BulkResult,
+    create_entities,
+    create_entity,
+    update_entity,
+    validate_bulk_inputs,
+)
 from src.models.manager.idam.role import Role as RoleModel
 
 from .queries import manager_role_to_graphql
@@ -48,13 +55,49 @@ async def update_manager_role(
 
     Returns:
         Role: 수정된 역할 객체 또는 None
+
+    Note:
+        상태(status)를 바꾸면 역할이 할당된 사용자들의 권한 캐시를 커밋 이후 무효화합니다.
     """
+    before_commit = None
+    if input_data.status is not None:
+        # 순환 참조 방지를 위해 함수 내부에서 import
+        from ..user_roles.queries import get_manager_user_ids_by_role_id
+
+        user_ids = await get_manager_user_ids_by_role_id(db, role_id)
+
+        def before_commit(_: RoleModel) -> None:
+            permission_cache.invalidate_after_commit(db, user_ids)
+
     return await update_entity(
         db=db,
         model_class=RoleModel,
         entity_id=role_id,
         input_data=input_data,
         to_graphql=manager_role_to_graphql,
+        before_commit=before_commit,
+    )
+
+
+async def create_manager_roles(
+    db: AsyncSession, inputs: list[ManagerRoleCreateInput]
+) -> BulkResult[ManagerRole]:
+    """
+    Manager 역할 일괄 생성
+
+    Args:
+        db: 데이터베이스 세션
+        inputs: 역할 생성 입력 데이터 목록
+
+    Returns:
+        BulkResult: 생성된 역할 + 실패한 행 오류 (이미 있는 code는 ALREADY_EXISTS)
+    """
+    return await create_entities(
+        db=db,
+        model_class=RoleModel,
+        inputs=inputs,
+        to_graphql=manager_role_to_graphql,
+        conflict_columns=["code"],
     )
 
 
@@ -99,3 +142,20 @@ class ManagerRoleMutations:
         """
         db = info.context.manager_db_session
         return await update_manager_role(db, UUID(id), input)
+
+    @strawberry.mutation(description="Manager 역할 일괄 생성")
+    async def bulk_create_roles(
+        self, info, inputs: list[ManagerRoleCreateInput]
+    ) -> BulkResult[ManagerRole]:
+        """
+        역할 일괄 생성
+
+        Args:
+            inputs: 역할 생성 입력 데이터 목록
+
+        Returns:
+            BulkResult: 생성된 역할 + 실패한 행 오류 (입력 위치 index 포함)
+        """
+        db = info.context.manager_db_session
+        validate_bulk_inputs(inputs)
+        return await create_manager_roles(db, inputs)
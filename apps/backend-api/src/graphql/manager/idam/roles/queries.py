@@ -8,8 +8,9 @@ from uuid import UUID
 
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.idam.role import Role as RoleModel
 
 from .types import ManagerRole
@@ -41,13 +42,16 @@ def manager_role_to_graphql(role: RoleModel) -> "ManagerRole":
     )
 
 
-async def get_manager_role_by_id(db: AsyncSession, role_id: UUID) -> "ManagerRole | None":
+async def get_manager_role_by_id(
+    db: AsyncSession, role_id: UUID, info: Info | None = None
+) -> "ManagerRole | None":
     """
     ID로 Manager 역할 단건 조회
 
     Args:
         db: 데이터베이스 세션
         role_id: 조회할 역할 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         Role: 역할 객체 또는 None
@@ -57,6 +61,7 @@ async def get_manager_role_by_id(db: AsyncSession, role_id: UUID) -> "ManagerRol
         model_class=RoleModel,
         id_=role_id,
         to_graphql=manager_role_to_graphql,
+        info=info,
     )
 
 
@@ -67,6 +72,9 @@ async def get_manager_roles(
     category: str | None = None,
     status: str | None = None,
     search: str | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerRole]":
     """
     Manager 역할 목록 조회
@@ -78,6 +86,9 @@ async def get_manager_roles(
         category: 카테고리 필터 (선택)
         status: 상태 필터 (선택)
         search: 역할 검색어 (code, name 검색)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[Role]: 역할 객체 리스트
@@ -111,6 +122,9 @@ async def get_manager_roles(
         offset=offset,
         order_by=RoleModel.priority,  # 우선순위 순으로 정렬
         extra_conditions=extra_conditions if extra_conditions else None,
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
@@ -135,7 +149,7 @@ class ManagerRoleQueries:
             Role: 역할 객체 또는 None
         """
         db = info.context.manager_db_session
-        return await get_manager_role_by_id(db, UUID(id))
+        return await get_manager_role_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 역할 목록")
     async def roles(
@@ -161,4 +175,42 @@ class ManagerRoleQueries:
             list[ManagerRole]: 역할 객체 리스트
         """
         db = info.context.manager_db_session
-        return await get_manager_roles(db, limit, offset, category, status, search)
+        return await get_manager_roles(
+            db, limit, offset, category, status, search, info=info
+        )
+
+    @strawberry.field(description="Manager 역할 목록 (커서 페이지네이션)")
+    async def roles_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> "Connection[ManagerRole]":
+        """
+        역할 목록 조회 (키셋 페이지네이션, 필터는 roles와 동일)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerRole]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_roles(
+            db,
+            limit=first + 1,
+            category=category,
+            status=status,
+            search=search,
+            after=after,
+            keyset=True,
+            info=info,
+        )
+        return to_connection(items, first, after)
@@ -21,22 +21,21 @@ async def resolve_manager_role_permissions(role_id: UUID, info) -> list:
     Returns:
         list[ManagerPermission]: 권한 GraphQL 객체 리스트
     """
-    db = info.context.manager_db_session
-
     # 1. Context에 등록된 전역 DataLoader 사용 시도 (최적화)
     loader = info.context.loaders.get("manager_permissions_by_role_loader")
     if loader:
-        return await loader.load(role_id)
-
-    # 2. Fallback: 전역 loader가 없으면 직접 DB 조회
-    # RolePermission 중간 테이블을 통해 Permission 조회
-    result = await db.execute(
-        select(Permission)
-        .join(RolePermission, RolePermission.permission_id == Permission.id)
-        .where(RolePermission.role_id == role_id)
-        .order_by(Permission.category, Permission.resource, Permission.action)
-    )
-    permissions = result.scalars().all()
+        permissions = await loader.load(role_id)
+    else:
+        # 2. Fallback: 전역 loader가 없으면 직접 DB 조회
+        # RolePermission 중간 테이블을 통해 Permission 조회
+        db = info.context.manager_db_session
+        result = await db.execute(
+            select(Permission)
+            .join(RolePermission, RolePermission.permission_id == Permission.id)
+            .where(RolePermission.role_id == role_id)
+            .order_by(Permission.category, Permission.resource, Permission.action)
+        )
+        permissions = result.scalars().all()
 
     # 3. Import를 여기서 하여 순환 참조 방지
     from ..permissions.queries import manager_permission_to_graphql
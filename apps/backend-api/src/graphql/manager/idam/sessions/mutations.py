@@ -4,15 +4,17 @@
 공통 모듈을 사용한 표준화된 변경 로직
 """
 
+from collections.abc import Callable
 from uuid import UUID
 
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.session_auth import revoke_session_after_commit, revoke_session_by_pk
 from src.graphql.common import delete_entity, update_entity
 from src.models.manager.idam.session import Session as SessionModel
 
-from .queries import manager_session_to_graphql
+from .queries import get_manager_session_by_id
 from .types import ManagerSession
 
 
@@ -23,6 +25,15 @@ class UpdateSessionInput:
     mfa_verified: bool | None = strawberry.field(default=None, description="MFA 검증 여부")
 
 
+def _revoke_after_commit(db: AsyncSession) -> Callable[[SessionModel], None]:
+    """update_entity의 before_commit 후킹: 커밋 후 세션 폐기 전파"""
+
+    def revoke(session: SessionModel) -> None:
+        revoke_session_after_commit(db, session.session_id, session.expires_at)
+
+    return revoke
+
+
 async def update_manager_session(
     db: AsyncSession, session_id: UUID, input_data: UpdateSessionInput
 ) -> ManagerSession | None:
@@ -49,16 +60,26 @@ async def update_manager_session(
     # 수정할 필드가 없으면 early return
     if not update_dict:
         # 기존 세션 반환
-        from .queries import get_manager_session_by_id
         return await get_manager_session_by_id(db, session_id)
 
-    return await update_entity(
+    # ACTIVE 이외 상태로 변경되면 커밋 후 모든 워커의 세션 검증 캐시에서 제거
+    before_commit = None
+    if input_data.status is not None and input_data.status != "ACTIVE":
+        before_commit = _revoke_after_commit(db)
+
+    updated_id = await update_entity(
         db=db,
         model_class=SessionModel,
         entity_id=session_id,
         input_data=type('UpdateInput', (), update_dict)(),
-        to_graphql=manager_session_to_graphql,
+        to_graphql=lambda session: session.id,
+        before_commit=before_commit,
     )
+    if updated_id is None:
+        return None
+
+    # 사용자명을 JOIN으로 함께 조회하여 반환
+    return await get_manager_session_by_id(db, updated_id)
 
 
 async def revoke_manager_session(db: AsyncSession, session_id: UUID) -> ManagerSession | None:
@@ -80,13 +101,20 @@ async def revoke_manager_session(db: AsyncSession, session_id: UUID) -> ManagerS
     class SessionRevokeInput:
         status = "REVOKED"
 
-    return await update_entity(
+    revoked_id = await update_entity(
         db=db,
         model_class=SessionModel,
         entity_id=session_id,
         input_data=SessionRevokeInput(),
-        to_graphql=manager_session_to_graphql,
+        to_graphql=lambda session: session.id,
+        # 커밋 후 폐기 목록 추가 + 모든 워커의 세션 검증 캐시 무효화
+        before_commit=_revoke_after_commit(db),
     )
+    if revoked_id is None:
+        return None
+
+    # 사용자명을 JOIN으로 함께 조회하여 반환
+    return await get_manager_session_by_id(db, revoked_id)
 
 
 async def delete_manager_session(db: AsyncSession, session_id: UUID) -> bool:
@@ -103,6 +131,9 @@ async def delete_manager_session(db: AsyncSession, session_id: UUID) -> bool:
     Returns:
         bool: 삭제 성공 여부
     """
+    # 삭제 전에 session_id를 조회해 커밋 후 폐기 전파 예약
+    await revoke_session_by_pk(db, session_id)
+
     return await delete_entity(
         db=db,
         model_class=SessionModel,
@@ -7,36 +7,35 @@
 from uuid import UUID
 
 import strawberry
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.graphql.common import clamp_limit
 from src.models.manager.idam.session import Session as SessionModel
 from src.models.manager.idam.user import User as UserModel
 
 from .types import ManagerSession, ManagerSessionList
 
 
-async def manager_session_to_graphql(session: SessionModel, db: AsyncSession) -> "ManagerSession":
+def manager_session_to_graphql(session: SessionModel, username: str | None = None) -> "ManagerSession":
     """
     SessionModel(DB 모델)을 ManagerSession(GraphQL 타입)으로 변환
 
+    사용자명은 세션 조회 시 JOIN으로 함께 가져온 값을 전달받습니다.
+    (세션마다 별도 조회하지 않음 - select_sessions_with_username 참고)
+
     Args:
         session: 데이터베이스 세션 모델
-        db: 데이터베이스 세션 (username 조회용)
+        username: 세션 소유자 사용자명 (사용자가 없으면 None)
 
     Returns:
         ManagerSession: GraphQL 세션 타입
     """
-    # 사용자명 조회
-    username = ""
-    result = await db.execute(select(UserModel.username).where(UserModel.id == session.user_id))
-    username = result.scalar_one_or_none() or ""
-
     return ManagerSession(
         id=strawberry.ID(str(session.id)),
         session_id=session.session_id,
         user_id=session.user_id,
-        username=username,
+        username=username or "",
         tenant_context=session.tenant_context,
         session_type=session.session_type,
         fingerprint=session.fingerprint,
@@ -54,6 +53,18 @@ async def manager_session_to_graphql(session: SessionModel, db: AsyncSession) ->
     )
 
 
+def select_sessions_with_username() -> Select:
+    """
+    세션 + 사용자명 조회 쿼리 생성
+
+    users 테이블을 LEFT JOIN하여 세션 목록과 사용자명을 한 번의 쿼리로 조회합니다.
+    결과 행은 (SessionModel, username) 형태입니다.
+    """
+    return select(SessionModel, UserModel.username).outerjoin(
+        UserModel, UserModel.id == SessionModel.user_id
+    )
+
+
 async def get_manager_session_by_id(db: AsyncSession, session_id: UUID) -> "ManagerSession | None":
     """
     ID로 Manager 세션 단건 조회
@@ -65,13 +76,14 @@ async def get_manager_session_by_id(db: AsyncSession, session_id: UUID) -> "Mana
     Returns:
         ManagerSession: 세션 객체 또는 None
     """
-    result = await db.execute(select(SessionModel).where(SessionModel.id == session_id))
-    session = result.scalar_one_or_none()
+    result = await db.execute(select_sessions_with_username().where(SessionModel.id == session_id))
+    row = result.first()
 
-    if not session:
+    if not row:
         return None
 
-    return await manager_session_to_graphql(session, db)
+    session, username = row
+    return manager_session_to_graphql(session, username)
 
 
 async def get_manager_sessions(
@@ -96,34 +108,34 @@ async def get_manager_sessions(
     Returns:
         tuple: (세션 객체 리스트, 전체 세션 개수)
     """
-    # 필터 조건 구성
-    base_query = select(SessionModel)
+    # 필터 조건 구성 (COUNT/목록 쿼리 공통)
+    conditions = []
     if user_id:
-        base_query = base_query.where(SessionModel.user_id == user_id)
+        conditions.append(SessionModel.user_id == user_id)
     if status:
-        base_query = base_query.where(SessionModel.status == status)
+        conditions.append(SessionModel.status == status)
     if session_type:
-        base_query = base_query.where(SessionModel.session_type == session_type)
+        conditions.append(SessionModel.session_type == session_type)
 
     # 1. 전체 개수 조회
-    count_query = select(func.count(SessionModel.id)).select_from(SessionModel)
-    if user_id:
-        count_query = count_query.where(SessionModel.user_id == user_id)
-    if status:
-        count_query = count_query.where(SessionModel.status == status)
-    if session_type:
-        count_query = count_query.where(SessionModel.session_type == session_type)
-
+    count_query = select(func.count(SessionModel.id)).select_from(SessionModel).where(*conditions)
     count_result = await db.execute(count_query)
     total_count = count_result.scalar() or 0
 
-    # 2. 페이징된 데이터 조회
-    query = base_query.order_by(SessionModel.created_at.desc()).limit(limit).offset(offset)
+    # 2. 페이징된 데이터 조회 (사용자명은 JOIN으로 함께 조회)
+    query = (
+        select_sessions_with_username()
+        .where(*conditions)
+        .order_by(SessionModel.created_at.desc())
+        .limit(clamp_limit(limit))
+        .offset(offset)
+    )
     result = await db.execute(query)
-    sessions = result.scalars().all()
 
-    # 3. 각 세션을 GraphQL 타입으로 변환 (username 포함)
-    graphql_sessions = [await manager_session_to_graphql(session, db) for session in sessions]
+    # 3. 각 세션을 GraphQL 타입으로 변환
+    graphql_sessions = [
+        manager_session_to_graphql(session, username) for session, username in result.all()
+    ]
 
     return graphql_sessions, total_count
 
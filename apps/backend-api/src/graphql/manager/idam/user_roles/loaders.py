@@ -3,14 +3,27 @@
 공통 모듈을 사용한 DataLoader 구현
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.graphql.common import BaseDataLoader
+from src.graphql.common import BaseDataLoader, BaseRelationLoader, SessionSource
+from src.models.manager.idam.role import Role as RoleModel
 from src.models.manager.idam.user_role import UserRole as UserRoleModel
 
 
 class ManagerUserRoleLoader(BaseDataLoader[UserRoleModel]):
     """Manager 사용자-역할 매핑 DataLoader (N+1 쿼리 최적화)"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: SessionSource):
         super().__init__(db, UserRoleModel)
+
+
+class ManagerRolesByUserLoader(BaseRelationLoader[RoleModel]):
+    """사용자별 활성 역할 목록 DataLoader (우선순위 순)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(
+            db,
+            RoleModel,
+            key_column=UserRoleModel.user_id,
+            join=(UserRoleModel, UserRoleModel.role_id == RoleModel.id),
+            conditions=[UserRoleModel.status == "ACTIVE"],
+            order_by=[RoleModel.priority],
+        )
@@ -11,6 +11,7 @@ import strawberry
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.permission_cache import permission_cache
 from src.graphql.common import update_entity
 from src.models.manager.idam.user_role import UserRole as UserRoleModel
 
@@ -73,7 +74,6 @@ async def create_manager_user_role(
 
     db.add(user_role)
     await db.flush()
-    await db.refresh(user_role)
 
     return manager_user_role_to_graphql(user_role)
 
@@ -114,6 +114,10 @@ async def update_manager_user_role(
         entity_id=user_role_id,
         input_data=type("UpdateData", (), prepared_data)(),
         to_graphql=manager_user_role_to_graphql,
+        # 커밋 전에 예약해야 unit of work 모드가 아닐 때도 커밋 이후 무효화됨
+        before_commit=lambda user_role: permission_cache.invalidate_after_commit(
+            db, [user_role.user_id]
+        ),
     )
 
 
@@ -280,7 +284,9 @@ class ManagerUserRoleMutations:
         db = info.context.manager_db_session
         # TODO: info.context에서 현재 사용자 ID 가져오기
         granted_by = None  # info.context.current_user.id
-        return await create_manager_user_role(db, input, granted_by)
+        user_role = await create_manager_user_role(db, input, granted_by)
+        permission_cache.invalidate_after_commit(db, [input.user_id])
+        return user_role
 
     @strawberry.mutation(description="Manager 사용자-역할 매핑 수정")
     async def update_user_role(
@@ -318,7 +324,10 @@ class ManagerUserRoleMutations:
             bool: 해제 성공 여부
         """
         db = info.context.manager_db_session
-        return await revoke_manager_user_role(db, input)
+        revoked = await revoke_manager_user_role(db, input)
+        if revoked:
+            permission_cache.invalidate_after_commit(db, [input.user_id])
+        return revoked
 
     @strawberry.mutation(description="Manager 사용자에서 역할 삭제")
     async def delete_user_role(
@@ -336,7 +345,10 @@ class ManagerUserRoleMutations:
             bool: 삭제 성공 여부
         """
         db = info.context.manager_db_session
-        return await delete_manager_user_role(db, input)
+        deleted = await delete_manager_user_role(db, input)
+        if deleted:
+            permission_cache.invalidate_after_commit(db, [input.user_id])
+        return deleted
 
     @strawberry.mutation(description="Manager 사용자에게 여러 역할 일괄 할당")
     async def bulk_assign_roles_to_user(
@@ -359,13 +371,15 @@ class ManagerUserRoleMutations:
         """
         db = info.context.manager_db_session
         granted_by = None  # info.context.current_user.id
-        return await bulk_assign_manager_roles_to_user(
+        user_roles = await bulk_assign_manager_roles_to_user(
             db,
             UUID(user_id),
             [UUID(rid) for rid in role_ids],
             scope,
             granted_by,
         )
+        permission_cache.invalidate_after_commit(db, [user_id])
+        return user_roles
 
     @strawberry.mutation(description="Manager 사용자에서 여러 역할 일괄 해제")
     async def bulk_revoke_roles_from_user(
@@ -385,8 +399,11 @@ class ManagerUserRoleMutations:
             int: 실제로 해제된 역할의 개수
         """
         db = info.context.manager_db_session
-        return await bulk_revoke_manager_roles_from_user(
+        revoked = await bulk_revoke_manager_roles_from_user(
             db,
             UUID(user_id),
             [UUID(rid) for rid in role_ids],
         )
+        if revoked:
+            permission_cache.invalidate_after_commit(db, [user_id])
+        return revoked
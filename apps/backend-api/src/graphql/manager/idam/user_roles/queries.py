@@ -7,9 +7,11 @@
 from uuid import UUID
 
 import strawberry
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.idam.user_role import UserRole as UserRoleModel
 
 from .types import ManagerUserRole
@@ -43,7 +45,7 @@ def manager_user_role_to_graphql(user_role: UserRoleModel) -> "ManagerUserRole":
 
 
 async def get_manager_user_role_by_id(
-    db: AsyncSession, user_role_id: UUID
+    db: AsyncSession, user_role_id: UUID, info: Info | None = None
 ) -> "ManagerUserRole | None":
     """
     ID로 Manager 사용자-역할 매핑 단건 조회
@@ -51,6 +53,7 @@ async def get_manager_user_role_by_id(
     Args:
         db: 데이터베이스 세션
         user_role_id: 조회할 매핑 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         ManagerUserRole: 매핑 객체 또는 None
@@ -60,6 +63,7 @@ async def get_manager_user_role_by_id(
         model_class=UserRoleModel,
         id_=user_role_id,
         to_graphql=manager_user_role_to_graphql,
+        info=info,
     )
 
 
@@ -71,6 +75,9 @@ async def get_manager_user_roles(
     role_id: UUID | None = None,
     scope: str | None = None,
     status: str | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerUserRole]":
     """
     Manager 사용자-역할 매핑 목록 조회
@@ -83,6 +90,9 @@ async def get_manager_user_roles(
         role_id: 역할 ID 필터 (선택)
         scope: 범위 필터 (선택)
         status: 상태 필터 (선택)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[UserRole]: 매핑 객체 리스트
@@ -106,6 +116,9 @@ async def get_manager_user_roles(
         limit=limit,
         offset=offset,
         order_by=UserRoleModel.created_at.desc(),  # 최신 순으로 정렬
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
@@ -152,6 +165,28 @@ async def get_manager_users_by_role_id(db: AsyncSession, role_id: UUID) -> "list
     )
 
 
+async def get_manager_user_ids_by_role_id(db: AsyncSession, role_id: UUID) -> list[UUID]:
+    """
+    특정 역할이 활성 상태로 할당된 사용자 ID 목록 조회
+
+    역할의 권한 변경 시 권한 캐시를 무효화할 대상을 찾는 데 사용합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        role_id: 역할 ID
+
+    Returns:
+        list[UUID]: 사용자 ID 리스트 (중복 제거)
+    """
+    stmt = (
+        select(UserRoleModel.user_id)
+        .where(UserRoleModel.role_id == role_id, UserRoleModel.status == "ACTIVE")
+        .distinct()
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
 @strawberry.type
 class ManagerUserRoleQueries:
     """
@@ -172,7 +207,7 @@ class ManagerUserRoleQueries:
             UserRole: 매핑 객체 또는 None
         """
         db = info.context.manager_db_session
-        return await get_manager_user_role_by_id(db, UUID(id))
+        return await get_manager_user_role_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 사용자-역할 매핑 목록")
     async def user_roles(
@@ -208,6 +243,7 @@ class ManagerUserRoleQueries:
             UUID(role_id) if role_id else None,
             scope,
             status,
+            info=info,
         )
 
     @strawberry.field(description="사용자에게 할당된 역할 목록")
@@ -237,3 +273,41 @@ class ManagerUserRoleQueries:
         """
         db = info.context.manager_db_session
         return await get_manager_users_by_role_id(db, UUID(role_id))
+
+    @strawberry.field(description="Manager 사용자-역할 매핑 목록 (커서 페이지네이션)")
+    async def user_roles_connection(
+        self,
+        info,
+        first: int = 50,
+        after: str | None = None,
+        user_id: strawberry.ID | None = None,
+        role_id: strawberry.ID | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+    ) -> "Connection[ManagerUserRole]":
+        """
+        사용자-역할 매핑 목록 조회 (키셋 페이지네이션)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerUserRole]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_user_roles(
+            db,
+            limit=first + 1,
+            user_id=UUID(user_id) if user_id else None,
+            role_id=UUID(role_id) if role_id else None,
+            scope=scope,
+            status=status,
+            after=after,
+            keyset=True,
+            info=info,
+        )
+        return to_connection(items, first, after)
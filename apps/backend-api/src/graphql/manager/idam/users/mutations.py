@@ -9,7 +9,7 @@ from uuid import UUID
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import hash_password
+from src.core.security import hash_password_async
 from src.graphql.common import create_entity, update_entity
 from src.models.manager.idam.user import User as UserModel
 
@@ -17,14 +17,17 @@ from .queries import manager_user_to_graphql
 from .types import ManagerUser, ManagerUserCreateInput, ManagerUserUpdateInput
 
 
-def prepare_manager_user_create_data(input_data: ManagerUserCreateInput) -> dict:
+def prepare_manager_user_create_data(
+    input_data: ManagerUserCreateInput, password_hash: str
+) -> dict:
     """
     사용자 생성 데이터 준비
 
-    비밀번호를 해싱하여 안전하게 저장할 수 있도록 데이터를 준비합니다.
+    해싱된 비밀번호로 안전하게 저장할 수 있도록 데이터를 준비합니다.
 
     Args:
         input_data: 사용자 생성 입력 데이터
+        password_hash: 해싱된 비밀번호 (hash_password_async 결과)
 
     Returns:
         dict: 데이터베이스에 저장할 준비된 데이터
@@ -34,7 +37,7 @@ def prepare_manager_user_create_data(input_data: ManagerUserCreateInput) -> dict
         "full_name": input_data.full_name,
         "email": input_data.email,
         "username": input_data.username,
-        "password": hash_password(input_data.password),
+        "password": password_hash,
         "phone": input_data.phone,
         "department": input_data.department,
         "position": input_data.position,
@@ -58,12 +61,15 @@ async def create_manager_user(db: AsyncSession, input_data: ManagerUserCreateInp
     Raises:
         Exception: 중복된 username 또는 email 등의 오류
     """
+    # bcrypt 해싱은 전용 스레드 풀에서 수행 (이벤트 루프 차단 방지)
+    password_hash = await hash_password_async(input_data.password)
+
     return await create_entity(
         db=db,
         model_class=UserModel,
         input_data=input_data,
         to_graphql=manager_user_to_graphql,
-        prepare_data=prepare_manager_user_create_data,
+        prepare_data=lambda data: prepare_manager_user_create_data(data, password_hash),
     )
 
 
@@ -9,8 +9,9 @@ from uuid import UUID
 
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.idam.user import User as UserModel
 
 from .types import ManagerUser
@@ -51,13 +52,16 @@ def manager_user_to_graphql(user: UserModel) -> "ManagerUser":
     )
 
 
-async def get_manager_user_by_id(db: AsyncSession, user_id: UUID) -> "ManagerUser | None":
+async def get_manager_user_by_id(
+    db: AsyncSession, user_id: UUID, info: Info | None = None
+) -> "ManagerUser | None":
     """
     ID로 Manager 사용자 단건 조회
 
     Args:
         db: 데이터베이스 세션
         user_id: 조회할 사용자 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         User: 사용자 객체 또는 None
@@ -67,6 +71,7 @@ async def get_manager_user_by_id(db: AsyncSession, user_id: UUID) -> "ManagerUse
         model_class=UserModel,
         id_=user_id,
         to_graphql=manager_user_to_graphql,
+        info=info,
     )
 
 
@@ -81,6 +86,9 @@ async def get_manager_users(
     force_password_change: bool | None = None,
     created_after: str | None = None,
     created_before: str | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerUser]":
     """
     Manager 사용자 목록 조회
@@ -96,6 +104,9 @@ async def get_manager_users(
         force_password_change: 비밀번호 변경 강제 여부 필터 (선택)
         created_after: 생성일시 이후 (ISO 8601 형식, 선택)
         created_before: 생성일시 이전 (ISO 8601 형식, 선택)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[User]: 사용자 객체 리스트
@@ -157,6 +168,9 @@ async def get_manager_users(
         offset=offset,
         order_by=UserModel.created_at.desc(),  # 최신 순으로 정렬
         extra_conditions=extra_conditions if extra_conditions else None,
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
@@ -181,7 +195,7 @@ class ManagerUserQueries:
             User: 사용자 객체 또는 None
         """
         db = info.context.manager_db_session
-        return await get_manager_user_by_id(db, UUID(id))
+        return await get_manager_user_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 사용자 목록")
     async def users(
@@ -226,4 +240,49 @@ class ManagerUserQueries:
             force_password_change,
             created_after,
             created_before,
+            info=info,
         )
+
+    @strawberry.field(description="Manager 사용자 목록 (커서 페이지네이션)")
+    async def users_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        user_type: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        mfa_enabled: bool | None = None,
+        force_password_change: bool | None = None,
+        created_after: str | None = None,
+        created_before: str | None = None,
+    ) -> "Connection[ManagerUser]":
+        """
+        사용자 목록 조회 (키셋 페이지네이션, 필터는 users와 동일)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerUser]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_users(
+            db,
+            limit=first + 1,
+            user_type=user_type,
+            status=status,
+            search=search,
+            mfa_enabled=mfa_enabled,
+            force_password_change=force_password_change,
+            created_after=created_after,
+            created_before=created_before,
+            after=after,
+            keyset=True,
+            info=info,
+        )
+        return to_connection(items, first, after)
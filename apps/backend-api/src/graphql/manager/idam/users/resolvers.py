@@ -24,24 +24,23 @@ async def resolve_manager_user_roles(user_id: UUID, info):
     Returns:
         list[ManagerRole]: 역할 GraphQL 객체 리스트
     """
-    db = info.context.manager_db_session
-
     # 1. Context에 등록된 전역 DataLoader 사용 시도 (최적화)
     loader = info.context.loaders.get("roles_by_user_loader")
     if loader:
-        return await loader.load(user_id)
-
-    # 2. Fallback: 전역 loader가 없으면 직접 DB 조회
-    # ACTIVE 상태의 UserRole 조회
-    from src.models.manager.idam.role import Role as RoleModel
-
-    result = await db.execute(
-        select(RoleModel)
-        .join(UserRoleModel, UserRoleModel.role_id == RoleModel.id)
-        .where(UserRoleModel.user_id == user_id, UserRoleModel.status == "ACTIVE")
-        .order_by(RoleModel.priority)
-    )
-    roles = result.scalars().all()
+        roles = await loader.load(user_id)
+    else:
+        # 2. Fallback: 전역 loader가 없으면 직접 DB 조회
+        # ACTIVE 상태의 UserRole 조회
+        from src.models.manager.idam.role import Role as RoleModel
+
+        db = info.context.manager_db_session
+        result = await db.execute(
+            select(RoleModel)
+            .join(UserRoleModel, UserRoleModel.role_id == RoleModel.id)
+            .where(UserRoleModel.user_id == user_id, UserRoleModel.status == "ACTIVE")
+            .order_by(RoleModel.priority)
+        )
+        roles = result.scalars().all()
 
     # 3. Import를 여기서 하여 순환 참조 방지
     from ..roles.queries import manager_role_to_graphql
@@ -69,8 +68,11 @@ async def resolve_manager_user_sessions(user_id: UUID, info, status: str | None
 
     from src.models.manager.idam.session import Session as SessionModel
 
-    # 세션 조회 쿼리 구성
-    query = select(SessionModel).where(SessionModel.user_id == user_id)
+    # Import를 여기서 하여 순환 참조 방지
+    from ..sessions.queries import manager_session_to_graphql, select_sessions_with_username
+
+    # 세션 조회 쿼리 구성 (사용자명은 JOIN으로 함께 조회)
+    query = select_sessions_with_username().where(SessionModel.user_id == user_id)
 
     if status:
         query = query.where(SessionModel.status == status)
@@ -78,17 +80,9 @@ async def resolve_manager_user_sessions(user_id: UUID, info, status: str | None
     query = query.order_by(SessionModel.created_at.desc()).limit(100)
 
     result = await db.execute(query)
-    sessions = result.scalars().all()
-
-    # Import를 여기서 하여 순환 참조 방지
-    from ..sessions.queries import manager_session_to_graphql
 
     # DB 모델을 GraphQL 타입으로 변환
-    graphql_sessions = []
-    for session in sessions:
-        graphql_session = await manager_session_to_graphql(session, db)
-        graphql_sessions.append(graphql_session)
-    return graphql_sessions
+    return [manager_session_to_graphql(session, username) for session, username in result.all()]
 
 
 async def resolve_manager_user_permissions(user_id: UUID, info):
@@ -6,6 +6,7 @@
 
 import strawberry
 
+from ..extensions import schema_extensions
 from .schema import ManagerMutation, ManagerQuery
 
 
@@ -19,4 +20,5 @@ Mutation = ManagerMutation
 manager_schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    extensions=schema_extensions("manager"),
 )
@@ -2,11 +2,12 @@
 
 import strawberry
 
+from ..common import Connection
 from .auth.mutations import ManagerAuthMutations
 from .auth.queries import ManagerAuthQueries
 from .auth.types import ManagerAuthUser
 from .dashboard import Activity, DashboardQueries, DashboardStats, TenantGrowthData
-from .idam.login_logs import ManagerLoginLog, ManagerLoginLogsConnection, ManagerLoginLogQueries
+from .idam.login_logs import ManagerLoginLog, ManagerLoginLogQueries, ManagerLoginLogsConnection
 from .idam.permissions import (
     ManagerPermission,
     ManagerPermissionMutations,
@@ -18,7 +19,12 @@ from .idam.role_permissions import (
     ManagerRolePermissionQueries,
 )
 from .idam.roles import ManagerRole, ManagerRoleMutations, ManagerRoleQueries
-from .idam.sessions import ManagerSession, ManagerSessionList, ManagerSessionMutations, ManagerSessionQueries
+from .idam.sessions import (
+    ManagerSession,
+    ManagerSessionList,
+    ManagerSessionMutations,
+    ManagerSessionQueries,
+)
 from .idam.user_roles import ManagerUserRole, ManagerUserRoleMutations, ManagerUserRoleQueries
 from .idam.users import ManagerUser, ManagerUserMutations, ManagerUserQueries
 from .tnnt.tenants import ManagerTenant, ManagerTenantMutations, ManagerTenantQueries
@@ -34,7 +40,7 @@ class ManagerQuery:
 
     # Auth
     @strawberry.field(description="현재 로그인한 사용자 정보 조회")
-    async def me(self, info) -> "ManagerAuthUser | None":
+    async def me(self, info) -> ManagerAuthUser | None:
         """현재 로그인한 사용자 정보를 조회합니다."""
         return await ManagerAuthQueries().me(info)
 
@@ -70,6 +76,20 @@ class ManagerQuery:
     ) -> "list[ManagerUser]":
         return await ManagerUserQueries.users(self, info, limit, offset, user_type, status, search)
 
+    @strawberry.field(description="사용자 목록 조회 (커서 페이지네이션)")
+    async def users_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        user_type: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> Connection[ManagerUser]:
+        return await ManagerUserQueries.users_connection(
+            self, info, first, after, user_type, status, search
+        )
+
     # IDAM - Sessions
     @strawberry.field(description="세션 조회 (ID)")
     async def session(self, info, id: strawberry.ID) -> "ManagerSession | None":
@@ -104,9 +124,19 @@ class ManagerQuery:
         success: bool | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        estimated_total: bool = False,
     ) -> ManagerLoginLogsConnection:
         return await ManagerLoginLogQueries().login_logs_connection(
-            info, limit, offset, search, user_id, attempt_type, success, start_date, end_date
+            info,
+            limit,
+            offset,
+            search,
+            user_id,
+            attempt_type,
+            success,
+            start_date,
+            end_date,
+            estimated_total,
         )
 
     @strawberry.field(description="로그인 이력 목록 조회 (레거시)")
@@ -126,6 +156,23 @@ class ManagerQuery:
             info, limit, offset, search, user_id, attempt_type, success, start_date, end_date
         )
 
+    @strawberry.field(description="로그인 이력 목록 조회 (커서 페이지네이션)")
+    async def login_logs_cursor_connection(
+        self,
+        info,
+        first: int = 50,
+        after: str | None = None,
+        search: str | None = None,
+        user_id: strawberry.ID | None = None,
+        attempt_type: str | None = None,
+        success: bool | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> Connection[ManagerLoginLog]:
+        return await ManagerLoginLogQueries().login_logs_cursor_connection(
+            info, first, after, search, user_id, attempt_type, success, start_date, end_date
+        )
+
     # IDAM - Roles
     @strawberry.field(description="역할 조회 (ID)")
     async def role(self, info, id: strawberry.ID) -> "ManagerRole | None":
@@ -143,6 +190,20 @@ class ManagerQuery:
     ) -> "list[ManagerRole]":
         return await ManagerRoleQueries.roles(self, info, limit, offset, category, status, search)
 
+    @strawberry.field(description="역할 목록 조회 (커서 페이지네이션)")
+    async def roles_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> Connection[ManagerRole]:
+        return await ManagerRoleQueries.roles_connection(
+            self, info, first, after, category, status, search
+        )
+
     # IDAM - Permissions
     @strawberry.field(description="권한 조회 (ID)")
     async def permission(self, info, id: strawberry.ID) -> "ManagerPermission | None":
@@ -166,6 +227,24 @@ class ManagerQuery:
             self, info, limit, offset, search, category, resource, action, scope, status, is_system
         )
 
+    @strawberry.field(description="권한 목록 조회 (커서 페이지네이션)")
+    async def permissions_connection(
+        self,
+        info,
+        first: int = 50,
+        after: str | None = None,
+        search: str | None = None,
+        category: str | None = None,
+        resource: str | None = None,
+        action: str | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        is_system: bool | None = None,
+    ) -> Connection[ManagerPermission]:
+        return await ManagerPermissionQueries.permissions_connection(
+            self, info, first, after, search, category, resource, action, scope, status, is_system
+        )
+
     # IDAM - Role Permissions
     @strawberry.field(description="역할-권한 조회 (ID)")
     async def role_permission(self, info, id: strawberry.ID) -> "ManagerRolePermission | None":
@@ -177,6 +256,14 @@ class ManagerQuery:
     ) -> "list[ManagerRolePermission]":
         return await ManagerRolePermissionQueries.role_permissions(self, info, limit, offset)
 
+    @strawberry.field(description="역할-권한 목록 조회 (커서 페이지네이션)")
+    async def role_permissions_connection(
+        self, info, first: int = 50, after: str | None = None
+    ) -> Connection[ManagerRolePermission]:
+        return await ManagerRolePermissionQueries.role_permissions_connection(
+            self, info, first, after
+        )
+
     @strawberry.field(description="역할별 권한 목록")
     async def permissions_by_role(self, info, role_id: strawberry.ID) -> "list[ManagerPermission]":
         return await ManagerRolePermissionQueries.permissions_by_role(self, info, role_id)
@@ -194,6 +281,12 @@ class ManagerQuery:
     async def user_roles(self, info, limit: int = 20, offset: int = 0) -> "list[ManagerUserRole]":
         return await ManagerUserRoleQueries.user_roles(self, info, limit, offset)
 
+    @strawberry.field(description="사용자-역할 목록 조회 (커서 페이지네이션)")
+    async def user_roles_connection(
+        self, info, first: int = 50, after: str | None = None
+    ) -> Connection[ManagerUserRole]:
+        return await ManagerUserRoleQueries.user_roles_connection(self, info, first, after)
+
     @strawberry.field(description="사용자별 역할 목록")
     async def roles_by_user(self, info, user_id: strawberry.ID) -> "list[ManagerRole]":
         return await ManagerUserRoleQueries.roles_by_user(self, info, user_id)
@@ -222,6 +315,21 @@ class ManagerQuery:
             info, limit, offset, search, status, type, is_suspended
         )
 
+    @strawberry.field(description="테넌트 목록 조회 (커서 페이지네이션)")
+    async def tenants_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        search: str | None = None,
+        status: str | None = None,
+        type: str | None = None,
+        is_suspended: bool | None = None,
+    ) -> Connection[ManagerTenant]:
+        return await ManagerTenantQueries().tenants_connection(
+            info, first, after, search, status, type, is_suspended
+        )
+
 
 @strawberry.type(description="Manager 시스템 Mutation")
 class ManagerMutation:
@@ -9,6 +9,7 @@ from uuid import UUID
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database import run_after_commit, tenant_engine_registry
 from src.graphql.common import create_entity, update_entity
 from src.models.manager.tnnt.tenant import Tenant as TenantModel
 
@@ -138,6 +139,10 @@ async def update_manager_tenant(
         entity_id=tenant_id,
         input_data=clean_data,
         to_graphql=manager_tenant_to_graphql,
+        # extra_data.database_url(전용 DSN) 변경을 커밋 후 이 워커에 바로 반영
+        before_commit=lambda tenant: run_after_commit(
+            db, "tenant_dsn", [tenant.code], tenant_engine_registry.forget
+        ),
     )
 
     return result
@@ -166,6 +171,8 @@ async def delete_manager_tenant(
 
         # 논리적 삭제 (is_deleted 플래그 설정)
         tenant.is_deleted = True
+        # 커밋 후 이 워커의 DSN 캐시에서 제거 (다른 워커는 tenant_dsn_ttl 이후 반영)
+        run_after_commit(db, "tenant_dsn", [tenant.code], tenant_engine_registry.forget)
         await db.commit()
 
         return {"success": True, "message": "테넌트가 삭제되었습니다"}
@@ -10,8 +10,9 @@ from uuid import UUID
 import strawberry
 from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
 
-from src.graphql.common import get_by_id, get_list
+from src.graphql.common import Connection, get_by_id, get_list, to_connection, validate_first
 from src.models.manager.tnnt.tenant import Tenant as TenantModel
 
 from .types import ManagerTenant
@@ -61,13 +62,16 @@ def manager_tenant_to_graphql(tenant: TenantModel) -> "ManagerTenant":
     )
 
 
-async def get_manager_tenant_by_id(db: AsyncSession, tenant_id: UUID) -> "ManagerTenant | None":
+async def get_manager_tenant_by_id(
+    db: AsyncSession, tenant_id: UUID, info: Info | None = None
+) -> "ManagerTenant | None":
     """
     ID로 Manager 테넌트 단건 조회
 
     Args:
         db: 데이터베이스 세션
         tenant_id: 조회할 테넌트 ID
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         Tenant: 테넌트 객체 또는 None
@@ -77,6 +81,7 @@ async def get_manager_tenant_by_id(db: AsyncSession, tenant_id: UUID) -> "Manage
         model_class=TenantModel,
         id_=tenant_id,
         to_graphql=manager_tenant_to_graphql,
+        info=info,
         is_deleted=False,
     )
 
@@ -89,6 +94,9 @@ async def get_manager_tenants(
     status: str | None = None,
     type: str | None = None,
     is_suspended: bool | None = None,
+    after: str | None = None,
+    keyset: bool = False,
+    info: Info | None = None,
 ) -> "list[ManagerTenant]":
     """
     Manager 테넌트 목록 조회
@@ -101,6 +109,9 @@ async def get_manager_tenants(
         status: 상태 필터 (선택)
         type: 테넌트 유형 필터 (선택)
         is_suspended: 중단 여부 필터 (선택)
+        after: 키셋 모드 커서 (선택)
+        keyset: 키셋(커서) 페이지네이션 모드 사용 여부
+        info: Strawberry Info (전달 시 요청된 필드의 컬럼만 조회)
 
     Returns:
         list[Tenant]: 테넌트 객체 리스트
@@ -135,6 +146,9 @@ async def get_manager_tenants(
         offset=offset,
         order_by=TenantModel.created_at.desc(),  # 최신 순으로 정렬
         extra_conditions=extra_conditions if extra_conditions else None,
+        after=after,
+        keyset=keyset,
+        info=info,
         **filters,
     )
 
@@ -159,7 +173,7 @@ class ManagerTenantQueries:
             Tenant: 테넌트 객체 또는 None
         """
         db = info.context.manager_db_session
-        return await get_manager_tenant_by_id(db, UUID(id))
+        return await get_manager_tenant_by_id(db, UUID(id), info=info)
 
     @strawberry.field(description="Manager 테넌트 목록")
     async def tenants(
@@ -195,4 +209,43 @@ class ManagerTenantQueries:
             status,
             type,
             is_suspended,
+            info=info,
         )
+
+    @strawberry.field(description="Manager 테넌트 목록 (커서 페이지네이션)")
+    async def tenants_connection(
+        self,
+        info,
+        first: int = 20,
+        after: str | None = None,
+        search: str | None = None,
+        status: str | None = None,
+        type: str | None = None,
+        is_suspended: bool | None = None,
+    ) -> "Connection[ManagerTenant]":
+        """
+        테넌트 목록 조회 (키셋 페이지네이션, 필터는 tenants와 동일)
+
+        (created_at, id) 기준으로 seek하므로 N번째 페이지도 첫 페이지와 같은 비용입니다.
+
+        Args:
+            first: 조회 개수
+            after: 이전 페이지의 pageInfo.endCursor
+
+        Returns:
+            Connection[ManagerTenant]: 엣지 목록과 페이지 정보
+        """
+        validate_first(first)
+        db = info.context.manager_db_session
+        items = await get_manager_tenants(
+            db,
+            limit=first + 1,
+            search=search,
+            status=status,
+            type=type,
+            is_suspended=is_suspended,
+            after=after,
+            keyset=True,
+            info=info,
+        )
+        return to_connection(items, first, after)
@@ -0,0 +1,218 @@
+"""GraphQL 영속 쿼리(Persisted Query) + 파싱/검증된 문서 캐시
+
+manager-web/tenants-web은 같은 수백 개의 쿼리 문서를 반복해서 보내므로,
+문서 전송과 파싱/검증을 요청마다 반복하지 않도록 합니다.
+
+자동 영속 쿼리 (APQ, Apollo 프로토콜):
+    1. 클라이언트가 extensions.persistedQuery.sha256Hash만 전송
+    2. 등록되지 않은 해시면 PersistedQueryNotFound 오류 → 클라이언트가 문서와 해시를 함께 재전송
+    3. 서버는 해시를 검증한 뒤 해시 → 문서를 저장 (로컬 LRU + Redis, 워커 간 공유)
+
+허용 목록(allow-list) 모드 (운영 환경, settings.graphql_persisted_queries_only):
+    프론트엔드 빌드에서 생성한 매니페스트(apollo-persisted-query-manifest 형식 또는
+    {해시: 문서} JSON)에 있는 문서만 실행합니다. APQ 등록은 하지 않습니다.
+
+문서 캐시:
+    DocumentCache는 스키마별로 검증을 통과한 쿼리 문자열 → 파싱된 문서(DocumentNode)를
+    LRU로 보관합니다 (DocumentCacheExtension에서 사용).
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from graphql import DocumentNode
+from src.core.cache import TwoLevelCache
+from src.core.config import settings
+from src.core.logging import get_logger
+
+
+logger = get_logger("graphql.persisted_queries")
+
+
+def query_hash(query: str) -> str:
+    """쿼리 문서의 SHA-256 해시 (16진수, APQ sha256Hash 형식)"""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueryError(Exception):
+    """영속 쿼리 처리 오류 (GraphQL 오류 응답으로 반환)"""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+def load_manifest(path: str) -> dict[str, str]:
+    """
+    영속 쿼리 매니페스트 읽기
+
+    지원 형식:
+        - apollo-persisted-query-manifest: {"operations": [{"id", "body", ...}]}
+        - 해시 → 문서 JSON: {"<sha256>": "query ..."}
+
+    Returns:
+        해시(id) → 문서
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict) and isinstance(data.get("operations"), list):
+        return {operation["id"]: operation["body"] for operation in data["operations"]}
+    return {str(key): str(value) for key, value in data.items()}
+
+
+class PersistedQueryStore:
+    """스키마별 영속 쿼리 저장소 (APQ 등록 문서 + 매니페스트)"""
+
+    def __init__(
+        self,
+        name: str,
+        manifest_paths: list[str] | None = None,
+        allow_list_only: bool = False,
+        apq_enabled: bool = True,
+    ):
+        """
+        Args:
+            name: 스키마 이름 (Redis 키 접두사)
+            manifest_paths: 매니페스트 파일 경로 목록
+            allow_list_only: 매니페스트에 있는 문서만 허용
+            apq_enabled: APQ 등록/조회 사용 여부 (허용 목록 모드에서는 등록하지 않음)
+        """
+        self.name = name
+        self.allow_list_only = allow_list_only
+        self.apq_enabled = apq_enabled
+
+        self._manifest: dict[str, str] = {}
+        for path in manifest_paths or []:
+            self._manifest.update(load_manifest(path))
+
+        # 문서 본문 해시 (id가 해시가 아닌 매니페스트도 문서로 허용 여부 판단)
+        self._allowed = {query_hash(query) for query in self._manifest.values()}
+
+        # 문서는 해시로 식별되어 바뀌지 않으므로 무효화 없이 TTL로만 정리
+        self._apq: TwoLevelCache[str] = TwoLevelCache(
+            f"graphql:apq:{name}",
+            max_size=2000,
+            local_ttl=3600.0,
+            redis_ttl=604800,
+            encode=str,
+            decode=str,
+        )
+
+        if allow_list_only:
+            logger.info(f"{name} GraphQL 허용 목록 모드: 문서 {len(self._manifest)}개")
+
+    def __len__(self) -> int:
+        return len(self._manifest)
+
+    def is_allowed(self, query: str) -> bool:
+        """매니페스트에 있는 문서인지 여부"""
+        return query_hash(query) in self._allowed
+
+    async def resolve(self, query: str | None, extensions: Any) -> str | None:
+        """
+        요청의 실행할 문서 결정
+
+        Args:
+            query: 요청 본문의 query (APQ 해시만 보낸 경우 None)
+            extensions: 요청 본문의 extensions
+
+        Returns:
+            실행할 문서 (query도 영속 쿼리도 없으면 None)
+
+        Raises:
+            PersistedQueryError: 등록되지 않은 해시, 해시 불일치, 허용 목록에 없는 문서
+        """
+        persisted = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+
+        # 1. 일반 요청 (허용 목록 모드에서는 매니페스트 문서만)
+        if persisted is None:
+            if self.allow_list_only and query is not None and not self.is_allowed(query):
+                raise PersistedQueryError(
+                    "허용되지 않은 쿼리입니다", code="PERSISTED_QUERY_NOT_ALLOWED"
+                )
+            return query
+
+        if not self.apq_enabled and not self.allow_list_only:
+            raise PersistedQueryError(
+                "PersistedQueryNotSupported", code="PERSISTED_QUERY_NOT_SUPPORTED"
+            )
+        digest = persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        if not isinstance(digest, str) or persisted.get("version") != 1:
+            raise PersistedQueryError(
+                "지원하지 않는 영속 쿼리 형식입니다", code="PERSISTED_QUERY_INVALID"
+            )
+
+        # 2. 해시만 전송 → 매니페스트, APQ 등록 문서 순으로 조회
+        if query is None:
+            found = self._manifest.get(digest)
+            if found is None and not self.allow_list_only:
+                found = await self._apq.get_cached(digest)
+            if found is None:
+                raise PersistedQueryError(
+                    "PersistedQueryNotFound", code="PERSISTED_QUERY_NOT_FOUND"
+                )
+            return found
+
+        # 3. 문서 + 해시 → 검증 후 등록
+        if query_hash(query) != digest:
+            raise PersistedQueryError(
+                "provided sha does not match query", code="PERSISTED_QUERY_HASH_MISMATCH"
+            )
+        if self.allow_list_only:
+            if not self.is_allowed(query):
+                raise PersistedQueryError(
+                    "허용되지 않은 쿼리입니다", code="PERSISTED_QUERY_NOT_ALLOWED"
+                )
+        elif self._apq.get_local(digest) is None:
+            await self._apq.set(digest, query)
+        return query
+
+
+class DocumentCache:
+    """
+    검증된 문서 LRU (스키마별, 쿼리 문자열 → DocumentNode)
+
+    검증을 통과한 문서만 저장하므로 적중하면 파싱과 검증을 모두 건너뜁니다.
+    DocumentNode는 실행 중 수정되지 않으므로 요청 간에 공유합니다.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._documents: OrderedDict[str, DocumentNode] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, query: str) -> DocumentNode | None:
+        document = self._documents.get(query)
+        if document is None:
+            self.misses += 1
+            return None
+        self._documents.move_to_end(query)
+        self.hits += 1
+        return document
+
+    def set(self, query: str, document: DocumentNode) -> None:
+        self._documents[query] = document
+        self._documents.move_to_end(query)
+        while len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+
+    def metrics(self) -> dict[str, int]:
+        """캐시 통계"""
+        return {"size": len(self._documents), "hits": self.hits, "misses": self.misses}
+
+
+def create_persisted_query_store(name: str, manifest_path: str) -> PersistedQueryStore:
+    """settings 기준 스키마별 영속 쿼리 저장소 생성"""
+    return PersistedQueryStore(
+        name,
+        manifest_paths=[manifest_path] if manifest_path else [],
+        allow_list_only=settings.graphql_persisted_queries_only,
+        apq_enabled=settings.graphql_apq_enabled,
+    )
@@ -0,0 +1,322 @@
+"""GraphQL 쿼리 비용 분석 + 비용 기반 실행 허용(admission)
+
+실행 전에 문서(AST)와 스키마만으로 쿼리 비용/깊이를 계산합니다.
+
+비용 계산:
+    - 스칼라/열거형 필드 (기본 리졸버): 0
+    - 객체 필드 (기본 리졸버): OBJECT_FIELD_COST
+    - 사용자 정의 리졸버 필드 (DB 조회 등): RESOLVER_FIELD_COST
+    - 목록 필드: 필드 비용 + 목록 크기 × max(하위 선택 비용, 1)
+      (스칼라 목록처럼 하위 비용이 0이어도 항목당 최소 1)
+      목록 크기는 limit/first/last/pageSize 인자(변수, 기본값 포함)로 정하며,
+      조회 헬퍼와 같이 MAX_PAGE_SIZE로 제한하고, 인자가 없으면 DEFAULT_LIST_SIZE로 추정합니다.
+      Connection처럼 limit 인자를 받는 단건 필드는 그 값을 하위의 첫 목록 필드에 적용합니다.
+
+실행 허용:
+    CostAdmission은 테넌트(없으면 사용자)별로 실행 중인 쿼리 비용 합계를 budget 이하로
+    유지합니다. 예산이 모자라면 대기열에서 기다리고, timeout 안에 자리가 나지 않으면 거부합니다.
+
+사용 예:
+    cost = analyze_query(schema, document, operation_name, variables)
+    await cost_admission.acquire(subject, cost.cost)
+    try:
+        ...  # 실행
+    finally:
+        await cost_admission.release(subject, cost.cost)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from graphql.utilities import get_operation_ast
+from strawberry.resolvers import is_default_resolver
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLField,
+    GraphQLSchema,
+    InlineFragmentNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    is_leaf_type,
+    is_list_type,
+    value_from_ast,
+)
+from src.core.config import settings
+
+from .common import MAX_PAGE_SIZE
+
+
+# 필드 비용
+OBJECT_FIELD_COST = 1
+RESOLVER_FIELD_COST = 10
+
+# 목록 크기 인자 (camelCase, 앞에 있는 인자 우선)
+LIST_SIZE_ARGUMENTS = ("limit", "first", "last", "pageSize")
+DEFAULT_LIST_SIZE = 20
+
+
+class QueryCostError(Exception):
+    """쿼리 비용/깊이 제한 초과"""
+
+    def __init__(self, message: str, code: str, detail: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.detail = detail or {}
+
+
+@dataclass(frozen=True)
+class QueryCost:
+    """쿼리 정적 분석 결과"""
+
+    cost: int
+    depth: int
+
+
+class _Analyzer:
+    def __init__(self, schema: GraphQLSchema, document: DocumentNode, variables: dict[str, Any]):
+        self.schema = schema
+        self.variables = variables
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def _collect_fields(
+        self, parent_type: Any, selection_set: SelectionSetNode, visited: frozenset[str]
+    ) -> list[tuple[Any, FieldNode]]:
+        """프래그먼트를 펼친 (부모 타입, 필드 노드) 목록"""
+        fields: list[tuple[Any, FieldNode]] = []
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                fields.append((parent_type, selection))
+                continue
+
+            if isinstance(selection, InlineFragmentNode):
+                fragment_type, fragment_selection = selection.type_condition, selection
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited:
+                    continue
+                visited = visited | {name}
+                fragment_type, fragment_selection = fragment.type_condition, fragment
+            else:
+                continue
+
+            target = parent_type
+            if fragment_type is not None:
+                target = self.schema.get_type(fragment_type.name.value) or parent_type
+            fields += self._collect_fields(target, fragment_selection.selection_set, visited)
+        return fields
+
+    def _list_size(self, field_def: GraphQLField, node: FieldNode) -> int | None:
+        """limit/first 등 인자 값 (없으면 인자 기본값, 둘 다 없으면 None, 최대 MAX_PAGE_SIZE)"""
+        values = {argument.name.value: argument.value for argument in node.arguments}
+        for name in LIST_SIZE_ARGUMENTS:
+            arg_def = field_def.args.get(name)
+            if arg_def is None:
+                continue
+            if name in values:
+                value = value_from_ast(values[name], arg_def.type, self.variables)
+            else:
+                value = arg_def.default_value
+            if isinstance(value, int) and value >= 0:
+                return min(value, MAX_PAGE_SIZE)
+        return None
+
+    def selection_cost(
+        self,
+        parent_type: Any,
+        selection_set: SelectionSetNode,
+        depth: int,
+        inherited_size: int | None = None,
+    ) -> tuple[int, int]:
+        """
+        선택 집합의 (비용, 최대 깊이)
+
+        Args:
+            inherited_size: 상위 단건 필드의 limit 값 (첫 목록 필드에 적용)
+        """
+        total = 0
+        max_depth = depth - 1
+        for field_parent, node in self._collect_fields(parent_type, selection_set, frozenset()):
+            name = node.name.value
+            field_def = getattr(field_parent, "fields", {}).get(name)
+            if field_def is None or name.startswith("__"):
+                continue
+
+            field_type = get_nullable_type(field_def.type)
+            named_type = get_named_type(field_type)
+            size = self._list_size(field_def, node)
+
+            # 1. 필드 자체 비용
+            if not is_default_resolver(field_def.resolve):
+                own = RESOLVER_FIELD_COST
+            else:
+                own = 0 if is_leaf_type(named_type) else OBJECT_FIELD_COST
+
+            # 2. 목록 크기 (단건 필드의 limit은 하위 목록으로 전달)
+            multiplier = 1
+            child_size = None
+            if is_list_type(field_type):
+                multiplier = size if size is not None else (inherited_size or DEFAULT_LIST_SIZE)
+            else:
+                child_size = size if size is not None else inherited_size
+
+            # 3. 하위 선택 (목록은 하위 비용이 0이어도 항목당 최소 1)
+            child_cost, child_depth = 0, depth
+            if node.selection_set is not None:
+                child_cost, child_depth = self.selection_cost(
+                    named_type, node.selection_set, depth + 1, child_size
+                )
+            if is_list_type(field_type):
+                child_cost = max(child_cost, 1)
+
+            total += own + multiplier * child_cost
+            max_depth = max(max_depth, child_depth)
+        return total, max_depth
+
+
+def analyze_query(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None = None,
+    variables: dict[str, Any] | None = None,
+) -> QueryCost:
+    """
+    쿼리 비용/깊이 계산 (검증을 통과한 문서 기준)
+
+    Args:
+        schema: graphql-core 스키마
+        document: 파싱된 문서
+        operation_name: 실행할 작업 이름 (문서에 작업이 여럿일 때)
+        variables: 요청 변수 (limit 등 인자 값 계산용)
+
+    Returns:
+        QueryCost (인트로스펙션 필드는 비용/깊이에서 제외)
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return QueryCost(cost=0, depth=0)
+
+    root_type = schema.get_root_type(operation.operation)
+    if root_type is None:
+        return QueryCost(cost=0, depth=0)
+
+    analyzer = _Analyzer(schema, document, variables or {})
+    cost, depth = analyzer.selection_cost(root_type, operation.selection_set, 1)
+    return QueryCost(cost=cost, depth=max(depth, 0))
+
+
+class CostAdmission:
+    """
+    주체(테넌트/사용자)별 실행 중 쿼리 비용 합계 제한
+
+    예산 안이면 바로 실행하고, 모자라면 먼저 온 요청이 끝날 때까지 대기합니다.
+    """
+
+    def __init__(
+        self,
+        budget: int = 20000,
+        timeout: float = 5.0,
+        budgets: dict[str, int] | None = None,
+    ):
+        """
+        Args:
+            budget: 주체별 실행 중 비용 합계 상한 (기본값)
+            timeout: 최대 대기 시간 (초)
+            budgets: 주체별 상한 재정의 (tenant_key → 비용)
+        """
+        self.budget = budget
+        self.timeout = timeout
+        self.budgets = budgets or {}
+
+        self._in_flight: dict[str, int] = {}
+        self._waiting: dict[str, int] = {}
+        self._conditions: dict[str, asyncio.Condition] = {}
+
+    def budget_for(self, subject: str) -> int:
+        return self.budgets.get(subject, self.budget)
+
+    def in_flight(self, subject: str) -> int:
+        return self._in_flight.get(subject, 0)
+
+    async def acquire(self, subject: str, cost: int) -> float:
+        """
+        실행 허용 대기
+
+        Returns:
+            대기 시간 (초)
+
+        Raises:
+            QueryCostError: 비용이 예산보다 크거나 timeout 안에 허용되지 않은 경우
+        """
+        budget = self.budget_for(subject)
+        if cost > budget:
+            raise QueryCostError(
+                "쿼리 비용이 실행 예산을 초과합니다",
+                code="QUERY_COST_BUDGET_EXCEEDED",
+                detail={"cost": cost, "budget": budget},
+            )
+
+        # 1. 빠른 경로: 대기 중인 요청이 없고 예산이 남아 있음
+        if not self._waiting.get(subject) and self.in_flight(subject) + cost <= budget:
+            self._in_flight[subject] = self.in_flight(subject) + cost
+            return 0.0
+
+        # 2. 대기열 (먼저 끝나는 요청이 notify)
+        start = time.monotonic()
+        condition = self._conditions.setdefault(subject, asyncio.Condition())
+        self._waiting[subject] = self._waiting.get(subject, 0) + 1
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self.in_flight(subject) + cost <= budget),
+                    self.timeout,
+                )
+                self._in_flight[subject] = self.in_flight(subject) + cost
+        except TimeoutError:
+            raise QueryCostError(
+                "실행 중인 쿼리가 많아 요청을 처리할 수 없습니다. 잠시 후 다시 시도하세요",
+                code="QUERY_COST_BUDGET_EXCEEDED",
+                detail={"cost": cost, "budget": budget, "in_flight": self.in_flight(subject)},
+            ) from None
+        finally:
+            self._waiting[subject] -= 1
+            if not self._waiting[subject]:
+                del self._waiting[subject]
+        return time.monotonic() - start
+
+    async def release(self, subject: str, cost: int) -> None:
+        """실행 종료 (대기 중인 요청 깨우기)"""
+        remaining = self.in_flight(subject) - cost
+        if remaining > 0:
+            self._in_flight[subject] = remaining
+        else:
+            self._in_flight.pop(subject, None)
+
+        condition = self._conditions.get(subject)
+        if condition is None:
+            return
+        if subject not in self._waiting:
+            # 대기 중인 요청이 없으면 Condition 정리 (주체 수만큼 누적되지 않도록)
+            del self._conditions[subject]
+            return
+        async with condition:
+            condition.notify_all()
+
+
+cost_admission = CostAdmission(
+    budget=settings.graphql_cost_budget,
+    timeout=settings.graphql_cost_queue_timeout,
+    budgets=settings.graphql_cost_budgets,
+)
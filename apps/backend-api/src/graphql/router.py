@@ -0,0 +1,72 @@
+"""GraphQL 라우터 (영속 쿼리 지원)
+
+Strawberry GraphQLRouter는 요청 본문의 extensions를 읽지 않으므로,
+본문 파싱 단계에서 extensions.persistedQuery를 해석해 실행할 문서를 결정합니다.
+(APQ/허용 목록 처리는 graphql/persisted_queries.py)
+
+영속 쿼리 오류는 Apollo 클라이언트가 처리할 수 있도록 HTTP 200 + GraphQL 오류로 반환합니다
+(PersistedQueryNotFound를 받으면 클라이언트가 문서와 함께 다시 요청).
+"""
+
+from typing import Any
+
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.http.exceptions import HTTPException
+from strawberry.types import ExecutionResult
+
+from graphql import GraphQLError
+
+from .persisted_queries import PersistedQueryError, PersistedQueryStore
+
+
+class PersistedQueryGraphQLRouter(GraphQLRouter):
+    """APQ + 허용 목록을 지원하는 GraphQLRouter"""
+
+    def __init__(self, schema: Any, *, persisted_queries: PersistedQueryStore, **kwargs: Any):
+        super().__init__(schema, **kwargs)
+        self.persisted_queries = persisted_queries
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        # 해시만 보낸 GET 요청(query 없음)은 GraphiQL이 아닌 쿼리 실행
+        if request.method == "GET" and request.query_params.get("extensions") is not None:
+            return False
+        return super().should_render_graphql_ide(request)
+
+    async def parse_http_body(self, request: Any) -> GraphQLRequestData:
+        content_type = request.content_type or ""
+
+        # 1. 본문 파싱 (Strawberry 기본 구현 + extensions)
+        if request.method == "GET":
+            data = self.parse_query_params(request.query_params)
+            if isinstance(data.get("extensions"), str):
+                data["extensions"] = self.parse_json(data["extensions"])
+        elif "application/json" in content_type:
+            data = self.parse_json(await request.get_body())
+        elif content_type.startswith("multipart/form-data"):
+            data = await self.parse_multipart(request)
+        else:
+            raise HTTPException(400, "Unsupported content type")
+
+        if not isinstance(data, dict):
+            raise HTTPException(400, "Unsupported request body")
+
+        # 2. 영속 쿼리 해석 (해시 → 문서, 허용 목록 검사)
+        query = await self.persisted_queries.resolve(data.get("query"), data.get("extensions"))
+
+        return GraphQLRequestData(
+            query=query,
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+
+    async def execute_operation(
+        self, request: Any, context: Any, root_value: Any
+    ) -> ExecutionResult:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as e:
+            return ExecutionResult(
+                data=None,
+                errors=[GraphQLError(e.message, extensions={"code": e.code})],
+            )
@@ -0,0 +1,15 @@
+"""Tenants CRM Customers - DataLoaders
+
+공통 모듈을 사용한 DataLoader 구현
+고객 데이터는 crm.partners 테이블을 사용합니다.
+"""
+
+from src.graphql.common import BaseDataLoader, SessionSource
+from src.models.tenants.crm.partners import Partners as PartnerModel
+
+
+class TenantsCustomerLoader(BaseDataLoader[PartnerModel]):
+    """Tenant 고객(거래처) DataLoader (N+1 쿼리 최적화)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(db, PartnerModel)
@@ -6,6 +6,7 @@
 
 import strawberry
 
+from ..extensions import schema_extensions
 from .schema import TenantsMutation, TenantsQuery
 
 
@@ -17,4 +18,5 @@ Mutation = TenantsMutation
 tenants_schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    extensions=schema_extensions("tenants"),
 )
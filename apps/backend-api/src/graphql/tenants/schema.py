@@ -2,6 +2,12 @@
 
 import strawberry
 
+from .sys.menus import (
+    TenantsMenu,
+    TenantsMenuMutations,
+    TenantsMenuQueries,
+    TenantsMenuTreeNode,
+)
 from .sys.users import (
     TenantsUser,
     TenantsUserMutations,
@@ -22,6 +28,21 @@ class TenantsQuery:
     async def users(self, info, limit: int = 20, offset: int = 0) -> "list[TenantsUser]":
         return await TenantsUserQueries.users(self, info, limit, offset)
 
+    # ===== SYS - Menus =====
+    @strawberry.field(description="테넌트 메뉴 조회 (ID)")
+    async def menu(self, info, id: strawberry.ID) -> "TenantsMenu | None":
+        return await TenantsMenuQueries.menu(self, info, id)
+
+    @strawberry.field(description="테넌트 메뉴 목록 조회")
+    async def menus(self, info, limit: int = 100, offset: int = 0) -> "list[TenantsMenu]":
+        return await TenantsMenuQueries.menus(self, info, limit, offset)
+
+    @strawberry.field(description="사용자 메뉴 트리 (권한으로 필터링된 사이드바)")
+    async def menu_tree(
+        self, info, user_id: strawberry.ID | None = None
+    ) -> "list[TenantsMenuTreeNode]":
+        return await TenantsMenuQueries.menu_tree(self, info, user_id)
+
 
 @strawberry.type(description="Tenants Mutation")
 class TenantsMutation:
@@ -36,5 +57,10 @@ class TenantsMutation:
         """테넌트 사용자 관련 Mutation"""
         return TenantsUserMutations()
 
+    @strawberry.field(description="메뉴 관련 Mutation")
+    def menus(self) -> TenantsMenuMutations:
+        """테넌트 메뉴 관련 Mutation"""
+        return TenantsMenuMutations()
+
 
 __all__ = ["TenantsQuery", "TenantsMutation"]
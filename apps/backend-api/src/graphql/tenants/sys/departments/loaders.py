@@ -0,0 +1,15 @@
+"""Tenants SYS Departments - DataLoaders
+
+공통 모듈을 사용한 DataLoader 구현
+부서 데이터는 hrm.departments 테이블을 사용합니다.
+"""
+
+from src.graphql.common import BaseDataLoader, SessionSource
+from src.models.tenants.hrm.departments import Departments as DepartmentModel
+
+
+class TenantsDepartmentLoader(BaseDataLoader[DepartmentModel]):
+    """Tenant 부서 DataLoader (N+1 쿼리 최적화)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(db, DepartmentModel)
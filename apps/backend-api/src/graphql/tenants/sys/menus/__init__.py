@@ -0,0 +1,24 @@
+"""Tenants SYS Menus"""
+
+from .loaders import TenantsMenuLoader
+from .mutations import TenantsMenuMutations
+from .queries import TenantsMenuQueries
+from .tree import menu_tree_cache
+from .types import (
+    TenantsMenu,
+    TenantsMenuCreateInput,
+    TenantsMenuTreeNode,
+    TenantsMenuUpdateInput,
+)
+
+
+__all__ = [
+    "TenantsMenu",
+    "TenantsMenuTreeNode",
+    "TenantsMenuCreateInput",
+    "TenantsMenuUpdateInput",
+    "TenantsMenuQueries",
+    "TenantsMenuMutations",
+    "TenantsMenuLoader",
+    "menu_tree_cache",
+]
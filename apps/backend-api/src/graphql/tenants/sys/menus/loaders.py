@@ -0,0 +1,14 @@
+"""Tenants SYS Menus - DataLoaders
+
+공통 모듈을 사용한 DataLoader 구현
+"""
+
+from src.graphql.common import BaseDataLoader, SessionSource
+from src.models.tenants.sys.menus import Menus as MenuModel
+
+
+class TenantsMenuLoader(BaseDataLoader[MenuModel]):
+    """Tenant 메뉴 DataLoader (N+1 쿼리 최적화)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(db, MenuModel, conditions=[MenuModel.is_deleted.is_(False)])
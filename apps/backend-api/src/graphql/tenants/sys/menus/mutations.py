@@ -0,0 +1,163 @@
+"""Tenants SYS Menus - Mutations
+
+메뉴가 변경되면 커밋 이후 테넌트 메뉴 트리 버전을 올려 캐시된 트리를 무효화합니다.
+(graphql/tenants/sys/menus/tree.py)
+"""
+
+from uuid import UUID
+
+import strawberry
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import NotFoundError, ValidationError
+from src.graphql.common import create_entity, delete_entity, update_entity
+from src.models.manager.tnnt.tenant import Tenant
+from src.models.tenants.sys.menus import Menus as MenuModel
+
+from .queries import tenants_menu_to_graphql
+from .tree import menu_tree_cache
+from .types import TenantsMenu, TenantsMenuCreateInput, TenantsMenuUpdateInput
+
+
+# 메뉴 최대 깊이 (ck_menus__depth_range)
+MAX_MENU_DEPTH = 5
+
+
+async def create_tenants_menu(
+    db: AsyncSession, input_data: TenantsMenuCreateInput, created_by: UUID, tenant_id: UUID
+) -> TenantsMenu:
+    """
+    Tenant 메뉴 생성
+
+    depth와 path(/상위코드/코드)는 부모 메뉴 기준으로 계산합니다.
+
+    Raises:
+        NotFoundError: 부모 메뉴가 없는 경우
+        ValidationError: 최대 깊이를 넘는 경우
+    """
+    # 1. 부모 메뉴 기준 계층 정보
+    depth, path = 0, f"/{input_data.code}"
+    parent_id = UUID(input_data.parent_id) if input_data.parent_id else None
+    if parent_id is not None:
+        result = await db.execute(
+            select(MenuModel.depth, MenuModel.path).where(
+                MenuModel.id == parent_id, MenuModel.is_deleted.is_not(True)
+            )
+        )
+        parent = result.first()
+        if parent is None:
+            raise NotFoundError(
+                message="부모 메뉴를 찾을 수 없습니다",
+                detail={"parent_id": str(parent_id)},
+            )
+        depth, path = parent.depth + 1, f"{parent.path or ''}/{input_data.code}"
+
+    if depth > MAX_MENU_DEPTH:
+        raise ValidationError(
+            message=f"메뉴는 최대 {MAX_MENU_DEPTH}단계까지 만들 수 있습니다",
+            detail={"depth": depth},
+        )
+
+    # 2. 메뉴 생성
+    def prepare_data(data: TenantsMenuCreateInput) -> dict:
+        values = {k: v for k, v in data.__dict__.items() if not k.startswith("_")}
+        values.update(
+            parent_id=parent_id,
+            depth=depth,
+            path=path,
+            tenant_id=tenant_id,
+            created_by=created_by,
+            updated_by=created_by,
+        )
+        return values
+
+    return await create_entity(
+        db=db,
+        model_class=MenuModel,
+        input_data=input_data,
+        to_graphql=tenants_menu_to_graphql,
+        prepare_data=prepare_data,
+    )
+
+
+async def update_tenants_menu(
+    db: AsyncSession, menu_id: UUID, input_data: TenantsMenuUpdateInput, updated_by: UUID
+) -> TenantsMenu | None:
+    """Tenant 메뉴 수정"""
+    return await update_entity(
+        db=db,
+        model_class=MenuModel,
+        entity_id=menu_id,
+        input_data=input_data,
+        to_graphql=tenants_menu_to_graphql,
+        before_commit=lambda menu: setattr(menu, "updated_by", updated_by),
+        is_deleted=False,
+    )
+
+
+async def delete_tenants_menu(db: AsyncSession, menu_id: UUID) -> bool:
+    """Tenant 메뉴 삭제 (논리 삭제, 하위 메뉴는 트리에서 함께 제외)"""
+    return await delete_entity(
+        db=db, model_class=MenuModel, entity_id=menu_id, soft_delete=True, is_deleted=False
+    )
+
+
+async def get_tenant_id(db: AsyncSession, tenant_key: str) -> UUID:
+    """
+    tenant_key(테넌트 코드)의 테넌트 ID 조회 (Manager DB)
+
+    Raises:
+        NotFoundError: 테넌트가 존재하지 않거나 삭제된 경우
+    """
+    result = await db.execute(
+        select(Tenant.id).where(Tenant.code == tenant_key, Tenant.is_deleted.is_(False))
+    )
+    tenant_id = result.scalar_one_or_none()
+    if tenant_id is None:
+        raise NotFoundError(
+            message="테넌트를 찾을 수 없습니다",
+            detail={"tenant_key": tenant_key},
+        )
+    return tenant_id
+
+
+@strawberry.type
+class TenantsMenuMutations:
+    """Tenants SYS Menus Mutation"""
+
+    @strawberry.mutation(description="Tenant 메뉴 생성")
+    async def create_menu(self, info, input: TenantsMenuCreateInput) -> TenantsMenu:
+        """Tenant 메뉴 생성"""
+        db = info.context.tenant_db_session
+        if not db:
+            raise Exception("Tenant database session not available")
+
+        current_user_id = UUID(info.context.user_id)
+        tenant_id = await get_tenant_id(info.context.manager_db_session, info.context.tenant_key)
+        # 헬퍼가 커밋하기 전에 등록해야 커밋 이후 무효화됨
+        menu_tree_cache.invalidate_after_commit(db, info.context.tenant_key)
+        return await create_tenants_menu(db, input, current_user_id, tenant_id)
+
+    @strawberry.mutation(description="Tenant 메뉴 수정")
+    async def update_menu(
+        self, info, id: strawberry.ID, input: TenantsMenuUpdateInput
+    ) -> TenantsMenu | None:
+        """Tenant 메뉴 수정"""
+        db = info.context.tenant_db_session
+        if not db:
+            raise Exception("Tenant database session not available")
+
+        current_user_id = UUID(info.context.user_id)
+        menu_tree_cache.invalidate_after_commit(db, info.context.tenant_key)
+        return await update_tenants_menu(db, UUID(id), input, current_user_id)
+
+    @strawberry.mutation(description="Tenant 메뉴 삭제")
+    async def delete_menu(self, info, id: strawberry.ID) -> bool:
+        """Tenant 메뉴 삭제"""
+        db = info.context.tenant_db_session
+        if not db:
+            raise Exception("Tenant database session not available")
+
+        menu_tree_cache.invalidate_after_commit(db, info.context.tenant_key)
+        return await delete_tenants_menu(db, UUID(id))
@@ -0,0 +1,225 @@
+"""Tenants SYS Menus - Queries"""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import strawberry
+from sqlalchemy import or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
+
+from src.core.exceptions import ForbiddenError, UnauthorizedError
+from src.graphql.common import get_by_id, get_list
+from src.models.tenants.sys.menus import Menus as MenuModel
+from src.models.tenants.sys.permissions import Permissions as PermissionModel
+from src.models.tenants.sys.role_permissions import RolePermissions as RolePermissionModel
+from src.models.tenants.sys.roles import Roles as RoleModel
+from src.models.tenants.sys.user_roles import UserRoles as UserRoleModel
+from src.models.tenants.sys.users import Users as UserModel
+
+from .tree import MenuTree, build_menu_tree, menu_tree_cache, prune_menu_tree
+from .types import TenantsMenu, TenantsMenuTreeNode
+
+
+# 다른 사용자의 메뉴 트리 조회에 필요한 권한 코드 (사용자 조회)
+VIEW_OTHER_USER_MENUS_PERMISSION = "ADM_USERS_READ"
+
+
+def tenants_menu_to_graphql(menu: MenuModel) -> TenantsMenu:
+    """MenuModel(DB 모델)을 TenantsMenu(GraphQL 타입)으로 변환"""
+    return TenantsMenu(
+        id=strawberry.ID(str(menu.id)),
+        code=menu.code,
+        name=menu.name,
+        name_en=menu.name_en,
+        description=menu.description,
+        parent_id=strawberry.ID(str(menu.parent_id)) if menu.parent_id else None,
+        depth=menu.depth,
+        sort_order=menu.sort_order,
+        path=menu.path,
+        menu_type=menu.menu_type,
+        module_code=menu.module_code,
+        route_path=menu.route_path,
+        component_path=menu.component_path,
+        external_url=menu.external_url,
+        icon=menu.icon,
+        icon_type=menu.icon_type,
+        badge_text=menu.badge_text,
+        badge_color=menu.badge_color,
+        permission_code=menu.permission_code,
+        is_public=menu.is_public or False,
+        is_visible=menu.is_visible if menu.is_visible is not None else True,
+        is_favorite=menu.is_favorite or False,
+        open_in_new_tab=menu.open_in_new_tab or False,
+        is_active=menu.is_active if menu.is_active is not None else True,
+        is_deleted=menu.is_deleted or False,
+        created_at=menu.created_at,
+        updated_at=menu.updated_at,
+        created_by=strawberry.ID(str(menu.created_by)) if menu.created_by else None,
+        updated_by=strawberry.ID(str(menu.updated_by)) if menu.updated_by else None,
+    )
+
+
+async def get_tenants_menu_by_id(
+    db: AsyncSession, menu_id: UUID, info: Info | None = None
+) -> TenantsMenu | None:
+    """ID로 Tenant 메뉴 조회"""
+    return await get_by_id(
+        db=db,
+        model_class=MenuModel,
+        id_=menu_id,
+        to_graphql=tenants_menu_to_graphql,
+        info=info,
+        is_deleted=False,
+    )
+
+
+async def get_tenants_menus(
+    db: AsyncSession, limit: int = 100, offset: int = 0, info: Info | None = None
+) -> list[TenantsMenu]:
+    """Tenant 메뉴 목록 조회 (깊이, 정렬 순서)"""
+    return await get_list(
+        db=db,
+        model_class=MenuModel,
+        to_graphql=tenants_menu_to_graphql,
+        limit=limit,
+        offset=offset,
+        order_by=[MenuModel.depth, MenuModel.sort_order, MenuModel.code],
+        info=info,
+        is_deleted=False,
+    )
+
+
+async def load_menu_tree(db: AsyncSession) -> MenuTree:
+    """테넌트 전체 메뉴 트리 구성 (활성/표시 메뉴, 쿼리 1회)"""
+    stmt = (
+        select(MenuModel)
+        .where(
+            MenuModel.is_deleted.is_not(True),
+            MenuModel.is_active.is_not(False),
+            MenuModel.is_visible.is_not(False),
+        )
+        .order_by(MenuModel.depth, MenuModel.sort_order, MenuModel.code)
+    )
+    result = await db.execute(stmt)
+    return build_menu_tree(result.scalars())
+
+
+async def get_tenants_user_permission_codes(db: AsyncSession, user_id: UUID) -> frozenset[str]:
+    """
+    사용자 권한 코드 집합 (기본 역할 + 유효한 역할 할당, 쿼리 1회)
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+
+    Returns:
+        활성 역할에 매핑된 활성 권한 코드 집합
+    """
+    # 1. 사용자 역할 (users.role_id + 해제/만료되지 않은 user_roles)
+    role_ids = union(
+        select(UserModel.role_id).where(
+            UserModel.id == user_id,
+            UserModel.role_id.is_not(None),
+            UserModel.is_active.is_(True),
+        ),
+        select(UserRoleModel.role_id).where(
+            UserRoleModel.user_id == user_id,
+            UserRoleModel.is_active.is_(True),
+            UserRoleModel.revoked_at.is_(None),
+            or_(
+                UserRoleModel.expires_at.is_(None),
+                UserRoleModel.expires_at > datetime.now(UTC),
+            ),
+        ),
+    ).subquery()
+
+    # 2. 활성 역할의 활성 권한 코드
+    stmt = (
+        select(PermissionModel.code)
+        .join(RolePermissionModel, RolePermissionModel.permission_id == PermissionModel.id)
+        .join(RoleModel, RoleModel.id == RolePermissionModel.role_id)
+        .where(
+            RolePermissionModel.role_id.in_(select(role_ids.c.role_id)),
+            RolePermissionModel.is_active.is_not(False),
+            RoleModel.is_active.is_not(False),
+            RoleModel.is_deleted.is_not(True),
+            PermissionModel.is_active.is_not(False),
+        )
+    )
+    result = await db.execute(stmt)
+    return frozenset(result.scalars())
+
+
+async def get_tenants_menu_tree(
+    db: AsyncSession, tenant_key: str, user_id: UUID
+) -> list[TenantsMenuTreeNode]:
+    """사용자 메뉴 트리 (테넌트 캐시 트리를 사용자 권한으로 필터링)"""
+    tree = await menu_tree_cache.get(tenant_key, lambda: load_menu_tree(db))
+    permission_codes = await get_tenants_user_permission_codes(db, user_id)
+    return prune_menu_tree(tree, permission_codes)
+
+
+async def resolve_menu_tree_user_id(
+    db: AsyncSession, caller_id: str | None, user_id: str | None
+) -> UUID:
+    """
+    메뉴 트리를 조회할 사용자 ID 결정
+
+    Args:
+        db: 데이터베이스 세션
+        caller_id: 현재 사용자 ID (비로그인 시 None/빈 문자열)
+        user_id: 요청한 사용자 ID (생략 시 현재 사용자)
+
+    Returns:
+        UUID: 메뉴 트리를 조회할 사용자 ID
+
+    Raises:
+        UnauthorizedError: 비로그인 요청
+        ForbiddenError: 다른 사용자를 지정했지만 사용자 조회 권한이 없음
+    """
+    if not caller_id:
+        raise UnauthorizedError()
+
+    caller = UUID(caller_id)
+    target = UUID(user_id) if user_id else caller
+    if target != caller:
+        caller_codes = await get_tenants_user_permission_codes(db, caller)
+        if VIEW_OTHER_USER_MENUS_PERMISSION not in caller_codes:
+            raise ForbiddenError(
+                message="다른 사용자의 메뉴를 조회할 권한이 없습니다",
+                detail={"required_permission": VIEW_OTHER_USER_MENUS_PERMISSION},
+            )
+    return target
+
+
+@strawberry.type
+class TenantsMenuQueries:
+    """Tenants SYS Menus Query"""
+
+    @strawberry.field(description="Tenant 메뉴 조회 (ID)")
+    async def menu(self, info, id: strawberry.ID) -> TenantsMenu | None:
+        """Tenant 메뉴 단건 조회"""
+        db = info.context.tenant_db_session
+        if not db:
+            raise Exception("Tenant database session not available")
+        return await get_tenants_menu_by_id(db, UUID(id), info=info)
+
+    @strawberry.field(description="Tenant 메뉴 목록")
+    async def menus(self, info, limit: int = 100, offset: int = 0) -> list[TenantsMenu]:
+        """Tenant 메뉴 목록 조회"""
+        db = info.context.tenant_db_session
+        if not db:
+            raise Exception("Tenant database session not available")
+        return await get_tenants_menus(db, limit, offset, info=info)
+
+    @strawberry.field(description="사용자 메뉴 트리 (권한으로 필터링된 사이드바)")
+    async def menu_tree(
+        self, info, user_id: strawberry.ID | None = None
+    ) -> list[TenantsMenuTreeNode]:
+        """사용자 메뉴 트리 조회 (user_id 생략 시 현재 사용자, 다른 사용자는 조회 권한 필요)"""
+        db = info.context.tenant_db_session
+        if not db:
+            raise Exception("Tenant database session not available")
+        target_id = await resolve_menu_tree_user_id(db, info.context.user_id, user_id)
+        return await get_tenants_menu_tree(db, info.context.tenant_key, target_id)
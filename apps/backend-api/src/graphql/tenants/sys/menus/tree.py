@@ -0,0 +1,237 @@
+"""Tenants SYS Menus - 메뉴 트리 (구성, 권한 필터링, 테넌트별 캐시)
+
+로그인마다 사이드바 전체를 만들기 위해 단계별 조회와 클라이언트 조립을 반복하지 않도록,
+테넌트별 전체 트리를 한 번 구성해 메모리에 보관하고 요청마다 사용자 권한으로만 걸러냅니다.
+
+    1. 구성: depth, sort_order 순으로 정렬된 메뉴를 한 번 순회 (부모가 항상 먼저 나옴)
+    2. 필터링: 권한 코드 집합으로 노드당 한 번 방문 (O(노드 수))
+    3. 캐시: 테넌트별 트리 + 버전, 메뉴 Mutation 커밋 후 Redis 버전 증가로 모든 워커 무효화
+
+버전은 요청마다 Redis GET 한 번으로 확인하므로 pub/sub 유실과 무관하게 다음 요청에서 갱신됩니다.
+Redis 장애 시에는 fallback_ttl 동안만 로컬 트리를 사용합니다.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import replace
+from typing import Any
+from weakref import WeakValueDictionary
+
+import strawberry
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import run_after_commit
+from src.core.logging import get_logger
+from src.core.redis import get_redis
+from src.models.tenants.sys.menus import Menus as MenuModel
+
+from .types import TenantsMenuTreeNode
+
+
+logger = get_logger("graphql.tenants.menus")
+
+MenuTree = list[TenantsMenuTreeNode]
+
+
+def build_menu_tree(menus: Iterable[MenuModel]) -> MenuTree:
+    """
+    메뉴 목록으로 트리 구성
+
+    Args:
+        menus: depth, sort_order 순으로 정렬된 활성/표시 메뉴
+
+    Returns:
+        최상위 메뉴 목록 (부모가 목록에 없는 메뉴는 하위 메뉴까지 제외)
+    """
+    nodes: dict[Any, TenantsMenuTreeNode] = {}
+    roots: MenuTree = []
+
+    for menu in menus:
+        if menu.parent_id is None:
+            siblings = roots
+        elif menu.parent_id in nodes:
+            siblings = nodes[menu.parent_id].children
+        else:
+            # 비활성/삭제/숨김 부모의 하위 메뉴
+            continue
+
+        node = TenantsMenuTreeNode(
+            id=strawberry.ID(str(menu.id)),
+            code=menu.code,
+            name=menu.name,
+            name_en=menu.name_en,
+            depth=menu.depth,
+            sort_order=menu.sort_order,
+            path=menu.path,
+            menu_type=menu.menu_type,
+            module_code=menu.module_code,
+            route_path=menu.route_path,
+            component_path=menu.component_path,
+            external_url=menu.external_url,
+            icon=menu.icon,
+            icon_type=menu.icon_type,
+            badge_text=menu.badge_text,
+            badge_color=menu.badge_color,
+            permission_code=menu.permission_code,
+            is_public=menu.is_public or False,
+            is_favorite=menu.is_favorite or False,
+            open_in_new_tab=menu.open_in_new_tab or False,
+            children=[],
+        )
+        nodes[menu.id] = node
+        siblings.append(node)
+
+    return roots
+
+
+def prune_menu_tree(tree: MenuTree, permission_codes: frozenset[str]) -> MenuTree:
+    """
+    사용자 권한으로 메뉴 트리 필터링
+
+    권한 코드가 지정된 비공개 메뉴는 권한이 있어야 하며, 메뉴가 제외되면 하위 메뉴도
+    함께 제외됩니다. 남은 하위 메뉴가 없는 FOLDER는 표시하지 않습니다.
+    캐시된 트리는 수정하지 않고 남은 노드만 복사합니다.
+
+    Args:
+        tree: 테넌트 전체 메뉴 트리 (캐시)
+        permission_codes: 사용자 권한 코드 집합
+
+    Returns:
+        사용자에게 표시할 메뉴 트리
+    """
+    pruned: MenuTree = []
+    for node in tree:
+        if (
+            node.permission_code
+            and not node.is_public
+            and node.permission_code not in permission_codes
+        ):
+            continue
+
+        children = prune_menu_tree(node.children, permission_codes)
+        if node.menu_type == "FOLDER" and not children:
+            continue
+
+        pruned.append(replace(node, children=children))
+    return pruned
+
+
+class MenuTreeCache:
+    """
+    테넌트별 메뉴 트리 캐시 (버전 기반 무효화)
+
+    로컬에는 (버전, 트리)를 보관하고, Redis의 테넌트별 버전이 바뀌면 다시 구성합니다.
+    """
+
+    def __init__(
+        self,
+        redis_factory: Callable[[], Redis] = get_redis,
+        max_size: int = 1000,
+        fallback_ttl: float = 60.0,
+    ):
+        """
+        Args:
+            redis_factory: Redis 클라이언트를 반환하는 함수
+            max_size: 로컬에 보관할 최대 테넌트 수
+            fallback_ttl: Redis 장애 시 로컬 트리 사용 시간 (초)
+        """
+        self._redis_factory = redis_factory
+        self.max_size = max_size
+        self.fallback_ttl = fallback_ttl
+
+        self.key_prefix = "menu:tree:version:"
+
+        # tenant_key → (버전, 구성 시각, 트리)
+        self._trees: OrderedDict[str, tuple[str | None, float, MenuTree]] = OrderedDict()
+        # 구성 중(대기 포함)인 테넌트의 락만 유지 (사용이 끝나면 자동 제거)
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+    async def version(self, tenant_key: str) -> str | None:
+        """테넌트 메뉴 버전 (Redis 장애 시 None)"""
+        try:
+            raw = await self._redis_factory().get(self.key_prefix + tenant_key)
+        except RedisError as e:
+            logger.warning(f"메뉴 트리 버전 조회 실패: {e}")
+            return None
+        return raw or "0"
+
+    async def get(self, tenant_key: str, loader: Callable[[], Awaitable[MenuTree]]) -> MenuTree:
+        """
+        테넌트 메뉴 트리 조회 (버전이 바뀌었으면 loader로 다시 구성)
+
+        Args:
+            tenant_key: 테넌트 코드
+            loader: 전체 메뉴 트리를 구성하는 함수 (DB 조회)
+
+        Returns:
+            테넌트 전체 메뉴 트리 (수정 금지, prune_menu_tree로 복사해 사용)
+        """
+        # 1. 버전 확인 후 로컬 트리 사용
+        version = await self.version(tenant_key)
+        tree = self._get_local(tenant_key, version)
+        if tree is not None:
+            return tree
+
+        # 2. 같은 테넌트의 동시 요청은 한 번만 구성
+        lock = self._locks.setdefault(tenant_key, asyncio.Lock())
+        async with lock:
+            tree = self._get_local(tenant_key, version)
+            if tree is not None:
+                return tree
+
+            # 구성 전에 읽은 버전으로 저장하므로, 구성 중 변경되면 다음 요청에서 다시 구성
+            tree = await loader()
+            self._trees[tenant_key] = (version, time.monotonic(), tree)
+            self._trees.move_to_end(tenant_key)
+            while len(self._trees) > self.max_size:
+                self._trees.popitem(last=False)
+            return tree
+
+    def _get_local(self, tenant_key: str, version: str | None) -> MenuTree | None:
+        entry = self._trees.get(tenant_key)
+        if entry is None:
+            return None
+
+        cached_version, built_at, tree = entry
+        if cached_version != version:
+            return None
+        if version is None and built_at + self.fallback_ttl < time.monotonic():
+            return None
+
+        self._trees.move_to_end(tenant_key)
+        return tree
+
+    async def invalidate(self, tenant_key: str) -> None:
+        """테넌트 메뉴 버전 증가 (모든 워커의 트리 무효화)"""
+        self._trees.pop(tenant_key, None)
+        try:
+            await self._redis_factory().incr(self.key_prefix + tenant_key)
+        except RedisError as e:
+            logger.warning(f"메뉴 트리 버전 증가 실패: {e}")
+
+    def invalidate_after_commit(self, db: AsyncSession, tenant_key: str) -> None:
+        """
+        세션 커밋 이후 테넌트 메뉴 트리 무효화 예약 (롤백되면 무효화하지 않음)
+
+        Args:
+            db: 메뉴를 변경한 DB 세션
+            tenant_key: 테넌트 코드
+        """
+        run_after_commit(db, "menu_tree", [tenant_key], self._on_commit)
+
+    def _on_commit(self, tenant_keys: set[str]) -> Awaitable[Any]:
+        # 로컬 트리는 즉시 제거하고, Redis 버전 증가는 이벤트 루프에서 비동기로 수행
+        for tenant_key in tenant_keys:
+            self._trees.pop(tenant_key, None)
+        return asyncio.gather(*(self.invalidate(tenant_key) for tenant_key in tenant_keys))
+
+    def clear_local(self) -> None:
+        """로컬 트리 비우기 (테스트용)"""
+        self._trees.clear()
+
+
+menu_tree_cache = MenuTreeCache()
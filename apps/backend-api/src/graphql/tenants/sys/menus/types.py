@@ -0,0 +1,139 @@
+"""Tenants SYS Menus - GraphQL Types"""
+
+from datetime import datetime
+
+import strawberry
+
+from src.graphql.common import Node
+
+
+@strawberry.type(description="Tenant 메뉴")
+class TenantsMenu(Node):
+    """
+    Tenant 시스템 메뉴
+
+    계층형 메뉴 (parent_id/depth/path, 최대 5단계)
+    """
+
+    id: strawberry.ID
+
+    # 메뉴 정보
+    code: str = strawberry.field(description="메뉴 코드")
+    name: str = strawberry.field(description="메뉴명")
+    name_en: str | None = strawberry.field(default=None, description="메뉴명 (영문)")
+    description: str | None = strawberry.field(default=None, description="설명")
+
+    # 계층 구조
+    parent_id: strawberry.ID | None = strawberry.field(default=None, description="부모 메뉴 ID")
+    depth: int = strawberry.field(description="메뉴 깊이 (0: 최상위)")
+    sort_order: int = strawberry.field(description="정렬 순서")
+    path: str | None = strawberry.field(default=None, description="계층 경로 (/SYS/SYS_USERS)")
+
+    # 화면 정보
+    menu_type: str = strawberry.field(description="메뉴 타입 (MENU/FOLDER/LINK/DIVIDER)")
+    module_code: str | None = strawberry.field(default=None, description="모듈 코드")
+    route_path: str | None = strawberry.field(default=None, description="라우트 경로")
+    component_path: str | None = strawberry.field(default=None, description="컴포넌트 경로")
+    external_url: str | None = strawberry.field(default=None, description="외부 링크 URL")
+    icon: str | None = strawberry.field(default=None, description="아이콘")
+    icon_type: str | None = strawberry.field(default=None, description="아이콘 타입")
+    badge_text: str | None = strawberry.field(default=None, description="배지 텍스트")
+    badge_color: str | None = strawberry.field(default=None, description="배지 색상")
+
+    # 권한/표시
+    permission_code: str | None = strawberry.field(default=None, description="필요 권한 코드")
+    is_public: bool = strawberry.field(description="공개 메뉴 여부")
+    is_visible: bool = strawberry.field(description="사이드바 표시 여부")
+    is_favorite: bool = strawberry.field(description="즐겨찾기 기본값")
+    open_in_new_tab: bool = strawberry.field(description="새 탭에서 열기")
+    is_active: bool = strawberry.field(description="활성 상태")
+    is_deleted: bool = strawberry.field(description="삭제 여부")
+
+    # 시스템 필드
+    created_at: datetime = strawberry.field(description="생성일시")
+    updated_at: datetime | None = strawberry.field(default=None, description="수정일시")
+    created_by: strawberry.ID | None = strawberry.field(default=None, description="생성자 ID")
+    updated_by: strawberry.ID | None = strawberry.field(default=None, description="수정자 ID")
+
+
+@strawberry.type(description="Tenant 메뉴 트리 노드 (사이드바)")
+class TenantsMenuTreeNode:
+    """
+    메뉴 트리 노드
+
+    테넌트별로 캐시된 트리를 사용자 권한으로 걸러낸 결과입니다 (menuTree).
+    children은 sort_order 순서입니다.
+    """
+
+    id: strawberry.ID
+    code: str = strawberry.field(description="메뉴 코드")
+    name: str = strawberry.field(description="메뉴명")
+    name_en: str | None = strawberry.field(default=None, description="메뉴명 (영문)")
+    depth: int = strawberry.field(description="메뉴 깊이 (0: 최상위)")
+    sort_order: int = strawberry.field(description="정렬 순서")
+    path: str | None = strawberry.field(default=None, description="계층 경로")
+    menu_type: str = strawberry.field(description="메뉴 타입 (MENU/FOLDER/LINK/DIVIDER)")
+    module_code: str | None = strawberry.field(default=None, description="모듈 코드")
+    route_path: str | None = strawberry.field(default=None, description="라우트 경로")
+    component_path: str | None = strawberry.field(default=None, description="컴포넌트 경로")
+    external_url: str | None = strawberry.field(default=None, description="외부 링크 URL")
+    icon: str | None = strawberry.field(default=None, description="아이콘")
+    icon_type: str | None = strawberry.field(default=None, description="아이콘 타입")
+    badge_text: str | None = strawberry.field(default=None, description="배지 텍스트")
+    badge_color: str | None = strawberry.field(default=None, description="배지 색상")
+    permission_code: str | None = strawberry.field(default=None, description="필요 권한 코드")
+    is_public: bool = strawberry.field(default=False, description="공개 메뉴 여부")
+    is_favorite: bool = strawberry.field(default=False, description="즐겨찾기 기본값")
+    open_in_new_tab: bool = strawberry.field(default=False, description="새 탭에서 열기")
+    children: list["TenantsMenuTreeNode"] = strawberry.field(
+        default_factory=list, description="하위 메뉴"
+    )
+
+
+@strawberry.input(description="Tenant 메뉴 생성 입력")
+class TenantsMenuCreateInput:
+    """Tenant 메뉴 생성 (depth/path는 부모 메뉴 기준으로 계산)"""
+
+    code: str = strawberry.field(description="메뉴 코드")
+    name: str = strawberry.field(description="메뉴명")
+    name_en: str | None = None
+    description: str | None = None
+    parent_id: strawberry.ID | None = None
+    sort_order: int = 0
+    menu_type: str = "MENU"
+    module_code: str | None = None
+    route_path: str | None = None
+    component_path: str | None = None
+    external_url: str | None = None
+    icon: str | None = None
+    icon_type: str | None = None
+    badge_text: str | None = None
+    badge_color: str | None = None
+    permission_code: str | None = None
+    is_public: bool = False
+    is_visible: bool = True
+    open_in_new_tab: bool = False
+
+
+@strawberry.input(description="Tenant 메뉴 수정 입력")
+class TenantsMenuUpdateInput:
+    """Tenant 메뉴 수정 (코드/부모 메뉴 변경은 지원하지 않음)"""
+
+    name: str | None = None
+    name_en: str | None = None
+    description: str | None = None
+    sort_order: int | None = None
+    menu_type: str | None = None
+    module_code: str | None = None
+    route_path: str | None = None
+    component_path: str | None = None
+    external_url: str | None = None
+    icon: str | None = None
+    icon_type: str | None = None
+    badge_text: str | None = None
+    badge_color: str | None = None
+    permission_code: str | None = None
+    is_public: bool | None = None
+    is_visible: bool | None = None
+    open_in_new_tab: bool | None = None
+    is_active: bool | None = None
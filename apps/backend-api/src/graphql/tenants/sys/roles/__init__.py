@@ -1,13 +1,15 @@
 """Tenants SYS Roles"""
 
-from .mutations import TenantRoleMutations
-from .queries import TenantRoleQueries
-from .types import TenantRole, TenantRoleCreateInput, TenantRoleUpdateInput
+from .loaders import TenantsRoleLoader
+from .mutations import TenantsRoleMutations
+from .queries import TenantsRoleQueries
+from .types import TenantsRole, TenantsRoleCreateInput, TenantsRoleUpdateInput
 
 __all__ = [
-    "TenantRole",
-    "TenantRoleCreateInput",
-    "TenantRoleUpdateInput",
-    "TenantRoleQueries",
-    "TenantRoleMutations",
+    "TenantsRole",
+    "TenantsRoleCreateInput",
+    "TenantsRoleUpdateInput",
+    "TenantsRoleQueries",
+    "TenantsRoleMutations",
+    "TenantsRoleLoader",
 ]
@@ -0,0 +1,14 @@
+"""Tenants SYS Roles - DataLoaders
+
+공통 모듈을 사용한 DataLoader 구현
+"""
+
+from src.graphql.common import BaseDataLoader, SessionSource
+from src.models.tenants.sys.roles import Roles as RoleModel
+
+
+class TenantsRoleLoader(BaseDataLoader[RoleModel]):
+    """Tenant 역할 DataLoader (N+1 쿼리 최적화)"""
+
+    def __init__(self, db: SessionSource):
+        super().__init__(db, RoleModel, conditions=[RoleModel.is_deleted.is_(False)])
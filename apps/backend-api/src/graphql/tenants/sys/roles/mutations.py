@@ -27,7 +27,6 @@ async def create_tenants_role(
 
     db.add(role)
     await db.commit()
-    await db.refresh(role)
 
     return TenantsRole(
         id=strawberry.ID(str(role.id)),
@@ -66,7 +65,6 @@ async def update_tenants_role(
     role.updated_by = updated_by
 
     await db.commit()
-    await db.refresh(role)
 
     return TenantsRole(
         id=strawberry.ID(str(role.id)),
@@ -6,6 +6,7 @@ import strawberry
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.graphql.common import clamp_limit
 from src.models.tenants.sys.roles import Roles as RoleModel
 
 from .types import TenantsRole
@@ -42,7 +43,7 @@ async def get_tenants_roles(
     stmt = (
         select(RoleModel)
         .where(RoleModel.is_deleted == False)
-        .limit(limit)
+        .limit(clamp_limit(limit))
         .offset(offset)
         .order_by(RoleModel.code)
     )
@@ -1,87 +1,28 @@
-"""Tenants SYS Users - DataLoaders"""
+"""Tenants SYS Users - DataLoaders
 
-from uuid import UUID
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+공통 모듈을 사용한 DataLoader 구현 (활성 사용자만 조회)
+"""
 
+from src.graphql.common import BaseDataLoader, BaseFieldLoader, SessionSource
 from src.models.tenants.sys.users import Users as UserModel
 
 
-class TenantsUserLoader:
+class TenantsUserLoader(BaseDataLoader[UserModel]):
     """Tenant 사용자 DataLoader (N+1 쿼리 최적화)"""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def load_many(self, user_ids: list[str]) -> list[UserModel | None]:
-        """
-        여러 사용자를 한 번의 쿼리로 조회
-
-        N+1 문제 해결: 여러 ID를 배치로 조회
-        """
-        if not user_ids:
-            return []
-
-        uuids = [UUID(uid) for uid in user_ids]
+    def __init__(self, db: SessionSource):
+        super().__init__(db, UserModel, conditions=[UserModel.is_active])
 
-        stmt = select(UserModel).where(UserModel.id.in_(uuids), UserModel.is_active)
-        result = await self.db.execute(stmt)
-        users = result.scalars().all()
 
-        # ID 순서 보장
-        user_map = {str(user.id): user for user in users}
-        return [user_map.get(uid) for uid in user_ids]
-
-    async def load(self, user_id: str) -> UserModel | None:
-        """단일 사용자 조회"""
-        result = await self.load_many([user_id])
-        return result[0] if result else None
-
-
-class TenantsUserByUsernameLoader:
+class TenantsUserByUsernameLoader(BaseFieldLoader[UserModel]):
     """Username으로 사용자 조회 DataLoader"""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def load_many(self, usernames: list[str]) -> list[UserModel | None]:
-        """여러 username을 한 번의 쿼리로 조회"""
-        if not usernames:
-            return []
+    def __init__(self, db: SessionSource):
+        super().__init__(db, UserModel, "username", conditions=[UserModel.is_active])
 
-        stmt = select(UserModel).where(UserModel.username.in_(usernames), UserModel.is_active)
-        result = await self.db.execute(stmt)
-        users = result.scalars().all()
 
-        user_map = {user.username: user for user in users}
-        return [user_map.get(username) for username in usernames]
-
-    async def load(self, username: str) -> UserModel | None:
-        """단일 사용자 조회"""
-        result = await self.load_many([username])
-        return result[0] if result else None
-
-
-class TenantsUserByEmailLoader:
+class TenantsUserByEmailLoader(BaseFieldLoader[UserModel]):
     """Email로 사용자 조회 DataLoader"""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def load_many(self, emails: list[str]) -> list[UserModel | None]:
-        """여러 email을 한 번의 쿼리로 조회"""
-        if not emails:
-            return []
-
-        stmt = select(UserModel).where(UserModel.email.in_(emails), UserModel.is_active)
-        result = await self.db.execute(stmt)
-        users = result.scalars().all()
-
-        user_map = {user.email: user for user in users}
-        return [user_map.get(email) for email in emails]
-
-    async def load(self, email: str) -> UserModel | None:
-        """단일 사용자 조회"""
-        result = await self.load_many([email])
-        return result[0] if result else None
+    def __init__(self, db: SessionSource):
+        super().__init__(db, UserModel, "email", conditions=[UserModel.is_active])
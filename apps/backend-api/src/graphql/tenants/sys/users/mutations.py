@@ -6,7 +6,7 @@ import strawberry
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import hash_password
+from src.core.security import hash_password_async
 from src.models.tenants.sys.users import Users as UserModel
 
 from .types import TenantsUser, TenantsUserCreateInput, TenantsUserUpdateInput
@@ -17,8 +17,8 @@ async def create_tenants_user(
 ) -> TenantsUser:
     """Tenant 사용자 생성"""
 
-    # 비밀번호 해시화
-    password_hash = hash_password(input_data.password)
+    # 비밀번호 해시화 (bcrypt 전용 스레드 풀)
+    password_hash = await hash_password_async(input_data.password)
 
     # 사용자 생성
     user = UserModel(
@@ -38,7 +38,6 @@ async def create_tenants_user(
 
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     return TenantsUser(
         id=strawberry.ID(str(user.id)),
@@ -98,7 +97,6 @@ async def update_tenants_user(
     user.updated_by = updated_by
 
     await db.commit()
-    await db.refresh(user)
 
     return TenantsUser(
         id=strawberry.ID(str(user.id)),
@@ -55,16 +55,30 @@ class TenantsUser(Node):
         """부서 정보"""
         if not self.department_id:
             return None
-        # TODO: DataLoader로 구현
-        return None
+
+        loader = info.context.loaders.get("tenants_department_loader")
+        if not loader:
+            return None
+
+        department = await loader.load(self.department_id)
+        if not department:
+            return None
+        return TenantsDepartment(id=strawberry.ID(str(department.id)), name=department.name)
 
     @strawberry.field(description="역할 정보")
     async def role(self, info) -> Optional["TenantsRole"]:
         """역할 정보"""
         if not self.role_id:
             return None
-        # TODO: DataLoader로 구현
-        return None
+
+        loader = info.context.loaders.get("tenants_role_loader")
+        if not loader:
+            return None
+
+        role = await loader.load(self.role_id)
+        if not role:
+            return None
+        return TenantsRole(id=strawberry.ID(str(role.id)), name=role.name)
 
 
 @strawberry.input(description="Tenant 사용자 생성 입력")
@@ -1,21 +1,32 @@
 """ConexGrow API 메인 애플리케이션"""
 
+import math
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
-# GraphQL
-from strawberry.fastapi import GraphQLRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from src.core.api_key_auth import api_key_cache
+from src.core.api_key_usage import api_key_usage_recorder
 from src.core.config import settings
 from src.core.database import close_db, init_db
-from src.core.exceptions import CXGError
-from src.core.middleware import RequestIDMiddleware, TimingMiddleware
+from src.core.exceptions import CXGError, RateLimitExceededError, ServiceUnavailableError
+from src.core.jwt_keys import jwt_key_set
+from src.core.login_log_buffer import login_log_buffer
+from src.core.metrics import metrics_registry
+from src.core.middleware import RequestContextMiddleware
+from src.core.permission_cache import permission_cache
+from src.core.rate_limit import rate_limiter
+from src.core.redis import close_redis
+from src.core.security import hashing_executor
+from src.core.session_auth import session_activity_recorder, session_cache
 from src.graphql.context import get_context
+from src.graphql.extensions import document_caches
 from src.graphql.manager.root_schema import manager_schema
+from src.graphql.persisted_queries import create_persisted_query_store
+from src.graphql.router import PersistedQueryGraphQLRouter
 from src.graphql.tenants.root_schema import tenants_schema
 from src.schemas import EnvelopeResponse
 
@@ -25,8 +36,24 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시
     await init_db()
+    permission_cache.start()
+    api_key_cache.start()
+    api_key_usage_recorder.start()
+    rate_limiter.start()
+    login_log_buffer.start()
+    session_cache.start()
+    session_activity_recorder.start()
     yield
     # 종료 시
+    await permission_cache.stop()
+    await api_key_cache.stop()
+    await api_key_usage_recorder.stop()
+    await rate_limiter.stop()
+    await login_log_buffer.stop()
+    await session_cache.stop()
+    await session_activity_recorder.stop()
+    await close_redis()
+    hashing_executor.shutdown()
     await close_db()
 
 
@@ -67,13 +94,26 @@ app.add_middleware(
         "X-Requested-With",
         "X-Total-Count",
         "X-Total-Pages",
+        "X-Request-ID",
+        "Server-Timing",
     ],
     max_age=3600,
 )
 
-# 커스텀 미들웨어
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(TimingMiddleware)
+# 커스텀 미들웨어 (요청 ID + 처리 시간, 순수 ASGI)
+app.add_middleware(RequestContextMiddleware)
+
+# /metrics 게이지 수집기 (백그라운드 컴포넌트 통계)
+metrics_registry.register_collector("password_hash", hashing_executor.metrics)
+metrics_registry.register_collector("api_key_usage", api_key_usage_recorder.metrics)
+metrics_registry.register_collector("login_log", login_log_buffer.metrics)
+metrics_registry.register_collector(
+    "jwt_verify_cache", lambda: {"hits": jwt_key_set.hits, "misses": jwt_key_set.misses}
+)
+for schema_name, document_cache in document_caches.items():
+    metrics_registry.register_collector(
+        f"graphql_document_cache_{schema_name}", document_cache.metrics
+    )
 
 
 # 예외 핸들러
@@ -90,6 +130,34 @@ async def cxg_exception_handler(request: Request, exc: CXGError):
     )
 
 
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exception_handler(request: Request, exc: RateLimitExceededError):
+    """요청 한도 초과 예외 핸들러"""
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        content=EnvelopeResponse.error_response(
+            code=exc.code,
+            message=exc.message,
+            detail=exc.detail,
+        ).model_dump(),
+    )
+
+
+@app.exception_handler(ServiceUnavailableError)
+async def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailableError):
+    """일시적 과부하 예외 핸들러 (재시도 가능한 용량 문제)"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+        content=EnvelopeResponse.error_response(
+            code=exc.code,
+            message=exc.message,
+            detail=exc.detail,
+        ).model_dump(),
+    )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """검증 예외 핸들러"""
@@ -116,18 +184,24 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# GraphQL 라우터 등록 - 시스템별 분리
+# GraphQL 라우터 등록 - 시스템별 분리 (영속 쿼리: APQ + 허용 목록)
 # Manager 시스템 GraphQL
-manager_graphql_app = GraphQLRouter(
+manager_graphql_app = PersistedQueryGraphQLRouter(
     manager_schema,
     context_getter=get_context,
+    persisted_queries=create_persisted_query_store(
+        "manager", settings.graphql_manager_query_manifest
+    ),
 )
 app.include_router(manager_graphql_app, prefix="/graphql/manager", tags=["GraphQL Manager"])
 
 # Tenants 시스템 GraphQL
-tenants_graphql_app = GraphQLRouter(
+tenants_graphql_app = PersistedQueryGraphQLRouter(
     tenants_schema,
     context_getter=get_context,
+    persisted_queries=create_persisted_query_store(
+        "tenants", settings.graphql_tenants_query_manifest
+    ),
 )
 app.include_router(tenants_graphql_app, prefix="/graphql/tenants", tags=["GraphQL Tenants"])
 
@@ -150,6 +224,26 @@ async def root():
     )
 
 
+@app.get("/.well-known/jwks.json", tags=["기본"])
+async def jwks():
+    """JWT 검증용 공개키 집합 (JWKS, 비대칭 서명 사용 시)"""
+    return JSONResponse(
+        content=jwt_key_set.jwks(),
+        headers={"Cache-Control": "public, max-age=300"},
+    )
+
+
+@app.get("/metrics", tags=["기본"], include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (워커 프로세스별)"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.get("/health", tags=["기본"])
 async def health():
     """헬스 체크"""
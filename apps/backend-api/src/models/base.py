@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, func
+from sqlalchemy import Boolean, DateTime, event, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -24,6 +24,18 @@ class TimestampMixin:
     )
 
 
+@event.listens_for(TimestampMixin, "before_insert", propagate=True)
+def _set_initial_updated_at(mapper, connection, target) -> None:
+    """
+    생성 시 updated_at을 NULL로 명시
+
+    updated_at은 onupdate(SQL 식)가 있어 값이 비어 있으면 eager_defaults가
+    INSERT 후 별도 SELECT로 다시 읽으므로, 값을 채워 RETURNING만으로 끝나게 합니다.
+    """
+    if "updated_at" not in target.__dict__:
+        target.updated_at = None
+
+
 class UserTrackingMixin:
     """사용자 추적 Mixin"""
 
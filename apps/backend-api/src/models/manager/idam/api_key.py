@@ -22,6 +22,7 @@ class ApiKey(BaseModel):
     # API 키 정보
     key_id: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
     key_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    key_digest: Mapped[str | None] = mapped_column(String(64), unique=True)
     key_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # 소유자 정보
@@ -1,6 +1,7 @@
 """RateLimits 모델"""
 
-from datetime import date, datetime
+from datetime import datetime
+from uuid import UUID
 
 from sqlalchemy import Boolean, DateTime, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
@@ -14,12 +15,32 @@ class RateLimits(BaseModel):
     __tablename__ = "rate_limits"
     __table_args__ = {"schema": "intg"}
 
+    # 제한 대상
+    tenant_id: Mapped[UUID | None] = mapped_column(index=True)
+    user_id: Mapped[UUID | None] = mapped_column(index=True)
+    api_key_id: Mapped[UUID | None] = mapped_column(index=True)
+    client_ip: Mapped[str | None] = mapped_column(String(45))
+
+    # 제한 설정
+    limit_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    limit_value: Mapped[int] = mapped_column(Integer, nullable=False)
+    window_size: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 현재 사용량 추적
     current_usage: Mapped[int | None] = mapped_column(Integer, default=0)
     window_start: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    # 제한 초과 처리
     action_on_exceed: Mapped[str] = mapped_column(String(20), nullable=False, default="BLOCK")
     burst_allowance: Mapped[int | None] = mapped_column(Integer, default=0)
+
+    # 통계 및 모니터링
+    last_access_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     total_requests: Mapped[int | None] = mapped_column(Integer, default=0)
     blocked_requests: Mapped[int | None] = mapped_column(Integer, default=0)
+
+    # 만료 관리
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     def __repr__(self) -> str:
@@ -1,6 +1,7 @@
 """테스트 설정 및 픽스처"""
 
 import asyncio
+import os
 from typing import AsyncGenerator, Generator
 
 import pytest
@@ -14,8 +15,8 @@ from src.core.database import Base, get_manager_db
 
 
 # 테스트 데이터베이스 URL
-TEST_DATABASE_URL = settings.mgmt_database_url.replace(
-    "mgmt_db", "test_mgmt_db"
+TEST_DATABASE_URL = settings.manager_database_url.replace(
+    "/mgmt", "/test_mgmt"
 ).replace("postgresql://", "postgresql+asyncpg://")
 
 
@@ -33,6 +34,16 @@ TestSessionLocal = async_sessionmaker(
 )
 
 
+def pytest_collection_modifyitems(config, items):
+    """benchmark 마커 테스트는 RUN_BENCHMARKS=1 일 때만 실행 (실행 시간은 환경에 따라 흔들림)"""
+    if os.environ.get("RUN_BENCHMARKS") == "1":
+        return
+    skip = pytest.mark.skip(reason="벤치마크는 RUN_BENCHMARKS=1 일 때만 실행")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     """이벤트 루프 설정"""
@@ -0,0 +1,166 @@
+"""API 키 인증 캐시 단위 테스트
+
+fakeredis로 검증 결과 캐시(digest → 인증 정보)의 적중/미스, digest가 없는 기존 키의
+bcrypt 검증 후 digest 채우기, 키 폐기 커밋 후 캐시 무효화를 검증합니다.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy.orm import Session
+
+from src.core import api_key_auth, database
+from src.core.api_key_auth import (
+    is_api_key_expired,
+    load_api_key_auth_info,
+    revoke_api_key_after_commit,
+)
+from src.core.cache import TwoLevelCache
+from src.core.security import compute_api_key_digest, get_password_hash
+
+
+API_KEY = "cxg_usr_s3cr3t-value"
+
+
+def _api_key(key_digest: str | None, key_hash: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        key_id="cxg_usr",
+        key_hash=key_hash,
+        key_digest=key_digest,
+        user_id=uuid4(),
+        tenant_context=None,
+        scopes=["read"],
+        service_account=None,
+        allowed_ips=[],
+        expires_at=None,
+        rate_limit_per_minute=1000,
+        rate_limit_per_hour=10000,
+        rate_limit_per_day=100000,
+    )
+
+
+class _FakeResult:
+    def __init__(self, record):
+        self._record = record
+
+    def scalar_one_or_none(self):
+        return self._record
+
+
+class _FakeSession:
+    """ApiKey 조회만 흉내 내는 AsyncSession 대역 (digest 조회 / key_id 기존 키 조회)"""
+
+    def __init__(self, *records):
+        self.records = list(records)
+        self.queries = 0
+        # 커밋 이벤트(after_commit)만 발생시키는 동기 세션
+        self.sync_session = Session()
+
+    async def execute(self, stmt):
+        self.queries += 1
+        params = stmt.compile().params
+        for record in self.records:
+            if "key_digest_1" in params and record.key_digest == params["key_digest_1"]:
+                return _FakeResult(record)
+            if "key_id_1" in params and (
+                record.key_digest is None and record.key_id == params["key_id_1"]
+            ):
+                return _FakeResult(record)
+        return _FakeResult(None)
+
+    async def commit(self):
+        self.sync_session.commit()
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch, redis):
+    cache = TwoLevelCache("apikey:verified", redis_factory=lambda: redis)
+    monkeypatch.setattr(api_key_auth, "api_key_cache", cache)
+    return cache
+
+
+async def test_cache_hit_skips_db(cache, redis):
+    """첫 인증 후에는 로컬 LRU, 로컬 만료 후에는 Redis에서 DB 조회 없이 인증"""
+    digest = compute_api_key_digest(API_KEY)
+    db = _FakeSession(_api_key(digest))
+
+    first = await load_api_key_auth_info(db, API_KEY)
+    second = await load_api_key_auth_info(db, API_KEY)
+    assert db.queries == 1
+    assert second == first
+    assert await redis.exists(f"apikey:verified:{digest}")
+
+    cache.clear_local()
+    assert await load_api_key_auth_info(db, API_KEY) == first
+    assert db.queries == 1
+
+
+async def test_unknown_key_is_not_cached():
+    """미스(존재하지 않는 키)는 캐시하지 않고 매번 조회"""
+    db = _FakeSession()
+
+    assert await load_api_key_auth_info(db, API_KEY) is None
+    assert await load_api_key_auth_info(db, API_KEY) is None
+    # digest 조회 + 기존 키 조회, 2회씩
+    assert db.queries == 4
+
+
+async def test_legacy_key_backfills_digest():
+    """digest가 없는 기존 키는 bcrypt 검증 후 digest를 채움"""
+    record = _api_key(None, key_hash=get_password_hash("s3cr3t-value"))
+    db = _FakeSession(record)
+
+    auth_info = await load_api_key_auth_info(db, API_KEY)
+
+    assert auth_info is not None
+    assert auth_info["api_key_id"] == str(record.id)
+    assert record.key_digest == compute_api_key_digest(API_KEY)
+
+
+async def test_legacy_key_wrong_secret_not_backfilled():
+    record = _api_key(None, key_hash=get_password_hash("other-secret"))
+    db = _FakeSession(record)
+
+    assert await load_api_key_auth_info(db, API_KEY) is None
+    assert record.key_digest is None
+
+
+async def test_revoke_invalidates_cache_after_commit(cache, redis):
+    """키 폐기 커밋 후 로컬/Redis 캐시를 지워 다음 인증은 DB에서 다시 확인"""
+    digest = compute_api_key_digest(API_KEY)
+    record = _api_key(digest)
+    db = _FakeSession(record)
+    await load_api_key_auth_info(db, API_KEY)
+
+    revoke_api_key_after_commit(db, record)
+    db.records.clear()  # 폐기되어 ACTIVE 조회에서 제외
+
+    # 커밋 전에는 캐시 유지
+    assert cache.get_local(digest) is not None
+
+    await db.commit()
+    await asyncio.gather(*database._after_commit_tasks)
+
+    assert cache.get_local(digest) is None
+    assert not await redis.exists(f"apikey:verified:{digest}")
+    assert await load_api_key_auth_info(db, API_KEY) is None
+
+
+def test_is_api_key_expired():
+    now = datetime.now(UTC)
+    past = {"expires_at": (now - timedelta(seconds=1)).isoformat()}
+    future = {"expires_at": (now + timedelta(days=1)).isoformat()}
+
+    assert is_api_key_expired(past, now)
+    assert not is_api_key_expired(future, now)
+    assert not is_api_key_expired({"expires_at": None}, now)
@@ -0,0 +1,145 @@
+"""API 키 사용 통계 버퍼 단위 테스트
+
+누적분이 키 ID 순 단일 executemany UPDATE로 반영되는지, 반영 실패 시 버퍼로
+되돌리고 상한을 넘는 분은 버리는지, 종료 시 남은 누적분을 반영하는지 검증합니다.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core import database
+from src.core.api_key_usage import ApiKeyUsageRecorder
+
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class _FakeSession:
+    """execute()/commit() 호출을 기록하는 AsyncSession 대역"""
+
+    def __init__(self, calls: list, fail: bool):
+        self.calls = calls
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params):
+        if self.fail:
+            raise ConnectionError("db down")
+        self.calls.append(params)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """ManagerSessionLocal 대역 (db.fail = True면 반영 실패)"""
+    state = SimpleNamespace(calls=[], fail=False)
+    monkeypatch.setattr(
+        database, "ManagerSessionLocal", lambda: _FakeSession(state.calls, state.fail)
+    )
+    return state
+
+
+async def test_flush_batches_sorted_by_key(db):
+    """키별 누적분을 키 ID 순 단일 UPDATE로 반영 (마지막 사용 시각/IP는 최신 값)"""
+    recorder = ApiKeyUsageRecorder()
+    key_a, key_b = sorted([uuid4(), uuid4()], reverse=True)
+
+    recorder.record(key_a, NOW, "10.0.0.1")
+    recorder.record(key_a, NOW + timedelta(seconds=2), "10.0.0.2")
+    recorder.record(key_a, NOW + timedelta(seconds=1), "10.0.0.3")
+    recorder.record(key_b, NOW, None)
+
+    assert await recorder.flush() == 2
+
+    assert len(db.calls) == 1
+    params = db.calls[0]
+    assert [p["b_id"] for p in params] == sorted([key_a, key_b])
+    row_a = next(p for p in params if p["b_id"] == key_a)
+    assert row_a["b_count"] == 3
+    assert row_a["b_used_at"] == NOW + timedelta(seconds=2)
+    assert row_a["b_ip"] == "10.0.0.2"
+    assert recorder.pending_keys == 0
+    assert recorder.metrics()["flushed_increments"] == 4
+
+
+async def test_empty_flush_skips_db(db):
+    assert await ApiKeyUsageRecorder().flush() == 0
+    assert db.calls == []
+
+
+async def test_failed_flush_restores_and_retries(db):
+    """반영 실패 시 누적분을 되돌리고, 이후 기록과 합쳐 다음 주기에 반영"""
+    recorder = ApiKeyUsageRecorder()
+    key = uuid4()
+    recorder.record(key, NOW, "10.0.0.1")
+    recorder.record(key, NOW, "10.0.0.1")
+
+    db.fail = True
+    assert await recorder.flush() == 0
+    assert recorder.failed_flushes == 1
+    assert recorder.pending_keys == 1
+
+    recorder.record(key, NOW + timedelta(seconds=5), "10.0.0.9")
+    db.fail = False
+    assert await recorder.flush() == 1
+
+    [row] = db.calls[0]
+    assert row["b_count"] == 3
+    assert row["b_ip"] == "10.0.0.9"
+
+
+async def test_restore_drops_oldest_over_cap(db):
+    """되돌린 누적분이 max_pending의 10배를 넘으면 오래된 키부터 버림"""
+    recorder = ApiKeyUsageRecorder(max_pending=2)
+    keys = [UUID(int=i + 1) for i in range(25)]
+    for key in keys:
+        recorder.record(key, NOW, None)
+
+    db.fail = True
+    await recorder.flush()
+
+    assert recorder.pending_keys == 20
+    assert recorder.dropped_increments == 5
+    assert keys[0] not in recorder._pending
+    assert keys[-1] in recorder._pending
+
+
+async def test_max_pending_wakes_flusher(db):
+    """누적 키 수가 max_pending에 도달하면 주기와 무관하게 즉시 반영"""
+    recorder = ApiKeyUsageRecorder(flush_interval=60, max_pending=3)
+    recorder.start()
+    try:
+        for _ in range(3):
+            recorder.record(uuid4(), NOW, None)
+        for _ in range(100):
+            if db.calls:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await recorder.stop()
+
+    assert len(db.calls) == 1
+    assert len(db.calls[0]) == 3
+
+
+async def test_stop_drains_pending(db):
+    """종료 시 주기를 기다리지 않고 남은 누적분을 반영"""
+    recorder = ApiKeyUsageRecorder(flush_interval=60)
+    recorder.start()
+    recorder.record(uuid4(), NOW, None)
+
+    await recorder.stop()
+
+    assert len(db.calls) == 1
+    assert recorder.pending_keys == 0
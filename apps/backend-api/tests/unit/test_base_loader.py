@@ -0,0 +1,82 @@
+"""DataLoader 베이스 클래스 단위 테스트
+
+max_batch_size로 분할된 배치와 같은 틱에 실행되는 다른 로더가
+하나의 요청 세션에서 동시에 execute()하지 않는지(세션별 직렬화)와
+입력 순서대로 결과를 돌려주는지 검증합니다.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from src.graphql.common.base_loader import BaseDataLoader, BaseFieldLoader
+from src.models.manager.idam.role import Role
+
+
+class FakeResult:
+    def __init__(self, items):
+        self._items = items
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._items
+
+
+class FakeSession:
+    """AsyncSession처럼 동시 execute()를 허용하지 않는 가짜 세션"""
+
+    def __init__(self, rows):
+        self.info = {}
+        self.rows = rows
+        self.batches = []
+        self.active = 0
+        self.overlapped = False
+
+    async def execute(self, stmt):
+        self.active += 1
+        self.overlapped |= self.active > 1
+        try:
+            # 다른 태스크가 끼어들 수 있도록 양보
+            await asyncio.sleep(0)
+            values = next(v for v in stmt.compile().params.values() if isinstance(v, list))
+            self.batches.append(values)
+            keys = {str(value) for value in values}
+            return FakeResult([row for row in self.rows if str(row.id) in keys or row.code in keys])
+        finally:
+            self.active -= 1
+
+
+def _rows(count):
+    return [SimpleNamespace(id=uuid.uuid4(), code=f"role-{i}") for i in range(count)]
+
+
+async def test_batches_over_max_size_are_serialized():
+    rows = _rows(5)
+    db = FakeSession(rows)
+    loader = BaseDataLoader(db, Role, max_batch_size=2)
+
+    keys = [str(row.id) for row in reversed(rows)] + [str(uuid.uuid4())]
+    result = await loader.load_many(keys)
+
+    assert [len(batch) for batch in db.batches] == [2, 2, 2]
+    assert not db.overlapped
+    assert result == [*reversed(rows), None]
+
+
+async def test_sibling_loaders_share_session_lock():
+    rows = _rows(3)
+    db = FakeSession(rows)
+    by_id = BaseDataLoader(lambda: db, Role)
+    by_code = BaseFieldLoader(lambda: db, Role, "code")
+
+    first, second = await asyncio.gather(
+        by_id.load_many([str(row.id) for row in rows]),
+        by_code.load_many(["role-2", "role-0", "missing"]),
+    )
+
+    assert len(db.batches) == 2
+    assert not db.overlapped
+    assert first == rows
+    assert second == [rows[2], rows[0], None]
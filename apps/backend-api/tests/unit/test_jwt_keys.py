@@ -0,0 +1,155 @@
+"""JWT 키 집합 단위 테스트
+
+kid 기반 키 교체 후 검증 키 선택, 제거된 kid의 캐시된 토큰 거부, 검증 캐시 만료,
+kid 없는 기존 HS256 토큰 검증을 검증합니다.
+"""
+
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwt
+
+from src.core import jwt_keys
+from src.core.jwt_keys import SYMMETRIC_KID, JwtKeySet
+
+
+def _write_private_key(keys_dir: Path, kid: str) -> bytes:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    (keys_dir / f"{kid}.pem").write_bytes(pem)
+    return pem
+
+
+def _retire(keys_dir: Path, kid: str) -> None:
+    """개인키를 검증 전용 공개키로 교체 (<kid>.pub.pem)"""
+    private_path = keys_dir / f"{kid}.pem"
+    private_key = serialization.load_pem_private_key(private_path.read_bytes(), password=None)
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    (keys_dir / f"{kid}.pub.pem").write_bytes(public_pem)
+    private_path.unlink()
+
+
+class _TwoMinutesLater(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now(tz) + timedelta(minutes=2)
+
+
+def _claims(sub: str = "user-1", ttl: int = 300) -> dict:
+    return {"sub": sub, "exp": int(time.time()) + ttl}
+
+
+@pytest.fixture
+def keys_dir(tmp_path):
+    _write_private_key(tmp_path, "k1")
+    return tmp_path
+
+
+def test_verify_after_kid_rotation(keys_dir):
+    """교체 후 새 토큰은 새 kid로 서명, 이전 토큰은 이전 kid의 공개키로 검증"""
+    key_set = JwtKeySet(algorithm="RS256", keys_dir=str(keys_dir))
+    old_token = key_set.sign(_claims("old"))
+
+    _write_private_key(keys_dir, "k2")
+    _retire(keys_dir, "k1")
+    key_set.load()
+    new_token = key_set.sign(_claims("new"))
+
+    assert jwt.get_unverified_header(old_token)["kid"] == "k1"
+    assert jwt.get_unverified_header(new_token)["kid"] == "k2"
+    assert key_set.verify(old_token)["sub"] == "old"
+    assert key_set.verify(new_token)["sub"] == "new"
+    assert sorted(key["kid"] for key in key_set.jwks()["keys"]) == ["k1", "k2"]
+
+
+def test_kid_selects_verify_key(keys_dir):
+    """헤더의 kid와 다른 키로 서명된 토큰은 거부"""
+    k2_pem = _write_private_key(keys_dir, "k2")
+    key_set = JwtKeySet(algorithm="RS256", keys_dir=str(keys_dir), active_kid="k1")
+
+    forged = jwt.encode(_claims(), k2_pem.decode(), algorithm="RS256", headers={"kid": "k1"})
+
+    with pytest.raises(JWTError):
+        key_set.verify(forged)
+
+
+def test_removed_kid_rejected_even_if_cached(keys_dir):
+    """키 집합에서 제거된 kid의 토큰은 검증 캐시에 있어도 거부"""
+    key_set = JwtKeySet(algorithm="RS256", keys_dir=str(keys_dir))
+    token = key_set.sign(_claims())
+    key_set.verify(token)
+
+    _write_private_key(keys_dir, "k2")
+    (keys_dir / "k1.pem").unlink()
+    key_set.load()
+
+    with pytest.raises(JWTError, match="Unknown key id"):
+        key_set.verify(token)
+    assert len(key_set._verified) == 0
+
+
+def test_verified_cache_hit_and_expiry(monkeypatch):
+    """같은 토큰은 캐시에서 검증, exp가 지나면 캐시를 버리고 만료로 거부"""
+    key_set = JwtKeySet(secret_key="secret")
+    token = key_set.sign(_claims(ttl=60))
+
+    key_set.verify(token)
+    key_set.verify(token)
+    assert (key_set.hits, key_set.misses) == (1, 1)
+
+    # 2분 후 (캐시의 exp 확인은 time.time, jose의 exp 검증은 datetime.now 사용)
+    real_time = time.time
+    monkeypatch.setattr(jwt_keys.time, "time", lambda: real_time() + 120)
+    monkeypatch.setattr(jwt, "datetime", _TwoMinutesLater)
+
+    with pytest.raises(JWTError):
+        key_set.verify(token)
+    assert key_set.misses == 2
+    assert len(key_set._verified) == 0
+
+
+def test_verified_cache_is_bounded():
+    key_set = JwtKeySet(secret_key="secret", cache_size=2)
+
+    for i in range(3):
+        key_set.verify(key_set.sign(_claims(f"user-{i}")))
+
+    assert len(key_set._verified) == 2
+
+
+def test_legacy_kidless_hs256_token():
+    """kid 없는 기존 HS256 토큰은 대칭 키로 검증"""
+    key_set = JwtKeySet(secret_key="secret")
+    legacy = jwt.encode(_claims(), "secret", algorithm="HS256")
+
+    assert "kid" not in jwt.get_unverified_header(legacy)
+    assert key_set.verify(legacy)["sub"] == "user-1"
+    assert jwt.get_unverified_header(key_set.sign(_claims()))["kid"] == SYMMETRIC_KID
+
+    with pytest.raises(JWTError):
+        key_set.verify(jwt.encode(_claims(), "other-secret", algorithm="HS256"))
+
+
+def test_kidless_token_rejected_with_asymmetric_keys(keys_dir):
+    """비대칭 키 집합에는 대칭 키가 없으므로 kid 없는 토큰은 거부"""
+    key_set = JwtKeySet(algorithm="RS256", keys_dir=str(keys_dir))
+    legacy = jwt.encode(_claims(), "secret", algorithm="HS256")
+
+    with pytest.raises(JWTError, match="Unknown key id"):
+        key_set.verify(legacy)
+
+
+def test_keys_dir_requires_asymmetric_algorithm(keys_dir):
+    with pytest.raises(ValueError):
+        JwtKeySet(algorithm="HS256", keys_dir=str(keys_dir))
@@ -0,0 +1,129 @@
+"""목록 + 전체 개수 조회(get_list_with_count)와 컬럼 프로젝션 단위 테스트
+
+aiosqlite 파일 DB로 COUNT(*) OVER () 한 번의 조회로 개수를 얻는지, 마지막 페이지를
+넘어선 요청에서만 COUNT로 보완하는지, 요청된 필드만 조회(load_only)한 객체의 미조회
+컬럼을 None으로 채우고 세션에서 분리해 이후 접근에서 DB 조회가 없는지 검증합니다.
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from strawberry.types.nodes import SelectedField
+
+from src.graphql.common import get_list_with_count
+from src.models.manager.idam.permission import Permission
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'main.db'}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute(f"ATTACH DATABASE '{tmp_path / 'idam.db'}' AS idam")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Permission.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def statements(engine) -> list[str]:
+    executed: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(" ".join(statement.split()))
+
+    return executed
+
+
+@pytest.fixture
+async def db(engine):
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        for i in range(5):
+            session.add(
+                Permission(
+                    code=f"p{i}",
+                    name=f"권한{i}",
+                    description="긴 설명" * 100,
+                    category="사용자",
+                    resource="users",
+                    action="READ",
+                    status="INACTIVE" if i == 4 else "ACTIVE",
+                )
+            )
+        await session.commit()
+        session.expunge_all()
+        yield session
+
+
+def _info(*field_names: str):
+    """items { <field_names> } 를 요청한 Info 대역"""
+    fields = [SelectedField(name, {}, {}, []) for name in field_names]
+    return type("Info", (), {"selected_fields": [SelectedField("list", {}, {}, fields)]})()
+
+
+async def _list(db: AsyncSession, **kwargs):
+    return await get_list_with_count(
+        db, Permission, lambda item: item, order_by=Permission.code, **kwargs
+    )
+
+
+# ==================== 전체 개수 ====================
+
+
+async def test_page_and_total_in_one_query(db, statements):
+    items, total = await _list(db, limit=2, offset=1)
+
+    assert [item.code for item in items] == ["p1", "p2"]
+    assert total == 5
+    assert len(statements) == 1
+    assert "OVER ()" in statements[0]
+
+
+async def test_past_last_page_falls_back_to_count(db, statements):
+    """행이 없으면 윈도우 결과도 없으므로 같은 필터로 COUNT 한 번 더 조회"""
+    items, total = await _list(db, limit=2, offset=10, status="ACTIVE")
+
+    assert items == []
+    assert total == 4
+    assert len(statements) == 2
+    assert statements[1].startswith("SELECT count(")
+
+
+async def test_empty_first_page_skips_count(db, statements):
+    items, total = await _list(db, limit=2, status="DELETED")
+
+    assert (items, total) == ([], 0)
+    assert len(statements) == 1
+
+
+# ==================== 프로젝션 ====================
+
+
+async def test_projection_loads_only_selected_columns(db, statements):
+    """미조회 컬럼은 None, 객체는 세션에서 분리되어 이후 접근에 DB 조회 없음"""
+    items, total = await _list(db, limit=2, info=_info("code", "name"))
+
+    assert total == 5
+    assert "description" not in statements[0]
+    assert [(item.code, item.name) for item in items] == [("p0", "권한0"), ("p1", "권한1")]
+    assert all(item not in db for item in items)
+
+    statements.clear()
+    assert [item.description for item in items] == [None, None]
+    assert [item.resource for item in items] == [None, None]
+    assert statements == []
+
+
+async def test_projection_keeps_fully_loaded_objects(db):
+    """identity map에 이미 전체 로딩된 객체는 그대로 두고 세션에서 분리하지 않음"""
+    full, _ = await _list(db, limit=1)
+
+    projected, _ = await _list(db, limit=1, info=_info("code"))
+
+    assert projected[0] is full[0]
+    assert projected[0] in db
+    assert projected[0].description == "긴 설명" * 100
@@ -0,0 +1,125 @@
+"""로그인 무차별 대입 방어 단위 테스트
+
+fakeredis(Lua 지원)로 실패 임계값, 지수적 잠금 시간, 잠금 NX(동시 요청), 실패 카운터
+만료 시간, 로그인 성공 시 초기화를 검증합니다.
+"""
+
+import fakeredis.aioredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.login_guard import LoginFailure, LoginGuard
+
+
+USER_FAIL = "login:fail:user:alice"
+USER_LOCK = "login:lock:user:alice"
+IP_FAIL = "login:fail:ip:10.0.0.1"
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def guard(redis):
+    return LoginGuard(
+        redis_factory=lambda: redis,
+        window=900,
+        user_threshold=3,
+        ip_threshold=5,
+        base_delay=30,
+        max_delay=100,
+    )
+
+
+async def _fail(guard: LoginGuard, times: int, username: str = "alice") -> list[LoginFailure]:
+    return [await guard.register_failure(username, "10.0.0.1") for _ in range(times)]
+
+
+async def test_lock_starts_at_threshold(guard):
+    """임계값 미만은 잠금 없음, 임계값 도달 시 base_delay 동안 잠금"""
+    failures = await _fail(guard, 3)
+
+    assert [f.user_failures for f in failures] == [1, 2, 3]
+    assert [f.user_lock_seconds for f in failures] == [0, 0, 30]
+    assert failures[-1].user_locked
+    assert 29 < await guard.check("alice", "10.0.0.1") <= 30
+
+
+async def test_no_lock_below_threshold(guard):
+    await _fail(guard, 2)
+
+    assert await guard.check("alice", "10.0.0.1") == 0.0
+
+
+async def test_lock_is_exponential_and_capped(guard, redis):
+    """잠금이 풀린 뒤 다시 실패하면 잠금 시간이 2배씩 늘고 max_delay에서 멈춤"""
+    await _fail(guard, 3)
+    lock_seconds = []
+    for _ in range(3):
+        await redis.delete(USER_LOCK)  # 잠금 만료
+        [failure] = await _fail(guard, 1)
+        lock_seconds.append(failure.user_lock_seconds)
+
+    assert lock_seconds == [60, 100, 100]
+
+
+async def test_lock_is_not_extended_while_locked(guard, redis):
+    """잠금 중 실패(동시 요청)는 새 잠금이 아니며 잠금 시간을 늘리지 않음 (NX)"""
+    await _fail(guard, 3)
+    ttl = await redis.ttl(USER_LOCK)
+
+    [failure] = await _fail(guard, 1)
+
+    assert failure.user_failures == 4
+    assert not failure.user_locked
+    assert await redis.ttl(USER_LOCK) == ttl
+    assert await redis.get(USER_LOCK) == "3"
+
+
+async def test_counter_expiry(guard, redis):
+    """실패 카운터는 window초 후 만료, 잠금 중에는 잠금 시간만큼 더 유지"""
+    await _fail(guard, 1)
+    assert await redis.ttl(USER_FAIL) == 900
+
+    await _fail(guard, 2)
+    assert await redis.ttl(USER_FAIL) == 900 + 30
+
+
+async def test_ip_threshold_across_usernames(guard):
+    """IP 카운터는 사용자명과 무관하게 누적"""
+    for i in range(4):
+        await guard.register_failure(f"user{i}", "10.0.0.1")
+
+    failure = await guard.register_failure("user9", "10.0.0.1")
+
+    assert failure.ip_failures == 5
+    assert failure.ip_lock_seconds == 30
+    assert not failure.user_locked
+    assert await guard.check("someone", "10.0.0.1") > 0
+
+
+async def test_success_resets_user_counter_only(guard, redis):
+    """로그인 성공 시 사용자명 카운터/잠금만 해제 (IP 카운터는 유지)"""
+    await _fail(guard, 3)
+
+    await guard.register_success("alice")
+
+    assert not await redis.exists(USER_FAIL, USER_LOCK)
+    assert await redis.get(IP_FAIL) == "3"
+    assert await guard.check("alice", "10.0.0.1") == 0.0
+    [failure] = await _fail(guard, 1)
+    assert failure.user_failures == 1
+
+
+async def test_redis_failure_allows_login():
+    """Redis 장애 시 잠금 없이 진행"""
+
+    def unavailable():
+        raise RedisConnectionError("redis down")
+
+    guard = LoginGuard(redis_factory=unavailable)
+
+    assert await guard.check("alice", "10.0.0.1") == 0.0
+    assert await guard.register_failure("alice", "10.0.0.1") == LoginFailure()
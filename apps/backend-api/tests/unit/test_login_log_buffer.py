@@ -0,0 +1,199 @@
+"""로그인 이력 write-behind 버퍼 단위 테스트
+
+버퍼 상한 초과 시 버리기, 컬럼 길이 자르기, batch_size 단위 executemany INSERT,
+기록 실패 시 순서를 유지한 되돌리기, 데이터 오류 행의 행 단위 격리,
+종료 시 남은 이력 기록을 검증합니다.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import DataError
+
+from src.core import database
+from src.core.login_log_buffer import UNKNOWN_IP, LoginLogBuffer, normalize_ip
+
+
+class _FakeSession:
+    """execute()에 전달된 행 목록을 기록하는 AsyncSession 대역"""
+
+    def __init__(self, state: SimpleNamespace):
+        self.state = state
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, rows):
+        if self.state.on_execute is not None:
+            self.state.on_execute()
+        if self.state.fail:
+            raise ConnectionError("db down")
+        if any(row["username"] in self.state.invalid for row in rows):
+            raise DataError("INSERT", rows, Exception("invalid row"))
+        self.state.batches.append([row["username"] for row in rows])
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """
+    ManagerSessionLocal 대역
+
+    fail = True면 기록 실패(DB 장애), invalid의 사용자명이 포함된 INSERT는 DataError,
+    on_execute는 기록 중 동작
+    """
+    state = SimpleNamespace(batches=[], fail=False, invalid=set(), on_execute=None)
+    monkeypatch.setattr(database, "ManagerSessionLocal", lambda: _FakeSession(state))
+    return state
+
+
+def _add(buffer: LoginLogBuffer, *usernames: str) -> None:
+    for username in usernames:
+        buffer.add(username=username, ip_address="127.0.0.1", success=False)
+
+
+def _pending(buffer: LoginLogBuffer) -> list[str]:
+    return [row["username"] for row in buffer._pending]
+
+
+def test_normalize_ip():
+    assert normalize_ip("10.0.0.1") == "10.0.0.1"
+    assert normalize_ip("unknown") == UNKNOWN_IP
+    assert normalize_ip(None) == UNKNOWN_IP
+
+
+def test_add_drops_over_cap():
+    """버퍼가 max_pending에 도달하면 새 이력을 버리고 건수를 기록"""
+    buffer = LoginLogBuffer(max_pending=3)
+
+    _add(buffer, "a", "b", "c", "d", "e")
+
+    assert _pending(buffer) == ["a", "b", "c"]
+    assert buffer.dropped_rows == 2
+
+
+def test_add_truncates_to_column_length():
+    """인증 전 입력(username 등)이 컬럼 길이를 넘으면 잘라서 보관"""
+    buffer = LoginLogBuffer()
+
+    buffer.add(username="a" * 500, ip_address="10.0.0.1", success=False, user_agent="x" * 500)
+
+    [row] = buffer._pending
+    assert row["username"] == "a" * 100
+    # Text 컬럼은 자르지 않음
+    assert len(row["user_agent"]) == 500
+
+
+async def test_flush_writes_in_batches(db):
+    """batch_size 단위 INSERT로 순서대로 기록"""
+    buffer = LoginLogBuffer(batch_size=2)
+    _add(buffer, "a", "b", "c", "d", "e")
+
+    assert await buffer.flush() == 5
+
+    assert db.batches == [["a", "b"], ["c", "d"], ["e"]]
+    assert buffer.pending_rows == 0
+    assert buffer.metrics()["written_rows"] == 5
+
+
+async def test_failed_flush_restores_in_order(db):
+    """기록 실패한 배치는 버퍼 앞쪽으로 되돌려 다음 주기에 순서대로 재시도"""
+    buffer = LoginLogBuffer(batch_size=2)
+    _add(buffer, "a", "b", "c", "d", "e")
+
+    def fail_second_batch():
+        db.fail = len(db.batches) == 1
+
+    db.on_execute = fail_second_batch
+    assert await buffer.flush() == 2
+
+    assert db.batches == [["a", "b"]]
+    assert _pending(buffer) == ["c", "d", "e"]
+    assert buffer.failed_flushes == 1
+
+    db.on_execute, db.fail = None, False
+    assert await buffer.flush() == 3
+    assert db.batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+async def test_failed_flush_drops_newest_over_cap(db):
+    """되돌린 뒤 상한을 넘으면 기록 중에 추가된 최신 이력부터 버림"""
+    buffer = LoginLogBuffer(batch_size=2, max_pending=3)
+    _add(buffer, "a", "b", "c")
+
+    db.on_execute = lambda: _add(buffer, "d", "e")
+    db.fail = True
+    assert await buffer.flush() == 0
+
+    assert _pending(buffer) == ["a", "b", "c"]
+    assert buffer.dropped_rows == 2
+
+
+async def test_invalid_row_is_rejected_row_by_row(db):
+    """데이터 오류로 배치가 실패하면 행 단위로 기록하고 실패한 행만 버림"""
+    buffer = LoginLogBuffer(batch_size=3)
+    _add(buffer, "a", "bad", "c", "d")
+    db.invalid = {"bad"}
+
+    assert await buffer.flush() == 3
+
+    assert db.batches == [["a"], ["c"], ["d"]]
+    assert buffer.pending_rows == 0
+    assert buffer.rejected_rows == 1
+    assert buffer.failed_flushes == 0
+
+    # 이후 기록은 다시 배치로 수행
+    _add(buffer, "e", "f")
+    assert await buffer.flush() == 2
+    assert db.batches[-1] == ["e", "f"]
+
+
+async def test_outage_during_row_retry_restores_rest(db):
+    """행 단위 재시도 중 DB 장애가 나면 남은 행을 되돌려 다음 주기에 재시도"""
+    buffer = LoginLogBuffer(batch_size=3)
+    _add(buffer, "a", "bad", "c")
+    db.invalid = {"bad"}
+
+    def fail_after_first_row():
+        db.fail = db.batches == [["a"]]
+
+    db.on_execute = fail_after_first_row
+    assert await buffer.flush() == 1
+
+    assert _pending(buffer) == ["bad", "c"]
+    assert buffer.failed_flushes == 1
+    assert buffer.rejected_rows == 0
+
+
+async def test_batch_size_wakes_flusher(db):
+    """batch_size에 도달하면 주기와 무관하게 즉시 기록"""
+    buffer = LoginLogBuffer(flush_interval=60, batch_size=2)
+    buffer.start()
+    try:
+        _add(buffer, "a", "b")
+        for _ in range(100):
+            if db.batches:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await buffer.stop()
+
+    assert db.batches == [["a", "b"]]
+
+
+async def test_stop_drains_pending(db):
+    """종료 시 주기를 기다리지 않고 남은 이력을 기록"""
+    buffer = LoginLogBuffer(flush_interval=60)
+    buffer.start()
+    _add(buffer, "a")
+
+    await buffer.stop()
+
+    assert db.batches == [["a"]]
+    assert buffer.pending_rows == 0
@@ -0,0 +1,196 @@
+"""메뉴 트리 구성/권한 필터링 및 테넌트별 캐시(버전 기반 무효화) 테스트
+
+fakeredis로 버전 키를 확인하고, 커밋 이후 무효화는 SQLite 동기 세션의
+after_commit 이벤트로 검증합니다. menuTree의 조회 대상 사용자 결정(비로그인 거부,
+다른 사용자 조회 권한)도 검증합니다.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.core.exceptions import ForbiddenError, UnauthorizedError
+from src.graphql.tenants.sys.menus import queries as menu_queries
+from src.graphql.tenants.sys.menus.tree import MenuTreeCache, build_menu_tree, prune_menu_tree
+
+
+@dataclass
+class _Menu:
+    code: str
+    parent_id: UUID | None = None
+    depth: int = 0
+    sort_order: int = 0
+    menu_type: str = "MENU"
+    permission_code: str | None = None
+    is_public: bool = False
+    id: UUID = field(default_factory=uuid4)
+    name: str = ""
+    name_en: str | None = None
+    path: str | None = None
+    module_code: str | None = None
+    route_path: str | None = None
+    component_path: str | None = None
+    external_url: str | None = None
+    icon: str | None = None
+    icon_type: str | None = None
+    badge_text: str | None = None
+    badge_color: str | None = None
+    is_favorite: bool = False
+    open_in_new_tab: bool = False
+
+
+def _menus() -> list[_Menu]:
+    """depth, sort_order 순으로 정렬된 메뉴 (load_menu_tree 조회 결과와 같은 순서)"""
+    sys_folder = _Menu("SYS", menu_type="FOLDER", sort_order=1)
+    adm_folder = _Menu("ADM", menu_type="FOLDER", sort_order=2)
+    return [
+        _Menu("HOME", permission_code="HOME_READ", is_public=True),
+        sys_folder,
+        adm_folder,
+        _Menu("SYS_ROLES", sys_folder.id, depth=1, sort_order=1, permission_code="ROLES_READ"),
+        _Menu("SYS_USERS", sys_folder.id, depth=1, sort_order=2, permission_code="USERS_READ"),
+        _Menu("ADM_LOGS", adm_folder.id, depth=1, permission_code="LOGS_READ"),
+        # 부모가 조회되지 않은(비활성/숨김) 메뉴
+        _Menu("ORPHAN", uuid4(), depth=1),
+    ]
+
+
+def _codes(tree) -> list:
+    return [(node.code, _codes(node.children)) if node.children else node.code for node in tree]
+
+
+def test_build_menu_tree():
+    """부모 아래 sort_order 순으로 연결하고, 부모가 없는 메뉴는 제외"""
+    tree = build_menu_tree(_menus())
+
+    assert _codes(tree) == [
+        "HOME",
+        ("SYS", ["SYS_ROLES", "SYS_USERS"]),
+        ("ADM", ["ADM_LOGS"]),
+    ]
+
+
+def test_prune_menu_tree():
+    """권한 없는 메뉴와 남은 하위 메뉴가 없는 폴더 제외, 캐시된 트리는 그대로"""
+    tree = build_menu_tree(_menus())
+
+    pruned = prune_menu_tree(tree, frozenset({"USERS_READ"}))
+
+    assert _codes(pruned) == ["HOME", ("SYS", ["SYS_USERS"])]
+    assert _codes(tree)[1] == ("SYS", ["SYS_ROLES", "SYS_USERS"])
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cache(redis) -> MenuTreeCache:
+    return MenuTreeCache(redis_factory=lambda: redis)
+
+
+async def test_cache_reuses_tree_until_version_changes(cache, redis):
+    """같은 버전이면 다시 구성하지 않고, 다른 워커가 버전을 올리면 다시 구성"""
+    builds = 0
+
+    async def loader():
+        nonlocal builds
+        builds += 1
+        return build_menu_tree(_menus())
+
+    first = await cache.get("acme", loader)
+    assert await cache.get("acme", loader) is first
+    assert builds == 1
+
+    await redis.incr(cache.key_prefix + "acme")
+    assert await cache.get("acme", loader) is not first
+    assert builds == 2
+
+    # 테넌트별로 따로 구성
+    await cache.get("other", loader)
+    assert builds == 3
+
+
+async def test_concurrent_builds_share_lock(cache):
+    """같은 테넌트의 동시 요청은 한 번만 구성하고, 구성이 끝난 테넌트의 락은 남기지 않음"""
+    builds = 0
+
+    async def loader():
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return build_menu_tree(_menus())
+
+    trees = await asyncio.gather(*(cache.get(f"t{i % 2}", loader) for i in range(6)))
+
+    assert builds == 2
+    assert trees[0] is trees[2] is trees[4]
+    assert len(cache._locks) == 0
+
+
+async def test_invalidate_after_commit(cache, redis):
+    """커밋 이후에만 버전 증가 (롤백 시 유지)"""
+    engine = create_engine("sqlite://")
+
+    @dataclass
+    class _Db:
+        sync_session: Session
+
+    with Session(engine) as session:
+        db = _Db(session)
+
+        cache.invalidate_after_commit(db, "acme")
+        session.execute(text("SELECT 1"))
+        session.rollback()
+        await asyncio.sleep(0)
+        assert await redis.get(cache.key_prefix + "acme") is None
+
+        cache.invalidate_after_commit(db, "acme")
+        session.execute(text("SELECT 1"))
+        session.commit()
+        await asyncio.sleep(0.01)
+        assert await redis.get(cache.key_prefix + "acme") == "1"
+
+
+# ==================== 조회 대상 사용자 ====================
+
+
+@pytest.fixture
+def caller_codes(monkeypatch):
+    codes: set[str] = set()
+
+    async def fake_codes(db, user_id):
+        return frozenset(codes)
+
+    monkeypatch.setattr(menu_queries, "get_tenants_user_permission_codes", fake_codes)
+    return codes
+
+
+async def test_menu_tree_requires_authentication(caller_codes):
+    with pytest.raises(UnauthorizedError):
+        await menu_queries.resolve_menu_tree_user_id(None, None, None)
+    with pytest.raises(UnauthorizedError):
+        await menu_queries.resolve_menu_tree_user_id(None, "", str(uuid4()))
+
+
+async def test_menu_tree_defaults_to_caller(caller_codes):
+    caller = uuid4()
+
+    assert await menu_queries.resolve_menu_tree_user_id(None, str(caller), None) == caller
+    assert await menu_queries.resolve_menu_tree_user_id(None, str(caller), str(caller)) == caller
+
+
+async def test_menu_tree_other_user_requires_permission(caller_codes):
+    caller, other = uuid4(), uuid4()
+
+    with pytest.raises(ForbiddenError):
+        await menu_queries.resolve_menu_tree_user_id(None, str(caller), str(other))
+
+    caller_codes.add(menu_queries.VIEW_OTHER_USER_MENUS_PERMISSION)
+    assert await menu_queries.resolve_menu_tree_user_id(None, str(caller), str(other)) == other
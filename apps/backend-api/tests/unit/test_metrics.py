@@ -0,0 +1,152 @@
+"""메트릭(Prometheus 텍스트 형식) + SQL 실행 계측 단위 테스트
+
+MetricsRegistry의 카운터/히스토그램/수집기 출력 형식, aiosqlite 엔진에 등록한
+계측 이벤트로 track_queries 범위 안의 SQL을 필드별로 집계하는지,
+PerformanceExtension이 리졸버별 SQL 횟수와 N+1 임계값 초과를 기록하는지 검증합니다.
+"""
+
+import pytest
+import strawberry
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.config import settings
+from src.core.metrics import (
+    MetricsRegistry,
+    instrument_engine,
+    reset_current_field,
+    set_current_field,
+    track_queries,
+)
+from src.graphql import extensions
+from src.graphql.extensions import PerformanceExtension
+
+
+@pytest.fixture
+async def engine():
+    engine = instrument_engine(create_async_engine("sqlite+aiosqlite://"))
+    yield engine
+    await engine.dispose()
+
+
+# ==================== Prometheus 출력 ====================
+
+
+def test_render_counter_and_gauges():
+    registry = MetricsRegistry(prefix="t")
+    requests = registry.counter("requests_total", "요청 수", ("path",))
+    requests.inc("/b")
+    requests.inc("/a", value=2)
+    requests.inc('/"q"')
+    registry.register_collector("pool", lambda: {"size": 3, "ratio": 0.5, "name": "skip"})
+
+    assert registry.render() == (
+        "# HELP t_requests_total 요청 수\n"
+        "# TYPE t_requests_total counter\n"
+        't_requests_total{path="/\\"q\\""} 1\n'
+        't_requests_total{path="/a"} 2\n'
+        't_requests_total{path="/b"} 1\n'
+        "# TYPE t_pool_size gauge\n"
+        "t_pool_size 3\n"
+        "# TYPE t_pool_ratio gauge\n"
+        "t_pool_ratio 0.5\n"
+    )
+
+
+def test_render_histogram_cumulative_buckets():
+    registry = MetricsRegistry(prefix="t")
+    duration = registry.histogram("duration_seconds", "처리 시간", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        duration.observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        't_duration_seconds_bucket{le="0.1"} 1',
+        't_duration_seconds_bucket{le="1"} 3',
+        't_duration_seconds_bucket{le="+Inf"} 4',
+        "t_duration_seconds_sum 4.25",
+        "t_duration_seconds_count 4",
+    ]
+
+
+def test_registry_returns_existing_metric():
+    registry = MetricsRegistry(prefix="t")
+
+    assert registry.counter("c", "doc") is registry.counter("c", "doc")
+
+
+# ==================== SQL 계측 ====================
+
+
+async def test_track_queries_counts_per_field(engine):
+    """추적 범위 안의 SQL만 기록하고, 지정된 필드로 집계"""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+        with track_queries() as tracker:
+            await conn.execute(text("SELECT 2"))
+            token = set_current_field("Query.items")
+            try:
+                for _ in range(3):
+                    await conn.execute(text("SELECT 3"))
+            finally:
+                reset_current_field(token)
+
+    assert tracker.sql_count == 4
+    assert tracker.fields["Query.items"].sql_count == 3
+    assert tracker.n_plus_one(threshold=2) == [("Query.items", "SELECT 3", 3)]
+    assert tracker.n_plus_one(threshold=3) == []
+
+
+# ==================== PerformanceExtension ====================
+
+
+def _schema(engine, schema_name: str) -> strawberry.Schema:
+    async def query(sql: str, **params) -> int:
+        async with engine.connect() as conn:
+            return (await conn.execute(text(sql), params)).scalar_one()
+
+    @strawberry.type
+    class Item:
+        id: int
+
+        @strawberry.field
+        async def detail(self) -> int:
+            # 항목마다 같은 SQL (N+1)
+            return await query("SELECT :id", id=self.id)
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def items(self, count: int) -> list[Item]:
+            await query("SELECT 1")
+            return [Item(id=i) for i in range(count)]
+
+    return strawberry.Schema(query=Query, extensions=[PerformanceExtension.for_schema(schema_name)])
+
+
+async def test_performance_extension_counts_sql_per_field(engine):
+    schema = _schema(engine, "perf-fields")
+
+    result = await schema.execute("{ items(count: 2) { detail } }")
+
+    assert result.errors is None
+    assert extensions.RESOLVER_SQL_QUERIES._values[("perf-fields", "Query.items")] == 1
+    assert extensions.RESOLVER_SQL_QUERIES._values[("perf-fields", "Item.detail")] == 2
+    rendered = extensions.metrics_registry.render()
+    assert (
+        'cxg_graphql_operation_sql_queries_count{schema="perf-fields",operation_type="query"} 1'
+        in rendered
+    )
+
+
+async def test_performance_extension_n_plus_one_threshold(engine, monkeypatch):
+    """같은 필드에서 같은 SQL이 임계값을 초과하면 N+1로 기록"""
+    monkeypatch.setattr(settings, "graphql_n_plus_one_threshold", 3)
+    schema = _schema(engine, "perf-n-plus-one")
+    key = ("perf-n-plus-one", "Item.detail")
+
+    await schema.execute("{ items(count: 3) { detail } }")
+    assert key not in extensions.N_PLUS_ONE._values
+
+    await schema.execute("{ items(count: 4) { detail } }")
+    assert extensions.N_PLUS_ONE._values[key] == 1
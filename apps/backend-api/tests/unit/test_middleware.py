@@ -0,0 +1,160 @@
+"""요청 컨텍스트 미들웨어 테스트 + BaseHTTPMiddleware 대비 벤치마크
+
+/health와 GraphQL 엔드포인트에서 기존 BaseHTTPMiddleware 2단(RequestID + Timing)과
+순수 ASGI 미들웨어의 초당 처리 요청 수를 비교합니다.
+(벤치마크는 benchmark 마커, RUN_BENCHMARKS=1 일 때만 실행)
+"""
+
+import time
+import uuid
+from collections.abc import Callable
+
+import httpx
+import pytest
+import strawberry
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import StreamingResponse
+from strawberry.fastapi import GraphQLRouter
+
+from src.core.middleware import RequestContextMiddleware, add_server_timing
+
+
+# ==================== 기존 구현 (비교 기준) ====================
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyTimingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+
+# ==================== 테스트 앱 ====================
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+def create_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health(request: Request):
+        return {"status": "healthy", "request_id": request.state.request_id}
+
+    @app.get("/timed")
+    async def timed(request: Request):
+        add_server_timing(request.scope, "db", 1.5)
+        return {}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.include_router(GraphQLRouter(strawberry.Schema(query=Query)), prefix="/graphql")
+
+    if legacy:
+        app.add_middleware(LegacyRequestIDMiddleware)
+        app.add_middleware(LegacyTimingMiddleware)
+    else:
+        app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+# ==================== 동작 ====================
+
+
+async def test_sets_request_id_and_server_timing():
+    async with _client(create_app(legacy=False)) as client:
+        response = await client.get("/health")
+
+    request_id = response.headers["x-request-id"]
+    assert response.json()["request_id"] == request_id
+    assert response.headers["server-timing"].startswith("app;dur=")
+    assert float(response.headers["x-process-time"]) >= 0
+
+
+async def test_keeps_valid_incoming_request_id():
+    async with _client(create_app(legacy=False)) as client:
+        valid = await client.get("/health", headers={"X-Request-ID": "trace-123"})
+        invalid = await client.get("/health", headers={"X-Request-ID": "bad id\r\nx: y"})
+
+    assert valid.headers["x-request-id"] == "trace-123"
+    assert invalid.headers["x-request-id"] != "bad id\r\nx: y"
+
+
+async def test_additional_server_timing_entries():
+    async with _client(create_app(legacy=False)) as client:
+        response = await client.get("/timed")
+
+    assert "db;dur=1.500" in response.headers["server-timing"]
+
+
+async def test_streaming_response_passes_through():
+    async with _client(create_app(legacy=False)) as client:
+        response = await client.get("/stream")
+
+    assert response.text == "0\n1\n2\n"
+    assert "x-request-id" in response.headers
+
+
+# ==================== 벤치마크 ====================
+
+
+async def _requests_per_second(app: FastAPI, send: Callable, number: int) -> float:
+    async with _client(app) as client:
+        for _ in range(20):  # 워밍업
+            response = await send(client)
+            assert response.status_code == 200
+
+        best = 0.0
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(number):
+                await send(client)
+            best = max(best, number / (time.perf_counter() - start))
+        return best
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        pytest.param(lambda client: client.get("/health"), id="health"),
+        pytest.param(
+            lambda client: client.post("/graphql", json={"query": "{ hello }"}), id="graphql"
+        ),
+    ],
+)
+async def test_benchmark_pure_asgi_vs_base_http_middleware(endpoint):
+    """순수 ASGI 미들웨어 1단이 BaseHTTPMiddleware 2단보다 처리량이 높음"""
+    number = 300
+    legacy_rps = await _requests_per_second(create_app(legacy=True), endpoint, number)
+    asgi_rps = await _requests_per_second(create_app(legacy=False), endpoint, number)
+
+    assert asgi_rps > legacy_rps, (
+        f"BaseHTTPMiddleware x2: {legacy_rps:.0f} req/s, pure ASGI: {asgi_rps:.0f} req/s"
+    )
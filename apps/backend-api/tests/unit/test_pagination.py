@@ -0,0 +1,50 @@
+"""페이지 크기(first/limit) 검증 테스트
+
+first가 1 ~ MAX_PAGE_SIZE 범위를 벗어나면 쿼리를 실행하기 전에 ValidationError가
+발생하는지, 오프셋 목록의 limit은 MAX_PAGE_SIZE로 제한되는지 검증합니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.exceptions import ValidationError
+from src.graphql.common import MAX_PAGE_SIZE, clamp_limit, validate_first
+from src.graphql.manager.idam.users.queries import ManagerUserQueries
+
+
+class _FailingSession:
+    """execute()가 호출되면 실패하는 AsyncSession 대역"""
+
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("first 검증 전에 쿼리가 실행됨")
+
+
+@pytest.mark.parametrize("first", [1, 20, MAX_PAGE_SIZE])
+def test_validate_first_accepts_range(first):
+    assert validate_first(first) == first
+
+
+@pytest.mark.parametrize("first", [0, -1, MAX_PAGE_SIZE + 1, 1_000_000])
+def test_validate_first_rejects_out_of_range(first):
+    with pytest.raises(ValidationError) as exc_info:
+        validate_first(first)
+
+    assert exc_info.value.detail == {"first": first, "max": MAX_PAGE_SIZE}
+
+
+def test_clamp_limit():
+    """오프셋 목록 limit은 거부하지 않고 0 ~ MAX_PAGE_SIZE로 제한"""
+    assert clamp_limit(20) == 20
+    assert clamp_limit(100_000) == MAX_PAGE_SIZE
+    assert clamp_limit(-5) == 0
+    assert clamp_limit(100_000, MAX_PAGE_SIZE + 1) == MAX_PAGE_SIZE + 1
+
+
+@pytest.mark.parametrize("first", [0, MAX_PAGE_SIZE + 1])
+async def test_connection_resolver_rejects_before_query(first):
+    """Connection 리졸버는 DB 조회 전에 first를 거부"""
+    info = SimpleNamespace(context=SimpleNamespace(manager_db_session=_FailingSession()))
+
+    with pytest.raises(ValidationError):
+        await ManagerUserQueries.users_connection(None, info, first=first)
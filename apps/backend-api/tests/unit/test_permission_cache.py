@@ -0,0 +1,234 @@
+"""사용자 권한 캐시 단위 테스트
+
+fakeredis로 권한 집합 캐시의 적중(로컬 LRU/Redis), 역할 만료 시각에 맞춘 TTL,
+역할/권한 Mutation 커밋 이후의 무효화와 롤백 시 무효화 취소를 검증합니다.
+Mutation은 SQLite 동기 세션을 감싼 AsyncSession 대역으로 실행합니다.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.core import database
+from src.core.permission_cache import PermissionCache
+from src.graphql.manager.idam.permissions import mutations as permission_mutations
+from src.graphql.manager.idam.roles import mutations as role_mutations
+from src.models.manager.idam.permission import Permission
+from src.models.manager.idam.role import Role
+from src.models.manager.idam.user_role import UserRole
+
+
+class _AsyncSessionAdapter:
+    """Mutation 함수가 쓰는 AsyncSession 메서드를 동기 Session으로 실행하는 대역"""
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    async def execute(self, statement, params=None, **kwargs):
+        return self.sync_session.execute(statement, params, **kwargs)
+
+    async def flush(self) -> None:
+        self.sync_session.flush()
+
+    async def commit(self) -> None:
+        self.sync_session.commit()
+
+    async def rollback(self) -> None:
+        self.sync_session.rollback()
+
+
+@dataclass
+class _RoleUpdate:
+    name: str | None = None
+    status: str | None = None
+
+
+@dataclass
+class _PermissionUpdate:
+    resource: str
+    action: str
+    name: str | None = None
+    status: str | None = None
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cache(monkeypatch, redis):
+    cache = PermissionCache(redis_factory=lambda: redis)
+    monkeypatch.setattr(role_mutations, "permission_cache", cache)
+    monkeypatch.setattr(permission_mutations, "permission_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS idam")
+
+    for model in (Permission, Role, UserRole):
+        model.__table__.create(engine)
+
+    with Session(engine, expire_on_commit=False) as session:
+        yield _AsyncSessionAdapter(session)
+    engine.dispose()
+
+
+def _loader(keys, expires_at=None):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return keys, expires_at
+
+    return load, calls
+
+
+async def _settle():
+    await asyncio.gather(*database._after_commit_tasks)
+
+
+# ==================== 조회 ====================
+
+
+async def test_cache_hit_skips_loader(cache, redis):
+    """첫 조회 후에는 로컬 LRU, 로컬 만료 후에는 Redis에서 조회"""
+    load, calls = _loader(["user:read", "user:list"])
+
+    assert await cache.get("u1", load) == {"user:read", "user:list"}
+    assert await cache.get("u1", load) == {"user:read", "user:list"}
+    cache.clear_local()
+    assert await cache.get("u1", load) == {"user:read", "user:list"}
+
+    assert len(calls) == 1
+    assert await redis.exists("perm:user:u1")
+
+
+async def test_empty_permissions_are_cached(cache):
+    load, calls = _loader([])
+
+    assert await cache.get("u1", load) == frozenset()
+    assert await cache.get("u1", load) == frozenset()
+    assert len(calls) == 1
+
+
+async def test_role_expiry_limits_ttl(cache, redis):
+    """역할 만료 시각까지만 캐시 (Redis TTL, 로컬 TTL 모두)"""
+    load, _ = _loader(["user:read"], datetime.now(UTC) + timedelta(seconds=5))
+
+    await cache.get("u1", load)
+
+    assert 0 < await redis.ttl("perm:user:u1") <= 5
+    expires_at, _ = cache._local["u1"]
+    assert expires_at - time.monotonic() <= 5
+
+
+async def test_expired_grant_is_not_cached(cache, redis):
+    load, calls = _loader(["user:read"], datetime.now(UTC) - timedelta(seconds=1))
+
+    await cache.get("u1", load)
+    await cache.get("u1", load)
+
+    assert len(calls) == 2
+    assert not await redis.exists("perm:user:u1")
+
+
+# ==================== Mutation 이후 무효화 ====================
+
+
+async def _cache_users(cache, *user_ids):
+    for user_id in user_ids:
+        load, _ = _loader(["role:read"])
+        await cache.get(str(user_id), load)
+
+
+def _seed_role(db, *user_ids) -> UUID:
+    role = Role(code=f"R{uuid4().hex[:8]}", name="역할", scope="TENANT")
+    db.sync_session.add(role)
+    db.sync_session.flush()
+    for user_id in user_ids:
+        db.sync_session.add(UserRole(user_id=user_id, role_id=role.id))
+    db.sync_session.commit()
+    return role.id
+
+
+async def test_role_status_change_invalidates_role_users(cache, redis, db):
+    member, other = uuid4(), uuid4()
+    role_id = _seed_role(db, member)
+    await _cache_users(cache, member, other)
+
+    await role_mutations.update_manager_role(db, role_id, _RoleUpdate(status="INACTIVE"))
+    await _settle()
+
+    assert cache.get_local(str(member)) is None
+    assert not await redis.exists(f"perm:user:{member}")
+    assert cache.get_local(str(other)) is not None
+
+
+async def test_role_rename_keeps_cache(cache, db):
+    member = uuid4()
+    role_id = _seed_role(db, member)
+    await _cache_users(cache, member)
+
+    await role_mutations.update_manager_role(db, role_id, _RoleUpdate(name="이름만 변경"))
+    await _settle()
+
+    assert cache.get_local(str(member)) is not None
+
+
+async def test_permission_update_invalidates_all(cache, redis, db):
+    permission = Permission(
+        code="users.read", name="조회", category="사용자", resource="users", action="READ"
+    )
+    db.sync_session.add(permission)
+    db.sync_session.commit()
+    users = [uuid4(), uuid4()]
+    await _cache_users(cache, *users)
+
+    await permission_mutations.update_manager_permission(
+        db, permission.id, _PermissionUpdate("users", "READ", status="INACTIVE")
+    )
+    await _settle()
+
+    for user_id in users:
+        assert cache.get_local(str(user_id)) is None
+        assert not await redis.exists(f"perm:user:{user_id}")
+
+
+async def test_invalidation_waits_for_commit_and_drops_on_rollback(cache, db):
+    """커밋 전에는 유지하고, 롤백되면 예약한 무효화를 버림"""
+    await _cache_users(cache, "u1")
+
+    cache.invalidate_all_after_commit(db)
+    await db.execute(text("SELECT 1"))
+    await _settle()
+    assert cache.get_local("u1") is not None
+
+    await db.rollback()
+    await db.execute(text("SELECT 1"))
+    await db.commit()
+    await _settle()
+    assert cache.get_local("u1") is not None
+
+    cache.invalidate_all_after_commit(db)
+    await db.execute(text("SELECT 1"))
+    await db.commit()
+    await _settle()
+    assert cache.get_local("u1") is None
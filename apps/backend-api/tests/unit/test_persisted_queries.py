@@ -0,0 +1,208 @@
+"""영속 쿼리(APQ/허용 목록) + 검증된 문서 캐시 단위 테스트
+
+fakeredis로 PersistedQueryStore.resolve의 해시 조회/등록/불일치, 허용 목록 모드의
+일반/APQ 문서 거부, GET 요청의 extensions 해석(라우터), DocumentCacheExtension이
+이전에 검증을 통과한 문서만 검증을 건너뛰는지 검증합니다.
+"""
+
+import json
+
+import fakeredis.aioredis
+import httpx
+import pytest
+import strawberry
+from fastapi import FastAPI
+
+from src.graphql.extensions import DocumentCacheExtension
+from src.graphql.persisted_queries import (
+    PersistedQueryError,
+    PersistedQueryStore,
+    query_hash,
+)
+from src.graphql.router import PersistedQueryGraphQLRouter
+
+
+QUERY = "{ hello }"
+OTHER_QUERY = "{ hello other: hello }"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+def _apq(query: str | None = None, digest: str | None = None) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": digest or query_hash(query or "")}}
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def make_store(redis, tmp_path):
+    def make(manifest: dict | None = None, **kwargs) -> PersistedQueryStore:
+        paths = []
+        if manifest is not None:
+            path = tmp_path / "manifest.json"
+            path.write_text(json.dumps(manifest), encoding="utf-8")
+            paths.append(str(path))
+        store = PersistedQueryStore("test", manifest_paths=paths, **kwargs)
+        store._apq._redis_factory = lambda: redis
+        return store
+
+    return make
+
+
+async def _resolve_error(store, query, extensions) -> str:
+    with pytest.raises(PersistedQueryError) as exc_info:
+        await store.resolve(query, extensions)
+    return exc_info.value.code
+
+
+# ==================== APQ ====================
+
+
+async def test_plain_query_passes_through(make_store):
+    store = make_store()
+
+    assert await store.resolve(QUERY, None) == QUERY
+    assert await store.resolve(QUERY, {}) == QUERY
+
+
+async def test_hash_only_not_found_then_registered(make_store):
+    """미등록 해시는 NOT_FOUND, 문서와 함께 재전송하면 등록되어 이후 해시만으로 조회"""
+    store = make_store()
+
+    assert await _resolve_error(store, None, _apq(QUERY)) == "PERSISTED_QUERY_NOT_FOUND"
+
+    assert await store.resolve(QUERY, _apq(QUERY)) == QUERY
+    assert await store.resolve(None, _apq(QUERY)) == QUERY
+
+
+async def test_hash_only_found_in_redis_from_other_worker(make_store):
+    await make_store().resolve(QUERY, _apq(QUERY))
+
+    # 다른 워커 (로컬 LRU 비어 있음)
+    assert await make_store().resolve(None, _apq(QUERY)) == QUERY
+
+
+async def test_hash_mismatch_is_rejected(make_store):
+    store = make_store()
+
+    code = await _resolve_error(store, QUERY, _apq(digest=query_hash(OTHER_QUERY)))
+
+    assert code == "PERSISTED_QUERY_HASH_MISMATCH"
+    # 잘못된 해시로 등록되지 않음
+    assert await _resolve_error(store, None, _apq(OTHER_QUERY)) == "PERSISTED_QUERY_NOT_FOUND"
+
+
+async def test_invalid_extension_format(make_store):
+    store = make_store()
+
+    extensions = {"persistedQuery": {"version": 2, "sha256Hash": query_hash(QUERY)}}
+    assert await _resolve_error(store, None, extensions) == "PERSISTED_QUERY_INVALID"
+
+
+async def test_apq_disabled(make_store):
+    store = make_store(apq_enabled=False)
+
+    assert await _resolve_error(store, QUERY, _apq(QUERY)) == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+
+# ==================== 허용 목록 ====================
+
+
+async def test_allow_list_rejects_unlisted_plain_query(make_store):
+    store = make_store({query_hash(QUERY): QUERY}, allow_list_only=True)
+
+    assert await store.resolve(QUERY, None) == QUERY
+    assert await _resolve_error(store, OTHER_QUERY, None) == "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+async def test_allow_list_rejects_unlisted_apq_document(make_store, redis):
+    """허용 목록 모드에서는 APQ 문서를 등록하지 않고, 등록된 APQ 문서도 조회하지 않음"""
+    store = make_store({query_hash(QUERY): QUERY}, allow_list_only=True)
+
+    code = await _resolve_error(store, OTHER_QUERY, _apq(OTHER_QUERY))
+    assert code == "PERSISTED_QUERY_NOT_ALLOWED"
+
+    await make_store().resolve(OTHER_QUERY, _apq(OTHER_QUERY))
+    assert await _resolve_error(store, None, _apq(OTHER_QUERY)) == "PERSISTED_QUERY_NOT_FOUND"
+
+
+async def test_allow_list_apollo_manifest(make_store):
+    """apollo-persisted-query-manifest 형식 (id가 해시가 아니어도 문서로 허용)"""
+    manifest = {
+        "format": "apollo-persisted-query-manifest",
+        "version": 1,
+        "operations": [
+            {"id": "hello-op", "name": "Hello", "type": "query", "body": QUERY},
+        ],
+    }
+    store = make_store(manifest, allow_list_only=True)
+
+    assert len(store) == 1
+    assert await store.resolve(None, _apq(digest="hello-op")) == QUERY
+    assert await store.resolve(QUERY, None) == QUERY
+
+
+# ==================== 라우터 (GET) ====================
+
+
+@pytest.fixture
+def client(make_store):
+    store = make_store()
+    app = FastAPI()
+    schema = strawberry.Schema(query=Query)
+    app.include_router(
+        PersistedQueryGraphQLRouter(schema, persisted_queries=store), prefix="/graphql"
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_get_with_extensions(client):
+    """GET 쿼리 문자열의 extensions(JSON)로 등록/조회 (GraphiQL로 응답하지 않음)"""
+    async with client:
+        params = {"extensions": json.dumps(_apq(QUERY))}
+        missing = await client.get("/graphql", params=params)
+        registered = await client.get("/graphql", params={**params, "query": QUERY})
+        found = await client.get("/graphql", params=params, headers={"Accept": "text/html"})
+
+    assert missing.status_code == 200
+    assert missing.json()["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert registered.json() == {"data": {"hello": "world"}}
+    assert found.json() == {"data": {"hello": "world"}}
+
+
+# ==================== 문서 캐시 ====================
+
+
+def _cached_schema(name: str) -> tuple[strawberry.Schema, type[DocumentCacheExtension]]:
+    extension = DocumentCacheExtension.for_schema(name)
+    return strawberry.Schema(query=Query, extensions=[extension]), extension
+
+
+async def test_document_cache_hit_skips_parse_and_validation():
+    schema, extension = _cached_schema("test-document-hit")
+
+    first = await schema.execute(QUERY)
+    second = await schema.execute(QUERY)
+
+    assert first.data == second.data == {"hello": "world"}
+    assert extension.documents.metrics() == {"size": 1, "hits": 1, "misses": 1}
+
+
+async def test_document_cache_revalidates_invalid_documents():
+    """검증에 실패한 문서는 저장하지 않으므로 매번 다시 검증해 오류 반환"""
+    schema, extension = _cached_schema("test-document-invalid")
+
+    for _ in range(2):
+        result = await schema.execute("{ missing }")
+        assert result.errors
+        assert "missing" in result.errors[0].message
+
+    assert extension.documents.metrics() == {"size": 0, "hits": 0, "misses": 2}
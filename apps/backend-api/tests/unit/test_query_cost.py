@@ -0,0 +1,194 @@
+"""GraphQL 쿼리 비용 분석 + 실행 허용(admission) 단위 테스트
+
+작은 Strawberry 스키마로 중첩 목록, 스칼라 목록, 프래그먼트, 변수, 목록 크기 상한에 따른
+비용/깊이를 검증하고, CostAdmission의 예산 대기/거부를 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+import strawberry
+
+from graphql import parse
+from src.graphql.common import MAX_PAGE_SIZE
+from src.graphql.query_cost import (
+    DEFAULT_LIST_SIZE,
+    RESOLVER_FIELD_COST,
+    CostAdmission,
+    QueryCostError,
+    analyze_query,
+)
+
+
+@strawberry.type
+class Item:
+    id: strawberry.ID
+    name: str
+    tags: list[str]
+
+    @strawberry.field
+    def children(self, limit: int = 5) -> list["Item"]:
+        return []
+
+
+@strawberry.type
+class ItemPage:
+    items: list[Item]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, limit: int = 10) -> list[Item]:
+        return []
+
+    @strawberry.field
+    def names(self, limit: int = 10) -> list[str]:
+        return []
+
+    @strawberry.field
+    def page(self, first: int = 20) -> ItemPage:
+        return ItemPage(items=[])
+
+
+schema = strawberry.Schema(query=Query)
+
+
+def _cost(query: str, variables: dict | None = None, operation_name: str | None = None):
+    return analyze_query(schema._schema, parse(query), operation_name, variables)
+
+
+def test_list_of_scalars_costs_per_item():
+    """하위 비용이 0인 스칼라 목록도 항목당 1"""
+    assert _cost("{ names(limit: 50) }").cost == RESOLVER_FIELD_COST + 50
+    # 기본 리졸버 스칼라 목록은 DEFAULT_LIST_SIZE로 추정
+    assert _cost("{ items(limit: 2) { tags } }").cost == (
+        RESOLVER_FIELD_COST + 2 * DEFAULT_LIST_SIZE
+    )
+
+
+def test_list_of_leaf_objects_costs_per_item():
+    assert _cost("{ items(limit: 3) { id name } }").cost == RESOLVER_FIELD_COST + 3
+
+
+def test_nested_lists_multiply():
+    cost = _cost("{ items(limit: 3) { children(limit: 4) { id } } }")
+
+    children = RESOLVER_FIELD_COST + 4
+    assert cost.cost == RESOLVER_FIELD_COST + 3 * children
+    assert cost.depth == 3
+
+
+def test_fragments_are_expanded():
+    nested = _cost("{ items(limit: 3) { children(limit: 4) { id } } }").cost
+    named = _cost(
+        """
+        query { items(limit: 3) { ...ItemChildren } }
+        fragment ItemChildren on Item { children(limit: 4) { id } }
+        """
+    )
+    inline = _cost("{ items(limit: 3) { ... on Item { children(limit: 4) { id } } } }")
+
+    assert named.cost == nested
+    assert inline.cost == nested
+
+
+def test_recursive_fragment_spread_is_ignored():
+    cost = _cost(
+        """
+        query { items(limit: 1) { ...A } }
+        fragment A on Item { id ...A }
+        """
+    )
+
+    assert cost.cost == RESOLVER_FIELD_COST + 1
+
+
+def test_list_size_from_variables():
+    query = "query Items($n: Int!) { items(limit: $n) { id } }"
+
+    assert _cost(query, {"n": 7}).cost == RESOLVER_FIELD_COST + 7
+    assert _cost(query, {"n": 70}).cost == RESOLVER_FIELD_COST + 70
+
+
+def test_list_size_defaults_to_argument_default():
+    assert _cost("{ items { id } }").cost == RESOLVER_FIELD_COST + 10
+
+
+def test_list_size_is_clamped_to_max_page_size():
+    """조회 헬퍼가 MAX_PAGE_SIZE로 제한하므로 비용도 같은 상한으로 계산"""
+    assert _cost("{ names(limit: 100000) }").cost == RESOLVER_FIELD_COST + MAX_PAGE_SIZE
+
+
+def test_single_field_limit_applies_to_child_list():
+    """Connection처럼 first를 받는 단건 필드는 그 값을 하위 목록 크기로 사용"""
+    cost = _cost("{ page(first: 5) { items { id } } }")
+
+    # page(리졸버) + items(객체 필드 1 + 5 × 1)
+    assert cost.cost == RESOLVER_FIELD_COST + 1 + 5
+
+
+def test_introspection_is_free():
+    assert _cost("{ __typename }").cost == 0
+
+
+def test_operation_name_selects_operation():
+    query = "query A { names(limit: 1) } query B { names(limit: 2) }"
+
+    assert _cost(query, operation_name="B").cost == RESOLVER_FIELD_COST + 2
+
+
+# ==================== CostAdmission ====================
+
+
+async def test_admission_rejects_cost_over_budget():
+    admission = CostAdmission(budget=100)
+
+    with pytest.raises(QueryCostError) as exc_info:
+        await admission.acquire("acme", 101)
+
+    assert exc_info.value.code == "QUERY_COST_BUDGET_EXCEEDED"
+    assert exc_info.value.detail == {"cost": 101, "budget": 100}
+
+
+async def test_admission_tracks_in_flight_per_subject():
+    admission = CostAdmission(budget=100, budgets={"big": 1000})
+
+    assert await admission.acquire("acme", 60) == 0.0
+    assert await admission.acquire("other", 60) == 0.0
+    assert await admission.acquire("big", 600) == 0.0
+    assert admission.in_flight("acme") == 60
+
+    await admission.release("acme", 60)
+    assert admission.in_flight("acme") == 0
+
+
+async def test_admission_waits_for_release():
+    """예산이 모자라면 먼저 실행 중인 쿼리가 끝날 때까지 대기"""
+    admission = CostAdmission(budget=100, timeout=5)
+    await admission.acquire("acme", 80)
+
+    waiter = asyncio.create_task(admission.acquire("acme", 50))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await admission.release("acme", 80)
+    waited = await asyncio.wait_for(waiter, 1)
+
+    assert waited > 0
+    assert admission.in_flight("acme") == 50
+
+
+async def test_admission_timeout_rejects():
+    admission = CostAdmission(budget=100, timeout=0.05)
+    await admission.acquire("acme", 80)
+
+    with pytest.raises(QueryCostError) as exc_info:
+        await admission.acquire("acme", 50)
+
+    assert exc_info.value.detail["in_flight"] == 80
+    assert admission._waiting == {}
+
+    # 대기자가 없으면 release 시 Condition 정리
+    await admission.release("acme", 80)
+    assert admission._conditions == {}
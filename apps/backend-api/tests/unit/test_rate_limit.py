@@ -0,0 +1,147 @@
+"""Redis 요청 제한 단위 테스트
+
+fakeredis(Lua 지원)로 슬라이딩 윈도우/토큰 버킷 판정과 통계 누적을 검증합니다.
+"""
+
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+
+from src.core.exceptions import RateLimitExceededError
+from src.core.rate_limit import RateLimiter, RateLimitRule, api_key_default_rules
+
+
+class _Clock:
+    """고정 시각 (초)"""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def limiter(clock):
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return RateLimiter(redis_factory=lambda: redis, clock=clock, throttle_max_delay=0.0)
+
+
+async def test_sliding_window_blocks_over_limit(limiter, clock):
+    rule = RateLimitRule(subject="user:a", limit=3, window=60)
+
+    results = [await limiter.hit([rule]) for _ in range(4)]
+
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert results[2].remaining == 0
+    assert results[3].rule == rule
+    assert 0 < results[3].retry_after <= 60
+
+
+async def test_window_slides(limiter, clock):
+    rule = RateLimitRule(subject="user:a", limit=2, window=60)
+
+    assert (await limiter.hit([rule])).allowed
+    clock.now += 30
+    assert (await limiter.hit([rule])).allowed
+    assert not (await limiter.hit([rule])).allowed
+
+    # 첫 요청이 윈도우를 벗어나면 1건 허용
+    clock.now += 31
+    assert (await limiter.hit([rule])).allowed
+    assert not (await limiter.hit([rule])).allowed
+
+
+async def test_burst_allowance_refills(limiter, clock):
+    rule = RateLimitRule(subject="apikey:k", limit=2, window=60, burst=2)
+
+    results = [(await limiter.hit([rule])).allowed for _ in range(5)]
+    assert results == [True, True, True, True, False]
+
+    # burst / window 속도로 토큰 충전 (30초에 1개)
+    clock.now += 30
+    assert (await limiter.hit([rule])).allowed
+    assert not (await limiter.hit([rule])).allowed
+
+
+async def test_blocked_request_does_not_consume_other_rules(limiter):
+    tight = RateLimitRule(subject="user:a", limit=1, window=60)
+    loose = RateLimitRule(subject="tenant:t", limit=2, window=60)
+
+    assert (await limiter.hit([tight, loose])).allowed
+    assert not (await limiter.hit([tight, loose])).allowed
+    assert not (await limiter.hit([tight, loose])).allowed
+
+    # 차단된 요청은 테넌트 한도를 소모하지 않음
+    assert (await limiter.hit([loose])).allowed
+
+
+async def test_log_only_rule_allows(limiter):
+    rule = RateLimitRule(subject="user:a", limit=1, window=60, action="LOG_ONLY")
+
+    assert all([(await limiter.hit([rule])).allowed for _ in range(3)])
+
+
+async def test_enforce_raises(limiter):
+    rule = RateLimitRule(subject="user:a", limit=1, window=60, action="THROTTLE")
+
+    await limiter.enforce([rule])
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        await limiter.enforce([rule])
+
+    assert exc_info.value.code == "RATE_LIMIT_EXCEEDED"
+    assert exc_info.value.retry_after > 0
+
+
+async def test_hit_uses_evalsha(clock):
+    """스크립트 본문은 EVAL로 매번 보내지 않고 SHA(EVALSHA)로 호출, NOSCRIPT 시 재등록"""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    limiter = RateLimiter(redis_factory=lambda: redis, clock=clock, throttle_max_delay=0.0)
+    rule = RateLimitRule(subject="user:a", limit=2, window=60)
+
+    async def no_eval(*args, **kwargs):
+        raise AssertionError("EVAL 호출됨")
+
+    redis.eval = no_eval
+
+    assert (await limiter.hit([rule])).allowed
+    assert await redis.script_exists(limiter._hit_script.sha) == [True]
+
+    # 스크립트 캐시가 비워져도(Redis 재시작 등) 재등록 후 판정
+    await redis.script_flush()
+    assert (await limiter.hit([rule])).allowed
+    assert not (await limiter.hit([rule])).allowed
+
+
+async def test_stats_are_collected_per_rule(limiter):
+    rule_id = str(uuid4())
+    rule = RateLimitRule(subject="user:a", limit=2, window=60, rule_id=rule_id)
+
+    for _ in range(3):
+        await limiter.hit([rule])
+
+    assert await limiter.collect_stats() == {rule_id: {"total": 3, "blocked": 1, "usage": 2}}
+    # 꺼낸 통계는 Redis에서 제거됨
+    assert await limiter.collect_stats() == {}
+
+
+def test_api_key_default_rules():
+    rules = api_key_default_rules(
+        {
+            "api_key_id": "k",
+            "rate_limit_per_minute": 10,
+            "rate_limit_per_hour": None,
+            "rate_limit_per_day": 1000,
+        }
+    )
+
+    assert [(r.subject, r.limit, r.window) for r in rules] == [
+        ("apikey:k", 10, 60),
+        ("apikey:k", 1000, 86400),
+    ]
@@ -0,0 +1,199 @@
+"""로그인 세션 검증 단위 테스트
+
+fakeredis로 검증 캐시(로컬 LRU → Redis → DB), 폐기 목록, 활동 시각 일괄 반영을
+검증합니다.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy.orm import Session
+
+from src.core import database, session_auth
+from src.core.cache import TwoLevelCache
+from src.core.config import settings
+from src.core.session_auth import (
+    ACTIVITY_PREFIX,
+    REVOKED_PREFIX,
+    SessionActivityRecorder,
+    revoke_session_after_commit,
+    revoke_session_cache,
+    validate_session,
+)
+
+
+USER_ID = str(uuid4())
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class _FakeSession:
+    """세션 조회(SELECT)와 활동 시각 UPDATE(executemany)만 흉내 내는 AsyncSession 대역"""
+
+    def __init__(self, state: SimpleNamespace):
+        self.state = state
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        if params is not None:
+            if self.state.fail:
+                raise ConnectionError("db down")
+            self.state.updates.append(params)
+            return None
+        self.state.selects += 1
+        session_id = stmt.compile().params["session_id_1"]
+        return _FakeResult(self.state.sessions.get(session_id))
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """ManagerSessionLocal 대역 (sessions: session_id → 행)"""
+    state = SimpleNamespace(sessions={}, selects=0, updates=[], fail=False)
+    monkeypatch.setattr(database, "ManagerSessionLocal", lambda: _FakeSession(state))
+    return state
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch, redis):
+    monkeypatch.setattr(session_auth, "get_redis", lambda: redis)
+    monkeypatch.setattr(
+        session_auth, "session_cache", TwoLevelCache("session:valid", redis_factory=lambda: redis)
+    )
+    monkeypatch.setattr(session_auth, "session_activity_recorder", SessionActivityRecorder())
+
+
+def _session(db, session_id: str, expires_in: timedelta = timedelta(hours=1)):
+    db.sessions[session_id] = SimpleNamespace(
+        id=uuid4(), user_id=USER_ID, expires_at=datetime.now(UTC) + expires_in
+    )
+
+
+async def test_validate_session_is_cached(db):
+    """첫 검증 후에는 DB 조회 없이 로컬/Redis 캐시로 검증"""
+    _session(db, "s1")
+
+    assert await validate_session("s1", USER_ID)
+    assert await validate_session("s1", USER_ID)
+    assert db.selects == 1
+
+    session_auth.session_cache.clear_local()
+    assert await validate_session("s1", USER_ID)
+    assert db.selects == 1
+
+
+async def test_validate_session_rejects(db):
+    """다른 사용자, 만료, 존재하지 않는(비활성) 세션은 거부"""
+    _session(db, "s1")
+    _session(db, "expired", expires_in=timedelta(seconds=-1))
+
+    assert not await validate_session("s1", str(uuid4()))
+    assert not await validate_session("expired", USER_ID)
+    assert not await validate_session("missing", USER_ID)
+    # 없는 세션은 캐시하지 않음
+    assert not await validate_session("missing", USER_ID)
+    assert db.selects == 4
+
+
+async def test_revoked_session_is_rejected(db, redis):
+    """폐기 시 폐기 목록에 추가하고 캐시를 지워, 다음 검증은 DB 조회 없이 거부"""
+    _session(db, "s1")
+    expires_at = db.sessions["s1"].expires_at
+    assert await validate_session("s1", USER_ID)
+
+    await revoke_session_cache(["s1"], expires_at)
+
+    assert session_auth.session_cache.get_local("s1") is None
+    assert 3590 < await redis.ttl(REVOKED_PREFIX + "s1") <= 3600
+    assert not await validate_session("s1", USER_ID)
+    assert db.selects == 1
+
+
+async def test_revoke_after_commit_waits_for_commit(db, redis):
+    """폐기 전파(폐기 목록 추가 + 캐시 무효화)는 커밋 후에 수행"""
+    _session(db, "s1")
+    assert await validate_session("s1", USER_ID)
+    manager_db = SimpleNamespace(sync_session=Session())
+
+    revoke_session_after_commit(manager_db, "s1", db.sessions["s1"].expires_at)
+    assert not await redis.exists(REVOKED_PREFIX + "s1")
+    assert session_auth.session_cache.get_local("s1") is not None
+
+    manager_db.sync_session.commit()
+    await asyncio.gather(*database._after_commit_tasks)
+
+    assert await redis.exists(REVOKED_PREFIX + "s1")
+    assert not await validate_session("s1", USER_ID)
+
+
+async def test_revocation_ttl_defaults_to_max_session_lifetime(redis):
+    await revoke_session_cache(["s1", "s2"])
+
+    assert await redis.ttl(REVOKED_PREFIX + "s2") == settings.session_revocation_ttl
+
+
+async def test_validate_touches_activity_once_per_interval(db):
+    """활동 시각은 세션별로 interval에 한 번만 기록 대상"""
+    _session(db, "s1")
+    recorder = session_auth.session_activity_recorder
+
+    for _ in range(3):
+        await validate_session("s1", USER_ID)
+
+    assert list(recorder._pending) == ["s1"]
+
+
+async def test_activity_flush_batches_and_skips_claimed(db, redis):
+    """모아둔 활동 시각을 단일 UPDATE로 반영, 다른 워커가 기록한 세션은 제외"""
+    recorder = SessionActivityRecorder(interval=60)
+    for session_id in ["s3", "s1", "s2"]:
+        recorder.touch(session_id)
+    await redis.set(ACTIVITY_PREFIX + "s2", 1)
+
+    assert await recorder.flush() == 2
+
+    [params] = db.updates
+    assert [p["b_session_id"] for p in params] == ["s1", "s3"]
+    assert await redis.ttl(ACTIVITY_PREFIX + "s1") == 60
+    assert await recorder.flush() == 0
+
+
+async def test_activity_flush_failure_is_not_retried(db):
+    recorder = SessionActivityRecorder()
+    recorder.touch("s1")
+    db.fail = True
+
+    assert await recorder.flush() == 0
+    assert recorder._pending == {}
+
+
+async def test_activity_stop_drains_pending(db):
+    recorder = SessionActivityRecorder(flush_interval=60)
+    recorder.start()
+    recorder.touch("s1")
+
+    await recorder.stop()
+
+    assert len(db.updates) == 1
@@ -0,0 +1,97 @@
+"""Manager 세션 조회 쿼리 수 회귀 테스트
+
+세션 목록 조회 시 사용자명을 세션마다 별도 조회(N+1)하지 않고
+JOIN으로 함께 가져오는지 DB 실행 횟수로 검증합니다.
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.graphql.manager.idam.sessions.queries import get_manager_sessions
+
+
+class _FakeResult:
+    """AsyncSession.execute() 결과 대역"""
+
+    def __init__(self, rows=None, scalar=None):
+        self._rows = rows or []
+        self._scalar = scalar
+
+    def scalar(self):
+        return self._scalar
+
+    def all(self):
+        return list(self._rows)
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: [row[0] for row in self._rows])
+
+
+class _CountingSession:
+    """execute() 호출 횟수를 기록하는 AsyncSession 대역"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        # 첫 번째 쿼리는 COUNT, 이후는 목록 조회
+        if len(self.statements) == 1:
+            return _FakeResult(scalar=len(self.rows))
+        return _FakeResult(rows=self.rows)
+
+
+def _make_rows(count: int):
+    """(세션 모델, 사용자명) 행 생성"""
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(count):
+        session = SimpleNamespace(
+            id=uuid4(),
+            session_id=f"session-{i}",
+            user_id=uuid4(),
+            tenant_context=None,
+            session_type="WEB",
+            fingerprint=None,
+            user_agent=None,
+            ip_address="127.0.0.1",
+            country_code=None,
+            city=None,
+            status="ACTIVE",
+            expires_at=now + timedelta(hours=1),
+            last_activity_at=now,
+            mfa_verified=False,
+            mfa_verified_at=None,
+            created_at=now,
+            updated_at=None,
+        )
+        rows.append((session, f"user{i}"))
+    return rows
+
+
+@pytest.mark.parametrize("page_size", [1, 20, 100])
+async def test_session_page_issues_constant_query_count(page_size):
+    """세션 페이지 크기와 관계없이 COUNT + 목록 = 2회만 조회"""
+    db = _CountingSession(_make_rows(page_size))
+
+    sessions, total = await get_manager_sessions(db, limit=page_size)
+
+    assert len(db.statements) == 2
+    assert total == page_size
+    assert len(sessions) == page_size
+
+
+async def test_session_page_maps_joined_usernames():
+    """JOIN으로 가져온 사용자명이 각 세션에 매핑됨"""
+    rows = _make_rows(3)
+    db = _CountingSession(rows)
+
+    sessions, _ = await get_manager_sessions(db, limit=3)
+
+    assert [s.username for s in sessions] == ["user0", "user1", "user2"]
+    # 목록 쿼리에 users 테이블 JOIN 포함
+    assert "JOIN idam.users" in str(db.statements[1])
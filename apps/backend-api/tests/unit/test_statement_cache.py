@@ -0,0 +1,123 @@
+"""공통 쿼리 헬퍼 문장 캐시 테스트 및 마이크로 벤치마크
+
+같은 모양(모델, 필터 키, 정렬)의 요청이 같은 문장 객체를 재사용하고,
+값은 bind 파라미터로만 전달되는지 검증합니다.
+벤치마크는 매 호출마다 select()를 구성하는 기존 방식과 캐시 조회 비용을 비교합니다.
+(benchmark 마커, RUN_BENCHMARKS=1 일 때만 실행)
+"""
+
+import timeit
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from src.graphql.common.statement_cache import (
+    select_by_id_statement,
+    select_count_statement,
+    select_list_statement,
+    statement_cache,
+)
+from src.models.manager.idam.user import User
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    statement_cache.clear()
+    yield
+    statement_cache.clear()
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_by_id_statement_reused_across_values():
+    """ID/필터 값이 달라도 같은 문장을 재사용하고 값은 파라미터로 전달"""
+    first_id, second_id = uuid4(), uuid4()
+
+    stmt1, params1 = select_by_id_statement(User, first_id, {"status": "ACTIVE"})
+    stmt2, params2 = select_by_id_statement(User, second_id, {"status": "LOCKED"})
+
+    assert stmt1 is stmt2
+    assert params1 == {"id_": first_id, "f_status": "ACTIVE"}
+    assert params2 == {"id_": second_id, "f_status": "LOCKED"}
+    assert "ACTIVE" not in _sql(stmt1)
+
+
+def test_by_id_statement_none_filter_uses_is_null():
+    """None 필터는 IS NULL 조건으로 별도 문장 사용"""
+    stmt_null, params = select_by_id_statement(User, uuid4(), {"phone": None})
+    stmt_value, _ = select_by_id_statement(User, uuid4(), {"phone": "010-0000-0000"})
+
+    assert stmt_null is not stmt_value
+    assert "phone IS NULL" in _sql(stmt_null)
+    assert "f_phone" not in params
+
+
+def test_list_statement_keyed_by_filter_set_and_order():
+    """필터 키 집합/정렬이 다르면 다른 문장, 같으면 페이지와 무관하게 같은 문장"""
+    stmt_a, params_a = select_list_statement(User, {"status": "ACTIVE", "user_type": None})
+    stmt_b, params_b = select_list_statement(User, {"status": "LOCKED"})
+    stmt_c, _ = select_list_statement(User, {"status": "ACTIVE"}, order_by=User.username.asc())
+
+    assert stmt_a is stmt_b
+    assert stmt_a is not stmt_c
+    assert params_a(_limit=20, _offset=0) == {"f_status": "ACTIVE", "_limit": 20, "_offset": 0}
+    assert params_b(_limit=20, _offset=40)["_offset"] == 40
+    assert "LIMIT %(_limit)s" in _sql(stmt_a)
+
+
+def test_uncacheable_order_by_is_not_stored():
+    """컬럼이 아닌 정렬 식은 캐시하지 않음"""
+    select_list_statement(User, {}, order_by=func.lower(User.username))
+
+    assert len(statement_cache) == 0
+
+
+def test_count_statement_reused():
+    stmt1, _ = select_count_statement(User, {"status": "ACTIVE"})
+    stmt2, params = select_count_statement(User, {"status": "LOCKED"})
+
+    assert stmt1 is stmt2
+    assert params == {"f_status": "LOCKED"}
+
+
+def test_cached_lookup_returns_same_statement():
+    """반복 조회는 같은 문장 객체를 반환하고 값은 매번 파라미터로 전달"""
+    filters = {"status": "ACTIVE", "user_type": "ADMIN"}
+    ids = [uuid4() for _ in range(3)]
+
+    results = [select_by_id_statement(User, id_, filters) for id_ in ids]
+
+    assert all(stmt is results[0][0] for stmt, _ in results)
+    assert [params["id_"] for _, params in results] == ids
+    assert len(statement_cache) == 1
+
+
+@pytest.mark.benchmark
+def test_benchmark_cached_statement_vs_rebuild():
+    """캐시된 문장 조회 + 캐시 키 계산이 매번 구성하는 방식보다 충분히 빠름"""
+    user_id = uuid4()
+    filters = {"status": "ACTIVE", "user_type": "ADMIN"}
+
+    def rebuild():
+        # 기존 get_by_id 방식: 매 호출 select() 구성 + SQLAlchemy 캐시 키 계산
+        stmt = select(User).where(User.id == user_id)
+        for field, value in filters.items():
+            stmt = stmt.where(getattr(User, field) == value)
+        stmt._generate_cache_key()
+
+    def cached():
+        stmt, _ = select_by_id_statement(User, user_id, filters)
+        stmt._generate_cache_key()
+
+    cached()  # 워밍업 (캐시 적재)
+    number = 200
+    rebuild_time = min(timeit.repeat(rebuild, number=number, repeat=3)) / number
+    cached_time = min(timeit.repeat(cached, number=number, repeat=3)) / number
+
+    assert cached_time * 3 < rebuild_time, (
+        f"rebuild: {rebuild_time * 1e6:.1f}us/call, cached: {cached_time * 1e6:.1f}us/call"
+    )
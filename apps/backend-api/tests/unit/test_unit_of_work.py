@@ -0,0 +1,310 @@
+"""요청 단위 트랜잭션(unit of work) 단위 테스트
+
+aiosqlite 파일 DB로 UnitOfWorkSession의 커밋 미루기/완료, 커밋 이후 작업 예약,
+GraphQLContext.end_unit_of_work의 세션별 커밋/롤백, UnitOfWorkExtension의
+성공 시 커밋, 리졸버 오류 시 롤백, 최종 커밋 실패 처리를 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+import strawberry
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core import database
+from src.core.database import UnitOfWorkSession, commit_now, run_after_commit
+from src.graphql.context import GraphQLContext
+from src.graphql.extensions import UnitOfWorkExtension
+
+
+async def _create_engine(path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE parents (id INTEGER PRIMARY KEY)"))
+        # 최종 커밋 실패 재현용 (커밋 시점에 검사하는 외래 키)
+        await conn.execute(
+            text(
+                "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+                "parent_id INTEGER REFERENCES parents(id) DEFERRABLE INITIALLY DEFERRED)"
+            )
+        )
+    return engine
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Manager DB 역할 세션 팩토리"""
+    engine = await _create_engine(tmp_path / "manager.db")
+    yield async_sessionmaker(engine, class_=UnitOfWorkSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def tenant_factory(tmp_path):
+    """Tenant DB 역할 세션 팩토리 (SQLite는 파일당 쓰기 트랜잭션이 하나이므로 별도 파일)"""
+    engine = await _create_engine(tmp_path / "tenant.db")
+    yield async_sessionmaker(engine, class_=UnitOfWorkSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _insert(db, name: str, parent_id: int | None = None) -> None:
+    await db.execute(
+        text("INSERT INTO items (name, parent_id) VALUES (:name, :parent_id)"),
+        {"name": name, "parent_id": parent_id},
+    )
+
+
+async def _names(session_factory) -> list[str]:
+    async with session_factory() as db:
+        return list((await db.scalars(text("SELECT name FROM items ORDER BY id"))).all())
+
+
+def _context(session_factory, tenant_factory=None) -> GraphQLContext:
+    return GraphQLContext(
+        request=None,
+        user_id="user-1",
+        username="alice",
+        role="ADMIN",
+        manager_session_factory=session_factory,
+        tenant_session_factory=tenant_factory,
+    )
+
+
+# ==================== UnitOfWorkSession ====================
+
+
+async def test_deferred_commit_only_flushes(session_factory):
+    """defer_commits() 이후 commit()은 저장하지 않고 complete(True)에서 한 번 커밋"""
+    async with session_factory() as db:
+        db.defer_commits()
+        await _insert(db, "a")
+        await db.commit()
+        await _insert(db, "b")
+        await db.commit()
+
+        assert db.deferred_commits == 2
+        assert await _names(session_factory) == []
+
+        assert await db.complete(commit=True)
+        assert not db.deferring
+
+    assert await _names(session_factory) == ["a", "b"]
+
+
+async def test_complete_without_commit_rolls_back(session_factory):
+    async with session_factory() as db:
+        db.defer_commits()
+        await _insert(db, "a")
+        await db.commit()
+
+        assert not await db.complete(commit=False)
+
+    assert await _names(session_factory) == []
+
+
+async def test_rollback_during_unit_of_work_blocks_commit(session_factory):
+    """작업 중 롤백되면 이후 변경이 있어도 complete(True)에서 커밋하지 않음"""
+    async with session_factory() as db:
+        db.defer_commits()
+        await _insert(db, "a")
+        await db.rollback()
+        await _insert(db, "b")
+        await db.commit()
+
+        assert not await db.complete(commit=True)
+
+    assert await _names(session_factory) == []
+
+
+async def test_commit_now_commits_while_deferring(session_factory):
+    async with session_factory() as db:
+        db.defer_commits()
+        await _insert(db, "lock")
+        await commit_now(db)
+        await _insert(db, "b")
+        await db.complete(commit=False)
+
+    assert await _names(session_factory) == ["lock"]
+
+
+# ==================== 커밋 이후 작업 ====================
+
+
+async def test_run_after_commit_waits_for_real_commit(session_factory):
+    """미룬 commit()에서는 실행하지 않고 실제 커밋 후 합쳐진 대상으로 한 번 실행"""
+    calls = []
+
+    async def callback(items):
+        calls.append(items)
+
+    async with session_factory() as db:
+        db.defer_commits()
+        await _insert(db, "a")
+        run_after_commit(db, "test", ["k1"], callback)
+        run_after_commit(db, "test", ["k2", "k1"], callback)
+        await db.commit()
+        assert calls == []
+
+        await db.complete(commit=True)
+        await asyncio.gather(*database._after_commit_tasks)
+
+    assert calls == [{"k1", "k2"}]
+
+
+async def test_run_after_commit_discarded_on_rollback(session_factory):
+    calls = []
+
+    async with session_factory() as db:
+        await _insert(db, "a")
+        run_after_commit(db, "test", ["k1"], calls.append)
+        await db.rollback()
+
+        # 롤백 후 다른 변경의 커밋에는 포함되지 않음
+        await _insert(db, "b")
+        await db.commit()
+
+    assert calls == []
+
+
+# ==================== GraphQLContext ====================
+
+
+async def test_end_unit_of_work_commits_all_sessions(session_factory, tenant_factory):
+    context = _context(session_factory, tenant_factory)
+    context.begin_unit_of_work()
+    for db in (context.manager_db_session, context.tenant_db_session):
+        await _insert(db, "a")
+        await db.commit()
+
+    assert await context.end_unit_of_work(commit=True) is True
+    await context.close_db_sessions()
+
+    assert await _names(session_factory) == ["a"]
+    assert await _names(tenant_factory) == ["a"]
+
+
+async def test_end_unit_of_work_rolls_back_all_if_one_rolled_back(
+    session_factory, tenant_factory
+):
+    context = _context(session_factory, tenant_factory)
+    context.begin_unit_of_work()
+    await _insert(context.manager_db_session, "manager")
+    await context.manager_db_session.commit()
+    await _insert(context.tenant_db_session, "tenant")
+    await context.tenant_db_session.rollback()
+
+    assert await context.end_unit_of_work(commit=True) is False
+    await context.close_db_sessions()
+
+    assert await _names(session_factory) == []
+    assert await _names(tenant_factory) == []
+
+
+async def test_end_unit_of_work_without_deferred_commits(session_factory):
+    """미룬 커밋이 없으면(조회만 한 작업) None"""
+    context = _context(session_factory)
+    context.begin_unit_of_work()
+    await context.manager_db_session.execute(text("SELECT 1"))
+
+    assert await context.end_unit_of_work(commit=True) is None
+    await context.close_db_sessions()
+
+
+async def test_end_unit_of_work_commit_failure_rolls_back_rest(session_factory, tenant_factory):
+    """커밋에 실패하면 예외를 전달하고, 아직 커밋하지 않은 세션은 롤백"""
+    context = _context(session_factory, tenant_factory)
+    context.begin_unit_of_work()
+    await _insert(context.manager_db_session, "orphan", parent_id=999)
+    await context.manager_db_session.commit()
+    await _insert(context.tenant_db_session, "tenant")
+    await context.tenant_db_session.commit()
+
+    with pytest.raises(Exception, match="FOREIGN KEY"):
+        await context.end_unit_of_work(commit=True)
+
+    assert not context.tenant_db_session.deferring
+    await context.close_db_sessions()
+    assert await _names(session_factory) == []
+    assert await _names(tenant_factory) == []
+
+
+# ==================== UnitOfWorkExtension ====================
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def ok(self) -> bool:
+        return True
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    async def add(self, info: strawberry.Info, name: str, parent_id: int | None = None) -> str:
+        db = info.context.manager_db_session
+        await _insert(db, name, parent_id)
+        await db.commit()
+        return name
+
+    @strawberry.mutation
+    async def fail(self, info: strawberry.Info) -> str:
+        raise ValueError("resolver error")
+
+
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[UnitOfWorkExtension.for_schema("test")],
+)
+
+
+async def _execute(session_factory, query: str):
+    context = _context(session_factory)
+    try:
+        return await schema.execute(query, context_value=context)
+    finally:
+        await context.close_db_sessions()
+
+
+def _codes(result) -> list[str | None]:
+    return [(error.extensions or {}).get("code") for error in result.errors or []]
+
+
+async def test_extension_commits_mutation_once(session_factory):
+    result = await _execute(session_factory, 'mutation { a: add(name: "a") b: add(name: "b") }')
+
+    assert result.errors is None
+    assert result.data == {"a": "a", "b": "b"}
+    assert await _names(session_factory) == ["a", "b"]
+
+
+async def test_extension_rolls_back_on_resolver_error(session_factory):
+    """한 필드라도 오류면 앞선 필드의 변경까지 롤백하고 data를 반환하지 않음"""
+    result = await _execute(session_factory, 'mutation { add(name: "a") fail }')
+
+    assert result.data is None
+    assert _codes(result) == [None, "TRANSACTION_ROLLED_BACK"]
+    assert await _names(session_factory) == []
+
+
+async def test_extension_reports_commit_failure(session_factory):
+    result = await _execute(session_factory, 'mutation { add(name: "a", parentId: 999) }')
+
+    assert result.data is None
+    assert _codes(result) == ["TRANSACTION_FAILED"]
+    assert await _names(session_factory) == []
+
+
+async def test_extension_skips_queries(session_factory):
+    context = _context(session_factory)
+    result = await schema.execute("{ ok }", context_value=context)
+
+    assert result.data == {"ok": True}
+    assert not context.unit_of_work
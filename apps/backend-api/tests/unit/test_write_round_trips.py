@@ -0,0 +1,394 @@
+"""쓰기 Mutation DB 왕복 횟수 회귀 테스트
+
+생성/수정 후 refresh(SELECT)로 서버 생성 값을 다시 읽지 않고,
+INSERT/UPDATE ... RETURNING 한 번으로 created_at/updated_at을 받는지
+실행된 SQL 문장으로 검증합니다. (idam, tenants-sys Mutation)
+
+일괄 처리(create_entities/upsert_entities/update_entities)는 청크당 왕복 수와 함께
+ON CONFLICT 경로, 배치 내 중복 제거, SAVEPOINT 실패 시 행 단위 재실행,
+결과를 입력 순서로 매칭하는지 검증합니다.
+
+PostgreSQL 없이 실행하도록 RETURNING을 지원하는 SQLite(표준 라이브러리)에
+동기 세션을 붙이고, Mutation 함수가 사용하는 AsyncSession 메서드만 감싼 대역을 사용합니다.
+"""
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.core.exceptions import ValidationError
+from src.graphql.common import (
+    create_entities,
+    update_entities,
+    upsert_entities,
+    validate_bulk_inputs,
+)
+from src.graphql.manager.idam.permissions.mutations import create_manager_permission
+from src.graphql.manager.idam.permissions.queries import manager_permission_to_graphql
+from src.graphql.manager.idam.roles.mutations import create_manager_role, update_manager_role
+from src.graphql.manager.idam.roles.queries import manager_role_to_graphql
+from src.graphql.tenants.sys.roles.mutations import update_tenants_role
+from src.graphql.tenants.sys.users.mutations import update_tenants_user
+from src.models.manager.idam.permission import Permission
+from src.models.manager.idam.role import Role
+from src.models.tenants.sys.roles import Roles as TenantRole
+from src.models.tenants.sys.users import Users as TenantUser
+
+
+class _AsyncSessionAdapter:
+    """Mutation 함수가 쓰는 AsyncSession 메서드를 동기 Session으로 실행하는 대역"""
+
+    def __init__(self, session: Session):
+        self.session = session
+        # True: 커밋 후 변경한 객체를 refresh (RETURNING 도입 전 방식 재현)
+        self.refresh_after_commit = False
+
+    def add(self, instance) -> None:
+        self.session.add(instance)
+
+    async def execute(self, statement, params=None, **kwargs):
+        return self.session.execute(statement, params, **kwargs)
+
+    async def scalars(self, statement, params=None, **kwargs):
+        return self.session.scalars(statement, params, **kwargs)
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        with self.session.begin_nested():
+            yield
+
+    async def flush(self) -> None:
+        self.session.flush()
+
+    async def commit(self) -> None:
+        written = list(self.session.new) + list(self.session.dirty)
+        self.session.commit()
+        if self.refresh_after_commit:
+            for instance in written:
+                self.session.refresh(instance)
+
+    async def refresh(self, instance) -> None:
+        self.session.refresh(instance)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _attach_schemas(dbapi_connection, connection_record):
+        for schema in ("idam", "sys"):
+            dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
+
+    for model in (Permission, Role, TenantRole, TenantUser):
+        model.__table__.create(engine)
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine) -> list[str]:
+    """실행된 SQL 문장 (공백 정리)"""
+    executed: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(" ".join(statement.split()))
+
+    return executed
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine, expire_on_commit=False) as session:
+        yield _AsyncSessionAdapter(session)
+
+
+def _kinds(statements: list[str]) -> list[str]:
+    return [statement.split()[0] for statement in statements]
+
+
+@dataclass
+class _RoleInput:
+    code: str
+    name: str
+    category: str = "TENANT_USER"
+    level: int = 100
+    scope: str = "TENANT"
+    description: str | None = None
+    is_default: bool = False
+    priority: int = 100
+
+
+@dataclass
+class _RoleUpdate:
+    name: str | None = None
+    description: str | None = None
+    level: int | None = None
+    is_default: bool | None = None
+    priority: int | None = None
+    status: str | None = None
+
+
+@dataclass
+class _PermissionInput:
+    code: str
+    name: str
+    category: str = "사용자 관리"
+    resource: str = "users"
+    action: str = "CREATE"
+    description: str | None = None
+    scope: str = "GLOBAL"
+    applies_to: str = "ALL"
+    is_system: bool = False
+
+
+@dataclass
+class _TenantRoleUpdate:
+    name: str | None = None
+    description: str | None = None
+    is_active: bool | None = None
+
+
+@dataclass
+class _TenantUserUpdate:
+    email: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    phone: str | None = None
+    department_id: str | None = None
+    position: str | None = None
+    role_id: str | None = None
+    is_active: bool | None = None
+
+
+def _seed(db: _AsyncSessionAdapter, instance) -> UUID:
+    db.session.add(instance)
+    db.session.commit()
+    return instance.id
+
+
+# ==================== 왕복 횟수 ====================
+
+
+async def test_create_entity_single_insert_with_returning(db, statements):
+    """idam 권한 생성: INSERT ... RETURNING 1회 (refresh SELECT 없음)"""
+    statements.clear()
+    permission = await create_manager_permission(db, _PermissionInput("users.create", "생성"))
+
+    assert _kinds(statements) == ["INSERT"]
+    assert "RETURNING" in statements[0]
+    assert permission.created_at is not None
+    assert permission.updated_at is None
+
+
+async def test_update_entity_select_then_update_with_returning(db, statements):
+    """idam 역할 수정: 대상 조회 + UPDATE ... RETURNING (수정 후 SELECT 없음)"""
+    role = await create_manager_role(db, _RoleInput("ROLE_A", "역할"))
+
+    statements.clear()
+    updated = await update_manager_role(db, UUID(role.id), _RoleUpdate(name="역할(수정)"))
+
+    assert _kinds(statements) == ["SELECT", "UPDATE"]
+    assert "RETURNING" in statements[1]
+    assert updated is not None
+    assert updated.name == "역할(수정)"
+    assert updated.updated_at is not None
+
+
+async def test_tenants_role_update(db, statements):
+    """tenants-sys 역할 수정: 대상 조회 + UPDATE ... RETURNING"""
+    role_id = _seed(db, TenantRole(tenant_id=uuid4(), code="ADMIN", name="관리자"))
+
+    statements.clear()
+    updated = await update_tenants_role(
+        db, role_id, _TenantRoleUpdate(name="관리자(수정)"), uuid4()
+    )
+
+    assert _kinds(statements) == ["SELECT", "UPDATE"]
+    assert "RETURNING" in statements[1]
+    assert updated is not None
+    assert updated.updated_at is not None
+
+
+async def test_tenants_user_update(db, statements):
+    """tenants-sys 사용자 수정: 대상 조회 + UPDATE ... RETURNING"""
+    user_id = _seed(
+        db,
+        TenantUser(
+            tenant_id=uuid4(),
+            user_code="U001",
+            username="user",
+            email="user@example.com",
+            password_hash="x",
+            is_active=True,
+        ),
+    )
+
+    statements.clear()
+    updated = await update_tenants_user(db, user_id, _TenantUserUpdate(first_name="길동"), uuid4())
+
+    assert _kinds(statements) == ["SELECT", "UPDATE"]
+    assert "RETURNING" in statements[1]
+    assert updated is not None
+    assert updated.updated_at is not None
+
+
+# ==================== refresh 방식과 비교 ====================
+
+
+async def test_round_trips_vs_refresh(db, statements):
+    """Mutation당 평균 왕복 횟수 (생성 + 수정, commit 후 refresh 방식과 비교)"""
+    number = 20
+
+    async def run(refresh: bool) -> float:
+        db.refresh_after_commit = refresh
+        statements.clear()
+        for i in range(number):
+            role = await create_manager_role(db, _RoleInput(f"R{refresh}{i}", "역할"))
+            await update_manager_role(db, UUID(role.id), _RoleUpdate(priority=i))
+        return len(statements) / (number * 2)
+
+    # refresh: 생성 2회(INSERT, SELECT) + 수정 3회(대상 SELECT, UPDATE, SELECT) → 평균 2.5회
+    assert await run(refresh=True) == 2.5
+    # RETURNING: 생성 1회(INSERT) + 수정 2회(대상 SELECT, UPDATE) → 평균 1.5회
+    assert await run(refresh=False) == 1.5
+
+
+# ==================== 일괄 처리 ====================
+
+
+def _permission_codes(db) -> list[str]:
+    return sorted(db.session.scalars(select(Permission.code)))
+
+
+def _role(code: str) -> Role:
+    return Role(code=code, name="역할", scope="TENANT")
+
+
+def _errors(result) -> list[tuple[int, str]]:
+    return [(error.index, error.code) for error in result.errors]
+
+
+async def test_bulk_create_one_insert_per_chunk(db, statements):
+    """청크(2행)마다 다중 행 INSERT ... RETURNING 1회, 결과는 입력 순서"""
+    inputs = [_PermissionInput(f"p{i}", f"권한{i}") for i in (3, 1, 2)]
+
+    statements.clear()
+    result = await create_entities(
+        db,
+        Permission,
+        inputs,
+        manager_permission_to_graphql,
+        conflict_columns=["code"],
+        chunk_size=2,
+    )
+
+    assert _kinds(statements).count("INSERT") == 2
+    assert [item.code for item in result.items] == ["p3", "p1", "p2"]
+    assert (result.success_count, result.error_count) == (3, 0)
+
+
+async def test_bulk_create_existing_code_already_exists(db):
+    """ON CONFLICT DO NOTHING으로 빠진 행은 ALREADY_EXISTS, 나머지는 생성"""
+    _seed(db, Permission(**_PermissionInput("p1", "기존").__dict__))
+
+    inputs = [_PermissionInput(code, code) for code in ("p2", "p1", "p3")]
+    result = await create_entities(
+        db, Permission, inputs, manager_permission_to_graphql, conflict_columns=["code"]
+    )
+
+    assert [item.code for item in result.items] == ["p2", "p3"]
+    assert _errors(result) == [(1, "ALREADY_EXISTS")]
+
+
+async def test_bulk_create_duplicate_in_batch(db):
+    inputs = [_PermissionInput(code, code) for code in ("p1", "p2", "p1")]
+
+    result = await create_entities(
+        db, Permission, inputs, manager_permission_to_graphql, conflict_columns=["code"]
+    )
+
+    assert [item.code for item in result.items] == ["p1", "p2"]
+    assert _errors(result) == [(2, "DUPLICATE_IN_BATCH")]
+
+
+async def test_bulk_create_falls_back_to_rows_on_constraint_error(db, statements):
+    """청크가 제약 조건 위반으로 실패하면 SAVEPOINT 롤백 후 행 단위로 재실행"""
+    inputs = [
+        _PermissionInput("p1", "정상"),
+        _PermissionInput("p2", "잘못된 scope", scope="INVALID"),
+        _PermissionInput("p3", "정상"),
+    ]
+
+    statements.clear()
+    result = await create_entities(
+        db, Permission, inputs, manager_permission_to_graphql, conflict_columns=["code"]
+    )
+
+    # 청크 1회 + 행 단위 3회
+    assert _kinds(statements).count("INSERT") == 4
+    assert [item.code for item in result.items] == ["p1", "p3"]
+    assert _errors(result) == [(1, "CONSTRAINT_VIOLATION")]
+    assert _permission_codes(db) == ["p1", "p3"]
+
+
+async def test_bulk_upsert_updates_existing_rows(db):
+    """ON CONFLICT DO UPDATE: 있는 code는 갱신(id 유지), 없는 code는 생성"""
+    existing_id = _seed(db, Permission(**_PermissionInput("p1", "이전 이름").__dict__))
+
+    inputs = [_PermissionInput("p2", "신규"), _PermissionInput("p1", "새 이름")]
+    result = await upsert_entities(
+        db, Permission, inputs, manager_permission_to_graphql, conflict_columns=["code"]
+    )
+
+    assert [(item.code, item.name) for item in result.items] == [("p2", "신규"), ("p1", "새 이름")]
+    assert result.items[1].id == str(existing_id)
+    assert result.error_count == 0
+
+
+async def test_bulk_update_maps_results_to_input_order(db, statements):
+    """대상 확인 + executemany UPDATE + 결과 조회, 없는 ID는 NOT_FOUND"""
+    role_ids = [_seed(db, _role(f"R{i}")) for i in range(3)]
+    updates = [
+        (role_ids[2], _RoleUpdate(priority=3)),
+        (uuid4(), _RoleUpdate(priority=9)),
+        (role_ids[0], _RoleUpdate(name="첫 역할")),
+        (role_ids[2], _RoleUpdate(priority=4)),
+    ]
+
+    statements.clear()
+    result = await update_entities(db, Role, updates, manager_role_to_graphql)
+
+    assert _kinds(statements).count("UPDATE") == 2
+    assert [item.id for item in result.items] == [str(role_ids[2]), str(role_ids[0])]
+    assert result.items[0].priority == 3
+    assert result.items[1].name == "첫 역할"
+    assert _errors(result) == [(1, "NOT_FOUND"), (3, "DUPLICATE_IN_BATCH")]
+
+
+async def test_bulk_update_falls_back_to_rows_on_constraint_error(db):
+    role_ids = [_seed(db, _role(f"R{i}")) for i in range(2)]
+    updates = [
+        (role_ids[0], _RoleUpdate(level=500)),
+        (role_ids[1], _RoleUpdate(level=50)),
+    ]
+
+    result = await update_entities(db, Role, updates, manager_role_to_graphql)
+
+    assert [item.id for item in result.items] == [str(role_ids[1])]
+    assert result.items[0].level == 50
+    assert _errors(result) == [(0, "CONSTRAINT_VIOLATION")]
+
+
+def test_validate_bulk_inputs():
+    validate_bulk_inputs([object()] * 3, maximum=3)
+
+    with pytest.raises(ValidationError):
+        validate_bulk_inputs([object()] * 4, maximum=3)
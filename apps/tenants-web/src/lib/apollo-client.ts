@@ -14,6 +14,7 @@ import {
 } from "@apollo/client";
 import { onError } from "@apollo/client/link/error";
 import { setContext } from "@apollo/client/link/context";
+import { createPersistedQueryLink } from "@apollo/client/link/persisted-queries";
 
 const GRAPHQL_ENDPOINT =
   process.env.NEXT_PUBLIC_GRAPHQL_URL || "http://localhost:8100/graphql/tenants";
@@ -26,6 +27,21 @@ const httpLink = new HttpLink({
   credentials: "include", // 쿠키 포함
 });
 
+/**
+ * 자동 영속 쿼리(APQ) Link
+ * 쿼리 문서 대신 SHA-256 해시를 전송하고, 서버에 등록되지 않은 경우에만 문서를 함께 재전송합니다.
+ */
+async function sha256(query: string): Promise<string> {
+  const digest = await crypto.subtle.digest("SHA-256", new TextEncoder().encode(query));
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+}
+
+// Web Crypto를 사용할 수 없는 환경(비보안 컨텍스트 등)에서는 문서를 그대로 전송
+const persistedQueryLinks =
+  typeof crypto !== "undefined" && crypto.subtle ? [createPersistedQueryLink({ sha256 })] : [];
+
 /**
  * 인증 Link
  * 모든 요청에 JWT 토큰을 자동으로 추가
@@ -105,7 +121,7 @@ const errorLink = onError(({ graphQLErrors, networkError, operation }) => {
  * Apollo Client 인스턴스 생성
  */
 export const apolloClient = new ApolloClient({
-  link: from([errorLink, authLink, httpLink]),
+  link: from([errorLink, authLink, ...persistedQueryLinks, httpLink]),
   cache: new InMemoryCache({
     typePolicies: {
       Query: {
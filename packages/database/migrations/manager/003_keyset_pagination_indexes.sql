@@ -0,0 +1,30 @@
+-- =====================================================================================
+-- 마이그레이션: 키셋(커서) 페이지네이션 인덱스
+-- 설명: GraphQL *Connection 쿼리(get_list keyset 모드)는 (created_at, id) 내림차순으로
+--       seek하므로, 페이지 깊이와 무관하게 인덱스 범위 스캔이 되도록 복합 인덱스를 추가합니다.
+-- 주의: CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없습니다.
+-- =====================================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_login_logs__created_id
+    ON idam.login_logs (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users__created_id
+    ON idam.users (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_roles__created_id
+    ON idam.roles (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_permissions__created_id
+    ON idam.permissions (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_role_permissions__created_id
+    ON idam.role_permissions (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_roles__created_id
+    ON idam.user_roles (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_keys__created_id
+    ON idam.api_keys (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tenants__created_id
+    ON tnnt.tenants (created_at DESC, id DESC);
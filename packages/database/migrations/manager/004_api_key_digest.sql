@@ -0,0 +1,15 @@
+-- =====================================================================================
+-- 마이그레이션: API 키 조회용 digest 컬럼
+-- 설명: API 인증 시 key_id 접두사 조회 + bcrypt 검증 대신, 전체 키의 HMAC-SHA256 digest로
+--       단건 조회합니다. 기존 키(digest 없음)는 최초 인증 성공 시 애플리케이션이 채웁니다.
+-- 주의: CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없습니다.
+-- =====================================================================================
+
+ALTER TABLE idam.api_keys
+    ADD COLUMN IF NOT EXISTS key_digest VARCHAR(64);
+
+COMMENT ON COLUMN idam.api_keys.key_digest IS '조회용 HMAC-SHA256 digest (전체 키 기준, API 인증 시 단건 조회)';
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_api_keys__key_digest
+    ON idam.api_keys (key_digest)
+ WHERE key_digest IS NOT NULL;
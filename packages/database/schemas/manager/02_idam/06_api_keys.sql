@@ -9,6 +9,7 @@ CREATE TABLE IF NOT EXISTS idam.api_keys
     -- API 키 정보
     key_id                      VARCHAR(100)                NOT NULL,                               -- 공개 키 ID (ak_xxxxxxxxxx)
     key_hash                    VARCHAR(255)                NOT NULL,                               -- 해시된 실제 키
+    key_digest                  VARCHAR(64),                                                        -- 조회용 HMAC-SHA256 digest
     key_name                    VARCHAR(100)                NOT NULL,                               -- 키 이름/설명
 
     -- 소유자 정보
@@ -48,6 +49,7 @@ COMMENT ON COLUMN idam.api_keys.updated_at                  IS '수정일시';
 COMMENT ON COLUMN idam.api_keys.updated_by                  IS '수정자 ID';
 COMMENT ON COLUMN idam.api_keys.key_id                      IS '공개 키 ID (ak_xxxxxxxxxx)';
 COMMENT ON COLUMN idam.api_keys.key_hash                    IS '해시된 실제 키';
+COMMENT ON COLUMN idam.api_keys.key_digest                  IS '조회용 HMAC-SHA256 digest (전체 키 기준, API 인증 시 단건 조회)';
 COMMENT ON COLUMN idam.api_keys.key_name                    IS '키 이름/설명';
 COMMENT ON COLUMN idam.api_keys.user_id                     IS '사용자 ID';
 COMMENT ON COLUMN idam.api_keys.tenant_context              IS '테넌트 컨텍스트 (키가 적용되는 테넌트)';
@@ -68,6 +70,11 @@ CREATE INDEX IF NOT EXISTS ix_api_keys__key_id
     ON idam.api_keys (key_id)
  WHERE status = 'ACTIVE';
 
+-- digest 조회용 유니크 인덱스 (API 인증용)
+CREATE UNIQUE INDEX IF NOT EXISTS ux_api_keys__key_digest
+    ON idam.api_keys (key_digest)
+ WHERE key_digest IS NOT NULL;
+
 -- 사용자 ID 조회용 인덱스
 CREATE INDEX IF NOT EXISTS ix_api_keys__user_id
     ON idam.api_keys (user_id)
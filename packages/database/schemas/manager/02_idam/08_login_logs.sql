@@ -105,3 +105,7 @@ CREATE INDEX IF NOT EXISTS ix_login_logs__mfa_used
 CREATE INDEX IF NOT EXISTS ix_login_logs__user_created
     ON idam.login_logs (user_id, created_at DESC)
  WHERE user_id IS NOT NULL;
+
+-- 키셋 페이지네이션용 인덱스 ((created_at, id) 기준 seek)
+CREATE INDEX IF NOT EXISTS ix_login_logs__created_id
+    ON idam.login_logs (created_at DESC, id DESC);